@@ -122,6 +122,7 @@ class Meeting(BaseModel):
     finalized_at: Optional[str] = None
     finalized_by: Optional[str] = None
     finalized_hash: str = ""  # SHA-256 hash of meeting JSON at finalization
+    hash_version: Optional[int] = None  # canonical JSON form of finalized_hash
     
     # Attestations
     attestations: List[Attestation] = []
@@ -14,8 +14,8 @@ from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any
 from enum import Enum
 import uuid
-import hashlib
-import json
+
+from services.canonical_json import canonical_hash, resolve_hash_version
 
 
 # ============ ENUMS ============
@@ -50,6 +50,7 @@ class EventType(str, Enum):
     VOIDED = "voided"
     ATTACHMENT_ADDED = "attachment_added"
     ATTESTATION_ADDED = "attestation_added"
+    STATUS_CHANGED = "status_changed"
 
 
 class AttestationRole(str, Enum):
@@ -74,11 +75,13 @@ def compute_content_hash(
     created_at: str,
     created_by: str,
     version: int,
-    parent_hash: Optional[str] = None
+    parent_hash: Optional[str] = None,
+    hash_version: Optional[int] = None
 ) -> str:
     """
     Compute SHA-256 hash for tamper-evident chain.
     Includes payload + metadata + parent hash for chain integrity.
+    hash_version selects the canonical JSON form (None means legacy).
     """
     hashable = {
         "payload": payload_json,
@@ -87,8 +90,7 @@ def compute_content_hash(
         "version": version,
         "parent_hash": parent_hash or ""
     }
-    canonical = json.dumps(hashable, sort_keys=True, default=str)
-    return hashlib.sha256(canonical.encode()).hexdigest()
+    return canonical_hash(hashable, resolve_hash_version(hash_version))
 
 
 # ============ CORE MODELS ============
@@ -164,6 +166,7 @@ class GovernanceRevision(BaseModel):
     # Hash chain for tamper evidence
     content_hash: str = ""
     parent_hash: Optional[str] = None
+    hash_version: Optional[int] = None  # canonical JSON form of content_hash
     
     class Config:
         use_enum_values = True
@@ -463,6 +466,33 @@ class RecordCreateRequest(BaseModel):
     new_subject_external_ref: Optional[str] = None  # External ref for new subject
 
 
+class RecordBulkImportRequest(BaseModel):
+    """
+    Request to create many governance records at once.
+    Each item has the RecordCreateRequest fields (portfolio_id/trust_id
+    default to the batch's) plus an optional client_ref. Re-posting the
+    same batch_id skips items already imported, so a failed import can be
+    resumed by sending the batch again.
+    """
+    batch_id: Optional[str] = None  # Client-chosen for resumable imports
+    portfolio_id: Optional[str] = None
+    trust_id: Optional[str] = None
+    items: List[Dict[str, Any]]
+    dry_run: bool = False  # Validate only
+
+
+class RecordBulkTransitionRequest(BaseModel):
+    """
+    Request to move many records to one lifecycle status (e.g. finalize a
+    year of minutes). Each record is validated on its own; valid ones are
+    transitioned and the rest reported with their errors.
+    """
+    record_ids: List[str]  # Record ids or RM-IDs
+    target_status: str  # A lifecycle status (finalized, approved, voided, ...)
+    reason: Optional[str] = None  # Required for voided
+    dry_run: bool = False  # Validate only
+
+
 class RecordAmendRequest(BaseModel):
     """Request to create an amendment"""
     change_type: ChangeType = ChangeType.AMENDMENT
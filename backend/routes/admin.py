@@ -19,6 +19,7 @@ from models.admin import (
     Reset2FARequest
 )
 from services.admin_service import get_admin_service
+from services.keyset_pagination import TOTAL_EXACT, InvalidCursor
 
 logger = logging.getLogger(__name__)
 
@@ -243,20 +244,27 @@ async def list_accounts(
     request: Request,
     search: Optional[str] = None,
     skip: int = 0,
-    limit: int = 50
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    total_mode: str = TOTAL_EXACT
 ):
     """List all accounts"""
     user = await require_admin(request)
     admin_service = get_admin_service()
     ip = get_client_ip(request)
     
-    result = await admin_service.list_accounts(
-        admin_user_id=user.user_id,
-        search=search,
-        skip=skip,
-        limit=limit,
-        ip_address=ip
-    )
+    try:
+        result = await admin_service.list_accounts(
+            admin_user_id=user.user_id,
+            search=search,
+            skip=skip,
+            limit=limit,
+            ip_address=ip,
+            cursor=cursor,
+            total_mode=total_mode
+        )
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
     return result
 
 
@@ -353,18 +361,25 @@ async def list_users(
     request: Request,
     search: Optional[str] = None,
     skip: int = 0,
-    limit: int = 50
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    total_mode: str = TOTAL_EXACT
 ):
     """List all users"""
     user = await require_admin(request)
     admin_service = get_admin_service()
     
-    result = await admin_service.list_users(
-        admin_user_id=user.user_id,
-        search=search,
-        skip=skip,
-        limit=limit
-    )
+    try:
+        result = await admin_service.list_users(
+            admin_user_id=user.user_id,
+            search=search,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            total_mode=total_mode
+        )
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
     return result
 
 
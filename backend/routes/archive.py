@@ -8,6 +8,8 @@ from datetime import datetime, timezone
 from uuid import uuid4
 from pydantic import BaseModel
 
+from services.keyset_pagination import TOTAL_EXACT, InvalidCursor, keyset_page
+
 router = APIRouter(prefix="/archive", tags=["Black Archive"])
 
 # These will be set by init function
@@ -82,8 +84,10 @@ async def get_sources(
     era: Optional[str] = None,
     skip: int = 0,
     limit: int = 50,
+    cursor: Optional[str] = None,
+    total_mode: str = TOTAL_EXACT,
 ):
-    """Get archive sources with filtering"""
+    """Get archive sources with filtering (oldest first; pass next_cursor back as cursor)"""
     from server import get_current_user
     user = await get_current_user(request)
     
@@ -108,10 +112,21 @@ async def get_sources(
     if era:
         query["era_tags"] = era
     
-    sources = await db.archive_sources.find(query, {"_id": 0}).skip(skip).limit(limit).to_list(limit)
-    total = await db.archive_sources.count_documents(query)
+    try:
+        page = await keyset_page(
+            db.archive_sources, query, [("created_at", 1)], "source_id",
+            limit, cursor=cursor, offset=skip, total=total_mode
+        )
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    return {"sources": sources, "total": total}
+    return {
+        "sources": page["items"],
+        "total": page["total"],
+        "total_is_estimate": page["total_is_estimate"],
+        "next_cursor": page["next_cursor"],
+        "has_more": page["has_more"]
+    }
 
 @router.get("/sources/{source_id}")
 async def get_source(source_id: str, request: Request):
@@ -199,8 +214,10 @@ async def get_claims(
     topic: Optional[str] = None,
     skip: int = 0,
     limit: int = 50,
+    cursor: Optional[str] = None,
+    total_mode: str = TOTAL_EXACT,
 ):
-    """Get archive claims with filtering"""
+    """Get archive claims with filtering (oldest first; pass next_cursor back as cursor)"""
     from server import get_current_user
     user = await get_current_user(request)
     
@@ -218,10 +235,21 @@ async def get_claims(
     if topic:
         query["topic_tags"] = topic
     
-    claims = await db.archive_claims.find(query, {"_id": 0}).skip(skip).limit(limit).to_list(limit)
-    total = await db.archive_claims.count_documents(query)
+    try:
+        page = await keyset_page(
+            db.archive_claims, query, [("created_at", 1)], "claim_id",
+            limit, cursor=cursor, offset=skip, total=total_mode
+        )
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    return {"claims": claims, "total": total}
+    return {
+        "claims": page["items"],
+        "total": page["total"],
+        "total_is_estimate": page["total_is_estimate"],
+        "next_cursor": page["next_cursor"],
+        "has_more": page["has_more"]
+    }
 
 @router.get("/claims/{claim_id}")
 async def get_claim(claim_id: str, request: Request):
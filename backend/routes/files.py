@@ -10,6 +10,8 @@ import uuid
 from datetime import datetime, timezone
 import logging
 
+from services.soft_delete import live_filter
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/files", tags=["Files"])
@@ -176,7 +178,7 @@ async def list_portfolio_files(request: Request, portfolio_id: str, category: Op
     
     query = {
         "portfolio_id": portfolio_id,
-        "is_deleted": False
+        **live_filter("files")
     }
     
     if category:
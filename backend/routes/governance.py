@@ -11,12 +11,24 @@ Response Envelope Standard:
 from fastapi import APIRouter, Request, Query
 from fastapi.responses import JSONResponse
 from typing import Optional
-import hashlib
-import json
-import re
 import uuid
 from datetime import datetime, timezone
 
+from services.activity_feed import fetch_activity_page
+from services.canonical_json import CURRENT_HASH_VERSION, canonical_hash, resolve_hash_version
+from services.dashboard_rollups import track_insert, track_delete, tracked_update_one
+from services.keyset_pagination import TOTAL_EXACT, InvalidCursor, keyset_page
+from services.governance_summaries import (
+    dispute_board_columns,
+    summarize_compensation,
+    summarize_disputes,
+    summarize_distributions,
+    summarize_insurance,
+)
+from services.rm_sort_key import RM_SORT_KEY_FIELD, parse_rm_id_for_sort, with_rm_sort_key
+from services.search_tokens import refresh_search_tokens, search_filter, with_search_tokens
+from services.soft_delete import deleted_filter, live_filter
+
 router = APIRouter(prefix="/api/governance", tags=["governance"])
 
 # Dependencies injected from server.py
@@ -111,8 +123,8 @@ def normalize_meeting(meeting: dict) -> dict:
     return meeting
 
 
-def success_list(items: list, total: int = None, sort_by: str = "created_at", sort_dir: str = "asc", empty_state: dict = None):
-    """Standard list response envelope"""
+def success_list(items: list, total: int = None, sort_by: str = "created_at", sort_dir: str = "asc", empty_state: dict = None, page: dict = None):
+    """Standard list response envelope (page: keyset_page result, for cursor fields)"""
     # Normalize all meeting items
     normalized_items = [normalize_meeting(item) if isinstance(item, dict) and "meeting_id" in item else item for item in items]
     
@@ -123,6 +135,10 @@ def success_list(items: list, total: int = None, sort_by: str = "created_at", so
         "total": total if total is not None else len(normalized_items),
         "sort": {"by": sort_by, "dir": sort_dir}
     }
+    if page is not None:
+        response["next_cursor"] = page["next_cursor"]
+        response["has_more"] = page["has_more"]
+        response["total_is_estimate"] = page["total_is_estimate"]
     if not normalized_items and empty_state:
         response["empty_state"] = empty_state
     return response
@@ -227,29 +243,6 @@ EMPTY_STATES = {
 
 # ============ SORTING HELPERS ============
 
-def parse_rm_id_for_sort(rm_id: str) -> tuple:
-    """
-    Parse RM-ID for proper sorting.
-    Format: RF743916765US-20.001 -> (prefix, category, sequence)
-    Returns tuple for comparison that sorts correctly.
-    """
-    if not rm_id:
-        return ("", 0, 0)
-    
-    try:
-        # Match pattern: PREFIX-CATEGORY.SEQUENCE
-        match = re.match(r'^(.+)-(\d+)\.(\d+)$', rm_id)
-        if match:
-            prefix = match.group(1)
-            category = int(match.group(2))
-            sequence = int(match.group(3))
-            return (prefix, category, sequence)
-    except Exception:
-        pass
-    
-    return (rm_id, 0, 0)
-
-
 def sort_by_rm_id(items: list, ascending: bool = True) -> list:
     """Sort items by RM-ID numerically"""
     return sorted(
@@ -259,7 +252,17 @@ def sort_by_rm_id(items: list, ascending: bool = True) -> list:
     )
 
 
-def generate_meeting_hash(meeting_data: dict) -> str:
+def mongo_sort_spec(sort_by: str, direction: int) -> list:
+    """
+    MongoDB sort for a list endpoint. rm_id sorts numerically via the
+    persisted rm_sort_key, with created_at breaking ties.
+    """
+    if sort_by == "rm_id":
+        return [(RM_SORT_KEY_FIELD, direction), ("created_at", direction)]
+    return [(sort_by, direction)]
+
+
+def generate_meeting_hash(meeting_data: dict, hash_version: Optional[int] = None) -> str:
     """Generate SHA-256 hash of meeting data for tamper-evidence"""
     hashable_data = {
         "meeting_id": meeting_data.get("meeting_id"),
@@ -274,8 +277,7 @@ def generate_meeting_hash(meeting_data: dict) -> str:
         "finalized_at": meeting_data.get("finalized_at"),
         "finalized_by": meeting_data.get("finalized_by"),
     }
-    canonical_json = json.dumps(hashable_data, sort_keys=True, default=str)
-    return hashlib.sha256(canonical_json.encode()).hexdigest()
+    return canonical_hash(hashable_data, resolve_hash_version(hash_version))
 
 
 # ============ MEETING MINUTES ENDPOINTS ============
@@ -291,6 +293,8 @@ async def get_meetings(
     sort_dir: Optional[str] = Query("asc", description="Sort direction: asc, desc"),
     limit: int = Query(100, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    total_mode: str = Query(TOTAL_EXACT, description="Total count: exact, estimate, none"),
     include_deleted: bool = Query(False, description="Include soft-deleted items")
 ):
     """Get all meetings with consistent envelope response"""
@@ -310,45 +314,38 @@ async def get_meetings(
     
     # Filter deleted
     if not include_deleted:
-        query["$or"] = [{"deleted_at": None}, {"deleted_at": {"$exists": False}}]
+        query.update(live_filter("meetings"))
     
     # Status filter
     if status:
         query["status"] = status
     
-    # Search filter
+    # Search filter (prefix match on title/rm_id tokens)
     if search:
-        query["$or"] = [
-            {"title": {"$regex": search, "$options": "i"}},
-            {"rm_id": {"$regex": search, "$options": "i"}}
-        ]
+        query.update(search_filter(search))
     
     try:
-        # Get total count first
-        total = await db.meetings.count_documents(query)
-        
         # Determine sort direction (default ASC - lowest first)
         mongo_sort_dir = 1 if sort_dir.lower() == "asc" else -1
         
-        # Get items with pagination
-        if sort_by == "rm_id":
-            # For rm_id, fetch all and sort in Python for numeric sorting
-            all_items = await db.meetings.find(query, {"_id": 0}).to_list(1000)
-            sorted_items = sort_by_rm_id(all_items, ascending=(sort_dir.lower() == "asc"))
-            items = sorted_items[offset:offset + limit]
-        else:
-            # Use MongoDB sort for other fields
-            sort_field = sort_by if sort_by in ["created_at", "date_time", "updated_at", "title"] else "created_at"
-            items = await db.meetings.find(query, {"_id": 0}).sort(sort_field, mongo_sort_dir).skip(offset).limit(limit).to_list(limit)
+        # Get items with keyset pagination (rm_id sorts numerically on the indexed sort key)
+        sort_field = sort_by if sort_by in ["rm_id", "created_at", "date_time", "updated_at", "title"] else "created_at"
+        page = await keyset_page(
+            db.meetings, query, mongo_sort_spec(sort_field, mongo_sort_dir), "meeting_id",
+            limit, cursor=cursor, offset=offset, total=total_mode
+        )
         
         return success_list(
-            items=items,
-            total=total,
+            items=page["items"],
+            total=page["total"],
             sort_by=sort_by,
             sort_dir=sort_dir,
-            empty_state=EMPTY_STATES["meetings"]
+            empty_state=EMPTY_STATES["meetings"],
+            page=page
         )
         
+    except InvalidCursor as e:
+        return error_response("INVALID_CURSOR", str(e))
     except Exception as e:
         print(f"Error fetching meetings: {e}")
         return error_response("DB_ERROR", "Failed to fetch meetings", {"error": str(e)}, status_code=500)
@@ -472,7 +469,8 @@ async def create_meeting(data: dict, request: Request):
         doc["updated_at"] = doc["updated_at"].isoformat()
         doc["deleted_at"] = None  # Soft delete support
         
-        await db.meetings.insert_one(doc)
+        await db.meetings.insert_one(with_search_tokens(with_rm_sort_key(doc)))
+        await track_insert(db, "meetings", doc)
         
         return success_item({k: v for k, v in doc.items() if k != "_id"})
         
@@ -524,8 +522,11 @@ async def update_meeting(meeting_id: str, data: dict, request: Request):
                 update_fields[field] = data[field]
         
         update_fields["updated_at"] = datetime.now(timezone.utc).isoformat()
+        refresh_search_tokens(update_fields, meeting)
         
-        await db.meetings.update_one(
+        await tracked_update_one(
+            db,
+            "meetings",
             {"meeting_id": meeting_id},
             {"$set": update_fields}
         )
@@ -582,8 +583,11 @@ async def delete_meeting(meeting_id: str, request: Request, hard: bool = Query(F
         
         if hard:
             await db.meetings.delete_one({"meeting_id": meeting_id})
+            await track_delete(db, "meetings", meeting)
         else:
-            await db.meetings.update_one(
+            await tracked_update_one(
+                db,
+                "meetings",
                 {"meeting_id": meeting_id},
                 {"$set": {
                     "deleted_at": datetime.now(timezone.utc).isoformat(),
@@ -834,9 +838,11 @@ async def finalize_meeting(meeting_id: str, data: dict, request: Request):
         meeting["locked"] = True
         meeting["locked_at"] = finalized_at
         
-        meeting_hash = generate_meeting_hash(meeting)
+        meeting_hash = generate_meeting_hash(meeting, CURRENT_HASH_VERSION)
         
-        await db.meetings.update_one(
+        await tracked_update_one(
+            db,
+            "meetings",
             {"meeting_id": meeting_id},
             {"$set": {
                 "status": "finalized",
@@ -845,6 +851,7 @@ async def finalize_meeting(meeting_id: str, data: dict, request: Request):
                 "finalized_at": finalized_at,
                 "finalized_by": finalized_by,
                 "finalized_hash": meeting_hash,
+                "hash_version": CURRENT_HASH_VERSION,
                 "updated_at": finalized_at
             }}
         )
@@ -917,7 +924,9 @@ async def add_attestation(meeting_id: str, data: dict, request: Request):
         
         new_status = "attested" if meeting.get("status") == "finalized" else meeting.get("status")
         
-        await db.meetings.update_one(
+        await tracked_update_one(
+            db,
+            "meetings",
             {"meeting_id": meeting_id},
             {"$set": {
                 "attestations": attestations,
@@ -1009,10 +1018,13 @@ async def create_amendment(meeting_id: str, data: dict, request: Request):
         doc["locked"] = False  # New amendment is unlocked/draft
         doc["locked_at"] = None
         
-        await db.meetings.insert_one(doc)
+        await db.meetings.insert_one(with_search_tokens(with_rm_sort_key(doc)))
+        await track_insert(db, "meetings", doc)
         
         # Update original to point to the amendment
-        await db.meetings.update_one(
+        await tracked_update_one(
+            db,
+            "meetings",
             {"meeting_id": meeting_id},
             {"$set": {
                 "amended_by_id": amendment.meeting_id,
@@ -1233,7 +1245,7 @@ async def verify_meeting_hash(meeting_id: str, request: Request):
         if not stored_hash:
             return success_item({"verified": False, "reason": "No hash found"})
         
-        calculated_hash = generate_meeting_hash(meeting)
+        calculated_hash = generate_meeting_hash(meeting, meeting.get("hash_version"))
         verified = stored_hash == calculated_hash
         
         return success_item({
@@ -1266,10 +1278,13 @@ async def get_distributions(
     portfolio_id: Optional[str] = None,
     trust_id: Optional[str] = None,
     status: Optional[str] = None,
+    search: Optional[str] = None,
     sort_by: str = "created_at",
     sort_dir: str = "asc",
     limit: int = 100,
-    offset: int = 0
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    total_mode: str = TOTAL_EXACT
 ):
     """Get distributions list"""
     try:
@@ -1278,21 +1293,24 @@ async def get_distributions(
         return error_response("AUTH_ERROR", "Authentication required", status_code=401)
     
     try:
-        query = {"user_id": user.user_id, "deleted_at": None}
+        query = {"user_id": user.user_id, **live_filter("distributions")}
         if portfolio_id:
             query["portfolio_id"] = portfolio_id
         if trust_id:
             query["trust_id"] = trust_id
         if status:
             query["status"] = status
+        if search:
+            query.update(search_filter(search))
         
         sort_direction = 1 if sort_dir == "asc" else -1
         
-        distributions = await db.distributions.find(query, {"_id": 0}).sort(
-            sort_by, sort_direction
-        ).skip(offset).limit(limit).to_list(limit)
-        
-        total = await db.distributions.count_documents(query)
+        page = await keyset_page(
+            db.distributions, query, mongo_sort_spec(sort_by, sort_direction), "distribution_id",
+            limit, cursor=cursor, offset=offset, total=total_mode
+        )
+        distributions = page["items"]
+        total = page["total"]
         
         # Normalize all distributions
         distributions = [normalize_distribution(d) for d in distributions]
@@ -1302,8 +1320,11 @@ async def get_distributions(
             total=total,
             sort_by=sort_by,
             sort_dir=sort_dir,
-            empty_state=EMPTY_STATES["distributions"] if not distributions else None
+            empty_state=EMPTY_STATES["distributions"] if not distributions else None,
+            page=page
         )
+    except InvalidCursor as e:
+        return error_response("INVALID_CURSOR", str(e))
     except Exception as e:
         print(f"Error fetching distributions: {e}")
         return error_response("DB_ERROR", "Failed to fetch distributions", status_code=500)
@@ -1322,62 +1343,17 @@ async def get_distributions_summary(
         return error_response("AUTH_ERROR", "Authentication required", status_code=401)
     
     try:
-        query = {"user_id": user.user_id, "deleted_at": None}
+        query = {"user_id": user.user_id, **live_filter("distributions")}
         if portfolio_id:
             query["portfolio_id"] = portfolio_id
         if trust_id:
             query["trust_id"] = trust_id
         
-        distributions = await db.distributions.find(query, {"_id": 0}).to_list(1000)
-        
-        if not distributions:
-            return success_item({
-                "has_data": False,
-                "total_distributed": 0,
-                "pending_amount": 0,
-                "distribution_count": 0,
-                "donut_data": [],
-                "timeline_data": [],
-                "by_type": {},
-                "by_status": {},
-                "empty_state": EMPTY_STATES["distributions"]
-            })
-        
-        # Calculate summary stats
-        total_distributed = sum(d.get("total_amount", 0) for d in distributions if d.get("status") == "completed")
-        pending_amount = sum(d.get("total_amount", 0) for d in distributions if d.get("status") in ("draft", "pending_approval", "approved"))
+        summary = await summarize_distributions(db, query)
+        if not summary["has_data"]:
+            summary["empty_state"] = EMPTY_STATES["distributions"]
         
-        # Group by type
-        by_type = {}
-        for d in distributions:
-            dtype = d.get("distribution_type", "regular")
-            by_type[dtype] = by_type.get(dtype, 0) + d.get("total_amount", 0)
-        
-        # Group by status
-        by_status = {}
-        for d in distributions:
-            status = d.get("status", "draft")
-            by_status[status] = by_status.get(status, 0) + 1
-        
-        # Donut chart data (by recipient role)
-        recipient_totals = {}
-        for d in distributions:
-            for r in d.get("recipients", []):
-                role = r.get("role", "beneficiary")
-                recipient_totals[role] = recipient_totals.get(role, 0) + r.get("amount", 0)
-        
-        donut_data = [{"name": k, "value": v} for k, v in recipient_totals.items()]
-        
-        return success_item({
-            "has_data": True,
-            "total_distributed": total_distributed,
-            "pending_amount": pending_amount,
-            "distribution_count": len(distributions),
-            "donut_data": donut_data,
-            "timeline_data": [],  # Would need date-based aggregation
-            "by_type": by_type,
-            "by_status": by_status
-        })
+        return success_item(summary)
     except Exception as e:
         print(f"Error fetching distribution summary: {e}")
         return error_response("DB_ERROR", "Failed to fetch summary", status_code=500)
@@ -1447,7 +1423,8 @@ async def create_distribution(data: dict, request: Request):
         doc["created_at"] = doc["created_at"].isoformat()
         doc["updated_at"] = doc["updated_at"].isoformat()
         
-        await db.distributions.insert_one(doc)
+        await db.distributions.insert_one(with_search_tokens(with_rm_sort_key(doc)))
+        await track_insert(db, "distributions", doc)
         
         return success_item({k: v for k, v in doc.items() if k != "_id"})
     except Exception as e:
@@ -1551,8 +1528,11 @@ async def update_distribution(distribution_id: str, data: dict, request: Request
                 update_fields[field] = data[field]
         
         update_fields["updated_at"] = datetime.now(timezone.utc).isoformat()
+        refresh_search_tokens(update_fields, distribution)
         
-        await db.distributions.update_one(
+        await tracked_update_one(
+            db,
+            "distributions",
             {"distribution_id": distribution_id},
             {"$set": update_fields}
         )
@@ -1598,12 +1578,16 @@ async def delete_distribution(distribution_id: str, request: Request):
             })
             
             if other_amendments == 0:
-                await db.distributions.update_one(
+                await tracked_update_one(
+                    db,
+                    "distributions",
                     {"distribution_id": parent_id},
                     {"$set": {"amended_by_id": None, "status": "finalized"}}
                 )
         
-        await db.distributions.update_one(
+        await tracked_update_one(
+            db,
+            "distributions",
             {"distribution_id": distribution_id},
             {"$set": {"deleted_at": datetime.now(timezone.utc).isoformat()}}
         )
@@ -1638,7 +1622,9 @@ async def submit_distribution_for_approval(distribution_id: str, request: Reques
         
         new_status = "pending_approval" if distribution.get("requires_approval") else "approved"
         
-        await db.distributions.update_one(
+        await tracked_update_one(
+            db,
+            "distributions",
             {"distribution_id": distribution_id},
             {"$set": {
                 "status": new_status,
@@ -1702,7 +1688,9 @@ async def approve_distribution(distribution_id: str, data: dict, request: Reques
             update_data["locked"] = True
             update_data["locked_at"] = datetime.now(timezone.utc).isoformat()
         
-        await db.distributions.update_one(
+        await tracked_update_one(
+            db,
+            "distributions",
             {"distribution_id": distribution_id},
             {"$set": update_data}
         )
@@ -1743,7 +1731,9 @@ async def execute_distribution(distribution_id: str, data: dict, request: Reques
                 r["paid_at"] = execution_date
                 r["payment_reference"] = data.get("payment_reference", "")
         
-        await db.distributions.update_one(
+        await tracked_update_one(
+            db,
+            "distributions",
             {"distribution_id": distribution_id},
             {"$set": {
                 "status": "completed",
@@ -1806,7 +1796,9 @@ async def finalize_distribution(distribution_id: str, data: dict, request: Reque
         finalized_at = datetime.now(timezone.utc).isoformat()
         finalized_by = data.get("finalized_by", user.name if hasattr(user, 'name') else "Unknown")
         
-        await db.distributions.update_one(
+        await tracked_update_one(
+            db,
+            "distributions",
             {"distribution_id": distribution_id},
             {"$set": {
                 "status": "finalized",
@@ -1903,9 +1895,12 @@ async def create_distribution_amendment(distribution_id: str, data: dict, reques
             "deleted_at": None
         }
         
-        await db.distributions.insert_one(amendment)
+        await db.distributions.insert_one(with_search_tokens(with_rm_sort_key(amendment)))
+        await track_insert(db, "distributions", amendment)
         
-        await db.distributions.update_one(
+        await tracked_update_one(
+            db,
+            "distributions",
             {"distribution_id": distribution_id},
             {"$set": {"amended_by_id": new_id, "status": "amended"}}
         )
@@ -1936,11 +1931,14 @@ async def get_disputes(
     portfolio_id: Optional[str] = None,
     trust_id: Optional[str] = None,
     status: Optional[str] = None,
+    search: Optional[str] = None,
     priority: Optional[str] = None,
     sort_by: str = "created_at",
     sort_dir: str = "asc",
     limit: int = 100,
-    offset: int = 0
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    total_mode: str = TOTAL_EXACT
 ):
     """Get disputes list"""
     try:
@@ -1949,23 +1947,26 @@ async def get_disputes(
         return error_response("AUTH_ERROR", "Authentication required", status_code=401)
     
     try:
-        query = {"user_id": user.user_id, "deleted_at": None}
+        query = {"user_id": user.user_id, **live_filter("disputes")}
         if portfolio_id:
             query["portfolio_id"] = portfolio_id
         if trust_id:
             query["trust_id"] = trust_id
         if status:
             query["status"] = status
+        if search:
+            query.update(search_filter(search))
         if priority:
             query["priority"] = priority
         
         sort_direction = 1 if sort_dir == "asc" else -1
         
-        disputes = await db.disputes.find(query, {"_id": 0}).sort(
-            sort_by, sort_direction
-        ).skip(offset).limit(limit).to_list(limit)
-        
-        total = await db.disputes.count_documents(query)
+        page = await keyset_page(
+            db.disputes, query, mongo_sort_spec(sort_by, sort_direction), "dispute_id",
+            limit, cursor=cursor, offset=offset, total=total_mode
+        )
+        disputes = page["items"]
+        total = page["total"]
         
         disputes = [normalize_dispute(d) for d in disputes]
         
@@ -1974,8 +1975,11 @@ async def get_disputes(
             total=total,
             sort_by=sort_by,
             sort_dir=sort_dir,
-            empty_state=EMPTY_STATES["disputes"] if not disputes else None
+            empty_state=EMPTY_STATES["disputes"] if not disputes else None,
+            page=page
         )
+    except InvalidCursor as e:
+        return error_response("INVALID_CURSOR", str(e))
     except Exception as e:
         print(f"Error fetching disputes: {e}")
         return error_response("DB_ERROR", "Failed to fetch disputes", status_code=500)
@@ -1994,47 +1998,26 @@ async def get_disputes_board(
         return error_response("AUTH_ERROR", "Authentication required", status_code=401)
     
     try:
-        query = {"user_id": user.user_id, "deleted_at": None}
+        query = {"user_id": user.user_id, **live_filter("disputes")}
         if portfolio_id:
             query["portfolio_id"] = portfolio_id
         if trust_id:
             query["trust_id"] = trust_id
         
-        disputes = await db.disputes.find(query, {"_id": 0}).to_list(1000)
+        columns = await dispute_board_columns(db, query, normalize_dispute)
+        has_data = any(column["cards"] for column in columns)
         
-        if not disputes:
+        if not has_data:
+            # Empty boards show the six primary columns
             return success_item({
                 "has_data": False,
-                "columns": [
-                    {"id": "open", "title": "Open", "cards": []},
-                    {"id": "in_progress", "title": "In Progress", "cards": []},
-                    {"id": "mediation", "title": "Mediation", "cards": []},
-                    {"id": "litigation", "title": "Litigation", "cards": []},
-                    {"id": "settled", "title": "Settled", "cards": []},
-                    {"id": "closed", "title": "Closed", "cards": []}
-                ],
+                "columns": [column for column in columns if column["id"] != "appealed"],
                 "empty_state": EMPTY_STATES["disputes"]
             })
         
-        # Group by status
-        columns = {
-            "open": {"id": "open", "title": "Open", "cards": []},
-            "in_progress": {"id": "in_progress", "title": "In Progress", "cards": []},
-            "mediation": {"id": "mediation", "title": "Mediation", "cards": []},
-            "litigation": {"id": "litigation", "title": "Litigation", "cards": []},
-            "settled": {"id": "settled", "title": "Settled", "cards": []},
-            "closed": {"id": "closed", "title": "Closed", "cards": []},
-            "appealed": {"id": "appealed", "title": "Appealed", "cards": []}
-        }
-        
-        for d in disputes:
-            status = d.get("status", "open")
-            if status in columns:
-                columns[status]["cards"].append(normalize_dispute(d))
-        
         return success_item({
             "has_data": True,
-            "columns": list(columns.values())
+            "columns": columns
         })
     except Exception as e:
         print(f"Error fetching disputes board: {e}")
@@ -2054,53 +2037,17 @@ async def get_disputes_summary(
         return error_response("AUTH_ERROR", "Authentication required", status_code=401)
     
     try:
-        query = {"user_id": user.user_id, "deleted_at": None}
+        query = {"user_id": user.user_id, **live_filter("disputes")}
         if portfolio_id:
             query["portfolio_id"] = portfolio_id
         if trust_id:
             query["trust_id"] = trust_id
         
-        disputes = await db.disputes.find(query, {"_id": 0}).to_list(1000)
+        summary = await summarize_disputes(db, query)
+        if not summary["has_data"]:
+            summary["empty_state"] = EMPTY_STATES["disputes"]
         
-        if not disputes:
-            return success_item({
-                "has_data": False,
-                "total_disputes": 0,
-                "open_disputes": 0,
-                "total_exposure": 0,
-                "by_status": {},
-                "by_priority": {},
-                "by_type": {},
-                "empty_state": EMPTY_STATES["disputes"]
-            })
-        
-        # Calculate summary
-        total_exposure = sum(d.get("estimated_exposure", 0) or d.get("amount_claimed", 0) for d in disputes)
-        open_disputes = len([d for d in disputes if d.get("status") not in ("settled", "closed")])
-        
-        by_status = {}
-        by_priority = {}
-        by_type = {}
-        
-        for d in disputes:
-            status = d.get("status", "open")
-            by_status[status] = by_status.get(status, 0) + 1
-            
-            priority = d.get("priority", "medium")
-            by_priority[priority] = by_priority.get(priority, 0) + 1
-            
-            dtype = d.get("dispute_type", "beneficiary")
-            by_type[dtype] = by_type.get(dtype, 0) + 1
-        
-        return success_item({
-            "has_data": True,
-            "total_disputes": len(disputes),
-            "open_disputes": open_disputes,
-            "total_exposure": total_exposure,
-            "by_status": by_status,
-            "by_priority": by_priority,
-            "by_type": by_type
-        })
+        return success_item(summary)
     except Exception as e:
         print(f"Error fetching disputes summary: {e}")
         return error_response("DB_ERROR", "Failed to fetch summary", status_code=500)
@@ -2168,7 +2115,8 @@ async def create_dispute(data: dict, request: Request):
         doc["created_at"] = doc["created_at"].isoformat()
         doc["updated_at"] = doc["updated_at"].isoformat()
         
-        await db.disputes.insert_one(doc)
+        await db.disputes.insert_one(with_search_tokens(with_rm_sort_key(doc)))
+        await track_insert(db, "disputes", doc)
         
         return success_item({k: v for k, v in doc.items() if k != "_id"})
     except Exception as e:
@@ -2274,8 +2222,11 @@ async def update_dispute(dispute_id: str, data: dict, request: Request):
                 update_fields[field] = data[field]
         
         update_fields["updated_at"] = datetime.now(timezone.utc).isoformat()
+        refresh_search_tokens(update_fields, dispute)
         
-        await db.disputes.update_one(
+        await tracked_update_one(
+            db,
+            "disputes",
             {"dispute_id": dispute_id},
             {"$set": update_fields}
         )
@@ -2329,7 +2280,9 @@ async def delete_dispute(dispute_id: str, request: Request):
                 )
         
         # Soft delete the dispute
-        await db.disputes.update_one(
+        await tracked_update_one(
+            db,
+            "disputes",
             {"dispute_id": dispute_id},
             {"$set": {"deleted_at": datetime.now(timezone.utc).isoformat()}}
         )
@@ -2536,7 +2489,9 @@ async def resolve_dispute(dispute_id: str, data: dict, request: Request):
         
         new_status = "settled" if data.get("resolution_type") == "settlement" else "closed"
         
-        await db.disputes.update_one(
+        await tracked_update_one(
+            db,
+            "disputes",
             {"dispute_id": dispute_id},
             {"$set": {
                 "resolution": resolution,
@@ -2608,7 +2563,9 @@ async def finalize_dispute(dispute_id: str, data: dict, request: Request):
         
         new_status = "closed" if dispute.get("status") not in ("settled", "closed") else dispute.get("status")
         
-        await db.disputes.update_one(
+        await tracked_update_one(
+            db,
+            "disputes",
             {"dispute_id": dispute_id},
             {"$set": {
                 "status": new_status,
@@ -2673,7 +2630,9 @@ async def set_dispute_outcome(dispute_id: str, data: dict, request: Request):
         
         updated_at = datetime.now(timezone.utc).isoformat()
         
-        await db.disputes.update_one(
+        await tracked_update_one(
+            db,
+            "disputes",
             {"dispute_id": dispute_id},
             {"$set": {
                 "status": new_status,
@@ -2748,7 +2707,8 @@ async def create_dispute_amendment(dispute_id: str, data: dict, request: Request
             "deleted_at": None
         }
         
-        await db.disputes.insert_one(amendment)
+        await db.disputes.insert_one(with_search_tokens(with_rm_sort_key(amendment)))
+        await track_insert(db, "disputes", amendment)
         
         await db.disputes.update_one(
             {"dispute_id": dispute_id},
@@ -2771,10 +2731,13 @@ async def get_insurance_policies(
     portfolio_id: Optional[str] = None,
     trust_id: Optional[str] = None,
     status: Optional[str] = None,
+    search: Optional[str] = None,
     sort_by: str = "created_at",
     sort_dir: str = "desc",
     limit: int = 100,
-    offset: int = 0
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    total_mode: str = TOTAL_EXACT
 ):
     """Get insurance policies list"""
     try:
@@ -2783,29 +2746,35 @@ async def get_insurance_policies(
         return error_response("AUTH_ERROR", "Authentication required", status_code=401)
     
     try:
-        query = {"user_id": user.user_id, "deleted_at": None}
+        query = {"user_id": user.user_id, **live_filter("insurance_policies")}
         if portfolio_id:
             query["portfolio_id"] = portfolio_id
         if trust_id:
             query["trust_id"] = trust_id
         if status:
             query["status"] = status
+        if search:
+            query.update(search_filter(search))
         
         sort_direction = 1 if sort_dir == "asc" else -1
         
-        policies = await db.insurance_policies.find(query, {"_id": 0}).sort(
-            sort_by, sort_direction
-        ).skip(offset).limit(limit).to_list(limit)
-        
-        total = await db.insurance_policies.count_documents(query)
+        page = await keyset_page(
+            db.insurance_policies, query, mongo_sort_spec(sort_by, sort_direction), "policy_id",
+            limit, cursor=cursor, offset=offset, total=total_mode
+        )
+        policies = page["items"]
+        total = page["total"]
         
         return success_list(
             items=policies,
             total=total,
             sort_by=sort_by,
             sort_dir=sort_dir,
-            empty_state=EMPTY_STATES["insurance"] if total == 0 else None
+            empty_state=EMPTY_STATES["insurance"] if not policies else None,
+            page=page
         )
+    except InvalidCursor as e:
+        return error_response("INVALID_CURSOR", str(e))
     except Exception as e:
         print(f"Error fetching insurance policies: {e}")
         return error_response("FETCH_ERROR", "Failed to fetch insurance policies", status_code=500)
@@ -2824,34 +2793,16 @@ async def get_insurance_summary(
         return error_response("AUTH_ERROR", "Authentication required", status_code=401)
     
     try:
-        query = {"user_id": user.user_id, "deleted_at": None}
+        query = {"user_id": user.user_id, **live_filter("insurance_policies")}
         if portfolio_id:
             query["portfolio_id"] = portfolio_id
         if trust_id:
             query["trust_id"] = trust_id
         
-        policies = await db.insurance_policies.find(query, {"_id": 0}).to_list(1000)
-        
-        active_policies = [p for p in policies if p.get("status") == "active"]
-        total_death_benefit = sum(p.get("death_benefit", 0) for p in active_policies)
-        total_cash_value = sum(p.get("cash_value", 0) for p in active_policies)
-        total_annual_premium = sum(
-            p.get("premium_amount", 0) * (12 if p.get("premium_frequency") == "monthly" else
-                                          4 if p.get("premium_frequency") == "quarterly" else
-                                          2 if p.get("premium_frequency") == "semi_annual" else 1)
-            for p in active_policies
-        )
+        summary = await summarize_insurance(db, query)
+        summary["empty_state"] = EMPTY_STATES["insurance"] if not summary["has_data"] else None
         
-        return success_item({
-            "has_data": len(policies) > 0,
-            "total_policies": len(policies),
-            "active_policies": len(active_policies),
-            "total_death_benefit": total_death_benefit,
-            "total_cash_value": total_cash_value,
-            "total_annual_premium": total_annual_premium,
-            "policies_by_type": {},
-            "empty_state": EMPTY_STATES["insurance"] if len(policies) == 0 else None
-        })
+        return success_item(summary)
     except Exception as e:
         print(f"Error fetching insurance summary: {e}")
         return error_response("FETCH_ERROR", "Failed to fetch insurance summary", status_code=500)
@@ -2913,7 +2864,8 @@ async def create_insurance_policy(data: dict, request: Request):
         doc["created_at"] = datetime.now(timezone.utc).isoformat()
         doc["updated_at"] = datetime.now(timezone.utc).isoformat()
         
-        await db.insurance_policies.insert_one(doc)
+        await db.insurance_policies.insert_one(with_search_tokens(with_rm_sort_key(doc)))
+        await track_insert(db, "insurance_policies", doc)
         
         return success_message("Insurance policy created", {"item": {k: v for k, v in doc.items() if k != "_id"}})
     except Exception as e:
@@ -3008,8 +2960,11 @@ async def update_insurance_policy(policy_id: str, data: dict, request: Request):
         
         update_data = {k: v for k, v in data.items() if k in allowed_fields}
         update_data["updated_at"] = datetime.now(timezone.utc).isoformat()
+        refresh_search_tokens(update_data, policy)
         
-        await db.insurance_policies.update_one(
+        await tracked_update_one(
+            db,
+            "insurance_policies",
             {"policy_id": policy_id},
             {"$set": update_data}
         )
@@ -3060,7 +3015,9 @@ async def delete_insurance_policy(policy_id: str, request: Request):
                     {"$set": {"amended_by_id": None}}
                 )
         
-        await db.insurance_policies.update_one(
+        await tracked_update_one(
+            db,
+            "insurance_policies",
             {"policy_id": policy_id},
             {"$set": {"deleted_at": datetime.now(timezone.utc).isoformat()}}
         )
@@ -3275,7 +3232,8 @@ async def create_insurance_amendment(policy_id: str, data: dict, request: Reques
             "deleted_at": None
         }
         
-        await db.insurance_policies.insert_one(amendment)
+        await db.insurance_policies.insert_one(with_search_tokens(with_rm_sort_key(amendment)))
+        await track_insert(db, "insurance_policies", amendment)
         
         await db.insurance_policies.update_one(
             {"policy_id": policy_id},
@@ -3298,10 +3256,13 @@ async def get_compensation(
     portfolio_id: Optional[str] = None,
     trust_id: Optional[str] = None,
     status: Optional[str] = None,
+    search: Optional[str] = None,
     sort_by: str = "created_at",
     sort_dir: str = "desc",
     limit: int = 100,
-    offset: int = 0
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    total_mode: str = TOTAL_EXACT
 ):
     """Get compensation records list"""
     try:
@@ -3310,37 +3271,35 @@ async def get_compensation(
         return error_response("AUTH_ERROR", "Authentication required", status_code=401)
     
     try:
-        query = {"user_id": user.user_id, "deleted_at": None}
+        query = {"user_id": user.user_id, **live_filter("compensation_entries")}
         if portfolio_id:
             query["portfolio_id"] = portfolio_id
         if trust_id:
             query["trust_id"] = trust_id
         if status:
             query["status"] = status
+        if search:
+            query.update(search_filter(search))
         
         sort_direction = -1 if sort_dir == "desc" else 1
         
-        entries = await db.compensation_entries.find(query, {"_id": 0}).sort(
-            sort_by, sort_direction
-        ).skip(offset).limit(limit).to_list(limit)
-        
-        total = await db.compensation_entries.count_documents(query)
-        
-        if total == 0:
-            return success_list(
-                items=[],
-                total=0,
-                sort_by=sort_by,
-                sort_dir=sort_dir,
-                empty_state=EMPTY_STATES["compensation"]
-            )
+        page = await keyset_page(
+            db.compensation_entries, query, mongo_sort_spec(sort_by, sort_direction), "compensation_id",
+            limit, cursor=cursor, offset=offset, total=total_mode
+        )
+        entries = page["items"]
+        total = page["total"]
         
         return success_list(
             items=entries,
             total=total,
             sort_by=sort_by,
-            sort_dir=sort_dir
+            sort_dir=sort_dir,
+            empty_state=EMPTY_STATES["compensation"] if not entries else None,
+            page=page
         )
+    except InvalidCursor as e:
+        return error_response("INVALID_CURSOR", str(e))
     except Exception as e:
         print(f"Error fetching compensation: {e}")
         return error_response("DB_ERROR", "Failed to fetch compensation entries", status_code=500)
@@ -3360,7 +3319,7 @@ async def get_compensation_summary(
         return error_response("AUTH_ERROR", "Authentication required", status_code=401)
     
     try:
-        query = {"user_id": user.user_id, "deleted_at": None}
+        query = {"user_id": user.user_id, **live_filter("compensation_entries")}
         if portfolio_id:
             query["portfolio_id"] = portfolio_id
         if trust_id:
@@ -3368,48 +3327,11 @@ async def get_compensation_summary(
         if fiscal_year:
             query["fiscal_year"] = fiscal_year
         
-        entries = await db.compensation_entries.find(query, {"_id": 0}).to_list(1000)
-        
-        if not entries:
-            return success_item({
-                "has_data": False,
-                "total_compensation": 0,
-                "total_hours": 0,
-                "entry_count": 0,
-                "by_recipient": [],
-                "by_type": [],
-                "empty_state": EMPTY_STATES["compensation"]
-            })
-        
-        total_compensation = sum(e.get("amount", 0) for e in entries)
-        total_hours = sum(e.get("hours_worked", 0) for e in entries)
-        
-        # Group by recipient
-        by_recipient = {}
-        for e in entries:
-            name = e.get("recipient_name", "Unknown")
-            if name not in by_recipient:
-                by_recipient[name] = {"name": name, "role": e.get("recipient_role", ""), "total": 0, "count": 0}
-            by_recipient[name]["total"] += e.get("amount", 0)
-            by_recipient[name]["count"] += 1
-        
-        # Group by type
-        by_type = {}
-        for e in entries:
-            comp_type = e.get("compensation_type", "other")
-            if comp_type not in by_type:
-                by_type[comp_type] = {"type": comp_type, "total": 0, "count": 0}
-            by_type[comp_type]["total"] += e.get("amount", 0)
-            by_type[comp_type]["count"] += 1
+        summary = await summarize_compensation(db, query)
+        if not summary["has_data"]:
+            summary["empty_state"] = EMPTY_STATES["compensation"]
         
-        return success_item({
-            "has_data": True,
-            "total_compensation": total_compensation,
-            "total_hours": total_hours,
-            "entry_count": len(entries),
-            "by_recipient": list(by_recipient.values()),
-            "by_type": list(by_type.values())
-        })
+        return success_item(summary)
     except Exception as e:
         print(f"Error fetching compensation summary: {e}")
         return error_response("DB_ERROR", "Failed to fetch summary", status_code=500)
@@ -3477,7 +3399,8 @@ async def create_compensation_entry(data: dict, request: Request):
         doc["created_at"] = doc["created_at"].isoformat()
         doc["updated_at"] = doc["updated_at"].isoformat()
         
-        await db.compensation_entries.insert_one(doc)
+        await db.compensation_entries.insert_one(with_search_tokens(with_rm_sort_key(doc)))
+        await track_insert(db, "compensation_entries", doc)
         
         return success_item({k: v for k, v in doc.items() if k != "_id"})
     except Exception as e:
@@ -3576,7 +3499,10 @@ async def update_compensation_entry(compensation_id: str, data: dict, request: R
         
         if update_fields:
             update_fields["updated_at"] = datetime.now(timezone.utc).isoformat()
-            await db.compensation_entries.update_one(
+            refresh_search_tokens(update_fields, entry)
+            await tracked_update_one(
+                db,
+                "compensation_entries",
                 {"compensation_id": compensation_id},
                 {"$set": update_fields}
             )
@@ -3629,7 +3555,9 @@ async def delete_compensation_entry(compensation_id: str, request: Request):
                     {"$set": {"amended_by_id": None}}
                 )
         
-        await db.compensation_entries.update_one(
+        await tracked_update_one(
+            db,
+            "compensation_entries",
             {"compensation_id": compensation_id},
             {"$set": {"deleted_at": datetime.now(timezone.utc).isoformat()}}
         )
@@ -3659,7 +3587,9 @@ async def submit_compensation(compensation_id: str, request: Request):
         if entry.get("status") != "draft":
             return error_response("INVALID_STATUS", "Only draft entries can be submitted", status_code=400)
         
-        await db.compensation_entries.update_one(
+        await tracked_update_one(
+            db,
+            "compensation_entries",
             {"compensation_id": compensation_id},
             {"$set": {
                 "status": "pending_approval",
@@ -3711,7 +3641,9 @@ async def approve_compensation(compensation_id: str, data: dict, request: Reques
         if len(approvals) >= entry.get("approval_threshold", 1):
             new_status = "approved"
         
-        await db.compensation_entries.update_one(
+        await tracked_update_one(
+            db,
+            "compensation_entries",
             {"compensation_id": compensation_id},
             {"$set": {
                 "approvals": approvals,
@@ -3748,7 +3680,9 @@ async def mark_compensation_paid(compensation_id: str, data: dict, request: Requ
         if entry.get("status") != "approved":
             return error_response("INVALID_STATUS", "Only approved entries can be marked as paid", status_code=400)
         
-        await db.compensation_entries.update_one(
+        await tracked_update_one(
+            db,
+            "compensation_entries",
             {"compensation_id": compensation_id},
             {"$set": {
                 "status": "paid",
@@ -3792,7 +3726,9 @@ async def finalize_compensation(compensation_id: str, data: dict, request: Reque
         finalized_at = datetime.now(timezone.utc).isoformat()
         finalized_by = data.get("finalized_by", user.name if hasattr(user, 'name') else "Unknown")
         
-        await db.compensation_entries.update_one(
+        await tracked_update_one(
+            db,
+            "compensation_entries",
             {"compensation_id": compensation_id},
             {"$set": {
                 "status": "finalized",
@@ -3892,7 +3828,8 @@ async def create_compensation_amendment(compensation_id: str, data: dict, reques
             "deleted_at": None
         }
         
-        await db.compensation_entries.insert_one(amendment)
+        await db.compensation_entries.insert_one(with_search_tokens(with_rm_sort_key(amendment)))
+        await track_insert(db, "compensation_entries", amendment)
         
         await db.compensation_entries.update_one(
             {"compensation_id": compensation_id},
@@ -3931,7 +3868,7 @@ async def get_governance_trash(
         if not module or module == "meetings":
             query = {
                 "user_id": user.user_id,
-                "deleted_at": {"$ne": None, "$exists": True}
+                **deleted_filter("meetings")
             }
             if portfolio_id:
                 query["portfolio_id"] = portfolio_id
@@ -3968,11 +3905,13 @@ async def restore_from_trash(item_id: str, request: Request, module: str = Query
     
     try:
         if module == "meetings":
-            result = await db.meetings.update_one(
-                {"meeting_id": item_id, "user_id": user.user_id},
+            restored = await tracked_update_one(
+                db,
+                "meetings",
+                {"meeting_id": item_id, "user_id": user.user_id, "deleted_at": {"$ne": None}},
                 {"$set": {"deleted_at": None, "updated_at": datetime.now(timezone.utc).isoformat()}}
             )
-            if result.modified_count == 0:
+            if restored is None:
                 return error_response("NOT_FOUND", "Item not found in trash", status_code=404)
         else:
             return error_response("INVALID_MODULE", f"Unknown module: {module}")
@@ -4008,142 +3947,90 @@ async def get_governance_status(request: Request):
 
 # ============ ACTIVITY FEED ============
 
+def format_activity(activity_type: str, doc: dict) -> dict:
+    """Signal Feed entry for one governance document"""
+    if activity_type == "meeting":
+        message = "Meeting Finalized" if doc.get("status") == "finalized" else "Meeting Created"
+        detail = f"RM-ID {doc.get('rm_id', 'N/A')}"
+        item_id = doc.get("meeting_id")
+    elif activity_type == "distribution":
+        status_msgs = {
+            "draft": "Distribution Drafted",
+            "pending": "Distribution Pending",
+            "approved": "Distribution Approved",
+            "paid": "Distribution Paid"
+        }
+        message = status_msgs.get(doc.get("status"), "Distribution Logged")
+        detail = f"${doc.get('amount', 0):,.0f} • {doc.get('rm_id', 'N/A')}"
+        item_id = doc.get("distribution_id")
+    elif activity_type == "dispute":
+        status_msgs = {
+            "open": "Dispute Opened",
+            "in_progress": "Dispute In Progress",
+            "resolved": "Dispute Resolved",
+            "closed": "Dispute Closed"
+        }
+        message = status_msgs.get(doc.get("status"), "Dispute Updated")
+        detail = f"{doc.get('title', 'Unknown')} • {doc.get('rm_id', 'N/A')}"
+        item_id = doc.get("dispute_id")
+    elif activity_type == "insurance":
+        status_msgs = {
+            "active": "Policy Active",
+            "pending": "Policy Pending",
+            "lapsed": "Policy Lapsed",
+            "claimed": "Policy Claimed"
+        }
+        message = status_msgs.get(doc.get("status"), "Insurance Updated")
+        detail = f"Benefit ${doc.get('death_benefit', 0):,.0f} • {doc.get('rm_id', 'N/A')}"
+        item_id = doc.get("policy_id")
+    else:
+        status_msgs = {
+            "draft": "Compensation Drafted",
+            "pending_approval": "Compensation Pending",
+            "approved": "Compensation Approved",
+            "paid": "Compensation Paid"
+        }
+        message = status_msgs.get(doc.get("status"), "Compensation Logged")
+        detail = f"${doc.get('amount', 0):,.0f} to {doc.get('recipient_name', 'Unknown')}"
+        item_id = doc.get("compensation_id")
+    
+    return {
+        "id": item_id,
+        "type": activity_type,
+        "message": message,
+        "detail": detail,
+        "timestamp": doc.get("updated_at") or doc.get("created_at"),
+        "rm_id": doc.get("rm_id")
+    }
+
+
 @router.get("/activity-feed")
 async def get_activity_feed(
     request: Request,
     portfolio_id: Optional[str] = None,
-    limit: int = 10
+    limit: int = 10,
+    cursor: Optional[str] = None
 ):
-    """Get recent activity across all governance modules for the Signal Feed"""
+    """
+    Get recent activity across all governance modules for the Signal Feed.
+    Pass the returned next_cursor to fetch the following page.
+    """
     try:
         user = await get_current_user(request)
     except Exception:
         return error_response("AUTH_ERROR", "Authentication required", status_code=401)
     
     try:
-        activities = []
         base_query = {"user_id": user.user_id, "deleted_at": None}
         if portfolio_id:
             base_query["portfolio_id"] = portfolio_id
         
-        # Fetch recent meetings
-        meetings = await db.meetings.find(
-            base_query, {"_id": 0, "meeting_id": 1, "title": 1, "rm_id": 1, "status": 1, "created_at": 1, "updated_at": 1}
-        ).sort("updated_at", -1).limit(limit).to_list(limit)
-        
-        for m in meetings:
-            status_msg = "Meeting Finalized" if m.get("status") == "finalized" else "Meeting Created"
-            activities.append({
-                "id": m.get("meeting_id"),
-                "type": "meeting",
-                "message": status_msg,
-                "detail": f"RM-ID {m.get('rm_id', 'N/A')}",
-                "timestamp": m.get("updated_at") or m.get("created_at"),
-                "rm_id": m.get("rm_id")
-            })
-        
-        # Fetch recent distributions
-        distributions = await db.distributions.find(
-            base_query, {"_id": 0, "distribution_id": 1, "title": 1, "rm_id": 1, "status": 1, "amount": 1, "created_at": 1, "updated_at": 1}
-        ).sort("updated_at", -1).limit(limit).to_list(limit)
-        
-        for d in distributions:
-            status_msgs = {
-                "draft": "Distribution Drafted",
-                "pending": "Distribution Pending",
-                "approved": "Distribution Approved",
-                "paid": "Distribution Paid"
-            }
-            msg = status_msgs.get(d.get("status"), "Distribution Logged")
-            activities.append({
-                "id": d.get("distribution_id"),
-                "type": "distribution",
-                "message": msg,
-                "detail": f"${d.get('amount', 0):,.0f} • {d.get('rm_id', 'N/A')}",
-                "timestamp": d.get("updated_at") or d.get("created_at"),
-                "rm_id": d.get("rm_id")
-            })
-        
-        # Fetch recent disputes
-        disputes = await db.disputes.find(
-            base_query, {"_id": 0, "dispute_id": 1, "title": 1, "rm_id": 1, "status": 1, "created_at": 1, "updated_at": 1}
-        ).sort("updated_at", -1).limit(limit).to_list(limit)
-        
-        for dp in disputes:
-            status_msgs = {
-                "open": "Dispute Opened",
-                "in_progress": "Dispute In Progress",
-                "resolved": "Dispute Resolved",
-                "closed": "Dispute Closed"
-            }
-            msg = status_msgs.get(dp.get("status"), "Dispute Updated")
-            activities.append({
-                "id": dp.get("dispute_id"),
-                "type": "dispute",
-                "message": msg,
-                "detail": f"{dp.get('title', 'Unknown')} • {dp.get('rm_id', 'N/A')}",
-                "timestamp": dp.get("updated_at") or dp.get("created_at"),
-                "rm_id": dp.get("rm_id")
-            })
-        
-        # Fetch recent insurance policies
-        insurance = await db.insurance_policies.find(
-            base_query, {"_id": 0, "policy_id": 1, "title": 1, "rm_id": 1, "status": 1, "death_benefit": 1, "created_at": 1, "updated_at": 1}
-        ).sort("updated_at", -1).limit(limit).to_list(limit)
-        
-        for ins in insurance:
-            status_msgs = {
-                "active": "Policy Active",
-                "pending": "Policy Pending",
-                "lapsed": "Policy Lapsed",
-                "claimed": "Policy Claimed"
-            }
-            msg = status_msgs.get(ins.get("status"), "Insurance Updated")
-            benefit = ins.get("death_benefit", 0)
-            activities.append({
-                "id": ins.get("policy_id"),
-                "type": "insurance",
-                "message": msg,
-                "detail": f"Benefit ${benefit:,.0f} • {ins.get('rm_id', 'N/A')}",
-                "timestamp": ins.get("updated_at") or ins.get("created_at"),
-                "rm_id": ins.get("rm_id")
-            })
-        
-        # Fetch recent compensation entries
-        compensation = await db.compensation_entries.find(
-            base_query, {"_id": 0, "compensation_id": 1, "title": 1, "rm_id": 1, "status": 1, "amount": 1, "recipient_name": 1, "created_at": 1, "updated_at": 1}
-        ).sort("updated_at", -1).limit(limit).to_list(limit)
-        
-        for comp in compensation:
-            status_msgs = {
-                "draft": "Compensation Drafted",
-                "pending_approval": "Compensation Pending",
-                "approved": "Compensation Approved",
-                "paid": "Compensation Paid"
-            }
-            msg = status_msgs.get(comp.get("status"), "Compensation Logged")
-            activities.append({
-                "id": comp.get("compensation_id"),
-                "type": "compensation",
-                "message": msg,
-                "detail": f"${comp.get('amount', 0):,.0f} to {comp.get('recipient_name', 'Unknown')}",
-                "timestamp": comp.get("updated_at") or comp.get("created_at"),
-                "rm_id": comp.get("rm_id")
-            })
-        
-        # Sort all activities by timestamp (most recent first)
-        def parse_timestamp(item):
-            ts = item.get("timestamp", "")
-            if not ts:
-                return datetime.min
-            try:
-                if isinstance(ts, str):
-                    return datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                return ts
-            except:
-                return datetime.min
+        try:
+            page, next_cursor = await fetch_activity_page(db, base_query, limit, cursor)
+        except InvalidCursor as e:
+            return error_response("INVALID_CURSOR", str(e))
         
-        activities.sort(key=parse_timestamp, reverse=True)
+        activities = [format_activity(activity_type, doc) for activity_type, doc in page]
         
         # Format timestamps as relative time
         now = datetime.now(timezone.utc)
@@ -4170,10 +4057,10 @@ async def get_activity_feed(
             else:
                 activity["time"] = "Unknown"
         
-        return success_list(
-            items=activities[:limit],
-            total=len(activities)
-        )
+        response = success_list(items=activities, sort_by="updated_at", sort_dir="desc")
+        response["next_cursor"] = next_cursor
+        response["has_more"] = next_cursor is not None
+        return response
         
     except Exception as e:
         print(f"Error fetching activity feed: {e}")
@@ -16,12 +16,14 @@ from fastapi.responses import JSONResponse
 from typing import Optional
 from datetime import datetime, timezone
 import re
+import uuid
 
 from models.governance_v2 import (
     GovernanceRecord, GovernanceRevision, GovernanceEvent,
     GovernanceAttestation,
     ModuleType, RecordStatus, ChangeType, EventType,
-    RecordCreateRequest, RecordAmendRequest, RevisionUpdateRequest,
+    RecordCreateRequest, RecordBulkImportRequest, RecordBulkTransitionRequest,
+    RecordAmendRequest, RevisionUpdateRequest,
     RecordVoidRequest, AttestationCreateRequest,
     MinutesPayload, DistributionPayload, DisputePayload,
     InsurancePayload, CompensationPayload,
@@ -30,7 +32,21 @@ from models.governance_v2 import (
 from models.rm_subject import (
     RMSubject, SubjectCategory, MODULE_TO_CATEGORY
 )
-from services.lifecycle_engine import lifecycle_engine
+from services.canonical_json import CURRENT_HASH_VERSION
+from services.dashboard_rollups import track_insert, track_insert_many, tracked_update_one
+from services.governance_import import (
+    chunked, find_imported, finish_import_batch, get_import_batch,
+    start_import_batch, write_import_chunk
+)
+from pymongo.errors import DuplicateKeyError
+from services.governance_transitions import (
+    BULK_TRANSITION_MAX_RECORDS, commit_transitions, load_transition_batch
+)
+from services.keyset_pagination import TOTAL_EXACT, InvalidCursor, keyset_page
+from services.record_detail_loader import load_record_detail, parse_includes, resolve_record
+from services.revision_diff import diff_revisions
+from services.lifecycle_engine import LifecycleStatus, lifecycle_engine
+from services.rmid_v2 import MAX_SUBNUMBER, lease_subnumbers
 
 router = APIRouter(prefix="/api/governance/v2", tags=["governance-v2"])
 
@@ -110,6 +126,23 @@ async def allocate_rm_id_from_subject(
     return (rm_id, allocated_sub, result["rm_base"], result["rm_group"], result["title"])
 
 
+async def pick_free_rm_group(portfolio_id: str, rm_base: str) -> int:
+    """Random unused group number for a new subject; ValueError if all 99 are taken."""
+    import random
+    
+    used_groups = await db.rm_subjects.distinct(
+        "rm_group",
+        {"portfolio_id": portfolio_id, "rm_base": rm_base, "deleted_at": None}
+    )
+    used_set = set(used_groups)
+    available = [g for g in range(1, 100) if g not in used_set]
+    
+    if not available:
+        raise ValueError(f"No available group numbers for {rm_base}")
+    
+    return random.choice(available)
+
+
 async def create_new_subject_and_allocate(
     portfolio_id: str,
     user_id: str,
@@ -125,22 +158,8 @@ async def create_new_subject_and_allocate(
     Create a new RM Subject and allocate the first subnumber (.001).
     Returns (subject_id, rm_id, rm_sub, rm_base, rm_group)
     """
-    import random
-    
     rm_base = await get_rm_base_for_portfolio(portfolio_id, user_id)
-    
-    # Get available group number
-    used_groups = await db.rm_subjects.distinct(
-        "rm_group",
-        {"portfolio_id": portfolio_id, "rm_base": rm_base, "deleted_at": None}
-    )
-    used_set = set(used_groups)
-    available = [g for g in range(1, 100) if g not in used_set]
-    
-    if not available:
-        raise ValueError(f"No available group numbers for {rm_base}")
-    
-    rm_group = random.choice(available)
+    rm_group = await pick_free_rm_group(portfolio_id, rm_base)
     
     # Create subject
     subject = RMSubject(
@@ -203,7 +222,7 @@ def serialize_doc(doc: dict) -> dict:
 
 # ============ AUDIT LOG HELPER ============
 
-async def log_event(
+def build_event_doc(
     event_type: EventType,
     record_id: str,
     actor_id: str,
@@ -212,8 +231,8 @@ async def log_event(
     revision_id: str = None,
     actor_name: str = "",
     meta: dict = None
-):
-    """Create an audit log entry"""
+) -> dict:
+    """Build an audit log entry document (without inserting it)"""
     event = GovernanceEvent(
         trust_id=trust_id,
         portfolio_id=portfolio_id,
@@ -227,6 +246,24 @@ async def log_event(
     )
     doc = event.model_dump()
     doc["at"] = doc["at"].isoformat()
+    return doc
+
+
+async def log_event(
+    event_type: EventType,
+    record_id: str,
+    actor_id: str,
+    portfolio_id: str,
+    trust_id: str = None,
+    revision_id: str = None,
+    actor_name: str = "",
+    meta: dict = None
+):
+    """Create an audit log entry"""
+    doc = build_event_doc(
+        event_type, record_id, actor_id, portfolio_id,
+        trust_id=trust_id, revision_id=revision_id, actor_name=actor_name, meta=meta
+    )
     await db.governance_events.insert_one(doc)
     return doc
 
@@ -301,11 +338,14 @@ async def list_records(
     status: Optional[str] = Query(None),
     include_voided: bool = Query(False),
     limit: int = Query(100, ge=1, le=500),
-    offset: int = Query(0, ge=0)
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    total_mode: str = Query(TOTAL_EXACT, description="Total count: exact, estimate, none")
 ):
     """
-    List governance records with filters.
-    Returns records with current revision summary.
+    List governance records with filters, newest first.
+    Returns records with current revision summary. Pass next_cursor back
+    as cursor for the following page.
     """
     try:
         user = await get_current_user(request)
@@ -327,10 +367,11 @@ async def list_records(
         query["status"] = {"$ne": "voided"}
     
     try:
-        total = await db.governance_records.count_documents(query)
-        records = await db.governance_records.find(
-            query, {"_id": 0}
-        ).sort("created_at", -1).skip(offset).limit(limit).to_list(limit)
+        page = await keyset_page(
+            db.governance_records, query, [("created_at", -1)], "id",
+            limit, cursor=cursor, offset=offset, total=total_mode
+        )
+        records = page["items"]
         
         # Enrich with current revision info
         items = []
@@ -360,11 +401,16 @@ async def list_records(
         
         return success_response({
             "items": items,
-            "total": total,
+            "total": page["total"],
+            "total_is_estimate": page["total_is_estimate"],
             "limit": limit,
-            "offset": offset
+            "offset": offset,
+            "next_cursor": page["next_cursor"],
+            "has_more": page["has_more"]
         })
         
+    except InvalidCursor as e:
+        return error_response("INVALID_CURSOR", str(e))
     except Exception as e:
         print(f"Error listing records: {e}")
         return error_response("DB_ERROR", "Failed to list records", {"error": str(e)}, status_code=500)
@@ -376,27 +422,16 @@ async def resolve_record_by_id_or_rm(id_or_rm: str, user_id: str) -> dict:
     """
     Resolve a record by either its `id` or `rm_id`.
     
-    Logic:
-    1. First try exact match on `id` field
-    2. If not found, try match on `rm_id` field
+    Logic (one query):
+    1. Exact match on `id` field wins
+    2. Otherwise a match on `rm_id` field
     
     Returns: (record, resolver_path) or (None, None)
     """
-    # First try by record ID
-    record = await db.governance_records.find_one(
-        {"id": id_or_rm, "user_id": user_id}, {"_id": 0}
-    )
+    record, resolver_path = await resolve_record(db, id_or_rm, user_id)
     
     if record:
-        return record, "id"
-    
-    # Try by RM-ID
-    record = await db.governance_records.find_one(
-        {"rm_id": id_or_rm, "user_id": user_id}, {"_id": 0}
-    )
-    
-    if record:
-        return record, "rm_id"
+        return record, resolver_path
     
     # Log the failed resolution for debugging
     print(f"[RESOLVE_FAIL] Could not find record: id_or_rm={id_or_rm}, user_id={user_id}")
@@ -405,10 +440,19 @@ async def resolve_record_by_id_or_rm(id_or_rm: str, user_id: str) -> dict:
 
 
 @router.get("/records/{record_id}")
-async def get_record(record_id: str, request: Request):
+async def get_record(
+    record_id: str,
+    request: Request,
+    include: Optional[str] = Query(
+        None,
+        description="Comma-separated sub-resources: current_revision, revision_count, "
+                    "attestations, attachments, events, revisions (default: the first four)"
+    )
+):
     """
     Get a single record with current revision, attestations, and attachments.
-    Accepts either record `id` or `rm_id` for lookup.
+    Accepts either record `id` or `rm_id` for lookup. `include` limits the
+    response to the sub-resources the view renders.
     """
     try:
         user = await get_current_user(request)
@@ -416,46 +460,29 @@ async def get_record(record_id: str, request: Request):
         return error_response("AUTH_ERROR", "Authentication required", status_code=401)
     
     try:
-        # Resolve by id or rm_id
-        record, resolver_path = await resolve_record_by_id_or_rm(record_id, user.user_id)
+        includes = parse_includes(include)
+    except ValueError as e:
+        return error_response("VALIDATION_ERROR", str(e))
+    
+    try:
+        # Resolve by id or rm_id, then fetch the requested sub-resources concurrently
+        detail = await load_record_detail(db, record_id, user.user_id, includes)
         
-        if not record:
+        if not detail:
             print(f"[GET_RECORD] NOT_FOUND: record_id={record_id}, user_id={user.user_id}")
             return error_response("NOT_FOUND", "Record not found", status_code=404)
         
-        # Get current revision
-        current_revision = None
-        if record.get("current_revision_id"):
-            current_revision = await db.governance_revisions.find_one(
-                {"id": record["current_revision_id"]}, {"_id": 0}
-            )
-        
-        # Count all revisions
-        revision_count = await db.governance_revisions.count_documents(
-            {"record_id": record_id}
-        )
-        
-        # Get attestations for current revision
-        attestations = []
-        if current_revision:
-            attestations = await db.governance_attestations.find(
-                {"revision_id": current_revision["id"]}, {"_id": 0}
-            ).to_list(50)
+        data = {"record": serialize_doc(detail["record"])}
+        if "current_revision" in detail:
+            current_revision = detail["current_revision"]
+            data["current_revision"] = serialize_doc(current_revision) if current_revision else None
+        if "revision_count" in detail:
+            data["revision_count"] = detail["revision_count"]
+        for name in ("attestations", "attachments", "events", "revisions"):
+            if name in detail:
+                data[name] = [serialize_doc(doc) for doc in detail[name]]
         
-        # Get attachments for current revision
-        attachments = []
-        if current_revision:
-            attachments = await db.governance_attachments.find(
-                {"revision_id": current_revision["id"]}, {"_id": 0}
-            ).to_list(100)
-        
-        return success_response({
-            "record": serialize_doc(record),
-            "current_revision": serialize_doc(current_revision) if current_revision else None,
-            "revision_count": revision_count,
-            "attestations": [serialize_doc(a) for a in attestations],
-            "attachments": [serialize_doc(a) for a in attachments]
-        })
+        return success_response(data)
         
     except Exception as e:
         print(f"Error getting record: {e}")
@@ -712,6 +739,7 @@ async def create_record(request: Request):
         revision_doc["created_at"] = revision_doc["created_at"].isoformat()
         
         await db.governance_records.insert_one(record_doc)
+        await track_insert(db, "governance_records", record_doc)
         print(f"[CREATE_RECORD] Record inserted: {record.id}")
         
         await db.governance_revisions.insert_one(revision_doc)
@@ -746,6 +774,404 @@ async def create_record(request: Request):
         return error_response("CREATE_ERROR", "Failed to create record", {"error": str(e)}, status_code=500)
 
 
+# ============ BULK IMPORT ENDPOINTS ============
+
+BULK_IMPORT_MAX_ITEMS = 5000
+
+IMPORT_THREAD_ATTEMPTS = 5
+
+
+def bulk_item_error(index: int, ref: str, code: str, message: str) -> dict:
+    return {"index": index, "client_ref": ref, "status": "error", "error": {"code": code, "message": message}}
+
+
+async def create_import_thread(
+    portfolio_id: str,
+    user_id: str,
+    trust_id: str,
+    module_type: ModuleType,
+    thread_no: int,
+    created_by: str
+):
+    """
+    Open import thread number `thread_no` for a module's legacy items.
+    Returns False if a concurrent import opened it (or took the group) first.
+    """
+    _, subject_name = MODULE_SUBJECT_CODES.get(module_type, ("00", "General"))
+    rm_base = await get_rm_base_for_portfolio(portfolio_id, user_id)
+    subject = RMSubject(
+        trust_id=trust_id,
+        portfolio_id=portfolio_id,
+        user_id=user_id,
+        rm_base=rm_base,
+        rm_group=await pick_free_rm_group(portfolio_id, rm_base),
+        title=f"{subject_name} (Imported)" if thread_no == 1 else f"{subject_name} (Imported {thread_no})",
+        category=MODULE_TO_CATEGORY.get(module_type.value, SubjectCategory.MISC),
+        next_sub=1,
+        created_by=created_by
+    )
+    
+    doc = subject.model_dump()
+    doc["created_at"] = doc["created_at"].isoformat()
+    doc["updated_at"] = doc["updated_at"].isoformat()
+    doc["import_module"] = module_type.value
+    doc["import_thread_no"] = thread_no
+    
+    try:
+        await db.rm_subjects.insert_one(doc)
+    except DuplicateKeyError:
+        return False
+    return True
+
+
+async def lease_import_subnumbers(
+    portfolio_id: str,
+    user_id: str,
+    trust_id: str,
+    module_type: ModuleType,
+    count: int,
+    created_by: str
+) -> list:
+    """
+    Lease `count` subnumbers for a module's legacy import items.
+    
+    Each (portfolio, module) keeps numbered import threads. Every import,
+    and every resume of a batch, fills the newest one; the next thread is
+    opened only once it reaches .999, so repeated imports don't use up the
+    portfolio's group numbers. Returns the leases in order.
+    """
+    thread_query = {"portfolio_id": portfolio_id, "user_id": user_id, "import_module": module_type.value}
+    leases = []
+    remaining = count
+    failures = 0
+    try:
+        while remaining > 0:
+            if failures >= IMPORT_THREAD_ATTEMPTS:
+                raise ValueError(f"Could not reserve RM-IDs for imported {module_type.value} records")
+            
+            thread = await db.rm_subjects.find_one(thread_query, {"_id": 0}, sort=[("import_thread_no", -1)])
+            room = 0
+            if thread and thread.get("deleted_at") is None:
+                room = MAX_SUBNUMBER + 1 - thread["next_sub"]
+            
+            if room <= 0:
+                opened = await create_import_thread(
+                    portfolio_id, user_id, trust_id, module_type,
+                    (thread or {}).get("import_thread_no", 0) + 1, created_by
+                )
+                failures += 0 if opened else 1
+                continue
+            
+            try:
+                lease = await lease_subnumbers(
+                    db.rm_subjects,
+                    {"id": thread["id"], "user_id": user_id, "deleted_at": None},
+                    min(remaining, room)
+                )
+            except ValueError:
+                # A concurrent import filled the thread since we read it
+                lease = None
+            if not lease:
+                failures += 1
+                continue
+            leases.append(lease)
+            remaining -= lease.remaining
+    except ValueError:
+        for lease in leases:
+            await lease.release(db, reason="bulk_import_unused")
+        raise
+    return leases
+
+
+async def allocate_bulk_rm_ids(items: list, user, created_by: str) -> tuple:
+    """
+    Allocate RM-IDs for validated import items in blocks.
+    
+    - Items linked to an existing subject share one subnumber lease per
+      subject (a single $inc reserves the whole block).
+    - create_new_subject items each spawn their own thread.
+    - Legacy items (no subject given) lease consecutive subnumbers from
+      their module's import thread (see lease_import_subnumbers), so every
+      item gets its own RM-ID.
+    
+    Returns ({index: (rm_id, rm_subject_id, rm_sub)}, {index: error}, leases)
+    """
+    allocated = {}
+    errors = {}
+    leases = []
+    
+    by_subject = {}
+    legacy_groups = {}
+    for item in items:
+        data = item["data"]
+        if data.rm_subject_id:
+            by_subject.setdefault(data.rm_subject_id, []).append(item)
+        elif data.create_new_subject:
+            try:
+                rm_subject_id, rm_id, rm_sub, _, _ = await create_new_subject_and_allocate(
+                    portfolio_id=data.portfolio_id,
+                    user_id=user.user_id,
+                    trust_id=data.trust_id,
+                    title=data.new_subject_title or data.title,
+                    category=MODULE_TO_CATEGORY.get(data.module_type.value, SubjectCategory.MISC),
+                    party_id=data.new_subject_party_id,
+                    party_name=data.new_subject_party_name,
+                    external_ref=data.new_subject_external_ref,
+                    created_by=created_by
+                )
+                allocated[item["index"]] = (rm_id, rm_subject_id, rm_sub)
+            except ValueError as e:
+                errors[item["index"]] = ("SUBJECT_ERROR", str(e))
+        else:
+            legacy_groups.setdefault((data.portfolio_id, data.module_type), []).append(item)
+    
+    for (portfolio_id, module_type), group_items in legacy_groups.items():
+        try:
+            group_leases = await lease_import_subnumbers(
+                portfolio_id, user.user_id, group_items[0]["data"].trust_id,
+                module_type, len(group_items), created_by
+            )
+        except ValueError as e:
+            for item in group_items:
+                errors[item["index"]] = ("SUBJECT_ERROR", str(e))
+            continue
+        leases.extend(group_leases)
+        subs = [(lease, lease.take()) for lease in group_leases for _ in range(lease.remaining)]
+        for item, (lease, sub) in zip(group_items, subs):
+            allocated[item["index"]] = (
+                format_rm_id(lease.doc["rm_base"], lease.doc["rm_group"], sub), lease.doc["id"], sub
+            )
+    
+    for subject_id, subject_items in by_subject.items():
+        try:
+            lease = await lease_subnumbers(
+                db.rm_subjects,
+                {"id": subject_id, "user_id": user.user_id, "deleted_at": None},
+                len(subject_items)
+            )
+            if not lease:
+                raise ValueError(f"Subject {subject_id} not found")
+        except ValueError as e:
+            for item in subject_items:
+                errors[item["index"]] = ("SUBJECT_ERROR", str(e))
+            continue
+        leases.append(lease)
+        for item in subject_items:
+            sub = lease.take()
+            allocated[item["index"]] = (
+                format_rm_id(lease.doc["rm_base"], lease.doc["rm_group"], sub), subject_id, sub
+            )
+    
+    return allocated, errors, leases
+
+
+def build_import_entry(item: dict, allocation: tuple, user, created_by: str, batch_id: str) -> dict:
+    """Record, initial revision and CREATED event docs for one import item"""
+    data = item["data"]
+    rm_id, rm_subject_id, rm_sub = allocation
+    
+    record = GovernanceRecord(
+        trust_id=data.trust_id,
+        portfolio_id=data.portfolio_id,
+        user_id=user.user_id,
+        module_type=data.module_type,
+        title=data.title,
+        rm_id=rm_id,
+        rm_subject_id=rm_subject_id,
+        rm_sub=rm_sub,
+        created_by=created_by
+    )
+    revision = GovernanceRevision(
+        record_id=record.id,
+        version=1,
+        change_type=ChangeType.INITIAL,
+        payload_json=item["payload"],
+        created_by=created_by
+    )
+    record.current_revision_id = revision.id
+    
+    record_doc = record.model_dump()
+    record_doc["created_at"] = record_doc["created_at"].isoformat()
+    record_doc["import_batch_id"] = batch_id
+    record_doc["import_ref"] = item["ref"]
+    
+    revision_doc = revision.model_dump()
+    revision_doc["created_at"] = revision_doc["created_at"].isoformat()
+    
+    event_doc = build_event_doc(
+        event_type=EventType.CREATED,
+        record_id=record.id,
+        actor_id=user.user_id,
+        portfolio_id=data.portfolio_id,
+        trust_id=data.trust_id,
+        revision_id=revision.id,
+        actor_name=created_by,
+        meta={
+            "module_type": data.module_type.value,
+            "title": data.title,
+            "rm_subject_id": rm_subject_id,
+            "rm_sub": rm_sub,
+            "rm_id": rm_id,
+            "import_batch_id": batch_id
+        }
+    )
+    return {"item": item, "record": record_doc, "revision": revision_doc, "event": event_doc}
+
+
+@router.post("/records/bulk")
+async def bulk_import_records(request: Request):
+    """
+    Create many governance records (each with a draft v1 revision) in one call.
+    
+    Body: {batch_id?, portfolio_id?, trust_id?, dry_run?, items: [
+        {client_ref?, module_type, title, payload_json, rm_subject_id?, create_new_subject?, ...}
+    ]}
+    
+    Every item is validated first and reported individually; valid items are
+    allocated RM-IDs in blocks and written in chunks. Items are identified by
+    client_ref (default: their index), so posting the same batch_id again
+    resumes an interrupted import without duplicating records.
+    """
+    try:
+        user = await get_current_user(request)
+    except Exception:
+        return error_response("AUTH_ERROR", "Authentication required", status_code=401)
+    
+    try:
+        body = await request.json()
+        data = RecordBulkImportRequest(**body)
+    except Exception as e:
+        return error_response("VALIDATION_ERROR", f"Invalid request fields: {str(e)}", status_code=422)
+    
+    if not data.items:
+        return error_response("VALIDATION_ERROR", "No items to import", status_code=422)
+    if len(data.items) > BULK_IMPORT_MAX_ITEMS:
+        return error_response(
+            "VALIDATION_ERROR",
+            f"Too many items ({len(data.items)}); the limit is {BULK_IMPORT_MAX_ITEMS} per batch",
+            status_code=422
+        )
+    
+    batch_id = data.batch_id or f"imp_{uuid.uuid4().hex[:12]}"
+    created_by = user.name if hasattr(user, 'name') else user.user_id
+    
+    try:
+        results = {}
+        imported = await find_imported(db, user.user_id, batch_id) if data.batch_id else {}
+        
+        # Validate every item up front
+        valid = []
+        seen_refs = set()
+        for index, raw in enumerate(data.items):
+            raw = dict(raw) if isinstance(raw, dict) else {}
+            ref = str(raw.pop("client_ref", None) or index)
+            if ref in seen_refs:
+                results[index] = bulk_item_error(index, ref, "DUPLICATE_REF", f"client_ref '{ref}' appears more than once")
+                continue
+            seen_refs.add(ref)
+            
+            if ref in imported:
+                results[index] = {
+                    "index": index, "client_ref": ref, "status": "skipped",
+                    "record_id": imported[ref]["id"], "rm_id": imported[ref].get("rm_id", "")
+                }
+                continue
+            
+            raw.setdefault("portfolio_id", data.portfolio_id)
+            raw.setdefault("trust_id", data.trust_id)
+            try:
+                item_data = RecordCreateRequest(**raw)
+            except Exception as e:
+                results[index] = bulk_item_error(index, ref, "VALIDATION_ERROR", f"Invalid request fields: {str(e)}")
+                continue
+            
+            is_valid, error_msg, normalized_payload = validate_payload(item_data.module_type, item_data.payload_json)
+            if not is_valid:
+                results[index] = bulk_item_error(index, ref, "VALIDATION_ERROR", f"Invalid payload: {error_msg}")
+                continue
+            
+            valid.append({"index": index, "ref": ref, "data": item_data, "payload": normalized_payload})
+        
+        if data.dry_run:
+            for item in valid:
+                results[item["index"]] = {"index": item["index"], "client_ref": item["ref"], "status": "valid"}
+        else:
+            await start_import_batch(db, user.user_id, batch_id, data.portfolio_id, len(data.items))
+            
+            allocated, allocation_errors, leases = await allocate_bulk_rm_ids(valid, user, created_by)
+            refs = {item["index"]: item["ref"] for item in valid}
+            for index, (code, message) in allocation_errors.items():
+                results[index] = bulk_item_error(index, refs[index], code, message)
+            
+            entries = [
+                build_import_entry(item, allocated[item["index"]], user, created_by, batch_id)
+                for item in valid if item["index"] in allocated
+            ]
+            
+            for chunk in chunked(entries):
+                failed = await write_import_chunk(db, chunk)
+                for position, entry in enumerate(chunk):
+                    item = entry["item"]
+                    if position in failed:
+                        results[item["index"]] = bulk_item_error(
+                            item["index"], item["ref"], failed[position]["code"], failed[position]["message"]
+                        )
+                    else:
+                        results[item["index"]] = {
+                            "index": item["index"], "client_ref": item["ref"], "status": "created",
+                            "record_id": entry["record"]["id"], "rm_id": entry["record"]["rm_id"]
+                        }
+                await track_insert_many(
+                    db, "governance_records",
+                    [entry["record"] for position, entry in enumerate(chunk) if position not in failed]
+                )
+            
+            for lease in leases:
+                await lease.release(db, reason="bulk_import_unused")
+        
+        items = [results[index] for index in sorted(results)]
+        counts = {
+            status: len([r for r in items if r["status"] == status])
+            for status in ("created", "skipped", "valid")
+        }
+        counts["failed"] = len([r for r in items if r["status"] == "error"])
+        
+        status = "validated"
+        if not data.dry_run:
+            status = await finish_import_batch(db, user.user_id, batch_id, counts)
+        
+        return success_response({
+            "batch_id": batch_id,
+            "status": status,
+            "dry_run": data.dry_run,
+            "total": len(items),
+            "counts": counts,
+            "items": items
+        }, message=f"Imported {counts['created']} of {len(items)} records")
+        
+    except Exception as e:
+        print(f"Error importing records: {e}")
+        return error_response("IMPORT_ERROR", "Failed to import records", {"error": str(e), "batch_id": batch_id}, status_code=500)
+
+
+@router.get("/records/bulk/{batch_id}")
+async def get_bulk_import_batch(batch_id: str, request: Request):
+    """Status of a bulk import batch (for resuming an interrupted import)"""
+    try:
+        user = await get_current_user(request)
+    except Exception:
+        return error_response("AUTH_ERROR", "Authentication required", status_code=401)
+    
+    try:
+        batch = await get_import_batch(db, user.user_id, batch_id)
+        if not batch:
+            return error_response("NOT_FOUND", "Import batch not found", status_code=404)
+        return success_response(batch)
+    except Exception as e:
+        print(f"Error getting import batch: {e}")
+        return error_response("DB_ERROR", "Failed to get import batch", {"error": str(e)}, status_code=500)
+
+
 # ============ UPDATE (PUT) ENDPOINT ============
 
 @router.put("/records/{record_id}")
@@ -947,7 +1373,8 @@ async def finalize_record(record_id: str, request: Request):
             created_at=revision.get("created_at", ""),
             created_by=revision.get("created_by", ""),
             version=revision.get("version", 1),
-            parent_hash=revision.get("parent_hash")
+            parent_hash=revision.get("parent_hash"),
+            hash_version=CURRENT_HASH_VERSION
         )
         
         # Update revision
@@ -956,7 +1383,8 @@ async def finalize_record(record_id: str, request: Request):
             {"$set": {
                 "finalized_at": finalized_at.isoformat(),
                 "finalized_by": finalized_by,
-                "content_hash": content_hash
+                "content_hash": content_hash,
+                "hash_version": CURRENT_HASH_VERSION
             }}
         )
         
@@ -972,7 +1400,8 @@ async def finalize_record(record_id: str, request: Request):
             record_update["finalized_at"] = finalized_at.isoformat()
             record_update["finalized_by"] = finalized_by
         
-        await db.governance_records.update_one(
+        await tracked_update_one(
+            db, "governance_records",
             {"id": actual_id},
             {"$set": record_update}
         )
@@ -1080,7 +1509,8 @@ async def create_amendment(record_id: str, data: RecordAmendRequest, request: Re
         await db.governance_revisions.insert_one(revision_doc)
         
         # Update record to point to new draft
-        await db.governance_records.update_one(
+        await tracked_update_one(
+            db, "governance_records",
             {"id": actual_id},
             {"$set": {
                 "current_revision_id": new_revision.id,
@@ -1251,7 +1681,8 @@ async def finalize_amendment(revision_id: str, request: Request):
             created_at=revision.get("created_at", ""),
             created_by=revision.get("created_by", ""),
             version=revision.get("version", 1),
-            parent_hash=revision.get("parent_hash")
+            parent_hash=revision.get("parent_hash"),
+            hash_version=CURRENT_HASH_VERSION
         )
         
         # Update revision
@@ -1260,12 +1691,14 @@ async def finalize_amendment(revision_id: str, request: Request):
             {"$set": {
                 "finalized_at": finalized_at.isoformat(),
                 "finalized_by": finalized_by,
-                "content_hash": content_hash
+                "content_hash": content_hash,
+                "hash_version": CURRENT_HASH_VERSION
             }}
         )
         
         # Update record
-        await db.governance_records.update_one(
+        await tracked_update_one(
+            db, "governance_records",
             {"id": record["id"]},
             {"$set": {
                 "current_revision_id": revision_id,
@@ -1336,7 +1769,8 @@ async def void_record(record_id: str, data: RecordVoidRequest, request: Request)
         voided_at = datetime.now(timezone.utc)
         voided_by = user.name if hasattr(user, 'name') else user.user_id
         
-        await db.governance_records.update_one(
+        await tracked_update_one(
+            db, "governance_records",
             {"id": actual_id},
             {"$set": {
                 "status": RecordStatus.VOIDED.value,
@@ -1368,6 +1802,205 @@ async def void_record(record_id: str, data: RecordVoidRequest, request: Request)
         return error_response("VOID_ERROR", "Failed to void record", {"error": str(e)}, status_code=500)
 
 
+# ============ BULK TRANSITION ENDPOINT ============
+
+def plan_transition(record: dict, revision: Optional[dict], target: str, reason: str, user, actor_name: str, now: str):
+    """
+    Validate one record's transition to target and build its write plan.
+    Returns (plan, None) or (None, (code, message, details)).
+    
+    Mirrors the single-record endpoints: finalize runs validate_finalization
+    and seals the current revision; void only requires the record not be
+    voided yet (as /void does); other targets follow LIFECYCLE_TRANSITIONS.
+    """
+    module_type = record.get("module_type", "minutes")
+    current_status = record.get("status", "draft")
+    payload = (revision or {}).get("payload_json", {})
+    revision_set = None
+    
+    if target == "amended":
+        return None, ("AMENDMENT_REQUIRED", "Use amend to create an amendment revision", None)
+    
+    if target == RecordStatus.FINALIZED.value:
+        if not revision:
+            return None, ("NO_REVISION", "Record has no revision to finalize", None)
+        if revision.get("finalized_at"):
+            return None, ("ALREADY_FINALIZED", "This revision is already finalized. Use amend to create a new revision.", None)
+        validation = lifecycle_engine.validate_finalization(
+            module_type=module_type, payload=payload, current_status=current_status
+        )
+        if not validation.can_finalize:
+            return None, ("VALIDATION_FAILED", "Cannot finalize record", {
+                "errors": validation.errors,
+                "warnings": validation.warnings,
+                "missing_required": validation.missing_required
+            })
+        content_hash = compute_content_hash(
+            payload_json=payload,
+            created_at=revision.get("created_at", ""),
+            created_by=revision.get("created_by", ""),
+            version=revision.get("version", 1),
+            parent_hash=revision.get("parent_hash"),
+            hash_version=CURRENT_HASH_VERSION
+        )
+        revision_set = {
+            "finalized_at": now,
+            "finalized_by": actor_name,
+            "content_hash": content_hash,
+            "hash_version": CURRENT_HASH_VERSION
+        }
+        record_set = {"status": target}
+        if not record.get("finalized_at"):
+            record_set["finalized_at"] = now
+            record_set["finalized_by"] = actor_name
+        event_type = EventType.FINALIZED
+        meta = {"version": revision.get("version", 1), "content_hash": content_hash}
+    
+    elif target == RecordStatus.VOIDED.value:
+        if current_status == RecordStatus.VOIDED.value:
+            return None, ("ALREADY_VOIDED", "Record is already voided", None)
+        if not reason:
+            return None, ("VALIDATION_ERROR", "Void reason is required", None)
+        record_set = {"status": target, "voided_at": now, "voided_by": actor_name, "void_reason": reason}
+        event_type = EventType.VOIDED
+        meta = {"void_reason": reason}
+    
+    else:
+        transition = lifecycle_engine.can_transition(current_status, target, module_type, payload)
+        if not transition.allowed:
+            return None, ("INVALID_TRANSITION", "; ".join(transition.errors), {"warnings": transition.warnings})
+        record_set = {"status": target}
+        event_type = EventType.STATUS_CHANGED
+        meta = {"from_status": current_status, "to_status": target}
+        if reason:
+            meta["reason"] = reason
+    
+    meta["bulk"] = True
+    plan = {
+        "record": record,
+        "record_set": record_set,
+        "revision_id": revision["id"] if revision else None,
+        "revision_set": revision_set,
+        "event": build_event_doc(
+            event_type=event_type,
+            record_id=record["id"],
+            actor_id=user.user_id,
+            portfolio_id=record.get("portfolio_id", ""),
+            trust_id=record.get("trust_id"),
+            revision_id=revision["id"] if revision else None,
+            actor_name=actor_name,
+            meta=meta
+        )
+    }
+    return plan, None
+
+
+@router.post("/records/bulk/transition")
+async def bulk_transition_records(data: RecordBulkTransitionRequest, request: Request):
+    """
+    Move many records to one lifecycle status in a single call.
+    Accepts record `id`s or `rm_id`s.
+    
+    Every record is validated with the lifecycle engine (the same checks as
+    the single-record endpoints) and reported individually; valid records
+    are committed together. A record whose status changes between
+    validation and the write is reported as CONFLICT and left untouched.
+    """
+    try:
+        user = await get_current_user(request)
+    except Exception:
+        return error_response("AUTH_ERROR", "Authentication required", status_code=401)
+    
+    record_ids = list(dict.fromkeys(data.record_ids))
+    if not record_ids:
+        return error_response("VALIDATION_ERROR", "No records to transition", status_code=422)
+    if len(record_ids) > BULK_TRANSITION_MAX_RECORDS:
+        return error_response(
+            "VALIDATION_ERROR",
+            f"Too many records ({len(record_ids)}); the limit is {BULK_TRANSITION_MAX_RECORDS} per call",
+            status_code=422
+        )
+    
+    target = data.target_status.strip().lower()
+    if target not in [s.value for s in LifecycleStatus]:
+        return error_response("VALIDATION_ERROR", f"Invalid target status: {data.target_status}", status_code=422)
+    reason = (data.reason or "").strip()
+    
+    try:
+        records, revisions = await load_transition_batch(db, user.user_id, record_ids)
+        
+        now = datetime.now(timezone.utc).isoformat()
+        actor_name = user.name if hasattr(user, 'name') else user.user_id
+        results = {}
+        plans = []
+        planned_ids = set()
+        for requested in record_ids:
+            record = records.get(requested)
+            if not record:
+                results[requested] = {"status": "error", "error": {"code": "NOT_FOUND", "message": "Record not found"}}
+                continue
+            if record["id"] in planned_ids:
+                results[requested] = {
+                    "status": "error", "record_id": record["id"],
+                    "error": {"code": "DUPLICATE", "message": "Record appears more than once in this request"}
+                }
+                continue
+            planned_ids.add(record["id"])
+            
+            plan, error = plan_transition(
+                record, revisions.get(record.get("current_revision_id")), target, reason, user, actor_name, now
+            )
+            if error:
+                code, message, details = error
+                error_body = {"code": code, "message": message}
+                if details:
+                    error_body["details"] = details
+                results[requested] = {"status": "error", "record_id": record["id"], "error": error_body}
+                continue
+            plans.append((requested, plan))
+        
+        conflicted = set()
+        if not data.dry_run:
+            conflicted = await commit_transitions(db, [plan for _, plan in plans])
+        
+        for requested, plan in plans:
+            record = plan["record"]
+            item = {
+                "status": "valid" if data.dry_run else "transitioned",
+                "record_id": record["id"],
+                "rm_id": record.get("rm_id", ""),
+                "from_status": record.get("status", "draft"),
+                "to_status": target
+            }
+            if plan["revision_set"]:
+                item["content_hash"] = plan["revision_set"]["content_hash"]
+            if record["id"] in conflicted:
+                item = {
+                    "status": "error", "record_id": record["id"],
+                    "error": {"code": "CONFLICT", "message": "Record was modified concurrently; retry"}
+                }
+            results[requested] = item
+        
+        items = [{"requested_id": requested, **results[requested]} for requested in record_ids]
+        counts = {
+            "transitioned": len([i for i in items if i["status"] == "transitioned"]),
+            "valid": len([i for i in items if i["status"] == "valid"]),
+            "failed": len([i for i in items if i["status"] == "error"])
+        }
+        
+        return success_response({
+            "target_status": target,
+            "dry_run": data.dry_run,
+            "total": len(items),
+            "counts": counts,
+            "items": items
+        }, message=f"Transitioned {counts['transitioned']} of {len(items)} records to {target}")
+        
+    except Exception as e:
+        print(f"Error transitioning records: {e}")
+        return error_response("TRANSITION_ERROR", "Failed to transition records", {"error": str(e)}, status_code=500)
+
+
 # ============ ATTESTATION ENDPOINT ============
 
 @router.post("/revisions/{revision_id}/attest")
@@ -1478,10 +2111,16 @@ async def get_record_events(record_id: str, request: Request, limit: int = Query
 # ============ DIFF ENDPOINT ============
 
 @router.get("/revisions/{revision_id}/diff")
-async def get_revision_diff(revision_id: str, request: Request, compare_to: Optional[str] = Query(None)):
+async def get_revision_diff(
+    revision_id: str,
+    request: Request,
+    compare_to: Optional[str] = Query(None),
+    include_payloads: bool = Query(False, description="Also return both full payloads")
+):
     """
-    Get diff between two revisions.
+    Get a structural diff between two revisions as a compact patch.
     If compare_to is not provided, compares to parent revision.
+    Diffs between finalized revisions are cached.
     """
     try:
         user = await get_current_user(request)
@@ -1512,36 +2151,30 @@ async def get_revision_diff(revision_id: str, request: Request, compare_to: Opti
                 {"id": revision["parent_revision_id"]}, {"_id": 0}
             )
         
-        # Compute simple key-based diff
-        current_payload = revision.get("payload_json", {})
-        parent_payload = compare_revision.get("payload_json", {}) if compare_revision else {}
-        
-        changes = []
-        all_keys = set(current_payload.keys()) | set(parent_payload.keys())
+        # Only compare against revisions the user owns
+        if compare_revision and compare_revision.get("record_id") != revision["record_id"]:
+            compare_record = await db.governance_records.find_one(
+                {"id": compare_revision.get("record_id"), "user_id": user.user_id}, {"_id": 1}
+            )
+            if not compare_record:
+                return error_response("NOT_FOUND", "Comparison revision not found", status_code=404)
         
-        for key in all_keys:
-            old_val = parent_payload.get(key)
-            new_val = current_payload.get(key)
-            
-            if old_val != new_val:
-                changes.append({
-                    "field": key,
-                    "old_value": old_val,
-                    "new_value": new_val,
-                    "type": "modified" if key in parent_payload and key in current_payload else (
-                        "added" if key not in parent_payload else "removed"
-                    )
-                })
+        diff = await diff_revisions(db, revision, compare_revision)
         
-        return success_response({
+        data = {
             "revision_id": revision_id,
             "revision_version": revision.get("version", 1),
             "compare_to_id": compare_revision["id"] if compare_revision else None,
             "compare_to_version": compare_revision.get("version") if compare_revision else None,
-            "changes": changes,
-            "before_payload": parent_payload,
-            "after_payload": current_payload
-        })
+            "changes": diff["changes"],
+            "summary": diff["summary"],
+            "cached": diff["cached"]
+        }
+        if include_payloads:
+            data["before_payload"] = compare_revision.get("payload_json", {}) if compare_revision else {}
+            data["after_payload"] = revision.get("payload_json", {})
+        
+        return success_response(data)
         
     except Exception as e:
         print(f"Error getting diff: {e}")
@@ -8,7 +8,9 @@ from fastapi import APIRouter, Request, HTTPException, Query
 from fastapi.responses import StreamingResponse
 from datetime import datetime, timezone
 from services.health_scanner import TrustHealthScanner, get_health_history, AuditReadinessChecker
-from services.health_scanner_v2 import TrustHealthScannerV2, get_default_v2_ruleset
+from services.health_scanner_v2 import TrustHealthScannerV2, get_default_v2_ruleset, invalidate_v2_ruleset_cache
+from services.health_rollups import resolve_granularity
+from services.dashboard_rollups import ROLLUP_FIELDS, track_many
 import json
 import io
 
@@ -216,6 +218,8 @@ async def update_v2_ruleset(request: Request):
         upsert=True
     )
     
+    invalidate_v2_ruleset_cache(user.user_id)
+    
     return success_response(config, "V2 health rules updated")
 
 
@@ -245,6 +249,8 @@ async def reset_v2_ruleset(request: Request):
         upsert=True
     )
     
+    invalidate_v2_ruleset_cache(user.user_id)
+    
     return success_response(default, "V2 health rules reset to defaults")
 
 
@@ -281,20 +287,22 @@ async def set_health_version(request: Request):
 
 
 @router.get("/history")
-async def get_score_history(request: Request, days: int = 30):
+async def get_score_history(request: Request, days: int = 30, granularity: str = Query(default=None)):
     """
     Get health score history for trend analysis.
+    Optional granularity: day or week (defaults by window size).
     """
     try:
         user = await get_current_user(request)
     except Exception:
         return error_response("AUTH_ERROR", "Authentication required", status_code=401)
     
-    history = await get_health_history(db, user.user_id, days)
+    history = await get_health_history(db, user.user_id, days, granularity)
     
     return success_response({
         "history": history,
         "days": days,
+        "granularity": resolve_granularity(days, granularity),
         "count": len(history)
     })
 
@@ -476,7 +484,11 @@ async def execute_fix_action(request: Request, action_id: str):
         finding = next((f for f in recent_scan.get("findings", []) if f.get("id") == action.get("finding_id")), None)
         if finding and finding.get("details", {}).get("orphan_ids"):
             orphan_ids = finding["details"]["orphan_ids"]
+            orphans = await db.governance_records.find(
+                {"id": {"$in": orphan_ids}}, ROLLUP_FIELDS
+            ).to_list(None)
             result = await db.governance_records.delete_many({"id": {"$in": orphan_ids}})
+            await track_many(db, "governance_records", [(doc, None) for doc in orphans])
             
             return success_response({
                 "fixed": True,
@@ -600,18 +612,19 @@ async def export_audit_report(request: Request):
 
 
 @router.get("/timeline")
-async def get_health_timeline(request: Request, days: int = 30):
+async def get_health_timeline(request: Request, days: int = 30, granularity: str = Query(default=None)):
     """
     Get health score timeline with events.
-    Returns score history and notable governance events.
+    Returns bucketed score history (daily up to 90 days, weekly beyond)
+    and notable governance events.
     """
     try:
         user = await get_current_user(request)
     except Exception:
         return error_response("AUTH_ERROR", "Authentication required", status_code=401)
     
-    # Get score history
-    history = await get_health_history(db, user.user_id, days)
+    # Get score history from the rollup buckets
+    history = await get_health_history(db, user.user_id, days, granularity)
     
     # Get governance events (records created/finalized in the period)
     from datetime import timedelta
@@ -658,13 +671,18 @@ async def get_health_timeline(request: Request, days: int = 30):
         "history": [
             {
                 "date": h.get("scanned_at"),
+                "bucket": h.get("bucket"),
                 "score": h.get("overall_score"),
+                "min_score": h.get("min_score"),
+                "max_score": h.get("max_score"),
+                "scan_count": h.get("scan_count", 0),
                 "category_scores": h.get("category_scores", {})
             }
             for h in history
         ],
         "events": events[:20],  # Last 20 events
         "days": days,
+        "granularity": resolve_granularity(days, granularity),
         "data_points": len(history)
     })
 
@@ -8,13 +8,15 @@ Provides endpoints for:
 """
 
 from fastapi import APIRouter, Request, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from typing import Optional
 from datetime import datetime, timezone
+import json
 
 from services.integrity_checker import create_integrity_checker
 from services.lifecycle_engine import lifecycle_engine
 from services.integrity_seal import create_integrity_seal_service
+from services.dashboard_rollups import track_delete
 
 router = APIRouter(prefix="/api/integrity", tags=["integrity"])
 
@@ -44,10 +46,14 @@ def error_response(code, message, details=None, status_code=400):
 # ============ SCAN ENDPOINTS ============
 
 @router.post("/scan")
-async def run_integrity_scan(request: Request):
+async def run_integrity_scan(
+    request: Request,
+    deep_verify: bool = Query(False, description="Re-verify every hash chain from version 1")
+):
     """
     Run a full integrity scan for the current user's data.
     Returns detailed report of any issues found.
+    Hash chains are verified from their last checkpoint unless deep_verify is set.
     """
     try:
         user = await get_current_user(request)
@@ -55,7 +61,10 @@ async def run_integrity_scan(request: Request):
         return error_response("AUTH_ERROR", "Authentication required", status_code=401)
     
     checker = create_integrity_checker(db)
-    result = await checker.run_full_scan(user.user_id)
+    if deep_verify:
+        result = await checker.run_full_scan(user.user_id, deep_verify_fraction=1.0)
+    else:
+        result = await checker.run_full_scan(user.user_id)
     
     # Convert to JSON-serializable format
     result_dict = {
@@ -68,6 +77,7 @@ async def run_integrity_scan(request: Request):
         "issues_by_type": result.issues_by_type,
         "auto_fixable_count": result.auto_fixable_count,
         "errors": result.errors,
+        "chain_verification": result.chain_verification,
         "issues": [
             {
                 "issue_type": issue.issue_type.value,
@@ -367,6 +377,7 @@ async def bulk_delete_orphaned_records(request: Request):
         # Delete
         await db.governance_records.delete_one({"id": record_id})
         await db.governance_revisions.delete_many({"record_id": record_id})
+        await track_delete(db, "governance_records", record)
         deleted_count += 1
     
     # Log the bulk deletion
@@ -421,6 +432,7 @@ async def delete_orphaned_record(record_id: str, request: Request):
     # Delete the record and its revisions
     await db.governance_records.delete_one({"id": record_id})
     await db.governance_revisions.delete_many({"record_id": record_id})
+    await track_delete(db, "governance_records", record)
     
     # Log the deletion
     log_entry = {
@@ -549,6 +561,8 @@ async def batch_seal_records(request: Request):
         sealed_by=user.name if hasattr(user, 'name') else user.user_id
     )
     
+    if result.get("error"):
+        return error_response("SEAL_BUSY", result["error"], status_code=409)
     return success_response(result)
 
 
@@ -579,6 +593,48 @@ async def verify_all_seals(request: Request):
     return success_response(result)
 
 
+@router.post("/seal/verify-all/stream")
+async def stream_verify_all_seals(request: Request):
+    """
+    Verify all seals in a portfolio, streaming one NDJSON line per batch
+    followed by a summary line.
+    
+    Body: { "portfolio_id": "..." }
+    """
+    try:
+        user = await get_current_user(request)
+    except Exception:
+        return error_response("AUTH_ERROR", "Authentication required", status_code=401)
+    
+    try:
+        body = await request.json()
+        portfolio_id = body.get("portfolio_id")
+    except Exception:
+        return error_response("INVALID_BODY", "Request body must contain portfolio_id", status_code=400)
+    
+    if not portfolio_id:
+        return error_response("MISSING_FIELD", "portfolio_id is required", status_code=400)
+    
+    seal_service = create_integrity_seal_service(db)
+    
+    async def generate():
+        totals = {"total_verified": 0, "valid_count": 0, "tampered_count": 0, "missing_count": 0}
+        async for batch in seal_service.iter_verify_seals(portfolio_id, user.user_id):
+            totals["total_verified"] += batch["checked"]
+            totals["valid_count"] += batch["valid_count"]
+            totals["tampered_count"] += batch["tampered_count"]
+            totals["missing_count"] += batch["missing_count"]
+            yield json.dumps({"type": "batch", **batch}) + "\n"
+        yield json.dumps({
+            "type": "summary",
+            "success": totals["tampered_count"] == 0,
+            **totals,
+            "verification_timestamp": datetime.now(timezone.utc).isoformat()
+        }) + "\n"
+    
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @router.get("/seal/chain/{portfolio_id}")
 async def verify_seal_chain(portfolio_id: str, request: Request):
     """
@@ -596,6 +652,80 @@ async def verify_seal_chain(portfolio_id: str, request: Request):
     return success_response(result)
 
 
+@router.get("/seal/{record_id}/proof")
+async def get_seal_proof(record_id: str, request: Request, verify: bool = Query(False)):
+    """
+    Get a Merkle inclusion proof for a record's seal.
+    With verify=true the record is re-hashed and checked against the signed root.
+    """
+    try:
+        user = await get_current_user(request)
+    except Exception:
+        return error_response("AUTH_ERROR", "Authentication required", status_code=401)
+    
+    seal_service = create_integrity_seal_service(db)
+    if verify:
+        result = await seal_service.verify_record_proof(record_id, user.user_id)
+    else:
+        result = await seal_service.get_record_proof(record_id, user.user_id)
+    
+    if result.get("error"):
+        return error_response("PROOF_ERROR", result["error"])
+    return success_response(result)
+
+
+@router.post("/seal/merkle/{portfolio_id}/publish")
+async def publish_merkle_root(portfolio_id: str, request: Request):
+    """
+    Publish a signed Merkle root over all seals in a portfolio.
+    """
+    try:
+        user = await get_current_user(request)
+    except Exception:
+        return error_response("AUTH_ERROR", "Authentication required", status_code=401)
+    
+    seal_service = create_integrity_seal_service(db)
+    result = await seal_service.publish_merkle_root(portfolio_id, user.user_id)
+    
+    if result.get("error"):
+        return error_response("SIGNING_ERROR", result["error"], status_code=503)
+    return success_response(result)
+
+
+@router.get("/seal/merkle/{portfolio_id}/root")
+async def get_merkle_root(portfolio_id: str, request: Request):
+    """
+    Get the latest signed Merkle root for a portfolio.
+    """
+    try:
+        user = await get_current_user(request)
+    except Exception:
+        return error_response("AUTH_ERROR", "Authentication required", status_code=401)
+    
+    seal_service = create_integrity_seal_service(db)
+    root = await seal_service.get_latest_merkle_root(portfolio_id, user.user_id)
+    
+    if not root:
+        return error_response("NOT_FOUND", "No signed Merkle root for this portfolio", status_code=404)
+    return success_response(root)
+
+
+@router.get("/seal/merkle/{portfolio_id}/verify")
+async def verify_merkle_root(portfolio_id: str, request: Request):
+    """
+    Verify the latest signed Merkle root for a portfolio, subtree by subtree.
+    """
+    try:
+        user = await get_current_user(request)
+    except Exception:
+        return error_response("AUTH_ERROR", "Authentication required", status_code=401)
+    
+    seal_service = create_integrity_seal_service(db)
+    result = await seal_service.verify_merkle_tree(portfolio_id, user.user_id)
+    
+    return success_response(result)
+
+
 @router.get("/seal/report/{portfolio_id}")
 async def get_seal_report(portfolio_id: str, request: Request):
     """
@@ -19,6 +19,11 @@ import re
 from models.rm_subject import (
     RMSubject, SubjectCategory
 )
+from pymongo import UpdateOne
+
+from services.keyset_pagination import TOTAL_EXACT, InvalidCursor, keyset_page
+from services.mongo_transactions import run_in_transaction, transactions_supported
+from services.rmid_v2 import SubnumberLease, lease_subnumbers
 
 router = APIRouter(prefix="/api/ledger-threads", tags=["ledger-threads"])
 
@@ -154,35 +159,61 @@ async def atomic_allocate_subnumber(
     Returns: (rm_id, rm_sub, rm_base, rm_group, subject_title)
     Raises: ValueError if subject not found or max exceeded
     """
-    # Atomic increment - findOneAndUpdate is atomic in MongoDB
-    result = await db.rm_subjects.find_one_and_update(
-        {
-            "id": subject_id,
-            "user_id": user_id,
-            "deleted_at": None
-        },
-        {
-            "$inc": {"next_sub": 1},
-            "$set": {"updated_at": datetime.now(timezone.utc).isoformat()}
-        },
-        return_document=True  # Return the document AFTER update
-    )
+    allocations, rm_base, rm_group, title = await atomic_allocate_subnumbers(subject_id, user_id, 1)
+    rm_id, allocated_sub = allocations[0]
+    
+    return (rm_id, allocated_sub, rm_base, rm_group, title)
+
+
+async def lease_thread_subnumbers(
+    subject_id: str,
+    user_id: str,
+    count: int
+) -> SubnumberLease:
+    """
+    Atomically reserve `count` consecutive subnumbers from a thread with a
+    single $inc. The lease keeps the thread document (rm_base, rm_group).
+    
+    Raises: ValueError if subject not found or max exceeded
+    """
+    try:
+        lease = await lease_subnumbers(
+            db.rm_subjects,
+            {"id": subject_id, "user_id": user_id, "deleted_at": None},
+            count
+        )
+    except ValueError as e:
+        if "exceeded" in str(e):
+            raise ValueError(f"Maximum subnumber (.999) exceeded for thread {subject_id}")
+        raise
     
-    if not result:
+    if not lease:
         raise ValueError(f"Ledger thread {subject_id} not found")
     
-    # The allocated sub is (next_sub - 1) since we just incremented
-    allocated_sub = result["next_sub"] - 1
+    return lease
+
+
+async def atomic_allocate_subnumbers(
+    subject_id: str,
+    user_id: str,
+    count: int
+) -> tuple:
+    """
+    Atomically reserve `count` consecutive subnumbers from a thread with a
+    single $inc, for operations that move many records at once.
     
-    # Enforce range .001-.999
-    if allocated_sub < 1:
-        raise ValueError("Invalid subnumber state")
-    if allocated_sub > 999:
-        raise ValueError(f"Maximum subnumber (.999) exceeded for thread {subject_id}")
+    Returns: ([(rm_id, rm_sub), ...], rm_base, rm_group, subject_title)
+    Raises: ValueError if subject not found or max exceeded
+    """
+    lease = await lease_thread_subnumbers(subject_id, user_id, count)
     
-    rm_id = format_rm_id(result["rm_base"], result["rm_group"], allocated_sub)
+    thread = lease.doc
+    allocations = [
+        (format_rm_id(thread["rm_base"], thread["rm_group"], sub), sub)
+        for sub in lease.take_many(count)
+    ]
     
-    return (rm_id, allocated_sub, result["rm_base"], result["rm_group"], result["title"])
+    return (allocations, thread["rm_base"], thread["rm_group"], thread["title"])
 
 
 async def create_thread_and_allocate_first(
@@ -244,6 +275,80 @@ async def create_thread_and_allocate_first(
     return (thread.id, rm_id, 1, rm_base, rm_group)
 
 
+# ============ BULK RECORD MOVES ============
+
+def plan_record_moves(records: list, subnumbers: list, rm_base: str, rm_group: int, target_thread_id: str) -> list:
+    """
+    Compute the remap table for moving records into a thread, pairing each
+    record with a reserved subnumber.
+    
+    Returns: [{record_id, old_thread_id, new_thread_id, old_rm_id, new_rm_id, new_sub}, ...]
+    """
+    return [
+        {
+            "record_id": record["id"],
+            "old_thread_id": record.get("rm_subject_id", ""),
+            "new_thread_id": target_thread_id,
+            "old_rm_id": record.get("rm_id", ""),
+            "new_rm_id": format_rm_id(rm_base, rm_group, sub),
+            "new_sub": sub
+        }
+        for record, sub in zip(records, subnumbers)
+    ]
+
+
+async def apply_record_moves(
+    remap: list,
+    history_field: str,
+    make_history,
+    log_doc: dict,
+    thread_updates: list = None,
+    lease: SubnumberLease = None
+) -> bool:
+    """
+    Apply a remap table in one write phase: one ordered bulk_write for the
+    records, any thread updates, and the integrity log entry. Runs inside a
+    transaction where the deployment supports one; if the transaction
+    aborts, the lease's subnumbers are given back.
+    
+    make_history(move, now) builds the record's history entry.
+    Returns whether the writes were transactional.
+    """
+    now = datetime.now(timezone.utc).isoformat()
+    record_ops = [
+        UpdateOne(
+            {"id": move["record_id"]},
+            {
+                "$set": {
+                    "rm_subject_id": move["new_thread_id"],
+                    "rm_id": move["new_rm_id"],
+                    "rm_sub": move["new_sub"],
+                    "updated_at": now,
+                    history_field: make_history(move, now)
+                }
+            }
+        )
+        for move in remap
+    ]
+    
+    async def writes(session):
+        if record_ops:
+            await db.governance_records.bulk_write(record_ops, ordered=True, session=session)
+        for query, update in thread_updates or []:
+            await db.rm_subjects.update_many(query, update, session=session)
+        await db.integrity_logs.insert_one(log_doc, session=session)
+    
+    transactional = await transactions_supported(db)
+    try:
+        await run_in_transaction(db, writes)
+    except Exception:
+        if transactional and lease:
+            lease.reset()
+            await lease.release(db, reason="aborted_thread_move")
+        raise
+    return transactional
+
+
 # ============ API ENDPOINTS ============
 
 @router.get("")
@@ -254,10 +359,12 @@ async def list_threads(
     party_id: Optional[str] = Query(None, description="Filter by party"),
     search: Optional[str] = Query(None, description="Search title/external_ref"),
     limit: int = Query(50, ge=1, le=200),
-    offset: int = Query(0, ge=0)
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    total_mode: str = Query(TOTAL_EXACT, description="Total count: exact, estimate, none")
 ):
     """
-    List Ledger Threads for a portfolio.
+    List Ledger Threads for a portfolio, in RM group order.
     Supports filtering by category, party, and text search.
     """
     try:
@@ -283,10 +390,11 @@ async def list_threads(
                 {"primary_party_name": {"$regex": search, "$options": "i"}}
             ]
         
-        total = await db.rm_subjects.count_documents(query)
-        threads = await db.rm_subjects.find(
-            query, {"_id": 0}
-        ).sort("rm_group", 1).skip(offset).limit(limit).to_list(limit)
+        page = await keyset_page(
+            db.rm_subjects, query, [("rm_group", 1)], "id",
+            limit, cursor=cursor, offset=offset, total=total_mode
+        )
+        threads = page["items"]
         
         # Enrich with record counts
         items = []
@@ -315,11 +423,16 @@ async def list_threads(
         
         return success_response({
             "items": items,
-            "total": total,
+            "total": page["total"],
+            "total_is_estimate": page["total_is_estimate"],
             "limit": limit,
-            "offset": offset
+            "offset": offset,
+            "next_cursor": page["next_cursor"],
+            "has_more": page["has_more"]
         })
         
+    except InvalidCursor as e:
+        return error_response("INVALID_CURSOR", str(e))
     except Exception as e:
         print(f"Error listing threads: {e}")
         return error_response("DB_ERROR", str(e), status_code=500)
@@ -668,83 +781,80 @@ async def merge_threads(thread_id: str, request: Request):
         if not target_thread:
             return error_response("NOT_FOUND", "Target thread not found", status_code=404)
         
-        # Verify source threads exist and get their records
-        merged_count = 0
-        deleted_threads = []
-        
-        for source_id in source_ids:
-            if source_id == thread_id:
-                continue  # Skip self
-            
-            source_thread = await db.rm_subjects.find_one(
-                {"id": source_id, "user_id": user.user_id, "deleted_at": None},
-                {"_id": 0}
-            )
-            if not source_thread:
-                continue  # Skip non-existent threads
-            
-            # Get records from source thread
+        # Phase 1: load all source threads and their records
+        source_ids = [sid for sid in dict.fromkeys(source_ids) if sid != thread_id]
+        source_threads = await db.rm_subjects.find(
+            {"id": {"$in": source_ids}, "user_id": user.user_id, "deleted_at": None},
+            {"_id": 0, "id": 1}
+        ).to_list(None)
+        found_ids = {t["id"] for t in source_threads}
+        # Skip self and non-existent threads, keeping the requested order
+        merged_thread_ids = [sid for sid in source_ids if sid in found_ids]
+        
+        records = []
+        if merged_thread_ids:
             records = await db.governance_records.find(
-                {"rm_subject_id": source_id, "status": {"$ne": "voided"}},
-                {"_id": 0, "id": 1, "rm_id": 1, "rm_sub": 1}
-            ).to_list(1000)
-            
-            if records:
-                # For each record, allocate a new subnumber in target thread
-                for record in records:
-                    old_rm_id = record.get("rm_id", "")
-                    new_rm_id, new_sub, _, _, _ = await atomic_allocate_subnumber(thread_id, user.user_id)
-                    
-                    # Update record with new thread and RM-ID
-                    await db.governance_records.update_one(
-                        {"id": record["id"]},
-                        {
-                            "$set": {
-                                "rm_subject_id": thread_id,
-                                "rm_id": new_rm_id,
-                                "rm_sub": new_sub,
-                                "updated_at": datetime.now(timezone.utc).isoformat(),
-                                "merge_history": {
-                                    "merged_from_thread": source_id,
-                                    "old_rm_id": old_rm_id,
-                                    "merged_at": datetime.now(timezone.utc).isoformat(),
-                                    "merge_reason": merge_reason
-                                }
-                            }
-                        }
-                    )
-                    merged_count += 1
-            
-            # Soft-delete source thread
-            await db.rm_subjects.update_one(
-                {"id": source_id},
+                {"rm_subject_id": {"$in": merged_thread_ids}, "status": {"$ne": "voided"}},
+                {"_id": 0, "id": 1, "rm_id": 1, "rm_sub": 1, "rm_subject_id": 1}
+            ).to_list(None)
+            thread_order = {sid: i for i, sid in enumerate(merged_thread_ids)}
+            records.sort(key=lambda r: (thread_order[r["rm_subject_id"]], r.get("rm_sub") or 0))
+        
+        # Phase 2: reserve one block of subnumbers in the target thread and plan the remap
+        lease = None
+        remap = []
+        if records:
+            lease = await lease_thread_subnumbers(thread_id, user.user_id, len(records))
+            remap = plan_record_moves(
+                records, lease.take_many(len(records)),
+                lease.doc["rm_base"], lease.doc["rm_group"], thread_id
+            )
+        
+        # Phase 3: move records, soft-delete source threads and log in one write phase
+        now = datetime.now(timezone.utc).isoformat()
+        thread_updates = []
+        if merged_thread_ids:
+            thread_updates.append((
+                {"id": {"$in": merged_thread_ids}},
                 {
                     "$set": {
-                        "deleted_at": datetime.now(timezone.utc).isoformat(),
+                        "deleted_at": now,
                         "deleted_reason": f"Merged into thread {thread_id}",
                         "merged_into": thread_id
                     }
                 }
-            )
-            deleted_threads.append(source_id)
-        
-        # Log the merge operation
-        await db.integrity_logs.insert_one({
-            "id": f"merge_{uuid.uuid4().hex[:12]}",
-            "action": "thread_merge",
-            "target_thread_id": thread_id,
-            "source_thread_ids": deleted_threads,
-            "records_merged": merged_count,
-            "merge_reason": merge_reason,
-            "performed_by": user.user_id,
-            "performed_at": datetime.now(timezone.utc).isoformat()
-        })
+            ))
+        
+        transactional = await apply_record_moves(
+            remap,
+            "merge_history",
+            lambda move, at: {
+                "merged_from_thread": move["old_thread_id"],
+                "old_rm_id": move["old_rm_id"],
+                "merged_at": at,
+                "merge_reason": merge_reason
+            },
+            {
+                "id": f"merge_{uuid.uuid4().hex[:12]}",
+                "action": "thread_merge",
+                "target_thread_id": thread_id,
+                "source_thread_ids": merged_thread_ids,
+                "records_merged": len(remap),
+                "merge_reason": merge_reason,
+                "performed_by": user.user_id,
+                "performed_at": now
+            },
+            thread_updates=thread_updates,
+            lease=lease
+        )
         
         return success_response({
             "target_thread_id": thread_id,
-            "merged_thread_ids": deleted_threads,
-            "records_merged": merged_count
-        }, message=f"Successfully merged {merged_count} records from {len(deleted_threads)} threads")
+            "merged_thread_ids": merged_thread_ids,
+            "records_merged": len(remap),
+            "remap": remap,
+            "transactional": transactional
+        }, message=f"Successfully merged {len(remap)} records from {len(merged_thread_ids)} threads")
         
     except ValueError as e:
         return error_response("MERGE_ERROR", str(e))
@@ -797,8 +907,8 @@ async def split_thread(thread_id: str, request: Request):
                 "rm_subject_id": thread_id,
                 "status": {"$ne": "voided"}
             },
-            {"_id": 0}
-        ).to_list(1000)
+            {"_id": 0, "id": 1, "rm_id": 1, "rm_sub": 1, "rm_subject_id": 1}
+        ).to_list(None)
         
         if not records:
             return error_response("VALIDATION_ERROR", "No valid records found in the specified thread")
@@ -815,58 +925,49 @@ async def split_thread(thread_id: str, request: Request):
             created_by=user.name if hasattr(user, 'name') else user.user_id
         )
         
-        # Move records to new thread (skip first since it's already allocated)
-        moved_count = 0
-        for i, record in enumerate(records):
-            old_rm_id = record.get("rm_id", "")
-            
-            if i == 0:
-                # First record uses the pre-allocated .001
-                new_rm_id = first_rm_id
-                new_sub = 1
-            else:
-                # Subsequent records get new subnumbers
-                new_rm_id, new_sub, _, _, _ = await atomic_allocate_subnumber(new_thread_id, user.user_id)
-            
-            await db.governance_records.update_one(
-                {"id": record["id"]},
-                {
-                    "$set": {
-                        "rm_subject_id": new_thread_id,
-                        "rm_id": new_rm_id,
-                        "rm_sub": new_sub,
-                        "updated_at": datetime.now(timezone.utc).isoformat(),
-                        "split_history": {
-                            "split_from_thread": thread_id,
-                            "old_rm_id": old_rm_id,
-                            "split_at": datetime.now(timezone.utc).isoformat(),
-                            "split_reason": split_reason
-                        }
-                    }
-                }
-            )
-            moved_count += 1
-        
-        # Log the split operation
-        await db.integrity_logs.insert_one({
-            "id": f"split_{uuid.uuid4().hex[:12]}",
-            "action": "thread_split",
-            "source_thread_id": thread_id,
-            "new_thread_id": new_thread_id,
-            "records_moved": moved_count,
-            "record_ids": [r["id"] for r in records],
-            "split_reason": split_reason,
-            "performed_by": user.user_id,
-            "performed_at": datetime.now(timezone.utc).isoformat()
-        })
+        # First record uses the pre-allocated .001; the rest share one block
+        subnumbers = [1]
+        lease = None
+        if len(records) > 1:
+            lease = await lease_thread_subnumbers(new_thread_id, user.user_id, len(records) - 1)
+            subnumbers.extend(lease.take_many(len(records) - 1))
+        
+        records.sort(key=lambda r: r.get("rm_sub") or 0)
+        remap = plan_record_moves(records, subnumbers, rm_base, rm_group, new_thread_id)
+        
+        # Move records and log in one write phase
+        transactional = await apply_record_moves(
+            remap,
+            "split_history",
+            lambda move, at: {
+                "split_from_thread": thread_id,
+                "old_rm_id": move["old_rm_id"],
+                "split_at": at,
+                "split_reason": split_reason
+            },
+            {
+                "id": f"split_{uuid.uuid4().hex[:12]}",
+                "action": "thread_split",
+                "source_thread_id": thread_id,
+                "new_thread_id": new_thread_id,
+                "records_moved": len(remap),
+                "record_ids": [move["record_id"] for move in remap],
+                "split_reason": split_reason,
+                "performed_by": user.user_id,
+                "performed_at": datetime.now(timezone.utc).isoformat()
+            },
+            lease=lease
+        )
         
         return success_response({
             "source_thread_id": thread_id,
             "new_thread_id": new_thread_id,
             "new_thread_rm_group": rm_group,
-            "records_moved": moved_count,
-            "new_thread_rm_preview": format_rm_id_preview(rm_base, rm_group)
-        }, message=f"Successfully split {moved_count} records into new thread")
+            "records_moved": len(remap),
+            "new_thread_rm_preview": format_rm_id_preview(rm_base, rm_group),
+            "remap": remap,
+            "transactional": transactional
+        }, message=f"Successfully split {len(remap)} records into new thread")
         
     except ValueError as e:
         return error_response("SPLIT_ERROR", str(e))
@@ -918,64 +1019,58 @@ async def reassign_records(request: Request):
                 "user_id": user.user_id,
                 "status": {"$ne": "voided"}
             },
-            {"_id": 0}
-        ).to_list(1000)
+            {"_id": 0, "id": 1, "rm_id": 1, "rm_sub": 1, "rm_subject_id": 1}
+        ).to_list(None)
         
         if not records:
             return error_response("VALIDATION_ERROR", "No valid records found")
         
-        # Reassign each record
-        reassigned_count = 0
-        source_threads = set()
-        
-        for record in records:
-            if record.get("rm_subject_id") == target_thread_id:
-                continue  # Already in target thread
-            
-            old_rm_id = record.get("rm_id", "")
-            old_thread_id = record.get("rm_subject_id", "")
-            source_threads.add(old_thread_id)
-            
-            # Allocate new subnumber in target thread
-            new_rm_id, new_sub, _, _, _ = await atomic_allocate_subnumber(target_thread_id, user.user_id)
-            
-            await db.governance_records.update_one(
-                {"id": record["id"]},
-                {
-                    "$set": {
-                        "rm_subject_id": target_thread_id,
-                        "rm_id": new_rm_id,
-                        "rm_sub": new_sub,
-                        "updated_at": datetime.now(timezone.utc).isoformat(),
-                        "reassign_history": {
-                            "reassigned_from_thread": old_thread_id,
-                            "old_rm_id": old_rm_id,
-                            "reassigned_at": datetime.now(timezone.utc).isoformat(),
-                            "reassign_reason": reassign_reason
-                        }
-                    }
-                }
+        # Skip records already in the target thread
+        to_move = [r for r in records if r.get("rm_subject_id") != target_thread_id]
+        to_move.sort(key=lambda r: (r.get("rm_subject_id") or "", r.get("rm_sub") or 0))
+        
+        # Allocate new subnumbers in target thread as one block
+        lease = None
+        remap = []
+        if to_move:
+            lease = await lease_thread_subnumbers(target_thread_id, user.user_id, len(to_move))
+            remap = plan_record_moves(
+                to_move, lease.take_many(len(to_move)),
+                lease.doc["rm_base"], lease.doc["rm_group"], target_thread_id
             )
-            reassigned_count += 1
-        
-        # Log the reassign operation
-        await db.integrity_logs.insert_one({
-            "id": f"reassign_{uuid.uuid4().hex[:12]}",
-            "action": "records_reassigned",
-            "target_thread_id": target_thread_id,
-            "source_thread_ids": list(source_threads),
-            "records_reassigned": reassigned_count,
-            "record_ids": [r["id"] for r in records if r.get("rm_subject_id") != target_thread_id],
-            "reassign_reason": reassign_reason,
-            "performed_by": user.user_id,
-            "performed_at": datetime.now(timezone.utc).isoformat()
-        })
+        source_threads = list(dict.fromkeys(move["old_thread_id"] for move in remap))
+        
+        # Move records and log in one write phase
+        transactional = await apply_record_moves(
+            remap,
+            "reassign_history",
+            lambda move, at: {
+                "reassigned_from_thread": move["old_thread_id"],
+                "old_rm_id": move["old_rm_id"],
+                "reassigned_at": at,
+                "reassign_reason": reassign_reason
+            },
+            {
+                "id": f"reassign_{uuid.uuid4().hex[:12]}",
+                "action": "records_reassigned",
+                "target_thread_id": target_thread_id,
+                "source_thread_ids": source_threads,
+                "records_reassigned": len(remap),
+                "record_ids": [move["record_id"] for move in remap],
+                "reassign_reason": reassign_reason,
+                "performed_by": user.user_id,
+                "performed_at": datetime.now(timezone.utc).isoformat()
+            },
+            lease=lease
+        )
         
         return success_response({
             "target_thread_id": target_thread_id,
-            "source_thread_ids": list(source_threads),
-            "records_reassigned": reassigned_count
-        }, message=f"Successfully reassigned {reassigned_count} records")
+            "source_thread_ids": source_threads,
+            "records_reassigned": len(remap),
+            "remap": remap,
+            "transactional": transactional
+        }, message=f"Successfully reassigned {len(remap)} records")
         
     except ValueError as e:
         return error_response("REASSIGN_ERROR", str(e))
@@ -1107,6 +1202,10 @@ __all__ = [
     "router",
     "init_ledger_thread_routes",
     "atomic_allocate_subnumber",
+    "atomic_allocate_subnumbers",
+    "lease_thread_subnumbers",
+    "plan_record_moves",
+    "apply_record_moves",
     "create_thread_and_allocate_first",
     "format_rm_id",
     "format_rm_id_preview",
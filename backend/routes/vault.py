@@ -13,6 +13,7 @@ from models.vault import (
 )
 from services.vault_service import get_vault_service
 from services.document_service import get_document_service
+from services.soft_delete import live_filter
 
 logger = logging.getLogger(__name__)
 
@@ -457,7 +458,7 @@ async def import_document_to_workspace(request: Request, vault_id: str, body: di
         source_doc = await _db.documents.find_one({
             "document_id": source_document_id,
             "user_id": {"$in": user_ids},
-            "is_deleted": {"$ne": True}
+            **live_filter("documents")
         }, {"_id": 0})
         
         if not source_doc:
@@ -565,7 +566,7 @@ async def get_importable_documents(request: Request, vault_id: str, portfolio_id
         # Build query - ALWAYS filter by portfolio (required above)
         query = {
             "user_id": {"$in": user_ids}, 
-            "is_deleted": {"$ne": True},
+            **live_filter("documents"),
             "portfolio_id": filter_portfolio_id
         }
         logger.info(f"Import docs - filtering by portfolio_id: {filter_portfolio_id}")
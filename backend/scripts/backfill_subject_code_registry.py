@@ -0,0 +1,86 @@
+"""
+Subject Code Registry Backfill Script
+Builds the per-portfolio subject code registry used by the legacy RM-ID
+generator from the codes existing items already hold.
+
+Operations:
+1. Create the registry's unique index
+2. Scan each portfolio's items and register their subject codes
+3. Re-run the consistency check and report any drift
+
+Safe to re-run: codes already in a registry are kept.
+
+Run: python scripts/backfill_subject_code_registry.py
+"""
+
+import asyncio
+from motor.motor_asyncio import AsyncIOMotorClient
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.subject_code_registry import (
+    backfill_registry,
+    check_subject_code_registry,
+    ensure_subject_code_registry_indexes,
+)
+
+MONGO_URL = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
+DB_NAME = os.environ.get('DB_NAME', 'test_database')
+
+
+async def run_backfill():
+    print("=" * 70)
+    print("SUBJECT CODE REGISTRY BACKFILL")
+    print("=" * 70)
+
+    client = AsyncIOMotorClient(MONGO_URL)
+    db = client[DB_NAME]
+
+    stats = {"portfolios": 0, "codes_registered": 0, "inconsistent": 0, "errors": 0}
+
+    try:
+        await ensure_subject_code_registry_indexes(db)
+
+        async for portfolio in db.portfolios.find({}, {"_id": 0, "portfolio_id": 1, "user_id": 1}):
+            portfolio_id = portfolio.get("portfolio_id")
+            user_id = portfolio.get("user_id")
+            if not portfolio_id or not user_id:
+                continue
+
+            try:
+                registry = await backfill_registry(db, portfolio_id, user_id)
+                report = await check_subject_code_registry(db, portfolio_id, user_id)
+
+                stats["portfolios"] += 1
+                stats["codes_registered"] += len(registry.get("used_codes", []))
+
+                if report["consistent"]:
+                    print(f"  {portfolio_id}: {len(registry.get('used_codes', []))} codes")
+                else:
+                    stats["inconsistent"] += 1
+                    print(
+                        f"  {portfolio_id}: registered but unused {report['unused_in_registry']}, "
+                        f"missing {report['missing_from_registry']}"
+                    )
+            except Exception as e:
+                stats["errors"] += 1
+                print(f"  Error backfilling {portfolio_id}: {e}")
+
+        print("\n" + "=" * 70)
+        print("BACKFILL COMPLETE")
+        print("=" * 70)
+        print("\nStatistics:")
+        print(f"  Portfolios: {stats['portfolios']}")
+        print(f"  Codes registered: {stats['codes_registered']}")
+        print(f"  Inconsistent after backfill: {stats['inconsistent']}")
+        print(f"  Errors: {stats['errors']}")
+
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(run_backfill())
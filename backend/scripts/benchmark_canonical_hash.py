@@ -0,0 +1,180 @@
+"""
+Canonical Hash Benchmark and Golden-Hash Check
+
+1. Checks that every hash version reproduces its golden digests, so legacy
+   (version 1) hashes stay byte-for-byte compatible with stored seals,
+   revision content hashes and meeting hashes.
+2. Checks version 2 float and NaN output against golden bytes on both the
+   orjson fast path and the pure-Python fallback, and that the two agree
+   on synthetic payloads.
+3. Times record hashing per version over synthetic governance payloads.
+
+Run: python scripts/benchmark_canonical_hash.py [--records 5000] [--check-only]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services import canonical_json
+from services.canonical_json import (
+    HASH_VERSION_LEGACY, HASH_VERSION_ORJSON, canonical_json as to_canonical_json
+)
+from services.integrity_seal import IntegritySealService
+from models.governance_v2 import compute_content_hash
+
+
+GOLDEN_RECORD = {
+    "id": "rec_golden0001",
+    "rm_id": "RF743916765US-20.001",
+    "module_type": "minutes",
+    "portfolio_id": "port_golden",
+    "title": "Quarterly Trustee Meeting",
+    "status": "finalized",
+    "finalized_at": "2024-03-01T12:00:00+00:00",
+    "finalized_by": "Trustee A",
+}
+
+GOLDEN_PAYLOAD = {
+    "attendees": [{"name": "Ann", "role": "trustee", "updated_at": "x"}],
+    "agenda_items": [{"title": "Distribution", "notes": "Approved — unanimously"}],
+    "amount": 1250.5,
+    "updated_at": "ignored",
+    "nested": {"b": 2, "a": [1, 2, 3]},
+}
+
+GOLDEN_CHAIN = ("00" * 32, None, "2024-03-01T12:00:00+00:00")
+
+GOLDEN_CONTENT = (GOLDEN_PAYLOAD, "2024-03-01T11:00:00+00:00", "user_1", 2, "abc123")
+
+# Version 2 floats are written in orjson's format, non-finite values as null
+GOLDEN_FLOATS = {
+    "big": 1e16, "small": 1e-7, "tiny": 1e-5, "ratio": 0.1, "whole": 100.0,
+    "huge": 1.5e300, "neg": -2.5e-12, "zero": -0.0, "nan": float("nan"), "inf": float("inf"),
+}
+GOLDEN_FLOATS_V2 = (
+    b'{"big":1e16,"huge":1.5e300,"inf":null,"nan":null,"neg":-2.5e-12,'
+    b'"ratio":0.1,"small":1e-7,"tiny":0.00001,"whole":100.0,"zero":-0.0}'
+)
+
+# Digests per hash version; version 1 values were produced by the
+# pre-versioning json.dumps implementations
+GOLDEN_HASHES = {
+    HASH_VERSION_LEGACY: {
+        "record": "d9e140fce493c66390c270a39a48c2aaac6100c0abb375e1e130826a3f2b68c8",
+        "content": "bd0d407d736ecadc3557da283f3134124f6fd8a244ee422396075f79d1663e1e",
+        "chain": "a108349dc16d1d38fe3008dfcc3ccb41012ab40463dbc948bc1a35b1e21527bf",
+    },
+    HASH_VERSION_ORJSON: {
+        "record": "1d5f7e7dd995316b42c8ab8ec8a7c4a3d33e80199f52a839beff5d469167e8f0",
+        "content": "70d5435af643237789e37e3ec572331dc71c5340e0a6e0dcaab45477d71d63fd",
+        "chain": "d2ee09d7cedde51d39268af6f43e83d4e5420ae3810ff592d1421b2e14a180e2",
+    },
+}
+
+
+def golden_digests(hash_version: int) -> dict:
+    seals = IntegritySealService(None)
+    payload, created_at, created_by, version, parent_hash = GOLDEN_CONTENT
+    return {
+        "record": seals.generate_record_hash(GOLDEN_RECORD, GOLDEN_PAYLOAD, hash_version),
+        "content": compute_content_hash(payload, created_at, created_by, version, parent_hash, hash_version),
+        "chain": seals.generate_chain_hash(*GOLDEN_CHAIN, hash_version=hash_version),
+    }
+
+
+def check_golden_hashes() -> bool:
+    ok = True
+    for hash_version, expected in GOLDEN_HASHES.items():
+        for name, digest in golden_digests(hash_version).items():
+            match = digest == expected[name]
+            ok = ok and match
+            print(f"  v{hash_version} {name:8} {'OK' if match else 'MISMATCH ' + digest}")
+    return ok
+
+
+def check_golden_floats() -> bool:
+    ok = True
+    encoders = [("stdlib", canonical_json._dumps_v2_stdlib)]
+    if canonical_json.orjson is not None:
+        encoders.insert(0, ("orjson", lambda doc: to_canonical_json(doc, HASH_VERSION_ORJSON)))
+    for name, encode in encoders:
+        match = encode(GOLDEN_FLOATS) == GOLDEN_FLOATS_V2
+        ok = ok and match
+        print(f"  v{HASH_VERSION_ORJSON} floats   {name:8} {'OK' if match else 'MISMATCH ' + encode(GOLDEN_FLOATS).decode()}")
+    return ok
+
+
+def check_fallback_parity(records: list) -> bool:
+    """Version 2 bytes must not depend on whether orjson is installed."""
+    if canonical_json.orjson is None:
+        print("  orjson not installed; skipping fast-path parity")
+        return True
+    for record, payload in records:
+        doc = {"record": record, "payload": payload}
+        if to_canonical_json(doc, HASH_VERSION_ORJSON) != canonical_json._dumps_v2_stdlib(doc):
+            print(f"  MISMATCH for {record['id']}")
+            return False
+    print(f"  orjson and stdlib agree on {len(records)} documents")
+    return True
+
+
+def synthetic_records(count: int) -> list:
+    records = []
+    for i in range(count):
+        record = dict(GOLDEN_RECORD, id=f"rec_{i:08d}", rm_id=f"RF743916765US-20.{i % 999 + 1:03d}")
+        payload = {
+            "attendees": [{"name": f"Attendee {j}", "role": "trustee", "present": j % 2 == 0} for j in range(8)],
+            "agenda_items": [
+                {"title": f"Item {j}", "notes": "Discussion é " * 20, "votes": {"for": 3, "against": j}}
+                for j in range(10)
+            ],
+            "amount": i * 1.25,
+            "rates": [i / 7, i * 1e-6, i * 1e15, i * 3.3e-5],
+            "notes": "Lorem ipsum dolor sit amet " * 40,
+        }
+        records.append((record, payload))
+    return records
+
+
+def benchmark(records: list):
+    seals = IntegritySealService(None)
+    for hash_version in (HASH_VERSION_LEGACY, HASH_VERSION_ORJSON):
+        started = time.perf_counter()
+        for record, payload in records:
+            seals.generate_record_hash(record, payload, hash_version)
+        elapsed = time.perf_counter() - started
+        print(
+            f"  v{hash_version}: {elapsed * 1000:.1f} ms total, "
+            f"{elapsed / len(records) * 1_000_000:.1f} us/record"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--records", type=int, default=5000)
+    parser.add_argument("--check-only", action="store_true")
+    args = parser.parse_args()
+
+    records = synthetic_records(args.records)
+
+    print("Golden hashes:")
+    ok = check_golden_hashes()
+    ok = check_golden_floats() and ok
+    print("Fast-path parity:")
+    ok = check_fallback_parity(records[:500]) and ok
+
+    if not args.check_only:
+        print(f"Record hashing ({args.records} records, orjson "
+              f"{'enabled' if canonical_json.orjson is not None else 'unavailable'}):")
+        benchmark(records)
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+"""
+Governance Summary Parity Check
+
+Compares the aggregation-backed governance summaries with straightforward
+Python reductions over every matching document (the way the summary
+endpoints used to compute them), for each portfolio. Run after changing a
+summary pipeline.
+
+Order-insensitive: breakdown lists are compared as sets of rows, and
+floating point totals with a small tolerance. Defaults follow the
+pipelines' $ifNull: only missing or null fields take them, so an empty
+string stays its own key.
+
+random_documents() builds randomized fixtures (missing, null and empty
+fields included) so the check can also run against a scratch database;
+tests/test_governance_summaries.py does that with mongomock.
+
+Run: python scripts/check_governance_summaries.py [--portfolio-id port_x]
+"""
+
+import argparse
+import asyncio
+import math
+import random
+from motor.motor_asyncio import AsyncIOMotorClient
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.governance_summaries import (
+    DISTRIBUTION_PENDING_STATUSES,
+    DISPUTE_CLOSED_STATUSES,
+    PREMIUM_PAYMENTS_PER_YEAR,
+    summarize_compensation,
+    summarize_disputes,
+    summarize_distributions,
+    summarize_insurance,
+)
+
+MONGO_URL = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
+DB_NAME = os.environ.get('DB_NAME', 'test_database')
+
+
+def _if_null(value, default):
+    """Python side of $ifNull: only missing/None take the default."""
+    return default if value is None else value
+
+
+def _n(value) -> float:
+    return _if_null(value, 0)
+
+
+def _add(totals: dict, key, amount):
+    totals[key] = totals.get(key, 0) + amount
+
+
+def reference_distributions(docs: list) -> dict:
+    by_type, by_status, roles, timeline = {}, {}, {}, {}
+    for d in docs:
+        amount = _n(d.get("total_amount"))
+        _add(by_type, _if_null(d.get("distribution_type"), "regular"), amount)
+        _add(by_status, _if_null(d.get("status"), "draft"), 1)
+        for r in d.get("recipients") or []:
+            _add(roles, _if_null(r.get("role"), "beneficiary"), _n(r.get("amount")))
+        period = _if_null(
+            d.get("execution_date"), _if_null(d.get("scheduled_date"), _if_null(d.get("created_at"), ""))
+        )[:7]
+        if period:
+            row = timeline.setdefault(period, {"period": period, "distributed": 0, "pending": 0, "count": 0})
+            row["count"] += 1
+            if d.get("status") == "completed":
+                row["distributed"] += amount
+            elif d.get("status") in DISTRIBUTION_PENDING_STATUSES:
+                row["pending"] += amount
+    return {
+        "has_data": bool(docs),
+        "total_distributed": sum(_n(d.get("total_amount")) for d in docs if d.get("status") == "completed"),
+        "pending_amount": sum(
+            _n(d.get("total_amount")) for d in docs if d.get("status") in DISTRIBUTION_PENDING_STATUSES
+        ),
+        "distribution_count": len(docs),
+        "donut_data": [{"name": k, "value": v} for k, v in roles.items()],
+        "timeline_data": [timeline[k] for k in sorted(timeline)],
+        "by_type": by_type,
+        "by_status": by_status,
+    }
+
+
+def reference_disputes(docs: list) -> dict:
+    by_status, by_priority, by_type = {}, {}, {}
+    for d in docs:
+        _add(by_status, _if_null(d.get("status"), "open"), 1)
+        _add(by_priority, _if_null(d.get("priority"), "medium"), 1)
+        _add(by_type, _if_null(d.get("dispute_type"), "beneficiary"), 1)
+    return {
+        "has_data": bool(docs),
+        "total_disputes": len(docs),
+        "open_disputes": len([d for d in docs if d.get("status") not in DISPUTE_CLOSED_STATUSES]),
+        "total_exposure": sum(_n(d.get("estimated_exposure")) or _n(d.get("amount_claimed")) for d in docs),
+        "by_status": by_status,
+        "by_priority": by_priority,
+        "by_type": by_type,
+    }
+
+
+def reference_insurance(docs: list) -> dict:
+    active = [p for p in docs if p.get("status") == "active"]
+    by_type = {}
+    for p in docs:
+        _add(by_type, _if_null(p.get("policy_type"), "whole_life"), 1)
+    return {
+        "has_data": bool(docs),
+        "total_policies": len(docs),
+        "active_policies": len(active),
+        "total_death_benefit": sum(_n(p.get("death_benefit")) for p in active),
+        "total_cash_value": sum(_n(p.get("cash_value")) for p in active),
+        "total_annual_premium": sum(
+            _n(p.get("premium_amount")) * PREMIUM_PAYMENTS_PER_YEAR.get(p.get("premium_frequency"), 1)
+            for p in active
+        ),
+        "policies_by_type": by_type,
+    }
+
+
+def reference_compensation(docs: list) -> dict:
+    by_recipient, by_type = {}, {}
+    for e in docs:
+        name = _if_null(e.get("recipient_name"), "Unknown")
+        row = by_recipient.setdefault(
+            name, {"name": name, "role": _if_null(e.get("recipient_role"), ""), "total": 0, "count": 0}
+        )
+        row["total"] += _n(e.get("amount"))
+        row["count"] += 1
+        comp_type = _if_null(e.get("compensation_type"), "other")
+        row = by_type.setdefault(comp_type, {"type": comp_type, "total": 0, "count": 0})
+        row["total"] += _n(e.get("amount"))
+        row["count"] += 1
+    return {
+        "has_data": bool(docs),
+        "total_compensation": sum(_n(e.get("amount")) for e in docs),
+        "total_hours": sum(_n(e.get("hours_worked")) for e in docs),
+        "entry_count": len(docs),
+        "by_recipient": list(by_recipient.values()),
+        "by_type": list(by_type.values()),
+    }
+
+
+MISSING = object()
+
+
+def _maybe(rng: random.Random, value):
+    """The value, or a missing/null/empty field now and then."""
+    roll = rng.random()
+    if roll < 0.1:
+        return MISSING
+    if roll < 0.2:
+        return None
+    if roll < 0.25 and isinstance(value, str):
+        return ""
+    return value
+
+
+def _doc(rng: random.Random, **fields) -> dict:
+    return {k: v for k, v in ((k, _maybe(rng, v)) for k, v in fields.items()) if v is not MISSING}
+
+
+def _date(rng: random.Random) -> str:
+    return f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T00:00:00+00:00"
+
+
+def random_documents(rng: random.Random, count: int) -> dict:
+    """{collection: [documents]} with randomized values for every summary."""
+    return {
+        "distributions": [
+            _doc(
+                rng,
+                status=rng.choice(["draft", "pending_approval", "approved", "completed", "cancelled"]),
+                distribution_type=rng.choice(["regular", "special", "final"]),
+                total_amount=round(rng.uniform(0, 50000), 2),
+                execution_date=_date(rng),
+                scheduled_date=_date(rng),
+                created_at=_date(rng),
+                recipients=[
+                    _doc(rng, role=rng.choice(["beneficiary", "trustee", "charity"]), amount=round(rng.uniform(0, 9000), 2))
+                    for _ in range(rng.randint(0, 3))
+                ]
+            )
+            for _ in range(count)
+        ],
+        "disputes": [
+            _doc(
+                rng,
+                status=rng.choice(["open", "in_progress", "mediation", "settled", "closed"]),
+                priority=rng.choice(["low", "medium", "high"]),
+                dispute_type=rng.choice(["beneficiary", "trustee", "creditor"]),
+                estimated_exposure=rng.choice([0, round(rng.uniform(0, 90000), 2)]),
+                amount_claimed=round(rng.uniform(0, 90000), 2)
+            )
+            for _ in range(count)
+        ],
+        "insurance_policies": [
+            _doc(
+                rng,
+                status=rng.choice(["active", "lapsed", "pending"]),
+                policy_type=rng.choice(["whole_life", "term", "universal"]),
+                death_benefit=round(rng.uniform(0, 1000000), 2),
+                cash_value=round(rng.uniform(0, 200000), 2),
+                premium_amount=round(rng.uniform(0, 5000), 2),
+                premium_frequency=rng.choice(["monthly", "quarterly", "semi_annual", "annual"])
+            )
+            for _ in range(count)
+        ],
+        "compensation_entries": [
+            _doc(
+                rng,
+                recipient_name=rng.choice(["Ada", "Grace", "Linus"]),
+                recipient_role=rng.choice(["trustee", "advisor"]),
+                compensation_type=rng.choice(["annual_fee", "hourly", "other"]),
+                amount=round(rng.uniform(0, 20000), 2),
+                hours_worked=round(rng.uniform(0, 80), 1)
+            )
+            for _ in range(count)
+        ],
+    }
+
+
+SUMMARIES = [
+    ("distributions", "distributions", summarize_distributions, reference_distributions),
+    ("disputes", "disputes", summarize_disputes, reference_disputes),
+    ("insurance", "insurance_policies", summarize_insurance, reference_insurance),
+    ("compensation", "compensation_entries", summarize_compensation, reference_compensation),
+]
+
+
+def same(a, b) -> bool:
+    if isinstance(a, (int, float)) and isinstance(b, (int, float)):
+        return math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-6)
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(same(a[k], b[k]) for k in a)
+    if isinstance(a, list) and isinstance(b, list):
+        # Breakdown rows may come back in any order
+        unmatched = list(b)
+        for item in a:
+            match = next((i for i, other in enumerate(unmatched) if same(item, other)), None)
+            if match is None:
+                return False
+            unmatched.pop(match)
+        return not unmatched
+    return a == b
+
+
+def diff(pipeline: dict, reference: dict) -> list:
+    return [key for key in reference if not same(pipeline.get(key), reference[key])]
+
+
+async def check_portfolio(db, user_id: str, portfolio_id: str) -> list:
+    """Returns [(summary name, mismatched keys), ...] for one portfolio."""
+    query = {"user_id": user_id, "portfolio_id": portfolio_id, "deleted_at": None}
+    mismatches = []
+    for name, collection, summarize, reference in SUMMARIES:
+        docs = await db[collection].find(query, {"_id": 0}).to_list(None)
+        keys = diff(await summarize(db, query), reference(docs))
+        if keys:
+            mismatches.append((name, keys))
+    return mismatches
+
+
+async def run_check(portfolio_id: str = None):
+    client = AsyncIOMotorClient(MONGO_URL)
+    db = client[DB_NAME]
+
+    checked = 0
+    failed = 0
+    try:
+        query = {"portfolio_id": portfolio_id} if portfolio_id else {}
+        async for portfolio in db.portfolios.find(query, {"_id": 0, "portfolio_id": 1, "user_id": 1}):
+            checked += 1
+            mismatches = await check_portfolio(db, portfolio["user_id"], portfolio["portfolio_id"])
+            for name, keys in mismatches:
+                failed += 1
+                print(f"  MISMATCH {portfolio['portfolio_id']} {name}: {', '.join(keys)}")
+
+        print(f"Checked {checked} portfolios, {failed} mismatched summaries")
+    finally:
+        client.close()
+
+    return failed == 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--portfolio-id")
+    args = parser.parse_args()
+    sys.exit(0 if asyncio.run(run_check(args.portfolio_id)) else 1)
+
+
+if __name__ == "__main__":
+    main()
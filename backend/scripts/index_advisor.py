@@ -0,0 +1,83 @@
+"""
+Index Advisor
+
+Replays query shapes through explain and reports the ones MongoDB answers
+with a collection scan or an in-memory sort. By default the shapes are the
+samples in the hot-path index registry; --profile uses find commands the
+profiler captured instead (enable it first with db.setProfilingLevel(1)
+and let the app serve traffic).
+
+Exits non-zero when any shape scans a collection.
+
+Run: python scripts/index_advisor.py [--profile] [--limit 500] [--ensure] [--verbose]
+"""
+
+import argparse
+import asyncio
+import json
+from motor.motor_asyncio import AsyncIOMotorClient
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.index_registry import (
+    advise_indexes,
+    captured_query_shapes,
+    ensure_hot_path_indexes,
+)
+
+MONGO_URL = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
+DB_NAME = os.environ.get('DB_NAME', 'test_database')
+
+
+def describe(report: dict) -> str:
+    sort = f" sort={json.dumps(dict(report['sort']))}" if report.get("sort") else ""
+    return f"{report['collection']} {json.dumps(report['filter'], default=str)}{sort}"
+
+
+async def run_advisor(profile: bool = False, limit: int = 500, ensure: bool = False, verbose: bool = False):
+    client = AsyncIOMotorClient(MONGO_URL)
+    db = client[DB_NAME]
+
+    try:
+        if ensure:
+            failed = await ensure_hot_path_indexes(db)
+            for collection, error in failed.items():
+                print(f"  INDEX ERROR {collection}: {error}")
+
+        shapes = await captured_query_shapes(db, limit) if profile else None
+        reports = await advise_indexes(db, shapes)
+
+        scans = 0
+        for report in reports:
+            if report.get("error"):
+                print(f"  ERROR      {describe(report)}: {report['error']}")
+            elif report["collection_scan"]:
+                scans += 1
+                print(f"  COLLSCAN   {describe(report)}")
+            elif report["in_memory_sort"]:
+                print(f"  SORT       {describe(report)} via {', '.join(report['indexes'])}")
+            elif verbose:
+                print(f"  OK         {describe(report)} via {', '.join(report['indexes'])}")
+
+        print(f"Explained {len(reports)} query shapes, {scans} collection scans")
+    finally:
+        client.close()
+
+    return scans == 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--profile", action="store_true", help="Replay shapes captured by the profiler")
+    parser.add_argument("--limit", type=int, default=500, help="Profiler entries to read")
+    parser.add_argument("--ensure", action="store_true", help="Create the registry's indexes first")
+    parser.add_argument("--verbose", action="store_true", help="Also list shapes served by an index")
+    args = parser.parse_args()
+    sys.exit(0 if asyncio.run(run_advisor(args.profile, args.limit, args.ensure, args.verbose)) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -13,9 +13,13 @@ Collections to migrate:
 import asyncio
 from datetime import datetime, timezone
 from motor.motor_asyncio import AsyncIOMotorClient
-import hashlib
-import json
 import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.canonical_json import HASH_VERSION_LEGACY, canonical_hash
 
 # MongoDB connection
 MONGO_URL = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
@@ -55,8 +59,7 @@ def compute_content_hash(payload: dict, created_at: str, created_by: str, versio
         "version": version,
         "parent_hash": parent_hash or ""
     }
-    canonical = json.dumps(hashable, sort_keys=True, default=str)
-    return hashlib.sha256(canonical.encode()).hexdigest()
+    return canonical_hash(hashable, HASH_VERSION_LEGACY)
 
 
 def extract_payload(doc: dict, collection: str) -> dict:
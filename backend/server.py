@@ -48,6 +48,13 @@ db = client[os.environ.get('DB_NAME', 'test_database')]
 
 # Import V2 RMID Allocator
 from services.rmid_v2 import RMIDAllocator, init_allocator
+from services.subject_code_registry import claim_subject_code, check_subject_code_registry
+from services.soft_delete import live_filter
+from services.bson_dates import decode_all
+from services.dashboard_rollups import (
+    track_insert, track_update, track_delete, clear_rollup_collections,
+    get_dashboard_rollup, reconcile_dashboard_rollups
+)
 
 # Global V2 allocator instance
 rmid_allocator: Optional[RMIDAllocator] = None
@@ -796,8 +803,8 @@ async def register(request: Request, response: Response):
     session_doc = {
         "session_token": session_token,
         "user_id": user_id,
-        "expires_at": expires_at.isoformat(),
-        "created_at": datetime.now(timezone.utc).isoformat()
+        "expires_at": expires_at,
+        "created_at": datetime.now(timezone.utc)
     }
     await db.user_sessions.insert_one(session_doc)
     
@@ -835,8 +842,8 @@ async def login(request: Request, response: Response):
     session_doc = {
         "session_token": session_token,
         "user_id": user_doc["user_id"],
-        "expires_at": expires_at.isoformat(),
-        "created_at": datetime.now(timezone.utc).isoformat()
+        "expires_at": expires_at,
+        "created_at": datetime.now(timezone.utc)
     }
     
     # Remove old sessions for this user
@@ -1051,8 +1058,8 @@ async def create_session(request: Request, response: Response):
     session_doc = {
         "session_token": session_token,
         "user_id": user_id,
-        "expires_at": expires_at.isoformat(),
-        "created_at": datetime.now(timezone.utc).isoformat()
+        "expires_at": expires_at,
+        "created_at": datetime.now(timezone.utc)
     }
     await db.user_sessions.insert_one(session_doc)
     
@@ -1150,8 +1157,8 @@ async def switch_dev_account(request: Request, response: Response):
     session_doc = {
         "session_token": session_token,
         "user_id": OWNER_USER_ID,
-        "expires_at": expires_at.isoformat(),
-        "created_at": datetime.now(timezone.utc).isoformat(),
+        "expires_at": expires_at,
+        "created_at": datetime.now(timezone.utc),
         "is_dev_session": True
     }
     await db.user_sessions.insert_one(session_doc)
@@ -1321,7 +1328,7 @@ async def get_portfolios(user: User = Depends(get_current_user)):
         count = await db.documents.count_documents({
             "user_id": user.user_id,
             "portfolio_id": portfolio["portfolio_id"],
-            "$or": [{"is_deleted": False}, {"is_deleted": {"$exists": False}}]
+            **live_filter("documents")
         })
         portfolio["document_count"] = count
     
@@ -1335,6 +1342,7 @@ async def create_portfolio(data: PortfolioCreate, user: User = Depends(get_curre
     doc['created_at'] = doc['created_at'].isoformat()
     doc['updated_at'] = doc['updated_at'].isoformat()
     await db.portfolios.insert_one(doc)
+    await track_insert(db, "portfolios", doc)
     # Return document without MongoDB _id field
     return {k: v for k, v in doc.items() if k != '_id'}
 
@@ -1359,6 +1367,9 @@ async def delete_portfolio(portfolio_id: str, user: User = Depends(get_current_u
     await db.documents.delete_many({"portfolio_id": portfolio_id})
     await db.parties.delete_many({"portfolio_id": portfolio_id})
     await db.mail_events.delete_many({"portfolio_id": portfolio_id})
+    await clear_rollup_collections(
+        db, user.user_id, portfolio_id, ["portfolios", "assets", "notices", "documents"]
+    )
     return {"message": "Portfolio deleted"}
 
 
@@ -2072,148 +2083,9 @@ async def generate_subject_rm_id(portfolio_id: str, user_id: str, subject_code:
     })
     cat_name = category.get("name", subject_name) if category else subject_name
     
-    # Helper to extract subject code from RM-ID
-    def extract_code_from_rm_id(rm_id):
-        """Extract subject code from RM-ID. Returns code as string or None."""
-        if not rm_id or "-" not in rm_id or "." not in rm_id:
-            return None
-        try:
-            parts = rm_id.split("-")
-            if len(parts) >= 2:
-                code_seq = parts[-1].split(".")
-                if len(code_seq) == 2:
-                    return code_seq[0]
-        except:
-            pass
-        return None
-    
-    # Find ALL used subject codes across ALL collections
-    used_codes = set()
-    
-    # Reserved codes: 00-09 for templates
-    # Governance codes 20-29 are NOT in reserved_codes because each governance module
-    # uses its own designated code (20=Meetings, 21=Distributions, 22=Disputes, 23=Insurance, 24=Compensation)
-    # Non-governance items should skip 20-29 when finding available codes
-    reserved_codes = {"00", "01", "02", "03", "04", "05", "06", "07", "08", "09"}
-    
-    # Governance codes that are designated for specific modules
-    governance_codes = {"20", "21", "22", "23", "24", "25", "26", "27", "28", "29"}
-    
-    # Check assets for used codes
-    assets = await db.assets.find(
-        {"portfolio_id": portfolio_id, "user_id": user_id},
-        {"subject_code": 1, "rm_id": 1}
-    ).to_list(10000)
-    for asset in assets:
-        if asset.get("subject_code"):
-            used_codes.add(asset["subject_code"])
-        code = extract_code_from_rm_id(asset.get("rm_id"))
-        if code:
-            used_codes.add(code)
-    
-    # Check ledger entries for used codes (standalone entries, not asset-linked)
-    ledger_entries = await db.trust_ledger.find(
-        {"portfolio_id": portfolio_id, "user_id": user_id, "asset_id": None},
-        {"subject_code": 1, "rm_id": 1}
-    ).to_list(10000)
-    for entry in ledger_entries:
-        if entry.get("subject_code"):
-            used_codes.add(entry["subject_code"])
-        code = extract_code_from_rm_id(entry.get("rm_id"))
-        if code:
-            used_codes.add(code)
-    
-    # Check documents for used codes
-    docs = await db.documents.find(
-        {"portfolio_id": portfolio_id, "user_id": user_id},
-        {"subject_code": 1, "rm_id": 1}
-    ).to_list(10000)
-    for doc in docs:
-        if doc.get("subject_code"):
-            used_codes.add(doc["subject_code"])
-        code = extract_code_from_rm_id(doc.get("rm_id"))
-        if code:
-            used_codes.add(code)
-    
-    # Check governance collections for used codes
-    # Meetings
-    meetings = await db.meetings.find(
-        {"portfolio_id": portfolio_id, "user_id": user_id},
-        {"rm_id": 1}
-    ).to_list(10000)
-    for m in meetings:
-        code = extract_code_from_rm_id(m.get("rm_id"))
-        if code:
-            used_codes.add(code)
-    
-    # Distributions
-    distributions = await db.distributions.find(
-        {"portfolio_id": portfolio_id, "user_id": user_id},
-        {"rm_id": 1}
-    ).to_list(10000)
-    for d in distributions:
-        code = extract_code_from_rm_id(d.get("rm_id"))
-        if code:
-            used_codes.add(code)
-    
-    # Disputes
-    disputes = await db.disputes.find(
-        {"portfolio_id": portfolio_id, "user_id": user_id},
-        {"rm_id": 1}
-    ).to_list(10000)
-    for d in disputes:
-        code = extract_code_from_rm_id(d.get("rm_id"))
-        if code:
-            used_codes.add(code)
-    
-    # Insurance Policies
-    insurance_policies = await db.insurance_policies.find(
-        {"portfolio_id": portfolio_id, "user_id": user_id},
-        {"rm_id": 1}
-    ).to_list(10000)
-    for p in insurance_policies:
-        code = extract_code_from_rm_id(p.get("rm_id"))
-        if code:
-            used_codes.add(code)
-    
-    # Determine if this is a governance code request
-    requested_code_int = int(subject_code) if subject_code.isdigit() else 10
-    is_governance_request = 20 <= requested_code_int <= 29
-    
-    # For governance modules requesting their specific code (20-29), 
-    # they can ALWAYS use their designated code - no uniqueness check needed
-    # because each module has its own designated code
-    if is_governance_request:
-        # Governance modules use their designated code directly
-        # 20=Meetings, 21=Distributions, 22=Disputes, 23=Insurance, 24=Compensation
-        assigned_code = f"{requested_code_int:02d}"
-    else:
-        # Non-governance items need to find an available code
-        assigned_code_int = requested_code_int
-        
-        # Find next available code
-        while True:
-            code_str = f"{assigned_code_int:02d}"
-            # Skip reserved (00-09) and governance (20-29) ranges
-            if code_str not in used_codes and code_str not in reserved_codes and code_str not in governance_codes:
-                break
-            assigned_code_int += 1
-            # Skip governance reserved range 20-29 for non-governance items
-            if 20 <= assigned_code_int <= 29:
-                assigned_code_int = 30
-            # Cap at 99
-            if assigned_code_int > 99:
-                # Wrap around and find any available
-                for i in range(10, 100):
-                    if i >= 20 and i <= 29:
-                        continue  # Skip governance range
-                    code_str = f"{i:02d}"
-                    if code_str not in used_codes and code_str not in reserved_codes:
-                        assigned_code_int = i
-                        break
-                break
-        
-        assigned_code = f"{assigned_code_int:02d}"
+    # Claim the next available whole code from the portfolio's subject code
+    # registry (governance modules 20-29 use their designated code directly)
+    assigned_code = await claim_subject_code(db, portfolio_id, user_id, subject_code)
     
     # Sequence number is always 001 for the main entry
     # Sub-items would use 002, 003, etc.
@@ -2318,6 +2190,48 @@ async def preview_rm_id(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@api_router.get("/rm/groups/availability")
+async def get_rm_group_availability(
+    portfolio_id: str,
+    user: User = Depends(get_current_user)
+):
+    """
+    Group number usage for a portfolio, with bitmap claim contention
+    counters (compare-and-set retries and stale-bitmap conflicts).
+    """
+    global rmid_allocator
+    
+    if rmid_allocator is None:
+        raise HTTPException(status_code=503, detail="RM-ID allocator not initialized")
+    
+    try:
+        result = await rmid_allocator.get_group_availability(portfolio_id, user.user_id)
+        return {"ok": True, "data": result}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@api_router.get("/rm/subject-codes/check")
+async def check_rm_subject_codes(
+    portfolio_id: str,
+    repair: bool = False,
+    release_unused: bool = False,
+    user: User = Depends(get_current_user)
+):
+    """
+    Compare a portfolio's subject code registry with the codes its items
+    actually hold. repair=true registers missing codes; release_unused=true
+    also frees codes no item holds any more.
+    """
+    try:
+        result = await check_subject_code_registry(
+            db, portfolio_id, user.user_id, repair=repair, release_unused=release_unused
+        )
+        return {"ok": True, "data": result}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @api_router.get("/portfolios/{portfolio_id}/subject-categories")
 async def get_subject_categories(portfolio_id: str, user: User = Depends(get_current_user)):
     """Get all subject categories for a portfolio"""
@@ -2466,6 +2380,7 @@ async def create_asset_for_portfolio(portfolio_id: str, data: dict, user: User =
     doc['created_at'] = doc['created_at'].isoformat()
     doc['updated_at'] = doc['updated_at'].isoformat()
     await db.assets.insert_one(doc)
+    await track_insert(db, "assets", doc)
     
     # Also create a ledger entry for this asset deposit
     ledger_entry = TrustLedgerEntry(
@@ -2537,6 +2452,7 @@ async def create_asset(data: AssetCreate, user: User = Depends(get_current_user)
     doc['created_at'] = doc['created_at'].isoformat()
     doc['updated_at'] = doc['updated_at'].isoformat()
     await db.assets.insert_one(doc)
+    await track_insert(db, "assets", doc)
     return {k: v for k, v in doc.items() if k != '_id'}
 
 
@@ -2567,6 +2483,7 @@ async def delete_asset(asset_id: str, user: User = Depends(get_current_user)):
     await db.trust_ledger.insert_one(ledger_doc)
     
     await db.assets.delete_one({"asset_id": asset_id, "user_id": user.user_id})
+    await track_delete(db, "assets", asset)
     return {"message": "Asset deleted", "rm_id": asset.get("rm_id", "")}
 
 
@@ -2687,26 +2604,33 @@ async def create_notice(data: NoticeCreate, user: User = Depends(get_current_use
     doc['created_at'] = doc['created_at'].isoformat()
     doc['updated_at'] = doc['updated_at'].isoformat()
     await db.notices.insert_one(doc)
+    await track_insert(db, "notices", doc)
     # Return document without MongoDB _id field
     return {k: v for k, v in doc.items() if k != '_id'}
 
 
 @api_router.put("/notices/{notice_id}")
 async def update_notice_status(notice_id: str, status: str, user: User = Depends(get_current_user)):
-    result = await db.notices.update_one(
+    before = await db.notices.find_one_and_update(
         {"notice_id": notice_id, "user_id": user.user_id},
-        {"$set": {"status": status, "updated_at": datetime.now(timezone.utc).isoformat()}}
+        {"$set": {"status": status, "updated_at": datetime.now(timezone.utc).isoformat()}},
+        projection={"_id": 0, "user_id": 1, "portfolio_id": 1, "status": 1}
     )
-    if result.modified_count == 0:
+    if before is None:
         raise HTTPException(status_code=404, detail="Notice not found")
+    await track_update(db, "notices", before, {**before, "status": status})
     return {"message": "Notice updated"}
 
 
 @api_router.delete("/notices/{notice_id}")
 async def delete_notice(notice_id: str, user: User = Depends(get_current_user)):
-    result = await db.notices.delete_one({"notice_id": notice_id, "user_id": user.user_id})
-    if result.deleted_count == 0:
+    deleted = await db.notices.find_one_and_delete(
+        {"notice_id": notice_id, "user_id": user.user_id},
+        projection={"_id": 0, "user_id": 1, "portfolio_id": 1, "status": 1}
+    )
+    if deleted is None:
         raise HTTPException(status_code=404, detail="Notice not found")
+    await track_delete(db, "notices", deleted)
     return {"message": "Notice deleted"}
 
 
@@ -2866,7 +2790,7 @@ async def get_documents(
         )
     
     if not include_deleted:
-        query["$or"] = [{"is_deleted": False}, {"is_deleted": {"$exists": False}}]
+        query.update(live_filter("documents"))
     # Sort ascending by created_at (oldest first, lowest sequence first)
     docs = await db.documents.find(query, {"_id": 0}).sort("created_at", 1).to_list(100)
     return docs
@@ -2926,6 +2850,7 @@ async def create_document(data: DocumentCreate, user: User = Depends(get_current
     if doc_dict.get('pinned_at'):
         doc_dict['pinned_at'] = doc_dict['pinned_at'].isoformat()
     await db.documents.insert_one(doc_dict)
+    await track_insert(db, "documents", doc_dict)
     # Return document without MongoDB _id field - ensure document_id is returned
     result = {k: v for k, v in doc_dict.items() if k != '_id'}
     logger.info(f"Document created: {result['document_id']}")
@@ -2954,7 +2879,7 @@ async def get_document(document_id: str, user: User = Depends(get_current_user))
 async def get_recent_documents(limit: int = 10, user: User = Depends(get_current_user)):
     """Get recently accessed documents"""
     docs = await db.documents.find(
-        {"user_id": user.user_id, "is_deleted": {"$ne": True}},
+        {"user_id": user.user_id, **live_filter("documents")},
         {"_id": 0}
     ).sort("last_accessed", -1).limit(limit).to_list(limit)
     return docs
@@ -2964,7 +2889,7 @@ async def get_recent_documents(limit: int = 10, user: User = Depends(get_current
 async def get_pinned_documents(user: User = Depends(get_current_user)):
     """Get pinned/favorite documents"""
     docs = await db.documents.find(
-        {"user_id": user.user_id, "is_pinned": True, "is_deleted": {"$ne": True}},
+        {"user_id": user.user_id, "is_pinned": True, **live_filter("documents")},
         {"_id": 0}
     ).sort("pinned_at", -1).to_list(50)
     return docs
@@ -3036,6 +2961,7 @@ async def delete_document(document_id: str, permanent: bool = False, user: User
         # Permanently delete
         await db.documents.delete_one({"document_id": document_id})
         await db.document_versions.delete_many({"document_id": document_id})
+        await track_delete(db, "documents", doc)
         return {"message": "Document permanently deleted"}
     else:
         # Soft delete - move to trash
@@ -3077,6 +3003,7 @@ async def permanently_delete_document(document_id: str, user: User = Depends(get
     
     await db.documents.delete_one({"document_id": document_id})
     await db.document_versions.delete_many({"document_id": document_id})
+    await track_delete(db, "documents", doc)
     return {"message": "Document permanently deleted"}
 
 
@@ -3115,7 +3042,7 @@ async def create_amendment(document_id: str, request: AmendmentRequest = None, u
     """
     # Get the original document
     original = await db.documents.find_one(
-        {"document_id": document_id, "user_id": user.user_id, "is_deleted": {"$ne": True}},
+        {"document_id": document_id, "user_id": user.user_id, **live_filter("documents")},
         {"_id": 0}
     )
     if not original:
@@ -3174,7 +3101,7 @@ async def create_amendment(document_id: str, request: AmendmentRequest = None, u
             "portfolio_id": portfolio_id,
             "user_id": user.user_id,
             "sub_record_id": {"$regex": f"^{re.escape(base_rm_id)}-{subject_code}\\."},
-            "is_deleted": {"$ne": True}
+            **live_filter("documents")
         },
         {"sub_record_id": 1}
     ).to_list(1000)
@@ -3225,6 +3152,7 @@ async def create_amendment(document_id: str, request: AmendmentRequest = None, u
     
     # Insert the amendment
     await db.documents.insert_one(amendment_dict)
+    await track_insert(db, "documents", amendment_dict)
     
     # Mark the original document as superseded (no longer controlling)
     await db.documents.update_one(
@@ -3272,7 +3200,7 @@ async def get_document_amendments(document_id: str, user: User = Depends(get_cur
     
     # Get the root document
     root_doc = await db.documents.find_one(
-        {"document_id": root_id, "user_id": user.user_id, "is_deleted": {"$ne": True}},
+        {"document_id": root_id, "user_id": user.user_id, **live_filter("documents")},
         {"_id": 0}
     )
     
@@ -3284,7 +3212,7 @@ async def get_document_amendments(document_id: str, user: User = Depends(get_cur
         {
             "amends_document_id": root_id,
             "user_id": user.user_id,
-            "is_deleted": {"$ne": True}
+            **live_filter("documents")
         },
         {"_id": 0}
     ).sort("amendment_number", 1).to_list(100)
@@ -3370,6 +3298,7 @@ async def duplicate_document(document_id: str, user: User = Depends(get_current_
     doc_dict['created_at'] = doc_dict['created_at'].isoformat()
     doc_dict['updated_at'] = doc_dict['updated_at'].isoformat()
     await db.documents.insert_one(doc_dict)
+    await track_insert(db, "documents", doc_dict)
     return {k: v for k, v in doc_dict.items() if k != '_id'}
 
 
@@ -4083,6 +4012,7 @@ Return ONLY the document content in HTML format."""
         doc_dict['last_accessed'] = doc_dict['last_accessed'].isoformat()
         
         await db.documents.insert_one(doc_dict)
+        await track_insert(db, "documents", doc_dict)
         
         return {
             "message": "Document generated successfully",
@@ -4320,7 +4250,7 @@ async def create_document_packet(request: PacketRequest, user: User = Depends(ge
     with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
         for doc_id in request.document_ids:
             doc = await db.documents.find_one(
-                {"document_id": doc_id, "user_id": user.user_id, "deleted_at": None},
+                {"document_id": doc_id, "user_id": user.user_id, **live_filter("documents")},
                 {"_id": 0}
             )
             
@@ -4493,18 +4423,18 @@ async def toggle_bookmark(module_id: str, lesson_id: str, user: User = Depends(g
 async def get_maxim_study_progress(user: User = Depends(get_current_user)):
     """Get all maxim study progress"""
     progress = await db.maxim_study.find({"user_id": user.user_id}, {"_id": 0}).to_list(100)
-    return progress
+    return decode_all(progress, "maxim_study")
 
 
 @api_router.get("/study/maxims/due")
 async def get_due_maxims(user: User = Depends(get_current_user)):
     """Get maxims due for review (spaced repetition)"""
-    now = datetime.now(timezone.utc).isoformat()
+    now = datetime.now(timezone.utc)
     due = await db.maxim_study.find(
         {"user_id": user.user_id, "next_review": {"$lte": now}},
         {"_id": 0}
     ).sort("next_review", 1).to_list(20)
-    return due
+    return decode_all(due, "maxim_study")
 
 
 @api_router.post("/study/maxims/review")
@@ -4553,8 +4483,8 @@ async def review_maxim(
                 "ease_factor": ef,
                 "interval_days": interval,
                 "repetitions": reps,
-                "next_review": next_review.isoformat(),
-                "last_reviewed": now.isoformat(),
+                "next_review": next_review,
+                "last_reviewed": now,
                 "correct_streak": streak,
                 "total_reviews": existing.get("total_reviews", 0) + 1
             }}
@@ -4574,12 +4504,7 @@ async def review_maxim(
             correct_streak=1 if quality >= 3 else 0,
             total_reviews=1
         )
-        study_dict = study.model_dump()
-        study_dict["next_review"] = study_dict["next_review"].isoformat()
-        study_dict["last_reviewed"] = study_dict["last_reviewed"].isoformat()
-        study_dict["created_at"] = study_dict["created_at"].isoformat()
-        
-        await db.maxim_study.insert_one(study_dict)
+        await db.maxim_study.insert_one(study.model_dump())
     
     return {"status": "recorded", "next_review_days": interval}
 
@@ -4596,7 +4521,7 @@ async def get_study_stats(user: User = Depends(get_current_user)):
     
     # Maxim study stats
     total_maxims_studied = await db.maxim_study.count_documents({"user_id": user.user_id})
-    now = datetime.now(timezone.utc).isoformat()
+    now = datetime.now(timezone.utc)
     due_for_review = await db.maxim_study.count_documents({
         "user_id": user.user_id,
         "next_review": {"$lte": now}
@@ -4623,25 +4548,46 @@ async def get_study_stats(user: User = Depends(get_current_user)):
 
 @api_router.get("/dashboard/stats")
 async def get_dashboard_stats(user: User = Depends(get_current_user)):
-    """Get dashboard statistics"""
-    portfolios_count = await db.portfolios.count_documents({"user_id": user.user_id})
-    documents_count = await db.documents.count_documents({"user_id": user.user_id})
-    assets_count = await db.assets.count_documents({"user_id": user.user_id})
-    notices_pending = await db.notices.count_documents({"user_id": user.user_id, "status": "pending"})
+    """Get dashboard statistics (counts come from the materialized dashboard rollups)"""
+    rollup = await get_dashboard_rollup(db, user.user_id)
+    counts = rollup["counts"]
     
     recent_docs = await db.documents.find(
         {"user_id": user.user_id}, {"_id": 0, "document_id": 1, "title": 1, "updated_at": 1}
     ).sort("updated_at", -1).limit(5).to_list(5)
     
     return {
-        "portfolios": portfolios_count,
-        "documents": documents_count,
-        "assets": assets_count,
-        "pending_notices": notices_pending,
+        "portfolios": counts.get("portfolios", 0),
+        "documents": counts.get("documents", 0),
+        "assets": counts.get("assets", 0),
+        "pending_notices": rollup["status_counts"].get("notices", {}).get("pending", 0),
         "recent_documents": recent_docs
     }
 
 
+@api_router.get("/dashboard/rollup")
+async def get_dashboard_rollup_endpoint(
+    portfolio_id: Optional[str] = None,
+    user: User = Depends(get_current_user)
+):
+    """
+    Materialized counters for one portfolio (or all portfolios): counts by
+    collection, status and governance module, and amount totals by currency.
+    """
+    rollup = await get_dashboard_rollup(db, user.user_id, portfolio_id)
+    return {"ok": True, "data": rollup}
+
+
+@api_router.post("/dashboard/rollup/reconcile")
+async def reconcile_dashboard_rollup(user: User = Depends(get_current_user)):
+    """Rebuild the current user's rollups from the source collections."""
+    try:
+        stats = await reconcile_dashboard_rollups(db, user.user_id)
+        return {"ok": True, "data": stats}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 # ============ NOTIFICATION ENDPOINTS ============
 
 @api_router.get("/notifications")
@@ -5460,6 +5406,16 @@ async def startup_init():
     except Exception as e:
         logger.error(f"❌ Failed to initialize Email Service: {e}")
     
+    # Initialize hot-path indexes from the index registry
+    try:
+        from services.index_registry import ensure_hot_path_indexes
+        failed = await ensure_hot_path_indexes(db)
+        if failed:
+            logger.warning(f"Hot-path indexes not created for: {failed}")
+        logger.info("✅ Hot-path indexes initialized")
+    except Exception as e:
+        logger.error(f"❌ Failed to initialize hot-path indexes: {e}")
+    
     # Initialize RM Subject indexes
     try:
         await ensure_rm_subject_indexes(db)
@@ -5467,6 +5423,114 @@ async def startup_init():
     except Exception as e:
         logger.error(f"❌ Failed to initialize RM Subject indexes: {e}")
     
+    # Initialize Trust Health rollup indexes
+    try:
+        from services.health_rollups import ensure_health_rollup_indexes
+        await ensure_health_rollup_indexes(db)
+        logger.info("✅ Health rollup indexes initialized")
+    except Exception as e:
+        logger.error(f"❌ Failed to initialize health rollup indexes: {e}")
+    
+    # Initialize integrity seal / Merkle root indexes
+    try:
+        from services.integrity_seal import ensure_integrity_seal_indexes, signing_key_status
+        await ensure_integrity_seal_indexes(db)
+        logger.info("✅ Integrity seal indexes initialized")
+        key_status = signing_key_status()
+        if key_status == "missing":
+            logger.error("❌ INTEGRITY_SIGNING_KEY is not set: Merkle roots will not be signed or verified")
+        elif key_status == "dev":
+            logger.warning("Merkle roots are signed with the public development key (INTEGRITY_ALLOW_DEV_KEY=true); not for production")
+    except Exception as e:
+        # Seal positions are only safe with the unique leaf index in place
+        logger.error(f"❌ Failed to initialize integrity seal indexes: {e}")
+        raise
+    
+    # Initialize integrity hash chain checkpoint indexes
+    try:
+        from services.integrity_checker import ensure_integrity_checkpoint_indexes
+        await ensure_integrity_checkpoint_indexes(db)
+        logger.info("✅ Integrity chain checkpoint indexes initialized")
+    except Exception as e:
+        logger.error(f"❌ Failed to initialize integrity chain checkpoint indexes: {e}")
+    
+    # Initialize governance RM-ID sort keys (index + backfill for older documents)
+    try:
+        from services.rm_sort_key import ensure_rm_sort_indexes, backfill_rm_sort_keys
+        await ensure_rm_sort_indexes(db)
+        backfilled = await backfill_rm_sort_keys(db)
+        logger.info(f"✅ Governance RM-ID sort keys initialized (backfilled: {sum(backfilled.values())})")
+    except Exception as e:
+        logger.error(f"❌ Failed to initialize governance RM-ID sort keys: {e}")
+    
+    # Initialize governance activity feed indexes
+    try:
+        from services.activity_feed import ensure_activity_feed_indexes
+        await ensure_activity_feed_indexes(db)
+        logger.info("✅ Governance activity feed indexes initialized")
+    except Exception as e:
+        logger.error(f"❌ Failed to initialize governance activity feed indexes: {e}")
+    
+    # Initialize governance revision diff cache indexes
+    try:
+        from services.revision_diff import ensure_diff_cache_indexes
+        await ensure_diff_cache_indexes(db)
+        logger.info("✅ Revision diff cache indexes initialized")
+    except Exception as e:
+        logger.error(f"❌ Failed to initialize revision diff cache indexes: {e}")
+    
+    # Initialize governance bulk import indexes
+    try:
+        from services.governance_import import ensure_import_indexes
+        await ensure_import_indexes(db)
+        logger.info("✅ Governance bulk import indexes initialized")
+    except Exception as e:
+        logger.error(f"❌ Failed to initialize governance bulk import indexes: {e}")
+    
+    # Initialize governance search tokens (index + backfill for older documents)
+    try:
+        from services.search_tokens import ensure_search_indexes, backfill_search_tokens
+        await ensure_search_indexes(db)
+        backfilled = await backfill_search_tokens(db)
+        logger.info(f"✅ Governance search tokens initialized (backfilled: {sum(backfilled.values())})")
+    except Exception as e:
+        logger.error(f"❌ Failed to initialize governance search tokens: {e}")
+    
+    # Initialize soft-delete filters (backfill the field on older documents + live-only indexes)
+    try:
+        from services.soft_delete import normalize_soft_delete_fields, ensure_live_indexes
+        normalized = await normalize_soft_delete_fields(db)
+        await ensure_live_indexes(db)
+        logger.info(f"✅ Soft-delete filters initialized (normalized: {sum(normalized.values())})")
+    except Exception as e:
+        logger.error(f"❌ Failed to initialize soft-delete filters: {e}")
+    
+    # Initialize native date fields (convert older ISO strings + session TTL index)
+    try:
+        from services.bson_dates import migrate_date_fields, ensure_date_indexes
+        converted = await migrate_date_fields(db)
+        await ensure_date_indexes(db)
+        logger.info(f"✅ Native date fields initialized (converted: {sum(converted.values())})")
+    except Exception as e:
+        logger.error(f"❌ Failed to initialize native date fields: {e}")
+    
+    # Initialize legacy subject code registry indexes
+    try:
+        from services.subject_code_registry import ensure_subject_code_registry_indexes
+        await ensure_subject_code_registry_indexes(db)
+        logger.info("✅ Subject code registry indexes initialized")
+    except Exception as e:
+        logger.error(f"❌ Failed to initialize subject code registry indexes: {e}")
+    
+    # Initialize dashboard rollups (index + background drift reconciler)
+    try:
+        from services.dashboard_rollups import ensure_dashboard_rollup_indexes, start_rollup_reconciler
+        await ensure_dashboard_rollup_indexes(db)
+        start_rollup_reconciler(db)
+        logger.info("✅ Dashboard rollups initialized")
+    except Exception as e:
+        logger.error(f"❌ Failed to initialize dashboard rollups: {e}")
+    
     # Initialize Ledger Thread indexes for collision prevention
     try:
         await db.rm_subjects.create_index(
@@ -5547,6 +5611,8 @@ async def seed_dev_test_accounts():
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    from services.dashboard_rollups import stop_rollup_reconciler
+    stop_rollup_reconciler()
     client.close()
 
 # Temporary download endpoint for backup file
@@ -1,5 +1,5 @@
 from .rmid import normalize_rm_id, generate_subject_rm_id, get_or_create_subject_category, seed_default_categories
-from .rmid_v2 import RMIDAllocator, init_allocator, allocate_rm_id
+from .rmid_v2 import RMIDAllocator, init_allocator, allocate_rm_id, allocate_rm_ids
 
 # pdf module is optional
 try:
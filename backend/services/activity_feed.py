@@ -0,0 +1,117 @@
+"""
+Governance Activity Feed
+
+The Signal Feed lists recent activity across the legacy governance modules.
+Each page fans out one keyset query per module concurrently and k-way merges
+the (already sorted) results with a heap, so a page costs one round of
+queries no matter how deep it is.
+
+Feed order is (updated_at, type, id) descending. The last item of a page is
+encoded as an opaque cursor; the next page asks every module only for
+documents strictly after it.
+"""
+
+import asyncio
+import heapq
+from itertools import islice
+from typing import Any, Dict, List, Optional, Tuple
+
+from services.keyset_pagination import InvalidCursor, decode_cursor, encode_cursor
+
+
+# (activity type, collection, id field, projected fields)
+ACTIVITY_SOURCES = [
+    ("meeting", "meetings", "meeting_id", ["title", "rm_id", "status"]),
+    ("distribution", "distributions", "distribution_id", ["title", "rm_id", "status", "amount"]),
+    ("dispute", "disputes", "dispute_id", ["title", "rm_id", "status"]),
+    ("insurance", "insurance_policies", "policy_id", ["title", "rm_id", "status", "death_benefit"]),
+    ("compensation", "compensation_entries", "compensation_id", ["title", "rm_id", "status", "amount", "recipient_name"]),
+]
+
+MAX_FEED_LIMIT = 100
+
+
+def _decode_position(cursor: str) -> Tuple[Optional[str], str, str]:
+    position = decode_cursor(cursor)
+    if len(position) != 3:
+        raise InvalidCursor("Invalid activity feed cursor")
+    return tuple(position)
+
+
+def _after_cursor(activity_type: str, id_field: str, cursor: Tuple) -> Optional[Dict[str, Any]]:
+    """
+    Filter for one module's documents that sort after the cursor, or None if
+    none can. Missing updated_at sorts last (MongoDB orders null below strings).
+    """
+    ts, cursor_type, cursor_id = cursor
+    if activity_type < cursor_type:
+        same_ts = {"updated_at": ts}
+    elif activity_type == cursor_type:
+        same_ts = {"updated_at": ts, id_field: {"$lt": cursor_id}}
+    else:
+        same_ts = None
+
+    if ts is None:
+        return same_ts
+    clauses = [{"updated_at": {"$lt": ts}}, {"updated_at": None}]
+    if same_ts:
+        clauses.append(same_ts)
+    return {"$or": clauses}
+
+
+def _sort_key(activity_type: str, doc: Dict[str, Any], id_field: str) -> Tuple:
+    return (doc.get("updated_at") or "", activity_type, doc.get(id_field) or "")
+
+
+async def _fetch_source(db, source, base_query: Dict[str, Any], cursor: Optional[Tuple], limit: int) -> List[Tuple]:
+    activity_type, collection, id_field, fields = source
+    query = dict(base_query)
+    if cursor:
+        after = _after_cursor(activity_type, id_field, cursor)
+        if after is None:
+            return []
+        query = {"$and": [base_query, after]}
+
+    projection = {"_id": 0, id_field: 1, "created_at": 1, "updated_at": 1}
+    projection.update({field: 1 for field in fields})
+    docs = await db[collection].find(query, projection).sort(
+        [("updated_at", -1), (id_field, -1)]
+    ).limit(limit).to_list(limit)
+    return [(_sort_key(activity_type, doc, id_field), activity_type, doc) for doc in docs]
+
+
+async def fetch_activity_page(
+    db,
+    base_query: Dict[str, Any],
+    limit: int,
+    cursor: Optional[str] = None
+) -> Tuple[List[Tuple[str, Dict[str, Any]]], Optional[str]]:
+    """
+    One feed page as [(activity type, document), ...] newest first, plus the
+    cursor for the next page (None on the last page).
+    """
+    limit = max(1, min(limit, MAX_FEED_LIMIT))
+    position = _decode_position(cursor) if cursor else None
+
+    # One extra row per module tells us whether another page exists
+    streams = await asyncio.gather(*[
+        _fetch_source(db, source, base_query, position, limit + 1)
+        for source in ACTIVITY_SOURCES
+    ])
+    merged = list(islice(heapq.merge(*streams, key=lambda entry: entry[0], reverse=True), limit + 1))
+
+    page = merged[:limit]
+    next_cursor = None
+    if len(merged) > limit:
+        (ts, activity_type, item_id), _, _ = page[-1]
+        next_cursor = encode_cursor([ts or None, activity_type, item_id])
+    return [(activity_type, doc) for _, activity_type, doc in page], next_cursor
+
+
+async def ensure_activity_feed_indexes(db):
+    """Index each module's feed order behind the user filter."""
+    for activity_type, collection, id_field, _ in ACTIVITY_SOURCES:
+        await db[collection].create_index(
+            [("user_id", 1), ("updated_at", -1), (id_field, -1)],
+            name="user_activity_feed"
+        )
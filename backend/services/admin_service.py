@@ -17,6 +17,7 @@ from models.admin import (
     AdminAuditAction
 )
 from services.entitlement_service import EntitlementService
+from services.keyset_pagination import TOTAL_EXACT, keyset_page
 from services.subscription_service import SubscriptionService
 
 logger = logging.getLogger(__name__)
@@ -392,9 +393,11 @@ class AdminService:
         search: str = None,
         skip: int = 0,
         limit: int = 50,
-        ip_address: str = None
+        ip_address: str = None,
+        cursor: str = None,
+        total_mode: str = TOTAL_EXACT
     ) -> Dict:
-        """List all accounts (admin only)"""
+        """List all accounts, oldest first (admin only). Raises InvalidCursor for a bad cursor."""
         if not await self.can_access_admin(admin_user_id):
             raise PermissionError("Admin access required")
         
@@ -405,12 +408,11 @@ class AdminService:
                 {"account_id": {"$regex": search, "$options": "i"}}
             ]
         
-        accounts = await self.db.accounts.find(
-            query,
-            {"_id": 0}
-        ).skip(skip).limit(limit).to_list(limit)
-        
-        total = await self.db.accounts.count_documents(query)
+        page = await keyset_page(
+            self.db.accounts, query, [("created_at", 1)], "account_id",
+            limit, cursor=cursor, offset=skip, total=total_mode
+        )
+        accounts = page["items"]
         
         # Enrich with subscription data
         enriched = []
@@ -430,9 +432,12 @@ class AdminService:
         
         return {
             "accounts": enriched,
-            "total": total,
+            "total": page["total"],
+            "total_is_estimate": page["total_is_estimate"],
             "skip": skip,
-            "limit": limit
+            "limit": limit,
+            "next_cursor": page["next_cursor"],
+            "has_more": page["has_more"]
         }
     
     async def get_account_details(
@@ -723,9 +728,11 @@ class AdminService:
         admin_user_id: str,
         search: str = None,
         skip: int = 0,
-        limit: int = 50
+        limit: int = 50,
+        cursor: str = None,
+        total_mode: str = TOTAL_EXACT
     ) -> Dict:
-        """List all users (admin only)"""
+        """List all users, oldest first (admin only). Raises InvalidCursor for a bad cursor."""
         if not await self.can_access_admin(admin_user_id):
             raise PermissionError("Admin access required")
         
@@ -737,12 +744,12 @@ class AdminService:
                 {"user_id": {"$regex": search, "$options": "i"}}
             ]
         
-        users = await self.db.users.find(
-            query,
-            {"_id": 0, "password_hash": 0}
-        ).skip(skip).limit(limit).to_list(limit)
-        
-        total = await self.db.users.count_documents(query)
+        page = await keyset_page(
+            self.db.users, query, [("created_at", 1)], "user_id",
+            limit, cursor=cursor, offset=skip, total=total_mode,
+            projection={"_id": 0, "password_hash": 0}
+        )
+        users = page["items"]
         
         # Enrich with global roles
         enriched = []
@@ -756,9 +763,12 @@ class AdminService:
         
         return {
             "users": enriched,
-            "total": total,
+            "total": page["total"],
+            "total_is_estimate": page["total_is_estimate"],
             "skip": skip,
-            "limit": limit
+            "limit": limit,
+            "next_cursor": page["next_cursor"],
+            "has_more": page["has_more"]
         }
     
     async def get_user_details(
@@ -6,7 +6,6 @@ Produces single printable PDFs with deterministic ordering.
 """
 
 import os
-import json
 import hashlib
 from datetime import datetime, timezone
 from typing import Dict, List, Optional
@@ -14,6 +13,8 @@ from uuid import uuid4
 from enum import Enum
 from dataclasses import dataclass, field, asdict
 
+from services.canonical_json import canonical_hash
+
 
 class BinderProfile(str, Enum):
     AUDIT = "audit"
@@ -194,6 +195,10 @@ class IntegrityStamp:
     total_pages: int
     seal_coverage_percent: float
     verification_url: str
+    # Signed Merkle root over the portfolio's integrity seals (if published)
+    seal_merkle_root: Optional[str] = None
+    seal_merkle_tree_size: int = 0
+    seal_merkle_signed_at: Optional[str] = None
 
 
 # Default Trust Administration Checklist v1
@@ -2088,8 +2093,12 @@ class BinderService:
                             <td style="padding: 8px 0; border-bottom: 1px solid #e5e7eb;">{integrity_stamp.get('total_items', 0)}</td>
                         </tr>
                         <tr>
-                            <td style="padding: 8px 0;"><strong>Seal Coverage:</strong></td>
-                            <td style="padding: 8px 0;">{integrity_stamp.get('seal_coverage_percent', 0)}%</td>
+                            <td style="padding: 8px 0; border-bottom: 1px solid #e5e7eb;"><strong>Seal Coverage:</strong></td>
+                            <td style="padding: 8px 0; border-bottom: 1px solid #e5e7eb;">{integrity_stamp.get('seal_coverage_percent', 0)}%</td>
+                        </tr>
+                        <tr>
+                            <td style="padding: 8px 0;"><strong>Seal Merkle Root:</strong></td>
+                            <td style="padding: 8px 0; font-family: monospace; font-size: 8pt; word-break: break-all;">{integrity_stamp.get('seal_merkle_root') or '—'}<br>Seals covered: {integrity_stamp.get('seal_merkle_tree_size', 0)}</td>
                         </tr>
                     </table>
                 </div>
@@ -2319,7 +2328,17 @@ class BinderService:
             include_integrity_stamp = rules.get("include_integrity_stamp", True)
             preliminary_stamp = None
             
+            seal_root = None
             if include_integrity_stamp:
+                # Embed the portfolio's signed seal root instead of per-record hashes
+                try:
+                    from services.integrity_seal import create_integrity_seal_service
+                    seal_root = await create_integrity_seal_service(self.db).get_latest_merkle_root(
+                        portfolio_id, user_id
+                    )
+                except Exception:
+                    seal_root = None
+                
                 # Create preliminary stamp with placeholder hash (will be updated after PDF)
                 preliminary_stamp = self.generate_integrity_stamp(
                     pdf_bytes=b"placeholder",  # Placeholder, real hash computed later
@@ -2327,7 +2346,8 @@ class BinderService:
                     run_id=run["id"],
                     portfolio_id=portfolio_id,
                     user_id=user_id,
-                    base_url=os.environ.get("REACT_APP_BACKEND_URL", "")
+                    base_url=os.environ.get("REACT_APP_BACKEND_URL", ""),
+                    seal_root=seal_root
                 )
                 content["_integrity_stamp"] = preliminary_stamp
             
@@ -2354,7 +2374,8 @@ class BinderService:
                     run_id=run["id"],
                     portfolio_id=portfolio_id,
                     user_id=user_id,
-                    base_url=os.environ.get("REACT_APP_BACKEND_URL", "")
+                    base_url=os.environ.get("REACT_APP_BACKEND_URL", ""),
+                    seal_root=seal_root
                 )
                 # Update page count
                 try:
@@ -3093,18 +3114,19 @@ class BinderService:
         run_id: str,
         portfolio_id: str,
         user_id: str,
-        base_url: str = ""
+        base_url: str = "",
+        seal_root: Optional[Dict] = None
     ) -> Dict:
         """
         Generate integrity stamp for a binder.
         Hash is computed on final PDF bytes (after all processing).
+        If a signed seal Merkle root is given it is embedded in the stamp.
         """
         # Compute SHA-256 of final PDF
         pdf_hash = hashlib.sha256(pdf_bytes).hexdigest()
         
         # Compute manifest hash
-        manifest_str = json.dumps(manifest, sort_keys=True, default=str)
-        manifest_hash = hashlib.sha256(manifest_str.encode()).hexdigest()
+        manifest_hash = canonical_hash(manifest)
         
         # Count sealed items
         sealed_count = sum(
@@ -3127,7 +3149,10 @@ class BinderService:
             total_items=len(manifest),
             total_pages=0,  # Will be set after PDF processing
             seal_coverage_percent=round(seal_coverage, 1),
-            verification_url=verification_url
+            verification_url=verification_url,
+            seal_merkle_root=seal_root.get("root_hash") if seal_root else None,
+            seal_merkle_tree_size=seal_root.get("tree_size", 0) if seal_root else 0,
+            seal_merkle_signed_at=seal_root.get("signed_at") if seal_root else None
         )
         
         return asdict(stamp)
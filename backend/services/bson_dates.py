@@ -0,0 +1,122 @@
+"""
+Native BSON Dates for Time Fields
+
+Most collections store timestamps as ISO strings. The fields below are
+stored as BSON dates instead: 8 bytes instead of ~32, ordered by instant
+rather than by text (so "+00:00" and "Z" spellings can't mis-order), and
+usable by TTL indexes and date operators like $dateTrunc.
+
+    user_sessions         expires_at, created_at
+    maxim_study           next_review, last_reviewed, created_at
+    omnibinder_schedules  next_run_at
+
+Writers pass aware datetimes; queries compare against datetimes. Readers
+that return these documents run them through decode_dates so the API keeps
+emitting the same ISO strings. The Motor client isn't tz_aware, so dates
+come back naive and are treated as UTC.
+
+Documents written before the switch are converted at startup by
+migrate_date_fields.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Optional
+
+from pymongo import UpdateOne
+
+
+# collection -> fields stored as BSON dates
+DATE_FIELDS: Dict[str, tuple] = {
+    "user_sessions": ("expires_at", "created_at"),
+    "maxim_study": ("next_review", "last_reviewed", "created_at"),
+    "omnibinder_schedules": ("next_run_at",),
+}
+
+MIGRATION_BATCH_SIZE = 500
+
+
+def to_bson_datetime(value: Any) -> Optional[datetime]:
+    """Aware UTC datetime for an ISO string or datetime; None if unparseable."""
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def to_iso(value: Any) -> Any:
+    """ISO string for a stored date (naive means UTC); other values unchanged."""
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.isoformat()
+    return value
+
+
+def decode_dates(doc: Optional[Dict[str, Any]], collection: str) -> Optional[Dict[str, Any]]:
+    """Turn a document's BSON date fields back into ISO strings for output."""
+    if doc:
+        for field in DATE_FIELDS[collection]:
+            if field in doc:
+                doc[field] = to_iso(doc[field])
+    return doc
+
+
+def decode_all(docs: Iterable[Dict[str, Any]], collection: str) -> list:
+    return [decode_dates(doc, collection) for doc in docs]
+
+
+async def migrate_date_fields(db, batch_size: int = MIGRATION_BATCH_SIZE) -> Dict[str, int]:
+    """
+    Convert ISO-string values of the registered fields to BSON dates.
+    Strings that don't parse are left alone. Safe to re-run.
+    """
+    converted = {}
+    for collection, fields in DATE_FIELDS.items():
+        count = 0
+        ops = []
+        async for doc in db[collection].find(
+            {"$or": [{field: {"$type": "string"}} for field in fields]},
+            {"_id": 1, **{field: 1 for field in fields}}
+        ):
+            update = {}
+            for field in fields:
+                if isinstance(doc.get(field), str):
+                    parsed = to_bson_datetime(doc[field])
+                    if parsed is not None:
+                        update[field] = parsed
+            if not update:
+                continue
+            ops.append(UpdateOne({"_id": doc["_id"]}, {"$set": update}))
+            if len(ops) >= batch_size:
+                await db[collection].bulk_write(ops, ordered=False)
+                count += len(ops)
+                ops = []
+        if ops:
+            await db[collection].bulk_write(ops, ordered=False)
+            count += len(ops)
+        converted[collection] = count
+    return converted
+
+
+async def ensure_date_indexes(db):
+    # Expired sessions are rejected by get_current_user; the TTL monitor
+    # removes them instead of letting the collection grow.
+    await db.user_sessions.create_index(
+        "expires_at",
+        expireAfterSeconds=0,
+        name="ttl_expires_at"
+    )
+    await db.maxim_study.create_index(
+        [("user_id", 1), ("next_review", 1)],
+        name="user_next_review"
+    )
+    await db.omnibinder_schedules.create_index(
+        [("status", 1), ("next_run_at", 1)],
+        name="status_next_run"
+    )
@@ -0,0 +1,178 @@
+"""
+Canonical JSON Serialization for Integrity Hashes
+
+One canonicalisation layer shared by seals, revision content hashes and
+meeting hashes. Every stored hash records the canonical form it was computed
+with (`hash_version`), so the serializer can change without invalidating
+existing hashes:
+
+- Version 1 (legacy): json.dumps(sort_keys=True, default=str). Byte-for-byte
+  what all hashes were computed with before versioning; documents without a
+  hash_version field are version 1.
+- Version 2: orjson with sorted keys (compact separators, UTF-8). Nested
+  payloads are embedded as objects instead of JSON strings inside JSON.
+  Without orjson (or for integers beyond 64 bits, which orjson rejects) a
+  pure-Python encoder writes the same bytes, including orjson's float
+  format (1e16, 1e-7, 0.00001) and null for NaN and infinities.
+"""
+
+import hashlib
+import json
+import math
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any, Optional
+from uuid import UUID
+
+# orjson is optional; version 2 falls back to the stdlib encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+HASH_VERSION_LEGACY = 1
+HASH_VERSION_ORJSON = 2
+HASH_VERSIONS = (HASH_VERSION_LEGACY, HASH_VERSION_ORJSON)
+
+# Version used for newly computed hashes
+CURRENT_HASH_VERSION = HASH_VERSION_ORJSON if orjson is not None else HASH_VERSION_LEGACY
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+
+def _v2_default(value: Any) -> Any:
+    """Fallback encoder mirroring orjson's native handling of common types."""
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+
+def _v2_float(value: float) -> str:
+    """
+    A float as orjson writes it: the shortest round-trip digits (same as
+    repr) laid out by ryu's rules, with NaN and infinities as null.
+    """
+    if not math.isfinite(value):
+        return "null"
+    if value == 0:
+        return repr(value)
+    
+    text = repr(value)
+    sign = "-" if text.startswith("-") else ""
+    mantissa, _, exponent = text.lstrip("-").partition("e")
+    int_part, _, frac_part = mantissa.partition(".")
+    digits = int_part + frac_part
+    # value = 0.<digits> * 10**point
+    point = len(int_part) + int(exponent or 0)
+    stripped = digits.lstrip("0")
+    point -= len(digits) - len(stripped)
+    digits = stripped.rstrip("0")
+    length = len(digits)
+    
+    if length <= point <= 16:
+        body = digits + "0" * (point - length) + ".0"
+    elif 0 < point <= 16:
+        body = digits[:point] + "." + digits[point:]
+    elif -5 < point <= 0:
+        body = "0." + "0" * -point + digits
+    elif length == 1:
+        body = f"{digits}e{point - 1}"
+    else:
+        body = f"{digits[0]}.{digits[1:]}e{point - 1}"
+    return sign + body
+
+
+def _v2_key(key: Any) -> str:
+    """A dict key as orjson's OPT_NON_STR_KEYS converts it."""
+    if isinstance(key, str):
+        return key
+    if isinstance(key, bool):
+        return "true" if key else "false"
+    if key is None:
+        return "null"
+    if isinstance(key, int):
+        return str(int(key))
+    if isinstance(key, float):
+        return _v2_float(key)
+    return str(_v2_default(key))
+
+
+def _encode_v2(value: Any, parts: list):
+    if isinstance(value, str):
+        parts.append(json.dumps(value, ensure_ascii=False))
+    elif value is None:
+        parts.append("null")
+    elif value is True:
+        parts.append("true")
+    elif value is False:
+        parts.append("false")
+    elif isinstance(value, int) and not isinstance(value, Enum):
+        parts.append(str(int(value)))
+    elif isinstance(value, float):
+        parts.append(_v2_float(value))
+    elif isinstance(value, dict):
+        items = sorted((_v2_key(k), v) for k, v in value.items())
+        parts.append("{")
+        for i, (key, item) in enumerate(items):
+            if i:
+                parts.append(",")
+            parts.append(json.dumps(key, ensure_ascii=False))
+            parts.append(":")
+            _encode_v2(item, parts)
+        parts.append("}")
+    elif isinstance(value, (list, tuple)):
+        parts.append("[")
+        for i, item in enumerate(value):
+            if i:
+                parts.append(",")
+            _encode_v2(item, parts)
+        parts.append("]")
+    else:
+        _encode_v2(_v2_default(value), parts)
+
+
+def _dumps_v2_stdlib(obj: Any) -> bytes:
+    """Version 2 bytes without orjson."""
+    parts: list = []
+    _encode_v2(obj, parts)
+    return "".join(parts).encode()
+
+
+def resolve_hash_version(hash_version: Optional[int]) -> int:
+    """Version for a stored document (missing means legacy)."""
+    if hash_version is None:
+        return HASH_VERSION_LEGACY
+    if hash_version not in HASH_VERSIONS:
+        raise ValueError(f"Unknown hash version: {hash_version}")
+    return hash_version
+
+
+def canonical_json(obj: Any, hash_version: int = HASH_VERSION_LEGACY) -> bytes:
+    """Canonical UTF-8 JSON bytes for obj under the given hash version."""
+    hash_version = resolve_hash_version(hash_version)
+    if hash_version == HASH_VERSION_LEGACY:
+        return json.dumps(obj, sort_keys=True, default=str).encode()
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # e.g. integers beyond 64 bits
+            pass
+    return _dumps_v2_stdlib(obj)
+
+
+def canonical_json_str(obj: Any, hash_version: int = HASH_VERSION_LEGACY) -> str:
+    """Canonical JSON as text."""
+    return canonical_json(obj, hash_version).decode()
+
+
+def canonical_hash(obj: Any, hash_version: int = HASH_VERSION_LEGACY) -> str:
+    """SHA-256 hex digest of obj's canonical JSON."""
+    return hashlib.sha256(canonical_json(obj, hash_version)).hexdigest()
@@ -0,0 +1,413 @@
+"""
+Dashboard Rollups
+Materialized per-portfolio counters for the dashboard.
+
+One document per (user_id, portfolio_id) in `dashboard_rollups`:
+- counts: live documents per collection
+- status_counts: live documents per collection and status
+- module_counts: governance records per module type
+- currency_totals: amounts per collection and currency
+
+Write paths report each change through track_insert / track_update /
+track_delete, which turn the before/after documents into one $inc on the
+rollup. The background reconciler rebuilds the rollups from the source
+collections on an interval and repairs any drift (missed write paths,
+crashes between the write and the $inc, direct database edits).
+
+Every $inc also bumps the rollup's `version`. A repair only replaces the
+counters if the version is still the one read before the rebuild, so an
+increment that lands mid-rebuild makes the repair retry instead of being
+overwritten. One worker per interval runs the reconciler, under a lease.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from pymongo.errors import DuplicateKeyError
+
+from services.db_lease import acquire_lease
+
+
+ROLLUP_COLLECTION = "dashboard_rollups"
+
+# Seconds between reconciler passes
+RECONCILE_INTERVAL_SECONDS = 3600
+
+# Lease that lets one worker run each reconciler pass
+RECONCILER_LEASE = "dashboard_rollup_reconciler"
+
+# Rebuild-and-swap attempts per user when increments keep landing
+RECONCILE_ATTEMPTS = 3
+
+ROLLUP_SECTIONS = ("counts", "status_counts", "module_counts", "currency_totals")
+
+# Tracked collections:
+# - live: filter a document must match to be counted (soft deletes drop out)
+# - status / module: fields counted per value
+# - amount: field summed per currency
+_LIVE = {"deleted_at": None}
+
+ROLLUP_SOURCES = {
+    "portfolios": {},
+    "documents": {},
+    "assets": {},
+    "notices": {"status": "status"},
+    "meetings": {"live": _LIVE, "status": "status"},
+    "distributions": {"live": _LIVE, "status": "status", "amount": "total_amount"},
+    "disputes": {"live": _LIVE, "status": "status"},
+    "insurance_policies": {"live": _LIVE, "status": "status"},
+    "compensation_entries": {"live": _LIVE, "status": "status", "amount": "amount"},
+    "governance_records": {"live": _LIVE, "status": "status", "module": "module_type"},
+}
+
+DEFAULT_CURRENCY = "USD"
+
+_reconciler_task: Optional[asyncio.Task] = None
+
+
+def _key(value: Any, default: str = "unknown") -> str:
+    """Field value as a rollup map key (dots and leading $ aren't allowed in keys)."""
+    if value is None or value == "":
+        return default
+    return str(getattr(value, "value", value)).replace(".", "_").lstrip("$") or default
+
+
+def _is_live(spec: Dict[str, Any], doc: Dict[str, Any]) -> bool:
+    return all(doc.get(field) == value for field, value in spec.get("live", {}).items())
+
+
+def contribution(collection: str, doc: Optional[Dict[str, Any]]) -> Dict[str, float]:
+    """Rollup counters a single document adds, as {dotted path: amount}."""
+    spec = ROLLUP_SOURCES.get(collection)
+    if spec is None or not doc or not _is_live(spec, doc):
+        return {}
+
+    paths = {f"counts.{collection}": 1}
+    if spec.get("status"):
+        paths[f"status_counts.{collection}.{_key(doc.get(spec['status']))}"] = 1
+    if spec.get("module"):
+        paths[f"module_counts.{_key(doc.get(spec['module']))}"] = 1
+    if spec.get("amount"):
+        currency = _key(doc.get("currency"), DEFAULT_CURRENCY)
+        paths[f"currency_totals.{collection}.{currency}"] = doc.get(spec["amount"]) or 0
+    return paths
+
+
+def _delta(collection: str, before: Optional[Dict], after: Optional[Dict]) -> Dict[str, float]:
+    delta = dict(contribution(collection, after))
+    for path, value in contribution(collection, before).items():
+        delta[path] = delta.get(path, 0) - value
+    return {path: value for path, value in delta.items() if value}
+
+
+async def ensure_dashboard_rollup_indexes(db):
+    """Create the rollup's unique key."""
+    await db[ROLLUP_COLLECTION].create_index(
+        [("user_id", 1), ("portfolio_id", 1)],
+        unique=True,
+        name="unique_dashboard_rollup"
+    )
+
+
+async def _apply(db, user_id: str, portfolio_id: Optional[str], delta: Dict[str, float]):
+    if not user_id or not delta:
+        return
+    await db[ROLLUP_COLLECTION].update_one(
+        {"user_id": user_id, "portfolio_id": portfolio_id},
+        {"$inc": {**delta, "version": 1}, "$set": {"updated_at": datetime.now(timezone.utc).isoformat()}},
+        upsert=True
+    )
+
+
+async def track_update(db, collection: str, before: Optional[Dict], after: Optional[Dict]):
+    """
+    Fold a document change into its rollup. Pass the document before and
+    after the write (None for inserts/hard deletes). Never raises: a missed
+    update is repaired by the reconciler.
+    """
+    try:
+        doc = after or before or {}
+        await _apply(db, doc.get("user_id"), doc.get("portfolio_id"), _delta(collection, before, after))
+    except Exception as e:
+        print(f"Warning: Failed to update dashboard rollup for {collection}: {e}")
+
+
+async def track_insert(db, collection: str, doc: Dict):
+    await track_update(db, collection, None, doc)
+
+
+async def track_delete(db, collection: str, doc: Optional[Dict]):
+    await track_update(db, collection, doc, None)
+
+
+async def track_many(db, collection: str, changes: List[Tuple[Optional[Dict], Optional[Dict]]]):
+    """
+    Fold many (before, after) document changes into their rollups with one
+    $inc per portfolio, for bulk writes. Never raises.
+    """
+    try:
+        deltas: Dict[tuple, Dict[str, float]] = {}
+        for before, after in changes:
+            doc = after or before or {}
+            target = deltas.setdefault((doc.get("user_id"), doc.get("portfolio_id")), {})
+            for path, value in _delta(collection, before, after).items():
+                target[path] = target.get(path, 0) + value
+        for (user_id, portfolio_id), delta in deltas.items():
+            await _apply(db, user_id, portfolio_id, {k: v for k, v in delta.items() if v})
+    except Exception as e:
+        print(f"Warning: Failed to update dashboard rollups for {collection}: {e}")
+
+
+async def track_insert_many(db, collection: str, docs: List[Dict]):
+    await track_many(db, collection, [(None, doc) for doc in docs])
+
+
+# Source fields the rollups count or sum
+ROLLUP_FIELDS = {
+    "_id": 0, "user_id": 1, "portfolio_id": 1, "status": 1, "deleted_at": 1,
+    "module_type": 1, "total_amount": 1, "amount": 1, "currency": 1
+}
+
+
+async def tracked_update_one(db, collection: str, query: Dict, update: Dict) -> Optional[Dict]:
+    """
+    update_one that also folds status, amount and soft-delete changes made
+    by its $set into the rollup. Returns the matched document's rollup
+    fields from before the update (None if nothing matched).
+    """
+    before = await db[collection].find_one_and_update(query, update, projection=ROLLUP_FIELDS)
+    if before is not None:
+        await track_update(db, collection, before, {**before, **update.get("$set", {})})
+    return before
+
+
+async def clear_rollup_collections(db, user_id: str, portfolio_id: Optional[str], collections: list):
+    """Zero a portfolio's counters for collections that were bulk-deleted."""
+    unset = {}
+    for collection in collections:
+        for section in ("counts", "status_counts", "currency_totals"):
+            unset[f"{section}.{collection}"] = ""
+        if ROLLUP_SOURCES.get(collection, {}).get("module"):
+            unset["module_counts"] = ""
+    try:
+        await db[ROLLUP_COLLECTION].update_one(
+            {"user_id": user_id, "portfolio_id": portfolio_id},
+            {
+                "$unset": unset,
+                "$inc": {"version": 1},
+                "$set": {"updated_at": datetime.now(timezone.utc).isoformat()}
+            }
+        )
+    except Exception as e:
+        print(f"Warning: Failed to clear dashboard rollup: {e}")
+
+
+def _merge(target: Dict[str, Any], source: Dict[str, Any]):
+    for key, value in source.items():
+        if isinstance(value, dict):
+            _merge(target.setdefault(key, {}), value)
+        else:
+            target[key] = target.get(key, 0) + value
+
+
+async def get_dashboard_rollup(db, user_id: str, portfolio_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Rollup for one portfolio, or all of a user's portfolios merged when
+    portfolio_id is None.
+    """
+    query = {"user_id": user_id}
+    if portfolio_id is not None:
+        query["portfolio_id"] = portfolio_id
+
+    merged = {section: {} for section in ROLLUP_SECTIONS}
+    updated_at = None
+    reconciled_at = None
+    async for rollup in db[ROLLUP_COLLECTION].find(query, {"_id": 0}):
+        for section in ROLLUP_SECTIONS:
+            _merge(merged[section], rollup.get(section, {}))
+        updated_at = max(filter(None, [updated_at, rollup.get("updated_at")]), default=None)
+        reconciled_at = min(filter(None, [reconciled_at, rollup.get("reconciled_at")]), default=None)
+
+    # Drop statuses/currencies whose counters have decremented to zero
+    for section in ROLLUP_SECTIONS[1:]:
+        merged[section] = _strip_zeros(merged[section])
+    merged["portfolio_id"] = portfolio_id
+    merged["updated_at"] = updated_at
+    merged["reconciled_at"] = reconciled_at
+    return merged
+
+
+# ============ RECONCILER ============
+
+async def _rebuild(db, user_id: Optional[str] = None) -> Dict[tuple, Dict[str, Any]]:
+    """Recompute rollups from the source collections, keyed by (user_id, portfolio_id)."""
+    rebuilt = {}
+    for collection, spec in ROLLUP_SOURCES.items():
+        match = dict(spec.get("live", {}))
+        if user_id:
+            match["user_id"] = user_id
+
+        group_id = {"user_id": "$user_id", "portfolio_id": "$portfolio_id"}
+        if spec.get("status"):
+            group_id["status"] = f"${spec['status']}"
+        if spec.get("module"):
+            group_id["module"] = f"${spec['module']}"
+        if spec.get("amount"):
+            group_id["currency"] = "$currency"
+
+        group = {"_id": group_id, "count": {"$sum": 1}}
+        if spec.get("amount"):
+            group["amount"] = {"$sum": {"$ifNull": [f"${spec['amount']}", 0]}}
+
+        async for row in db[collection].aggregate([{"$match": match}, {"$group": group}]):
+            key = row["_id"]
+            if not key.get("user_id"):
+                continue
+            rollup = rebuilt.setdefault(
+                (key["user_id"], key.get("portfolio_id")),
+                {section: {} for section in ROLLUP_SECTIONS}
+            )
+            counts = {f"counts.{collection}": row["count"]}
+            if spec.get("status"):
+                counts[f"status_counts.{collection}.{_key(key.get('status'))}"] = row["count"]
+            if spec.get("module"):
+                counts[f"module_counts.{_key(key.get('module'))}"] = row["count"]
+            if spec.get("amount"):
+                counts[f"currency_totals.{collection}.{_key(key.get('currency'), DEFAULT_CURRENCY)}"] = row["amount"]
+            for path, value in counts.items():
+                section, *rest = path.split(".")
+                node = rollup[section]
+                for part in rest[:-1]:
+                    node = node.setdefault(part, {})
+                node[rest[-1]] = node.get(rest[-1], 0) + value
+    return rebuilt
+
+
+def _strip_zeros(section: Dict[str, Any]) -> Dict[str, Any]:
+    cleaned = {}
+    for key, value in section.items():
+        if isinstance(value, dict):
+            value = _strip_zeros(value)
+            if value:
+                cleaned[key] = value
+        elif value:
+            cleaned[key] = value
+    return cleaned
+
+
+async def _swap_rollup(db, key: tuple, version: Optional[int], fresh: Optional[Dict[str, Any]], now: str) -> bool:
+    """
+    Replace a rollup's counters with rebuilt ones (or delete it when fresh
+    is None) if its version is still the one read before the rebuild.
+    Returns False when a concurrent increment got there first.
+    """
+    query = {"user_id": key[0], "portfolio_id": key[1], "version": version}
+    if fresh is None:
+        result = await db[ROLLUP_COLLECTION].delete_one(query)
+        return result.deleted_count == 1
+    try:
+        result = await db[ROLLUP_COLLECTION].update_one(
+            query,
+            {"$set": {**fresh, "version": (version or 0) + 1, "updated_at": now, "reconciled_at": now}},
+            upsert=version is None
+        )
+    except DuplicateKeyError:
+        # A first increment created the rollup after it was read as missing
+        return False
+    return result.matched_count == 1 or result.upserted_id is not None
+
+
+async def _reconcile_pass(db, user_id: Optional[str], stats: Dict[str, int]) -> set:
+    """One read-rebuild-swap pass; returns the user_ids whose swaps lost a race."""
+    query = {"user_id": user_id} if user_id else {}
+    # Versions are read before the rebuild, so any increment after this
+    # point fails the swap
+    stored = {
+        (doc["user_id"], doc.get("portfolio_id")): doc
+        async for doc in db[ROLLUP_COLLECTION].find(query, {"_id": 0})
+    }
+    rebuilt = await _rebuild(db, user_id)
+    now = datetime.now(timezone.utc).isoformat()
+    conflicts = set()
+
+    for key, doc in stored.items():
+        stats["checked"] += 1
+        fresh = rebuilt.get(key)
+        drifted = fresh is None or any(
+            _strip_zeros(doc.get(section, {})) != fresh[section]
+            for section in ROLLUP_SECTIONS
+        )
+        if not drifted:
+            await db[ROLLUP_COLLECTION].update_one(
+                {"user_id": key[0], "portfolio_id": key[1]},
+                {"$set": {"reconciled_at": now}}
+            )
+        elif await _swap_rollup(db, key, doc.get("version"), fresh, now):
+            stats["removed" if fresh is None else "repaired"] += 1
+        else:
+            conflicts.add(key[0])
+
+    for key, fresh in rebuilt.items():
+        if key in stored:
+            continue
+        if await _swap_rollup(db, key, None, fresh, now):
+            stats["repaired"] += 1
+        else:
+            conflicts.add(key[0])
+    return conflicts
+
+
+async def reconcile_dashboard_rollups(db, user_id: Optional[str] = None) -> Dict[str, int]:
+    """
+    Rebuild rollups from the source collections and overwrite any that
+    drifted. Limited to one user when user_id is given. A repair that races
+    an increment is retried for that user with a fresh rebuild; users still
+    conflicting after RECONCILE_ATTEMPTS are left for the next pass.
+    """
+    stats = {"checked": 0, "repaired": 0, "removed": 0, "conflicts": 0}
+    conflicts = await _reconcile_pass(db, user_id, stats)
+    for _ in range(RECONCILE_ATTEMPTS - 1):
+        if not conflicts:
+            break
+        retry = set()
+        for conflicted_user in conflicts:
+            retry |= await _reconcile_pass(db, conflicted_user, stats)
+        conflicts = retry
+    stats["conflicts"] = len(conflicts)
+    return stats
+
+
+async def run_rollup_reconciler(db, interval_seconds: int = RECONCILE_INTERVAL_SECONDS):
+    """
+    Reconcile all rollups now and then every interval_seconds. Every worker
+    runs this loop, but a pass only runs in the worker that takes the
+    reconciler lease; the lease isn't released, so it also spaces passes
+    one interval apart across workers.
+    """
+    while True:
+        try:
+            if await acquire_lease(db, RECONCILER_LEASE, interval_seconds):
+                stats = await reconcile_dashboard_rollups(db)
+                if stats["repaired"] or stats["removed"] or stats["conflicts"]:
+                    print(f"Dashboard rollups reconciled: {stats}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"Error reconciling dashboard rollups: {e}")
+        await asyncio.sleep(interval_seconds)
+
+
+def start_rollup_reconciler(db, interval_seconds: int = RECONCILE_INTERVAL_SECONDS) -> asyncio.Task:
+    """Start the background reconciler (once per process)."""
+    global _reconciler_task
+    if _reconciler_task is None or _reconciler_task.done():
+        _reconciler_task = asyncio.create_task(run_rollup_reconciler(db, interval_seconds))
+    return _reconciler_task
+
+
+def stop_rollup_reconciler():
+    global _reconciler_task
+    if _reconciler_task is not None:
+        _reconciler_task.cancel()
+        _reconciler_task = None
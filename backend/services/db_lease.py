@@ -0,0 +1,113 @@
+"""
+Database Leases
+
+Short-lived named locks shared by every worker process. A lease is one
+document in `db_leases` keyed by name; it is claimed with an upsert that
+only matches an expired lease, so while another holder's lease is live the
+upsert collides on _id and the claim fails instead of waiting.
+
+    async with lease(db, f"integrity_seal:{user_id}:{portfolio_id}", 300) as held:
+        if not held:
+            return busy_response
+        ...
+        await held.renew()   # before each write phase; raises LeaseLost
+        ...
+
+Leases expire on their own, so a crashed holder only blocks others until
+its TTL runs out. While the block runs, a heartbeat renews the lease every
+third of its TTL, so long work doesn't outlive it.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Optional
+from uuid import uuid4
+
+from pymongo.errors import DuplicateKeyError
+
+
+LEASE_COLLECTION = "db_leases"
+
+
+class LeaseLost(Exception):
+    """The lease expired and was taken over while it was held."""
+
+
+def _expiry(now: datetime, ttl_seconds: int) -> str:
+    return (now + timedelta(seconds=ttl_seconds)).isoformat()
+
+
+async def acquire_lease(db, name: str, ttl_seconds: int) -> Optional[str]:
+    """Claim a lease; returns its token, or None if someone else holds it."""
+    token = uuid4().hex
+    now = datetime.now(timezone.utc)
+    try:
+        await db[LEASE_COLLECTION].update_one(
+            {"_id": name, "expires_at": {"$lt": now.isoformat()}},
+            {"$set": {
+                "token": token,
+                "acquired_at": now.isoformat(),
+                "expires_at": _expiry(now, ttl_seconds)
+            }},
+            upsert=True
+        )
+    except DuplicateKeyError:
+        return None
+    return token
+
+
+async def renew_lease(db, name: str, token: str, ttl_seconds: int) -> bool:
+    """Extend a held lease; False if it expired and was taken over."""
+    result = await db[LEASE_COLLECTION].update_one(
+        {"_id": name, "token": token},
+        {"$set": {"expires_at": _expiry(datetime.now(timezone.utc), ttl_seconds)}}
+    )
+    return result.matched_count == 1
+
+
+async def release_lease(db, name: str, token: str):
+    await db[LEASE_COLLECTION].delete_one({"_id": name, "token": token})
+
+
+class HeldLease:
+    """A lease held by the current block."""
+
+    def __init__(self, db, name: str, token: str, ttl_seconds: int):
+        self.db = db
+        self.name = name
+        self.token = token
+        self.ttl_seconds = ttl_seconds
+        self.lost = False
+
+    async def renew(self):
+        """Extend the lease; raises LeaseLost if someone else holds it now."""
+        if self.lost or not await renew_lease(self.db, self.name, self.token, self.ttl_seconds):
+            self.lost = True
+            raise LeaseLost(self.name)
+
+    async def _heartbeat(self):
+        while True:
+            await asyncio.sleep(self.ttl_seconds / 3)
+            try:
+                await self.renew()
+            except LeaseLost:
+                return
+            except Exception as e:
+                print(f"Warning: Failed to renew lease {self.name}: {e}")
+
+
+@asynccontextmanager
+async def lease(db, name: str, ttl_seconds: int) -> AsyncIterator[Optional[HeldLease]]:
+    """Hold a lease for the block, renewed in the background; yields None if not acquired."""
+    token = await acquire_lease(db, name, ttl_seconds)
+    if token is None:
+        yield None
+        return
+    held = HeldLease(db, name, token, ttl_seconds)
+    heartbeat = asyncio.create_task(held._heartbeat())
+    try:
+        yield held
+    finally:
+        heartbeat.cancel()
+        await release_lease(db, name, token)
@@ -6,13 +6,14 @@ Generates court-ready exhibit packets with chronological timelines.
 """
 
 import json
-import hashlib
 from datetime import datetime, timezone
 from typing import Dict, List, Optional
 from uuid import uuid4
 from enum import Enum
 from dataclasses import dataclass, field, asdict
 
+from services.canonical_json import canonical_hash
+
 
 class ExhibitFormat(str, Enum):
     """Exhibit numbering format."""
@@ -464,9 +465,7 @@ class EvidenceBinderService:
             exhibit_id, exhibit_label = get_exhibit_label(idx, exhibit_format, exhibit_prefix)
             
             # Compute hash for integrity
-            item_hash = hashlib.sha256(
-                json.dumps(item.get("data", {}), sort_keys=True, default=str).encode()
-            ).hexdigest()[:16]
+            item_hash = canonical_hash(item.get("data", {}))[:16]
             
             exhibit = ExhibitEntry(
                 exhibit_id=exhibit_id,
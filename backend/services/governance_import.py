@@ -0,0 +1,137 @@
+"""
+Governance Bulk Import Writes
+
+Persistence side of POST /api/governance/v2/records/bulk. Validated,
+RM-ID-allocated items are written in chunks: one insert_many each for
+revisions, records and events, instead of three inserts per record.
+
+- Revisions go first, so a record never exists without its revision.
+- Records are inserted unordered so one failure doesn't stop the chunk;
+  failed items are reported individually and their revisions removed.
+- Every imported record carries import_batch_id / import_ref under a
+  unique index, so re-posting a batch skips what already landed and a
+  concurrent retry can't import an item twice.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+from pymongo.errors import BulkWriteError
+
+
+IMPORT_BATCH_COLLECTION = "governance_import_batches"
+
+IMPORT_CHUNK_SIZE = 200
+
+DUPLICATE_KEY = 11000
+
+IMPORT_REF_INDEX = "unique_import_ref"
+
+IMPORT_THREAD_INDEX = "unique_import_thread"
+
+
+def chunked(items: List[Any], size: int = IMPORT_CHUNK_SIZE) -> Iterator[List[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+async def ensure_import_indexes(db):
+    await db.governance_records.create_index(
+        [("user_id", 1), ("import_batch_id", 1), ("import_ref", 1)],
+        unique=True,
+        name=IMPORT_REF_INDEX,
+        partialFilterExpression={"import_batch_id": {"$exists": True}}
+    )
+    await db[IMPORT_BATCH_COLLECTION].create_index(
+        [("user_id", 1), ("batch_id", 1)],
+        unique=True,
+        name="unique_import_batch"
+    )
+    # Legacy items go to numbered per-module import threads; two imports
+    # racing to open the next one must end up sharing it
+    await db.rm_subjects.create_index(
+        [("user_id", 1), ("portfolio_id", 1), ("import_module", 1), ("import_thread_no", 1)],
+        unique=True,
+        name=IMPORT_THREAD_INDEX,
+        partialFilterExpression={"import_module": {"$exists": True}}
+    )
+
+
+async def find_imported(db, user_id: str, batch_id: str) -> Dict[str, Dict[str, Any]]:
+    """Records already imported by a batch, keyed by import_ref."""
+    imported = {}
+    async for record in db.governance_records.find(
+        {"user_id": user_id, "import_batch_id": batch_id},
+        {"_id": 0, "id": 1, "rm_id": 1, "import_ref": 1}
+    ):
+        imported[record["import_ref"]] = record
+    return imported
+
+
+async def write_import_chunk(db, entries: List[Dict[str, Any]]) -> Dict[int, Dict[str, str]]:
+    """
+    Write one chunk of entries ({"record", "revision", "event"} docs).
+    Returns {position in chunk: error} for entries whose record wasn't
+    written; everything else was written in full.
+    """
+    if not entries:
+        return {}
+    failed: Dict[int, Dict[str, str]] = {}
+
+    await db.governance_revisions.insert_many([e["revision"] for e in entries], ordered=False)
+
+    try:
+        await db.governance_records.insert_many([e["record"] for e in entries], ordered=False)
+    except BulkWriteError as e:
+        for error in e.details.get("writeErrors", []):
+            if error.get("code") == DUPLICATE_KEY and IMPORT_REF_INDEX in error.get("errmsg", ""):
+                failed[error["index"]] = {"code": "ALREADY_IMPORTED", "message": "Item was already imported in this batch"}
+            elif error.get("code") == DUPLICATE_KEY:
+                failed[error["index"]] = {"code": "DUPLICATE_RM_ID", "message": "RM-ID is already in use by another record"}
+            else:
+                failed[error["index"]] = {"code": "CREATE_ERROR", "message": error.get("errmsg", "Insert failed")}
+        await db.governance_revisions.delete_many(
+            {"id": {"$in": [entries[i]["revision"]["id"] for i in failed]}}
+        )
+
+    events = [e["event"] for i, e in enumerate(entries) if i not in failed]
+    if events:
+        await db.governance_events.insert_many(events, ordered=False)
+    return failed
+
+
+async def start_import_batch(db, user_id: str, batch_id: str, portfolio_id: Optional[str], total: int):
+    now = datetime.now(timezone.utc).isoformat()
+    await db[IMPORT_BATCH_COLLECTION].update_one(
+        {"user_id": user_id, "batch_id": batch_id},
+        {
+            "$setOnInsert": {"user_id": user_id, "batch_id": batch_id, "created_at": now},
+            "$set": {"portfolio_id": portfolio_id, "status": "running", "total": total, "updated_at": now},
+            "$inc": {"attempts": 1}
+        },
+        upsert=True
+    )
+
+
+async def finish_import_batch(db, user_id: str, batch_id: str, counts: Dict[str, int]):
+    status = "completed" if counts.get("failed", 0) == 0 else "partial"
+    await db[IMPORT_BATCH_COLLECTION].update_one(
+        {"user_id": user_id, "batch_id": batch_id},
+        {"$set": {
+            "status": status,
+            "counts": counts,
+            "updated_at": datetime.now(timezone.utc).isoformat()
+        }}
+    )
+    return status
+
+
+async def get_import_batch(db, user_id: str, batch_id: str) -> Optional[Dict[str, Any]]:
+    batch = await db[IMPORT_BATCH_COLLECTION].find_one(
+        {"user_id": user_id, "batch_id": batch_id}, {"_id": 0}
+    )
+    if batch:
+        batch["imported"] = await db.governance_records.count_documents(
+            {"user_id": user_id, "import_batch_id": batch_id}
+        )
+    return batch
@@ -0,0 +1,264 @@
+"""
+Governance Summary Aggregations
+
+Chart summaries for the legacy governance modules, computed by MongoDB
+aggregation pipelines instead of loading documents and summing them in
+Python. Every summary is a single $facet round trip over all matching
+documents, so the totals stay exact past any fetch limit.
+
+Each summarize_* function takes the route's match query and returns the
+response payload (without the empty_state, which the routes add).
+"""
+
+from typing import Dict, Any, List
+
+
+def _num(field: str) -> Dict[str, Any]:
+    """Numeric field, treating missing/null as 0."""
+    return {"$ifNull": [f"${field}", 0]}
+
+
+def _key(field: str, default: str) -> Dict[str, Any]:
+    """Grouping key, treating missing/null as the route's default."""
+    return {"$ifNull": [f"${field}", default]}
+
+
+def _count_by(field: str, default: str) -> List[Dict[str, Any]]:
+    return [{"$group": {"_id": _key(field, default), "count": {"$sum": 1}}}]
+
+
+def _to_dict(rows: List[Dict[str, Any]], value: str) -> Dict[str, Any]:
+    return {row["_id"]: row[value] for row in rows}
+
+
+async def _facet(collection, query: Dict[str, Any], facets: Dict[str, list]) -> Dict[str, list]:
+    results = await collection.aggregate([
+        {"$match": query},
+        {"$facet": facets}
+    ]).to_list(1)
+    return results[0] if results else {name: [] for name in facets}
+
+
+def _totals(facet: Dict[str, list]) -> Dict[str, Any]:
+    return facet["totals"][0] if facet.get("totals") else {}
+
+
+# ============ DISTRIBUTIONS ============
+
+DISTRIBUTION_PENDING_STATUSES = ["draft", "pending_approval", "approved"]
+
+
+async def summarize_distributions(db, query: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Totals, breakdowns and a monthly timeline for distributions. Timeline
+    entries are bucketed by execution date, falling back to the scheduled
+    date and then the creation date.
+    """
+    amount = _num("total_amount")
+    facet = await _facet(db.distributions, query, {
+        "totals": [{"$group": {
+            "_id": None,
+            "count": {"$sum": 1},
+            "total_distributed": {"$sum": {"$cond": [{"$eq": ["$status", "completed"]}, amount, 0]}},
+            "pending_amount": {"$sum": {"$cond": [{"$in": ["$status", DISTRIBUTION_PENDING_STATUSES]}, amount, 0]}}
+        }}],
+        "by_type": [{"$group": {"_id": _key("distribution_type", "regular"), "total": {"$sum": amount}}}],
+        "by_status": _count_by("status", "draft"),
+        "by_recipient_role": [
+            {"$unwind": "$recipients"},
+            {"$group": {
+                "_id": _key("recipients.role", "beneficiary"),
+                "total": {"$sum": _num("recipients.amount")}
+            }},
+            {"$sort": {"total": -1}}
+        ],
+        "timeline": [
+            {"$group": {
+                "_id": {"$substr": [
+                    {"$ifNull": ["$execution_date", {"$ifNull": ["$scheduled_date", {"$ifNull": ["$created_at", ""]}]}]},
+                    0, 7
+                ]},
+                "distributed": {"$sum": {"$cond": [{"$eq": ["$status", "completed"]}, amount, 0]}},
+                "pending": {"$sum": {"$cond": [{"$in": ["$status", DISTRIBUTION_PENDING_STATUSES]}, amount, 0]}},
+                "count": {"$sum": 1}
+            }},
+            {"$sort": {"_id": 1}}
+        ]
+    })
+    totals = _totals(facet)
+
+    return {
+        "has_data": totals.get("count", 0) > 0,
+        "total_distributed": totals.get("total_distributed", 0),
+        "pending_amount": totals.get("pending_amount", 0),
+        "distribution_count": totals.get("count", 0),
+        "donut_data": [{"name": row["_id"], "value": row["total"]} for row in facet["by_recipient_role"]],
+        "timeline_data": [
+            {
+                "period": row["_id"],
+                "distributed": row["distributed"],
+                "pending": row["pending"],
+                "count": row["count"]
+            }
+            for row in facet["timeline"] if row["_id"]
+        ],
+        "by_type": _to_dict(facet["by_type"], "total"),
+        "by_status": _to_dict(facet["by_status"], "count")
+    }
+
+
+# ============ DISPUTES ============
+
+DISPUTE_CLOSED_STATUSES = ["settled", "closed"]
+
+DISPUTE_BOARD_COLUMNS = [
+    ("open", "Open"),
+    ("in_progress", "In Progress"),
+    ("mediation", "Mediation"),
+    ("litigation", "Litigation"),
+    ("settled", "Settled"),
+    ("closed", "Closed"),
+    ("appealed", "Appealed"),
+]
+
+
+async def summarize_disputes(db, query: Dict[str, Any]) -> Dict[str, Any]:
+    """Counts and exposure for disputes (exposure falls back to amount claimed)."""
+    exposure = {"$cond": [
+        {"$ne": [_num("estimated_exposure"), 0]},
+        "$estimated_exposure",
+        _num("amount_claimed")
+    ]}
+    facet = await _facet(db.disputes, query, {
+        "totals": [{"$group": {
+            "_id": None,
+            "count": {"$sum": 1},
+            "open": {"$sum": {"$cond": [{"$in": ["$status", DISPUTE_CLOSED_STATUSES]}, 0, 1]}},
+            "total_exposure": {"$sum": exposure}
+        }}],
+        "by_status": _count_by("status", "open"),
+        "by_priority": _count_by("priority", "medium"),
+        "by_type": _count_by("dispute_type", "beneficiary")
+    })
+    totals = _totals(facet)
+
+    return {
+        "has_data": totals.get("count", 0) > 0,
+        "total_disputes": totals.get("count", 0),
+        "open_disputes": totals.get("open", 0),
+        "total_exposure": totals.get("total_exposure", 0),
+        "by_status": _to_dict(facet["by_status"], "count"),
+        "by_priority": _to_dict(facet["by_priority"], "count"),
+        "by_type": _to_dict(facet["by_type"], "count")
+    }
+
+
+async def dispute_board_columns(db, query: Dict[str, Any], normalize) -> List[Dict[str, Any]]:
+    """
+    Kanban columns with every matching dispute as a card. Disputes are
+    streamed from a pipeline that drops statuses without a column, so no
+    fetch limit applies and unused documents never leave the server.
+    """
+    columns = {
+        status: {"id": status, "title": title, "cards": []}
+        for status, title in DISPUTE_BOARD_COLUMNS
+    }
+    async for dispute in db.disputes.aggregate([
+        {"$match": query},
+        {"$addFields": {"status": _key("status", "open")}},
+        {"$match": {"status": {"$in": list(columns)}}},
+        {"$project": {"_id": 0}}
+    ]):
+        columns[dispute["status"]]["cards"].append(normalize(dispute))
+    return list(columns.values())
+
+
+# ============ INSURANCE ============
+
+PREMIUM_PAYMENTS_PER_YEAR = {"monthly": 12, "quarterly": 4, "semi_annual": 2}
+
+
+async def summarize_insurance(db, query: Dict[str, Any]) -> Dict[str, Any]:
+    """Policy counts and annualised totals over active policies."""
+    is_active = {"$eq": ["$status", "active"]}
+    payments_per_year = {"$switch": {
+        "branches": [
+            {"case": {"$eq": ["$premium_frequency", frequency]}, "then": payments}
+            for frequency, payments in PREMIUM_PAYMENTS_PER_YEAR.items()
+        ],
+        "default": 1
+    }}
+    facet = await _facet(db.insurance_policies, query, {
+        "totals": [{"$group": {
+            "_id": None,
+            "count": {"$sum": 1},
+            "active": {"$sum": {"$cond": [is_active, 1, 0]}},
+            "total_death_benefit": {"$sum": {"$cond": [is_active, _num("death_benefit"), 0]}},
+            "total_cash_value": {"$sum": {"$cond": [is_active, _num("cash_value"), 0]}},
+            "total_annual_premium": {"$sum": {"$cond": [
+                is_active,
+                {"$multiply": [_num("premium_amount"), payments_per_year]},
+                0
+            ]}}
+        }}],
+        "by_type": _count_by("policy_type", "whole_life")
+    })
+    totals = _totals(facet)
+
+    return {
+        "has_data": totals.get("count", 0) > 0,
+        "total_policies": totals.get("count", 0),
+        "active_policies": totals.get("active", 0),
+        "total_death_benefit": totals.get("total_death_benefit", 0),
+        "total_cash_value": totals.get("total_cash_value", 0),
+        "total_annual_premium": totals.get("total_annual_premium", 0),
+        "policies_by_type": _to_dict(facet["by_type"], "count")
+    }
+
+
+# ============ COMPENSATION ============
+
+async def summarize_compensation(db, query: Dict[str, Any]) -> Dict[str, Any]:
+    """Compensation totals grouped by recipient and by type (largest first)."""
+    amount = _num("amount")
+    facet = await _facet(db.compensation_entries, query, {
+        "totals": [{"$group": {
+            "_id": None,
+            "count": {"$sum": 1},
+            "total_compensation": {"$sum": amount},
+            "total_hours": {"$sum": _num("hours_worked")}
+        }}],
+        "by_recipient": [
+            {"$group": {
+                "_id": _key("recipient_name", "Unknown"),
+                "role": {"$first": _key("recipient_role", "")},
+                "total": {"$sum": amount},
+                "count": {"$sum": 1}
+            }},
+            {"$sort": {"total": -1, "_id": 1}}
+        ],
+        "by_type": [
+            {"$group": {
+                "_id": _key("compensation_type", "other"),
+                "total": {"$sum": amount},
+                "count": {"$sum": 1}
+            }},
+            {"$sort": {"total": -1, "_id": 1}}
+        ]
+    })
+    totals = _totals(facet)
+
+    return {
+        "has_data": totals.get("count", 0) > 0,
+        "total_compensation": totals.get("total_compensation", 0),
+        "total_hours": totals.get("total_hours", 0),
+        "entry_count": totals.get("count", 0),
+        "by_recipient": [
+            {"name": row["_id"], "role": row["role"], "total": row["total"], "count": row["count"]}
+            for row in facet["by_recipient"]
+        ],
+        "by_type": [
+            {"type": row["_id"], "total": row["total"], "count": row["count"]}
+            for row in facet["by_type"]
+        ]
+    }
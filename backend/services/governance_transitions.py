@@ -0,0 +1,111 @@
+"""
+Governance Bulk Lifecycle Transitions
+
+Persistence side of POST /api/governance/v2/records/bulk/transition. The
+route validates every record against the lifecycle engine and builds one
+plan per record; this module loads the batch and commits the plans.
+
+- Records and their current revisions are loaded with two $in queries.
+- Record status updates go out in one bulk_write, each guarded by the
+  status the record was validated in, so a record changed concurrently is
+  reported as a conflict instead of being transitioned twice.
+- Revision seals and audit events are written only for records whose
+  status update landed.
+"""
+
+from typing import Any, Dict, List, Set, Tuple
+
+from pymongo import UpdateOne
+
+from services.dashboard_rollups import track_many
+
+
+BULK_TRANSITION_MAX_RECORDS = 500
+
+
+async def load_transition_batch(
+    db,
+    user_id: str,
+    ids: List[str]
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """
+    Resolve ids (record id or RM-ID, an id match wins) and load the current
+    revisions. Returns ({requested id: record}, {revision id: revision}).
+    """
+    records = await db.governance_records.find(
+        {"user_id": user_id, "$or": [{"id": {"$in": ids}}, {"rm_id": {"$in": ids}}]},
+        {"_id": 0}
+    ).to_list(None)
+
+    by_id = {record["id"]: record for record in records}
+    by_rm_id = {}
+    for record in records:
+        if record.get("rm_id"):
+            by_rm_id.setdefault(record["rm_id"], record)
+    resolved = {}
+    for requested in ids:
+        record = by_id.get(requested) or by_rm_id.get(requested)
+        if record:
+            resolved[requested] = record
+
+    revision_ids = list({
+        record["current_revision_id"] for record in resolved.values()
+        if record.get("current_revision_id")
+    })
+    revisions = {}
+    if revision_ids:
+        async for revision in db.governance_revisions.find({"id": {"$in": revision_ids}}, {"_id": 0}):
+            revisions[revision["id"]] = revision
+    return resolved, revisions
+
+
+def _landed(doc: Dict[str, Any], record_set: Dict[str, Any]) -> bool:
+    return all(doc.get(field) == value for field, value in record_set.items())
+
+
+async def commit_transitions(db, plans: List[Dict[str, Any]]) -> Set[str]:
+    """
+    Write planned transitions. Each plan has "record", "record_set",
+    "revision_set" (or None) and "event". Returns the ids of records that
+    changed status concurrently and were left untouched.
+    """
+    if not plans:
+        return set()
+
+    result = await db.governance_records.bulk_write([
+        UpdateOne(
+            {"id": plan["record"]["id"], "status": plan["record"].get("status", "draft")},
+            {"$set": plan["record_set"]}
+        )
+        for plan in plans
+    ], ordered=False)
+
+    conflicted: Set[str] = set()
+    if result.matched_count < len(plans):
+        stored = {}
+        async for doc in db.governance_records.find(
+            {"id": {"$in": [plan["record"]["id"] for plan in plans]}},
+            {"_id": 0, "id": 1, **{field: 1 for plan in plans for field in plan["record_set"]}}
+        ):
+            stored[doc["id"]] = doc
+        conflicted = {
+            plan["record"]["id"] for plan in plans
+            if not _landed(stored.get(plan["record"]["id"], {}), plan["record_set"])
+        }
+
+    landed = [plan for plan in plans if plan["record"]["id"] not in conflicted]
+
+    revision_updates = [
+        UpdateOne({"id": plan["revision_id"], "finalized_at": None}, {"$set": plan["revision_set"]})
+        for plan in landed if plan.get("revision_set")
+    ]
+    if revision_updates:
+        await db.governance_revisions.bulk_write(revision_updates, ordered=False)
+
+    if landed:
+        await db.governance_events.insert_many([plan["event"] for plan in landed], ordered=False)
+
+    await track_many(db, "governance_records", [
+        (plan["record"], {**plan["record"], **plan["record_set"]}) for plan in landed
+    ])
+    return conflicted
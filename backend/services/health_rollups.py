@@ -0,0 +1,316 @@
+"""
+Trust Health Score Rollups
+Time-bucketed summaries of health scans for history and timeline charts.
+
+Each scan updates one daily and one weekly bucket document per user in
+`health_score_rollups`:
+- min/max/last overall score
+- last category scores
+- scan count and first/last scan timestamps
+
+Timeline reads are then a single indexed query over small documents instead
+of loading every raw scan (with its findings) in the period.
+
+Scans that predate the rollups are folded in once per user, on the user's
+first history read; `health_rollup_backfills` records which users are done.
+Every fold bumps the bucket's `version`, and a rebuilt bucket is only
+swapped in if its version is unchanged, so a live scan landing during a
+backfill is never lost or counted twice.
+"""
+
+from datetime import datetime, timezone, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from pymongo.errors import DuplicateKeyError
+
+
+ROLLUP_COLLECTION = "health_score_rollups"
+
+BACKFILL_COLLECTION = "health_rollup_backfills"
+
+GRANULARITY_DAY = "day"
+GRANULARITY_WEEK = "week"
+GRANULARITIES = (GRANULARITY_DAY, GRANULARITY_WEEK)
+
+# Above this window the timeline switches from daily to weekly buckets
+DAILY_MAX_DAYS = 90
+
+# Backfill passes before giving up on buckets that keep changing under it
+BACKFILL_ATTEMPTS = 3
+
+ROLLUP_PROJECTION = {
+    "_id": 0,
+    "bucket": 1,
+    "granularity": 1,
+    "min_score": 1,
+    "max_score": 1,
+    "last_score": 1,
+    "category_scores": 1,
+    "scan_count": 1,
+    "first_scanned_at": 1,
+    "last_scanned_at": 1,
+    "last_scan_id": 1,
+}
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an ISO timestamp as stored on health scans."""
+    dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def bucket_start(dt: datetime, granularity: str) -> str:
+    """Return the ISO date (YYYY-MM-DD) that opens the bucket containing dt."""
+    day = dt.astimezone(timezone.utc).date()
+    if granularity == GRANULARITY_WEEK:
+        # ISO weeks start on Monday
+        day = day - timedelta(days=day.weekday())
+    return day.isoformat()
+
+
+def scan_score(scan: Dict) -> Optional[float]:
+    """Overall score of a scan (V1 stores overall_score, V2 final_score)."""
+    score = scan.get("overall_score")
+    if score is None:
+        score = scan.get("final_score")
+    return score
+
+
+def resolve_granularity(days: int, granularity: Optional[str] = None) -> str:
+    """Pick a bucket size for a timeline window."""
+    if granularity in GRANULARITIES:
+        return granularity
+    return GRANULARITY_DAY if days <= DAILY_MAX_DAYS else GRANULARITY_WEEK
+
+
+async def ensure_health_rollup_indexes(db):
+    """Create indexes for rollup lookups."""
+    await db[ROLLUP_COLLECTION].create_index(
+        [("user_id", 1), ("granularity", 1), ("bucket", 1)],
+        unique=True,
+        name="unique_health_rollup_bucket"
+    )
+    await db[BACKFILL_COLLECTION].create_index(
+        "user_id",
+        unique=True,
+        name="unique_health_rollup_backfill_user"
+    )
+    # Latest-scan and backfill reads on the raw scans
+    await db.health_scans.create_index(
+        [("user_id", 1), ("scanned_at", -1)],
+        name="health_scans_user_scanned_at"
+    )
+
+
+async def record_scan_rollup(db, scan: Dict):
+    """
+    Fold a completed scan into its daily and weekly buckets.
+    Called by the scanners right after the scan document is inserted.
+    """
+    score = scan_score(scan)
+    scanned_at = scan.get("scanned_at")
+    if score is None or not scanned_at:
+        return
+
+    scanned_dt = _parse_timestamp(scanned_at)
+    now = datetime.now(timezone.utc).isoformat()
+
+    for granularity in GRANULARITIES:
+        bucket_filter = {
+            "user_id": scan["user_id"],
+            "granularity": granularity,
+            "bucket": bucket_start(scanned_dt, granularity)
+        }
+        await db[ROLLUP_COLLECTION].update_one(
+            bucket_filter,
+            {
+                "$min": {"min_score": score, "first_scanned_at": scanned_at},
+                "$max": {"max_score": score},
+                "$inc": {"scan_count": 1, "version": 1},
+                "$set": {"updated_at": now}
+            },
+            upsert=True
+        )
+        # Only a scan at least as new as the bucket's last one replaces it,
+        # so scans folded out of order can't roll "last" back
+        await db[ROLLUP_COLLECTION].update_one(
+            {
+                **bucket_filter,
+                "$or": [
+                    {"last_scanned_at": {"$exists": False}},
+                    {"last_scanned_at": {"$lte": scanned_at}}
+                ]
+            },
+            {"$set": {
+                "last_score": score,
+                "last_scanned_at": scanned_at,
+                "last_scan_id": scan.get("scan_id"),
+                "category_scores": scan.get("category_scores", {})
+            }}
+        )
+
+
+def _fold_scan(buckets: Dict[Tuple[str, str], Dict], scan: Dict, now: str):
+    """Fold a scan into in-memory buckets (scans arrive oldest first)."""
+    score = scan_score(scan)
+    scanned_at = scan.get("scanned_at")
+    if score is None or not scanned_at:
+        return
+    scanned_dt = _parse_timestamp(scanned_at)
+    for granularity in GRANULARITIES:
+        key = (granularity, bucket_start(scanned_dt, granularity))
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = buckets[key] = {
+                "user_id": scan["user_id"],
+                "granularity": granularity,
+                "bucket": key[1],
+                "min_score": score,
+                "max_score": score,
+                "first_scanned_at": scanned_at,
+                "scan_count": 0
+            }
+        bucket["min_score"] = min(bucket["min_score"], score)
+        bucket["max_score"] = max(bucket["max_score"], score)
+        bucket["first_scanned_at"] = min(bucket["first_scanned_at"], scanned_at)
+        bucket["scan_count"] += 1
+        bucket.update({
+            "last_score": score,
+            "last_scanned_at": scanned_at,
+            "last_scan_id": scan.get("scan_id"),
+            "category_scores": scan.get("category_scores", {}),
+            "updated_at": now
+        })
+
+
+async def _swap_bucket(db, user_id: str, key: Tuple[str, str], version: Optional[int], fresh: Optional[Dict]) -> bool:
+    """
+    Replace one bucket with its rebuilt value (or remove it if no scans fall
+    in it) unless a scan was folded in since `version` was read.
+    """
+    granularity, bucket = key
+    bucket_filter = {"user_id": user_id, "granularity": granularity, "bucket": bucket, "version": version}
+    if fresh is None:
+        result = await db[ROLLUP_COLLECTION].delete_one(bucket_filter)
+        return result.deleted_count == 1
+    try:
+        result = await db[ROLLUP_COLLECTION].replace_one(
+            bucket_filter,
+            {**fresh, "version": (version or 0) + 1},
+            upsert=version is None
+        )
+    except DuplicateKeyError:
+        # A live scan created the bucket first
+        return False
+    return result.matched_count == 1 or result.upserted_id is not None
+
+
+async def backfill_rollups(db, user_id: str, days: Optional[int] = None) -> int:
+    """
+    Rebuild rollup buckets for a user from raw scans in the window
+    (all of the user's scans when days is None).
+
+    Bucket versions are read before the scans, so any scan the rebuild
+    misses was folded in live and bumped its bucket's version; those
+    buckets are rebuilt again on the next pass. Existing buckets stay
+    readable throughout.
+    Returns the number of scans folded in.
+    """
+    scan_query = {"user_id": user_id}
+    bucket_query = {"user_id": user_id}
+    if days is not None:
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+        # Start at a week boundary so the first weekly bucket is rebuilt whole
+        window_start = bucket_start(cutoff, GRANULARITY_WEEK)
+        scan_query["scanned_at"] = {"$gte": window_start}
+        bucket_query["bucket"] = {"$gte": window_start}
+
+    count = 0
+    for _ in range(BACKFILL_ATTEMPTS):
+        versions = {
+            (doc["granularity"], doc["bucket"]): doc.get("version")
+            async for doc in db[ROLLUP_COLLECTION].find(
+                bucket_query, {"_id": 0, "granularity": 1, "bucket": 1, "version": 1}
+            )
+        }
+
+        now = datetime.now(timezone.utc).isoformat()
+        fresh: Dict[Tuple[str, str], Dict] = {}
+        count = 0
+        async for scan in db.health_scans.find(
+            scan_query,
+            {"_id": 0, "user_id": 1, "scan_id": 1, "scanned_at": 1,
+             "overall_score": 1, "final_score": 1, "category_scores": 1}
+        ).sort("scanned_at", 1):
+            _fold_scan(fresh, scan, now)
+            count += 1
+
+        conflicts = 0
+        for key in set(versions) | set(fresh):
+            if not await _swap_bucket(db, user_id, key, versions.get(key), fresh.get(key)):
+                conflicts += 1
+        if not conflicts:
+            break
+    else:
+        print(f"Warning: health rollup backfill for {user_id} left buckets that kept changing")
+    return count
+
+
+async def ensure_user_backfilled(db, user_id: str) -> bool:
+    """
+    Fold a user's pre-rollup scans into their buckets, once per user.
+    Scans recorded since the rollups shipped are rebuilt along with them,
+    so it doesn't matter whether the user has scanned since.
+    Returns True if this call ran the backfill.
+    """
+    if await db[BACKFILL_COLLECTION].find_one({"user_id": user_id}, {"_id": 1}):
+        return False
+
+    # Claim the backfill so concurrent first reads don't rebuild in parallel
+    claim = await db[BACKFILL_COLLECTION].update_one(
+        {"user_id": user_id},
+        {"$setOnInsert": {
+            "user_id": user_id,
+            "started_at": datetime.now(timezone.utc).isoformat()
+        }},
+        upsert=True
+    )
+    if claim.upserted_id is None:
+        return False
+
+    try:
+        count = await backfill_rollups(db, user_id)
+    except Exception:
+        await db[BACKFILL_COLLECTION].delete_one({"user_id": user_id})
+        raise
+
+    await db[BACKFILL_COLLECTION].update_one(
+        {"user_id": user_id},
+        {"$set": {
+            "completed_at": datetime.now(timezone.utc).isoformat(),
+            "scan_count": count
+        }}
+    )
+    return True
+
+
+async def get_rollup_history(
+    db,
+    user_id: str,
+    days: int = 30,
+    granularity: Optional[str] = None
+) -> List[Dict]:
+    """Get bucketed score history, oldest bucket first."""
+    granularity = resolve_granularity(days, granularity)
+    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+
+    return await db[ROLLUP_COLLECTION].find(
+        {
+            "user_id": user_id,
+            "granularity": granularity,
+            "bucket": {"$gte": bucket_start(cutoff, granularity)}
+        },
+        ROLLUP_PROJECTION
+    ).sort("bucket", 1).to_list(None)
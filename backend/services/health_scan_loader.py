@@ -0,0 +1,96 @@
+"""
+Trust Health Scan Data Loader
+Fetches everything a health scan needs in one concurrent round.
+
+- Sources (governance records, portfolios, documents, ledger entries) are
+  queried concurrently with asyncio.gather instead of one after another.
+- Each source is projected down to the fields the enabled checks declare,
+  so scans no longer pull full payloads they never read.
+- Per-source fetch timings are recorded for the scan result.
+"""
+
+import asyncio
+import time
+from typing import Dict, List, Optional, Iterable
+
+
+# Source name -> (collection, document limit)
+SCAN_SOURCES = {
+    "records": ("governance_records", 10000),
+    "portfolios": ("portfolios", 1000),
+    "documents": ("documents", 10000),
+    "ledger_entries": ("ledger_entries", 10000),
+}
+
+# Fields every scan needs regardless of which checks are enabled
+# (stats counters and finding record_ids)
+BASE_SCAN_FIELDS = {
+    "records": ["id", "module_type", "status", "portfolio_id"],
+    "portfolios": ["portfolio_id"],
+    "documents": ["id"],
+    "ledger_entries": ["id"],
+}
+
+
+def elapsed_ms(started: float) -> float:
+    """Milliseconds since a time.perf_counter() reading."""
+    return round((time.perf_counter() - started) * 1000, 2)
+
+
+def merge_field_requirements(requirements: Iterable[Dict[str, List[str]]]) -> Dict[str, List[str]]:
+    """Union per-source field lists, starting from the base fields."""
+    merged = {source: set(fields) for source, fields in BASE_SCAN_FIELDS.items()}
+    for req in requirements:
+        for source, fields in (req or {}).items():
+            merged.setdefault(source, set()).update(fields)
+    return {source: sorted(fields) for source, fields in merged.items()}
+
+
+def build_projection(fields: Optional[List[str]]) -> Dict:
+    """Mongo projection for a field list (None means full documents)."""
+    if fields is None:
+        return {"_id": 0}
+    projection = {"_id": 0}
+    for f in fields:
+        projection[f] = 1
+    return projection
+
+
+class ScanDataLoader:
+    """Concurrent, projected loader for health scan inputs."""
+
+    def __init__(self, db):
+        self.db = db
+        self.timings: Dict[str, float] = {}
+
+    async def _fetch(self, source: str, user_id: str, fields: Optional[List[str]]) -> List[Dict]:
+        collection, limit = SCAN_SOURCES[source]
+        started = time.perf_counter()
+        docs = await self.db[collection].find(
+            {"user_id": user_id},
+            build_projection(fields)
+        ).to_list(limit)
+        self.timings[source] = elapsed_ms(started)
+        return docs
+
+    async def load(
+        self,
+        user_id: str,
+        fields: Optional[Dict[str, List[str]]] = None
+    ) -> Dict[str, List[Dict]]:
+        """
+        Load all scan sources concurrently.
+
+        Args:
+            user_id: Owner of the data
+            fields: Per-source field lists; None loads full documents
+
+        Returns:
+            Dict keyed by source name (records, portfolios, documents, ledger_entries)
+        """
+        sources = list(SCAN_SOURCES.keys())
+        results = await asyncio.gather(*[
+            self._fetch(source, user_id, fields.get(source) if fields is not None else None)
+            for source in sources
+        ])
+        return dict(zip(sources, results))
@@ -16,11 +16,14 @@ Blocking Conditions (caps):
 - Draft showing as Active → cap at 75
 """
 
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
 from typing import Dict, List, Optional
 from uuid import uuid4
 import re
 
+from services.health_scan_loader import ScanDataLoader
+from services.health_rollups import record_scan_rollup, get_rollup_history, ensure_user_backfilled
+
 
 class HealthFinding:
     """Represents a health scan finding."""
@@ -143,11 +146,12 @@ class TrustHealthScanner:
         # Load configuration from database
         await self._load_config(user_id)
         
-        # Gather all data
-        records = await self._get_governance_records(user_id)
-        portfolios = await self._get_portfolios(user_id)
-        documents = await self._get_documents(user_id)
-        ledger_entries = await self._get_ledger_entries(user_id)
+        # Gather all data (sources fetched concurrently)
+        data = await ScanDataLoader(self.db).load(user_id)
+        records = data["records"]
+        portfolios = data["portfolios"]
+        documents = data["documents"]
+        ledger_entries = data["ledger_entries"]
         
         # Run category scans
         self.category_scores["governance_hygiene"] = await self._scan_governance_hygiene(records)
@@ -199,36 +203,14 @@ class TrustHealthScanner:
             "_id": self.scan_id
         })
         
+        # Fold into daily/weekly rollups used by the timeline
+        try:
+            await record_scan_rollup(self.db, scan_result)
+        except Exception as e:
+            print(f"Error updating health rollups: {e}")
+        
         return scan_result
     
-    async def _get_governance_records(self, user_id: str) -> List[Dict]:
-        """Fetch all governance records."""
-        return await self.db.governance_records.find(
-            {"user_id": user_id},
-            {"_id": 0}
-        ).to_list(10000)
-    
-    async def _get_portfolios(self, user_id: str) -> List[Dict]:
-        """Fetch all portfolios."""
-        return await self.db.portfolios.find(
-            {"user_id": user_id},
-            {"_id": 0}
-        ).to_list(1000)
-    
-    async def _get_documents(self, user_id: str) -> List[Dict]:
-        """Fetch all documents."""
-        return await self.db.documents.find(
-            {"user_id": user_id},
-            {"_id": 0}
-        ).to_list(10000)
-    
-    async def _get_ledger_entries(self, user_id: str) -> List[Dict]:
-        """Fetch all ledger entries."""
-        return await self.db.ledger_entries.find(
-            {"user_id": user_id},
-            {"_id": 0}
-        ).to_list(10000)
-    
     def _count_by_field(self, records: List[Dict], field: str) -> Dict[str, int]:
         """Count records by a field value."""
         counts = {}
@@ -629,19 +611,34 @@ async def get_health_scanner(db) -> TrustHealthScanner:
     return TrustHealthScanner(db)
 
 
-async def get_health_history(db, user_id: str, days: int = 30) -> List[Dict]:
-    """Get health score history for trend analysis."""
-    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+async def get_health_history(
+    db,
+    user_id: str,
+    days: int = 30,
+    granularity: Optional[str] = None
+) -> List[Dict]:
+    """
+    Get health score history for trend analysis.
+    Served from the daily/weekly rollups (one entry per bucket, last scan wins);
+    each user's scans that predate the rollups are backfilled on their first read.
+    """
+    await ensure_user_backfilled(db, user_id)
+    buckets = await get_rollup_history(db, user_id, days, granularity)
     
-    history = await db.health_scans.find(
+    return [
         {
-            "user_id": user_id,
-            "scanned_at": {"$gte": cutoff.isoformat()}
-        },
-        {"_id": 0, "scan_id": 1, "scanned_at": 1, "overall_score": 1, "category_scores": 1}
-    ).sort("scanned_at", 1).to_list(100)
-    
-    return history
+            "scan_id": b.get("last_scan_id"),
+            "scanned_at": b.get("last_scanned_at"),
+            "overall_score": b.get("last_score"),
+            "category_scores": b.get("category_scores", {}),
+            "bucket": b.get("bucket"),
+            "granularity": b.get("granularity"),
+            "min_score": b.get("min_score"),
+            "max_score": b.get("max_score"),
+            "scan_count": b.get("scan_count", 0)
+        }
+        for b in buckets
+    ]
 
 
 class AuditReadinessChecker:
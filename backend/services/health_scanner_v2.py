@@ -29,7 +29,12 @@ from typing import Dict, List, Optional, Any
 from uuid import uuid4
 from dataclasses import dataclass, field, asdict
 from enum import Enum
+import copy
 import re
+import time
+
+from services.health_scan_loader import ScanDataLoader, merge_field_requirements, elapsed_ms
+from services.health_rollups import record_scan_rollup
 
 
 # =============================================================================
@@ -85,6 +90,8 @@ class HealthCheck:
     fix_route: Optional[str] = None
     enabled: bool = True
     auto_fixable: bool = False
+    # Fields this check reads, per scan source (records, portfolios, documents, ledger_entries)
+    fields: Dict[str, List[str]] = field(default_factory=dict)
     
     def calculate_penalty(self, count: int = 1, multiplier: float = 1.0) -> float:
         """Calculate bounded penalty with severity multiplier."""
@@ -250,7 +257,8 @@ DEFAULT_V2_CHECKS = [
         base_deduction=10,
         max_penalty=10,
         effort=Effort.MEDIUM,
-        fix_route="/governance?module=minutes&action=create"
+        fix_route="/governance?module=minutes&action=create",
+        fields={"records": ["module_type"]}
     ),
     HealthCheck(
         id="GOV_002",
@@ -261,7 +269,8 @@ DEFAULT_V2_CHECKS = [
         base_deduction=8,
         max_penalty=16,
         effort=Effort.SMALL,
-        fix_route="/governance?module=minutes&filter=draft"
+        fix_route="/governance?module=minutes&filter=draft",
+        fields={"records": ["module_type", "status", "id"]}
     ),
     HealthCheck(
         id="GOV_003",
@@ -272,7 +281,8 @@ DEFAULT_V2_CHECKS = [
         base_deduction=3,
         max_penalty=18,
         effort=Effort.SMALL,
-        fix_route="/governance?module=minutes&filter=needs_attestation"
+        fix_route="/governance?module=minutes&filter=needs_attestation",
+        fields={"records": ["module_type", "status", "attestations", "finalized_by", "id"]}
     ),
     HealthCheck(
         id="GOV_004",
@@ -283,7 +293,8 @@ DEFAULT_V2_CHECKS = [
         base_deduction=3,
         max_penalty=15,
         effort=Effort.MEDIUM,
-        fix_route="/governance?filter=amended"
+        fix_route="/governance?filter=amended",
+        fields={"records": ["amended_by_id", "status", "id"]}
     ),
     HealthCheck(
         id="GOV_005",
@@ -294,7 +305,8 @@ DEFAULT_V2_CHECKS = [
         base_deduction=5,
         max_penalty=25,
         effort=Effort.SMALL,
-        fix_route="/diagnostics?issue=missing_finalizer"
+        fix_route="/diagnostics?issue=missing_finalizer",
+        fields={"records": ["status", "finalized_by", "id"]}
     ),
     HealthCheck(
         id="GOV_006",
@@ -305,7 +317,8 @@ DEFAULT_V2_CHECKS = [
         base_deduction=6,
         max_penalty=12,
         effort=Effort.MEDIUM,
-        fix_route="/governance?module=minutes&action=create"
+        fix_route="/governance?module=minutes&action=create",
+        fields={"records": ["module_type", "status", "finalized_at"]}
     ),
     
     # ==========================================================================
@@ -320,7 +333,8 @@ DEFAULT_V2_CHECKS = [
         base_deduction=3,
         max_penalty=18,
         effort=Effort.MEDIUM,
-        fix_route="/governance?module=distribution&filter=draft"
+        fix_route="/governance?module=distribution&filter=draft",
+        fields={"records": ["module_type", "status", "created_at", "id"]}
     ),
     HealthCheck(
         id="FIN_002",
@@ -331,7 +345,8 @@ DEFAULT_V2_CHECKS = [
         base_deduction=5,
         max_penalty=10,
         effort=Effort.MEDIUM,
-        fix_route="/governance?module=compensation&filter=pending"
+        fix_route="/governance?module=compensation&filter=pending",
+        fields={"records": ["module_type", "status", "id"]}
     ),
     HealthCheck(
         id="FIN_003",
@@ -342,7 +357,8 @@ DEFAULT_V2_CHECKS = [
         base_deduction=15,
         max_penalty=15,
         effort=Effort.LARGE,
-        fix_route="/ledger?action=reconcile"
+        fix_route="/ledger?action=reconcile",
+        fields={"ledger_entries": ["debit", "credit"]}
     ),
     HealthCheck(
         id="FIN_004",
@@ -353,7 +369,8 @@ DEFAULT_V2_CHECKS = [
         base_deduction=8,
         max_penalty=16,
         effort=Effort.MEDIUM,
-        fix_route="/ledger?action=reconcile"
+        fix_route="/ledger?action=reconcile",
+        fields={}
     ),
     HealthCheck(
         id="FIN_005",
@@ -364,7 +381,8 @@ DEFAULT_V2_CHECKS = [
         base_deduction=6,
         max_penalty=24,
         effort=Effort.MEDIUM,
-        fix_route="/governance?module=distribution&filter=unposted"
+        fix_route="/governance?module=distribution&filter=unposted",
+        fields={"records": ["module_type", "status", "id"], "ledger_entries": ["record_id", "record_type"]}
     ),
     
     # ==========================================================================
@@ -379,7 +397,8 @@ DEFAULT_V2_CHECKS = [
         base_deduction=5,
         max_penalty=15,
         effort=Effort.LARGE,
-        fix_route="/templates"
+        fix_route="/templates",
+        fields={"documents": ["template_id"]}
     ),
     HealthCheck(
         id="COM_002",
@@ -390,7 +409,8 @@ DEFAULT_V2_CHECKS = [
         base_deduction=4,
         max_penalty=16,
         effort=Effort.SMALL,
-        fix_route="/vault?filter=draft&essential=true"
+        fix_route="/vault?filter=draft&essential=true",
+        fields={"documents": ["template_id", "status", "id"]}
     ),
     HealthCheck(
         id="COM_003",
@@ -401,7 +421,8 @@ DEFAULT_V2_CHECKS = [
         base_deduction=3,
         max_penalty=15,
         effort=Effort.MEDIUM,
-        fix_route="/governance?filter=needs_attachment"
+        fix_route="/governance?filter=needs_attachment",
+        fields={"records": ["status", "requires_attachment", "attachments", "id"]}
     ),
     HealthCheck(
         id="COM_004",
@@ -412,7 +433,8 @@ DEFAULT_V2_CHECKS = [
         base_deduction=5,
         max_penalty=20,
         effort=Effort.LARGE,
-        fix_route="/diagnostics?issue=revision_chain"
+        fix_route="/diagnostics?issue=revision_chain",
+        fields={"records": ["status", "is_amended", "revision_history", "id"]}
     ),
     
     # ==========================================================================
@@ -427,7 +449,8 @@ DEFAULT_V2_CHECKS = [
         base_deduction=8,
         max_penalty=32,
         effort=Effort.LARGE,
-        fix_route="/governance?module=dispute&filter=aging"
+        fix_route="/governance?module=dispute&filter=aging",
+        fields={"records": ["module_type", "status", "created_at", "id", "title"]}
     ),
     HealthCheck(
         id="RISK_002",
@@ -438,7 +461,8 @@ DEFAULT_V2_CHECKS = [
         base_deduction=4,
         max_penalty=24,
         effort=Effort.MEDIUM,
-        fix_route="/governance?module=dispute&filter=pending"
+        fix_route="/governance?module=dispute&filter=pending",
+        fields={"records": ["module_type", "status", "created_at", "id", "title"]}
     ),
     HealthCheck(
         id="RISK_003",
@@ -449,7 +473,8 @@ DEFAULT_V2_CHECKS = [
         base_deduction=10,
         max_penalty=10,
         effort=Effort.LARGE,
-        fix_route="/governance?module=insurance&action=create"
+        fix_route="/governance?module=insurance&action=create",
+        fields={"records": ["module_type"]}
     ),
     HealthCheck(
         id="RISK_004",
@@ -460,7 +485,8 @@ DEFAULT_V2_CHECKS = [
         base_deduction=8,
         max_penalty=8,
         effort=Effort.MEDIUM,
-        fix_route="/governance?module=insurance&filter=draft"
+        fix_route="/governance?module=insurance&filter=draft",
+        fields={"records": ["module_type", "status"]}
     ),
     HealthCheck(
         id="RISK_005",
@@ -471,7 +497,8 @@ DEFAULT_V2_CHECKS = [
         base_deduction=6,
         max_penalty=12,
         effort=Effort.MEDIUM,
-        fix_route="/governance?module=insurance&filter=expiring"
+        fix_route="/governance?module=insurance&filter=expiring",
+        fields={"records": ["module_type", "status", "expiry_date", "end_date", "id", "title"]}
     ),
     
     # ==========================================================================
@@ -487,7 +514,8 @@ DEFAULT_V2_CHECKS = [
         max_penalty=15,
         effort=Effort.MEDIUM,
         fix_route="/diagnostics?issue=orphans",
-        auto_fixable=True
+        auto_fixable=True,
+        fields={"records": ["portfolio_id", "id"], "portfolios": ["portfolio_id"]}
     ),
     HealthCheck(
         id="DATA_002",
@@ -498,7 +526,8 @@ DEFAULT_V2_CHECKS = [
         base_deduction=5,
         max_penalty=20,
         effort=Effort.SMALL,
-        fix_route="/diagnostics?issue=rm_id"
+        fix_route="/diagnostics?issue=rm_id",
+        fields={"records": ["rm_id", "id"]}
     ),
     HealthCheck(
         id="DATA_003",
@@ -509,7 +538,8 @@ DEFAULT_V2_CHECKS = [
         base_deduction=5,
         max_penalty=25,
         effort=Effort.SMALL,
-        fix_route="/diagnostics?issue=timestamps"
+        fix_route="/diagnostics?issue=timestamps",
+        fields={"records": ["status", "finalized_at", "id"]}
     ),
     HealthCheck(
         id="DATA_004",
@@ -520,7 +550,8 @@ DEFAULT_V2_CHECKS = [
         base_deduction=3,
         max_penalty=15,
         effort=Effort.SMALL,
-        fix_route="/diagnostics?issue=timestamps"
+        fix_route="/diagnostics?issue=timestamps",
+        fields={"records": ["status", "finalized_at", "id"]}
     ),
     HealthCheck(
         id="DATA_005",
@@ -531,7 +562,8 @@ DEFAULT_V2_CHECKS = [
         base_deduction=6,
         max_penalty=24,
         effort=Effort.LARGE,
-        fix_route="/diagnostics?issue=lifecycle"
+        fix_route="/diagnostics?issue=lifecycle",
+        fields={"records": ["status", "previous_status", "id"]}
     ),
     HealthCheck(
         id="DATA_006",
@@ -542,7 +574,8 @@ DEFAULT_V2_CHECKS = [
         base_deduction=10,
         max_penalty=20,
         effort=Effort.MEDIUM,
-        fix_route="/diagnostics?issue=duplicates"
+        fix_route="/diagnostics?issue=duplicates",
+        fields={"records": ["rm_id", "portfolio_id", "id"]}
     )
 ]
 
@@ -573,6 +606,34 @@ AUDIT_REQUIRED_CHECKS = [
     {"id": "audit_hash_chain", "name": "Hash Chain Integrity Verified", "required": False, "category": "integrity"},
 ]
 
+# Fields the readiness checklist reads, per scan source
+AUDIT_REQUIRED_FIELDS = {
+    "records": [
+        "id", "module_type", "status", "portfolio_id", "rm_id", "created_at",
+        "attestations", "finalized_by", "amended_by_id", "is_amended", "revision_history"
+    ],
+    "documents": ["template_id", "status"],
+    "portfolios": ["portfolio_id"],
+}
+
+
+# =============================================================================
+# RULESET CACHE
+# =============================================================================
+
+# Parsed V2 rulesets per user. Entries are dropped when the ruleset is
+# updated or reset; the TTL bounds staleness across worker processes.
+RULESET_CACHE_TTL_SECONDS = 300
+_ruleset_cache: Dict[str, Dict[str, Any]] = {}
+
+
+def invalidate_v2_ruleset_cache(user_id: Optional[str] = None):
+    """Drop a user's cached ruleset (or all cached rulesets)."""
+    if user_id is None:
+        _ruleset_cache.clear()
+    else:
+        _ruleset_cache.pop(user_id, None)
+
 
 # =============================================================================
 # V2 HEALTH SCANNER
@@ -600,60 +661,86 @@ class TrustHealthScannerV2:
         self.mode = ReadinessMode.NORMAL
         
     async def _load_config(self, user_id: str):
-        """Load V2 health rules configuration from database."""
+        """Load V2 health rules configuration (cached per user)."""
+        cached = _ruleset_cache.get(user_id)
+        if cached and time.monotonic() - cached["loaded_at"] < RULESET_CACHE_TTL_SECONDS:
+            self._apply_ruleset(cached)
+            return
+        
         try:
             config_doc = await self.db.system_config.find_one(
                 {"config_type": "health_rules_v2", "user_id": user_id},
-                {"_id": 0}
+                {"_id": 0, "config": 1}
             )
             
             if config_doc and config_doc.get("config"):
-                config = config_doc["config"]
-                
-                # Load weights (keep as percentage for storage, convert for calc)
-                weights = config.get("category_weights", DEFAULT_V2_WEIGHTS)
-                self.weights = {k: v / 100.0 for k, v in weights.items()}
-                
-                # Load severity multipliers
-                self.severity_multipliers = config.get(
-                    "severity_multipliers", 
-                    DEFAULT_V2_SEVERITY_MULTIPLIERS
-                )
-                
-                # Load checks (merge with defaults, allow overrides)
-                self.checks = {c.id: c for c in DEFAULT_V2_CHECKS}
-                custom_checks = config.get("checks_override", {})
-                for check_id, overrides in custom_checks.items():
-                    if check_id in self.checks:
-                        for key, value in overrides.items():
-                            if hasattr(self.checks[check_id], key):
-                                setattr(self.checks[check_id], key, value)
-                
-                # Load caps
-                self.caps = DEFAULT_V2_CAPS.copy()
-                custom_caps = config.get("blocking_caps", {})
-                for cap in self.caps:
-                    if cap.id in custom_caps:
-                        cap_override = custom_caps[cap.id]
-                        cap.enabled = cap_override.get("enabled", cap.enabled)
-                        cap.cap_value = cap_override.get("cap_value", cap.cap_value)
-                
-                # Load mode
-                mode_str = config.get("readiness_mode", "normal")
-                self.mode = ReadinessMode(mode_str) if mode_str in [m.value for m in ReadinessMode] else ReadinessMode.NORMAL
+                ruleset = self._parse_ruleset(config_doc["config"])
             else:
-                self._use_defaults()
+                ruleset = self._parse_ruleset({})
         except Exception as e:
             print(f"Error loading V2 config: {e}")
             self._use_defaults()
+            return
+        
+        ruleset["loaded_at"] = time.monotonic()
+        _ruleset_cache[user_id] = ruleset
+        self._apply_ruleset(ruleset)
+    
+    @staticmethod
+    def _parse_ruleset(config: Dict) -> Dict[str, Any]:
+        """Parse a stored V2 config into weights, checks, caps and mode."""
+        # Load weights (keep as percentage for storage, convert for calc)
+        weights = config.get("category_weights", DEFAULT_V2_WEIGHTS)
+        
+        # Load checks (merge with defaults, allow overrides). Copies keep
+        # per-user overrides from leaking into the module defaults.
+        checks = {c.id: copy.deepcopy(c) for c in DEFAULT_V2_CHECKS}
+        custom_checks = config.get("checks_override", {})
+        for check_id, overrides in custom_checks.items():
+            if check_id in checks:
+                for key, value in overrides.items():
+                    if hasattr(checks[check_id], key):
+                        setattr(checks[check_id], key, value)
+        
+        # Load caps
+        caps = copy.deepcopy(DEFAULT_V2_CAPS)
+        custom_caps = config.get("blocking_caps", {})
+        for cap in caps:
+            if cap.id in custom_caps:
+                cap_override = custom_caps[cap.id]
+                cap.enabled = cap_override.get("enabled", cap.enabled)
+                cap.cap_value = cap_override.get("cap_value", cap.cap_value)
+        
+        # Load mode
+        mode_str = config.get("readiness_mode", "normal")
+        mode = ReadinessMode(mode_str) if mode_str in [m.value for m in ReadinessMode] else ReadinessMode.NORMAL
+        
+        return {
+            "weights": {k: v / 100.0 for k, v in weights.items()},
+            "severity_multipliers": config.get("severity_multipliers", DEFAULT_V2_SEVERITY_MULTIPLIERS),
+            "checks": checks,
+            "caps": caps,
+            "mode": mode
+        }
+    
+    def _apply_ruleset(self, ruleset: Dict[str, Any]):
+        """Use a parsed ruleset for this scan."""
+        self.weights = ruleset["weights"]
+        self.severity_multipliers = ruleset["severity_multipliers"]
+        self.checks = ruleset["checks"]
+        self.caps = ruleset["caps"]
+        self.mode = ruleset["mode"]
     
     def _use_defaults(self):
         """Use default V2 configuration."""
-        self.weights = {k: v / 100.0 for k, v in DEFAULT_V2_WEIGHTS.items()}
-        self.severity_multipliers = DEFAULT_V2_SEVERITY_MULTIPLIERS
-        self.checks = {c.id: c for c in DEFAULT_V2_CHECKS}
-        self.caps = DEFAULT_V2_CAPS.copy()
-        self.mode = ReadinessMode.NORMAL
+        self._apply_ruleset(self._parse_ruleset({}))
+    
+    def _required_fields(self) -> Dict[str, List[str]]:
+        """Per-source fields needed by the enabled checks (and readiness mode)."""
+        requirements = [c.fields for c in self.checks.values() if c.enabled]
+        if self.mode in [ReadinessMode.AUDIT, ReadinessMode.COURT]:
+            requirements.append(AUDIT_REQUIRED_FIELDS)
+        return merge_field_requirements(requirements)
     
     def _get_severity_multiplier(self, severity: Severity) -> float:
         """Get multiplier for a severity level."""
@@ -701,22 +788,34 @@ class TrustHealthScannerV2:
         self.category_penalties = {}
         self.blockers_triggered = []
         self.scanned_at = datetime.now(timezone.utc).isoformat()
+        timings: Dict[str, Any] = {}
+        scan_started = time.perf_counter()
         
         # Load configuration
+        started = time.perf_counter()
         await self._load_config(user_id)
+        timings["load_config"] = elapsed_ms(started)
         
-        # Gather all data
-        records = await self._get_governance_records(user_id)
-        portfolios = await self._get_portfolios(user_id)
-        documents = await self._get_documents(user_id)
-        ledger_entries = await self._get_ledger_entries(user_id)
+        # Gather all data concurrently, projected to the fields checks declare
+        started = time.perf_counter()
+        loader = ScanDataLoader(self.db)
+        data = await loader.load(user_id, self._required_fields())
+        timings["load_data"] = elapsed_ms(started)
+        timings["load_sources"] = loader.timings
+        
+        records = data["records"]
+        portfolios = data["portfolios"]
+        documents = data["documents"]
+        ledger_entries = data["ledger_entries"]
         
         # Run category scans (each returns penalty total, not score)
+        started = time.perf_counter()
         gov_penalty = await self._scan_governance_hygiene(records)
         fin_penalty = await self._scan_financial_integrity(records, ledger_entries)
         com_penalty = await self._scan_compliance(records, documents)
         risk_penalty = await self._scan_risk_exposure(records)
         data_penalty = await self._scan_data_integrity(records, portfolios)
+        timings["checks"] = elapsed_ms(started)
         
         # Store penalties and calculate category scores
         self.category_penalties = {
@@ -746,9 +845,13 @@ class TrustHealthScannerV2:
         # Run readiness check if in Audit or Court mode
         readiness_result = None
         if self.mode in [ReadinessMode.AUDIT, ReadinessMode.COURT]:
+            started = time.perf_counter()
             readiness_result = await self._run_readiness_check(
                 records, documents, portfolios, ledger_entries
             )
+            timings["readiness"] = elapsed_ms(started)
+        
+        timings["total"] = elapsed_ms(scan_started)
         
         # Build scan result
         scan_result = {
@@ -799,7 +902,10 @@ class TrustHealthScannerV2:
                 "weights": {k: round(v * 100, 1) for k, v in self.weights.items()},
                 "severity_multipliers": self.severity_multipliers,
                 "caps_enabled": [c.id for c in self.caps if c.enabled]
-            }
+            },
+            
+            # Per-phase timings (ms)
+            "timings": timings
         }
         
         # Save to database
@@ -808,32 +914,18 @@ class TrustHealthScannerV2:
             "_id": self.scan_id
         })
         
+        # Fold into daily/weekly rollups used by the timeline
+        try:
+            await record_scan_rollup(self.db, scan_result)
+        except Exception as e:
+            print(f"Error updating health rollups: {e}")
+        
         return scan_result
     
     # =========================================================================
-    # DATA FETCHING
+    # HELPERS
     # =========================================================================
     
-    async def _get_governance_records(self, user_id: str) -> List[Dict]:
-        return await self.db.governance_records.find(
-            {"user_id": user_id}, {"_id": 0}
-        ).to_list(10000)
-    
-    async def _get_portfolios(self, user_id: str) -> List[Dict]:
-        return await self.db.portfolios.find(
-            {"user_id": user_id}, {"_id": 0}
-        ).to_list(1000)
-    
-    async def _get_documents(self, user_id: str) -> List[Dict]:
-        return await self.db.documents.find(
-            {"user_id": user_id}, {"_id": 0}
-        ).to_list(10000)
-    
-    async def _get_ledger_entries(self, user_id: str) -> List[Dict]:
-        return await self.db.ledger_entries.find(
-            {"user_id": user_id}, {"_id": 0}
-        ).to_list(10000)
-    
     def _count_by_field(self, records: List[Dict], field: str) -> Dict[str, int]:
         counts = {}
         for r in records:
@@ -0,0 +1,192 @@
+"""
+Hot-Path Index Registry
+
+Declares the compound indexes behind the app's hottest queries in one place
+so startup can create them together (one createIndexes per collection, all
+collections concurrently) instead of each module carrying its own
+create_index calls. Indexes owned by a feature module (rmid_v2, rm_sort_key,
+activity_feed, ...) stay with that module; this covers the lookups nothing
+else indexed.
+
+Each entry also lists sample query shapes it is meant to serve. The index
+advisor (scripts/index_advisor.py) replays those shapes, or shapes captured
+by the MongoDB profiler, through explain and reports collection scans and
+in-memory sorts.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+from pymongo import IndexModel
+
+
+# A query shape: (collection, filter, sort)
+QueryShape = Tuple[str, Dict[str, Any], Optional[List[Tuple[str, int]]]]
+
+# collection -> [(keys, name, sample shapes as (filter, sort))]
+HOT_PATH_INDEXES: Dict[str, List[Tuple[List[Tuple[str, int]], str, List[Tuple[Dict[str, Any], Any]]]]] = {
+    "governance_records": [
+        ([("user_id", 1), ("portfolio_id", 1), ("created_at", -1), ("id", -1)], "hot_user_portfolio_created", [
+            ({"user_id": "u", "portfolio_id": "p", "status": {"$ne": "voided"}}, [("created_at", -1), ("id", -1)]),
+        ]),
+        ([("user_id", 1), ("created_at", -1), ("id", -1)], "hot_user_created", [
+            ({"user_id": "u", "status": {"$ne": "voided"}}, [("created_at", -1), ("id", -1)]),
+        ]),
+        ([("id", 1)], "hot_id", [({"id": "rec_x"}, None)]),
+    ],
+    "governance_revisions": [
+        ([("id", 1)], "hot_id", [({"id": "rev_x"}, None)]),
+        ([("record_id", 1), ("version", 1)], "hot_record_version", [({"record_id": "rec_x"}, [("version", 1)])]),
+    ],
+    "governance_events": [
+        ([("record_id", 1), ("at", -1)], "hot_record_at", [({"record_id": "rec_x"}, [("at", -1)])]),
+    ],
+    "governance_attestations": [
+        ([("revision_id", 1)], "hot_revision", [({"revision_id": "rev_x"}, None)]),
+    ],
+    "governance_attachments": [
+        ([("revision_id", 1)], "hot_revision", [({"revision_id": "rev_x"}, None)]),
+    ],
+    "user_sessions": [
+        ([("session_token", 1)], "hot_session_token", [({"session_token": "tok"}, None)]),
+        ([("user_id", 1)], "hot_user", [({"user_id": "u"}, None)]),
+    ],
+    "users": [
+        ([("user_id", 1)], "hot_user_id", [({"user_id": "u"}, None)]),
+        ([("email", 1)], "hot_email", [({"email": "a@b.c"}, None)]),
+    ],
+    "portfolios": [
+        ([("user_id", 1), ("created_at", -1)], "hot_user_created", [({"user_id": "u"}, [("created_at", -1)])]),
+    ],
+    "trust_profiles": [
+        ([("portfolio_id", 1), ("user_id", 1)], "hot_portfolio_user", [({"portfolio_id": "p", "user_id": "u"}, None)]),
+    ],
+    "documents": [
+        ([("document_id", 1), ("user_id", 1)], "hot_document_user", [
+            ({"document_id": "d", "user_id": "u", "is_deleted": False}, None),
+        ]),
+        # Live listings use soft_delete's partial (user_id, portfolio_id, created_at) index
+        ([("user_id", 1), ("is_deleted", 1), ("deleted_at", -1)], "hot_user_trash", [
+            ({"user_id": "u", "is_deleted": True}, [("deleted_at", -1)]),
+        ]),
+    ],
+    "audit_log": [
+        ([("actor_id", 1), ("timestamp", -1)], "hot_actor_timestamp", [
+            ({"actor_id": "u"}, [("timestamp", -1)]),
+            ({"actor_id": "u", "category": "governance"}, [("timestamp", -1)]),
+        ]),
+        ([("resource_type", 1), ("resource_id", 1), ("actor_id", 1), ("timestamp", -1)], "hot_resource_history", [
+            ({"resource_type": "record", "resource_id": "r", "actor_id": "u"}, [("timestamp", -1)]),
+        ]),
+    ],
+    "admin_audit_logs": [
+        ([("timestamp", -1)], "hot_timestamp", [({}, [("timestamp", -1)])]),
+    ],
+    "binder_runs": [
+        ([("id", 1)], "hot_id", [({"id": "run_x", "user_id": "u"}, None)]),
+        ([("portfolio_id", 1), ("user_id", 1), ("started_at", -1)], "hot_portfolio_started", [
+            ({"portfolio_id": "p", "user_id": "u"}, [("started_at", -1)]),
+        ]),
+        ([("portfolio_id", 1), ("user_id", 1), ("status", 1), ("finished_at", -1)], "hot_portfolio_status_finished", [
+            ({"portfolio_id": "p", "user_id": "u", "status": "complete"}, [("finished_at", -1)]),
+        ]),
+    ],
+}
+
+
+def registered_query_shapes() -> List[QueryShape]:
+    return [
+        (collection, query, sort)
+        for collection, indexes in HOT_PATH_INDEXES.items()
+        for _, _, shapes in indexes
+        for query, sort in shapes
+    ]
+
+
+async def _ensure_collection(db, collection: str, indexes) -> List[str]:
+    return await db[collection].create_indexes([
+        IndexModel(keys, name=name) for keys, name, _ in indexes
+    ])
+
+
+async def ensure_hot_path_indexes(db) -> Dict[str, str]:
+    """
+    Create every registered index, collections concurrently. A collection
+    that fails (e.g. an index with the same keys under another name) doesn't
+    stop the rest. Returns {collection: error} for the failures.
+    """
+    collections = list(HOT_PATH_INDEXES)
+    results = await asyncio.gather(
+        *[_ensure_collection(db, collection, HOT_PATH_INDEXES[collection]) for collection in collections],
+        return_exceptions=True
+    )
+    return {
+        collection: str(result)
+        for collection, result in zip(collections, results)
+        if isinstance(result, Exception)
+    }
+
+
+# ============ INDEX ADVISOR ============
+
+def _plan_stages(plan: Dict[str, Any], stages: List[Dict[str, Any]]):
+    if not isinstance(plan, dict):
+        return
+    if plan.get("stage"):
+        stages.append({"stage": plan["stage"], "index": plan.get("indexName")})
+    for key in ("queryPlan", "inputStage"):
+        _plan_stages(plan.get(key), stages)
+    for child in plan.get("inputStages", []):
+        _plan_stages(child, stages)
+
+
+async def explain_shape(db, collection: str, query: Dict[str, Any], sort=None) -> Dict[str, Any]:
+    """Winning plan summary for one query shape."""
+    find = {"find": collection, "filter": query, "limit": 20}
+    if sort:
+        find["sort"] = dict(sort)
+    explained = await db.command("explain", find, verbosity="queryPlanner")
+
+    stages: List[Dict[str, Any]] = []
+    _plan_stages(explained.get("queryPlanner", {}).get("winningPlan", {}), stages)
+    names = [stage["stage"] for stage in stages]
+    return {
+        "collection": collection,
+        "filter": query,
+        "sort": sort,
+        "stages": names,
+        "indexes": [stage["index"] for stage in stages if stage["index"]],
+        "collection_scan": "COLLSCAN" in names,
+        "in_memory_sort": "SORT" in names,
+    }
+
+
+async def captured_query_shapes(db, limit: int = 500) -> List[QueryShape]:
+    """
+    Distinct find shapes from the profiler (db.setProfilingLevel(1) or
+    higher must have been on while the app served traffic).
+    """
+    shapes, seen = [], set()
+    async for entry in db["system.profile"].find(
+        {"op": "query", "command.find": {"$exists": True}}
+    ).sort("ts", -1).limit(limit):
+        command = entry["command"]
+        query = command.get("filter", {})
+        sort = list(command["sort"].items()) if command.get("sort") else None
+        key = (command["find"], tuple(sorted(query)), tuple(sort or ()))
+        if key in seen:
+            continue
+        seen.add(key)
+        shapes.append((command["find"], query, sort))
+    return shapes
+
+
+async def advise_indexes(db, shapes: Optional[List[QueryShape]] = None) -> List[Dict[str, Any]]:
+    """Explain each shape (the registry's by default); one report per shape."""
+    reports = []
+    for collection, query, sort in shapes if shapes is not None else registered_query_shapes():
+        try:
+            reports.append(await explain_shape(db, collection, query, sort))
+        except Exception as e:
+            reports.append({"collection": collection, "filter": query, "sort": sort, "error": str(e)})
+    return reports
@@ -8,11 +8,17 @@ Provides tools for:
 4. Repair actions (re-link, reconcile, reindex)
 """
 
-from typing import Dict, List, Optional, Any
+import asyncio
+import random
+from typing import Dict, List, Optional, Any, Set
 from datetime import datetime, timezone
 from dataclasses import dataclass, field
 from enum import Enum
 
+from pymongo import UpdateOne
+
+from models.governance_v2 import compute_content_hash
+
 
 class IssueSeverity(str, Enum):
     """Severity levels for integrity issues"""
@@ -65,19 +71,77 @@ class IntegrityScanResult:
     issues: List[IntegrityIssue] = field(default_factory=list)
     auto_fixable_count: int = 0
     errors: List[str] = field(default_factory=list)
+    chain_verification: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class ScanIndex:
+    """
+    Id sets and join tables built from streamed, projected scans.
+    Lets the checks resolve references with set lookups instead of one
+    find_one per record.
+    """
+    portfolio_ids: Set[str] = field(default_factory=set)
+    subject_ids: Set[str] = field(default_factory=set)
+    record_ids: Set[str] = field(default_factory=set)
+    # current_revision_id -> record id, for revisions not yet seen
+    pending_revision_refs: Dict[str, str] = field(default_factory=dict)
+    # finalized record id -> [(version, revision id, content_hash, parent_hash, hash_version)]
+    revision_chains: Dict[str, List[tuple]] = field(default_factory=dict)
+
+
+VALID_RECORD_STATUSES = ["draft", "pending_approval", "approved", "executed", "finalized", "amended", "voided"]
+
+RECORD_SCAN_PROJECTION = {
+    "_id": 0, "id": 1, "title": 1, "status": 1, "portfolio_id": 1,
+    "current_revision_id": 1, "rm_subject_id": 1
+}
+
+REVISION_SCAN_PROJECTION = {
+    "_id": 0, "id": 1, "record_id": 1, "version": 1, "content_hash": 1, "parent_hash": 1,
+    "hash_version": 1
+}
+
+# Fields compute_content_hash covers, for re-hashing revisions
+REVISION_HASH_PROJECTION = {
+    "_id": 0, "id": 1, "payload_json": 1, "created_at": 1, "created_by": 1,
+    "version": 1, "parent_hash": 1, "content_hash": 1, "hash_version": 1
+}
+
+CHAIN_CHECKPOINT_COLLECTION = "integrity_chain_checkpoints"
+
+# Fraction of checkpointed chains re-verified from version 1 on each scan
+DEEP_VERIFY_FRACTION = 0.05
+
+# Revisions loaded per query when re-hashing payloads
+CHAIN_VERIFY_BATCH_SIZE = 500
 
 
 class IntegrityChecker:
     """
     Scans database for integrity issues and provides repair utilities.
+    
+    A full scan is a fixed number of sequential passes regardless of data size:
+    portfolios, rm_subjects and governance_records build id sets, then one
+    pass over governance_revisions resolves orphan, missing-FK and hash-chain
+    checks against those sets in memory.
+    
+    Hash chains are verified incrementally: each clean chain leaves a
+    checkpoint, and later scans only verify revisions appended after it,
+    plus a random sample of chains that are re-verified from version 1.
     """
     
     def __init__(self, db):
         self.db = db
     
-    async def run_full_scan(self, user_id: Optional[str] = None) -> IntegrityScanResult:
+    async def run_full_scan(
+        self,
+        user_id: Optional[str] = None,
+        deep_verify_fraction: float = DEEP_VERIFY_FRACTION
+    ) -> IntegrityScanResult:
         """
         Run comprehensive integrity scan across all collections.
+        deep_verify_fraction=1 re-verifies every hash chain from version 1.
         """
         import uuid
         scan_id = f"scan_{uuid.uuid4().hex[:8]}"
@@ -91,11 +155,12 @@ class IntegrityChecker:
         
         try:
             # Run all checks
-            await self._check_governance_records(result, user_id)
-            await self._check_revisions(result, user_id)
+            index = await self._build_index(user_id)
+            await self._check_governance_records(result, user_id, index)
+            await self._check_revisions(result, user_id, index)
             await self._check_rm_threads(result, user_id)
-            await self._check_portfolios(result, user_id)
-            await self._check_hash_chains(result, user_id)
+            self._check_missing_revisions(result, index)
+            await self._check_hash_chains(result, index, deep_verify_fraction)
             
         except Exception as e:
             result.errors.append(f"Scan error: {str(e)}")
@@ -106,16 +171,40 @@ class IntegrityChecker:
         
         return result
     
-    async def _check_governance_records(self, result: IntegrityScanResult, user_id: Optional[str]):
-        """Check governance_records collection"""
+    async def _build_index(self, user_id: Optional[str]) -> ScanIndex:
+        """Stream the id sets the reference checks join against."""
+        index = ScanIndex()
+        query = {"user_id": user_id} if user_id else {}
+        
+        async for portfolio in self.db.portfolios.find(query, {"portfolio_id": 1, "_id": 0}):
+            index.portfolio_ids.add(portfolio.get("portfolio_id"))
+        
+        # Thread links and revision parents may point outside the user's
+        # scope, so these sets cover the whole collection (ids only)
+        async for subject in self.db.rm_subjects.find({}, {"id": 1, "_id": 0}):
+            index.subject_ids.add(subject.get("id"))
+        
+        async for record in self.db.governance_records.find({}, {"id": 1, "_id": 0}):
+            index.record_ids.add(record.get("id"))
+        
+        return index
+    
+    async def _check_governance_records(
+        self,
+        result: IntegrityScanResult,
+        user_id: Optional[str],
+        index: ScanIndex
+    ):
+        """Check governance_records collection (including portfolio references)"""
         query = {"user_id": user_id} if user_id else {}
         
-        async for record in self.db.governance_records.find(query, {"_id": 0}):
+        async for record in self.db.governance_records.find(query, RECORD_SCAN_PROJECTION):
             result.total_records_scanned += 1
             record_id = record.get("id", "unknown")
+            portfolio_id = record.get("portfolio_id")
             
-            # Check 1: Missing portfolio_id
-            if not record.get("portfolio_id"):
+            # Check 1: Missing portfolio_id / portfolio not found
+            if not portfolio_id:
                 issue = IntegrityIssue(
                     issue_type=IssueType.MISSING_PORTFOLIO,
                     severity=IssueSeverity.HIGH,
@@ -127,6 +216,18 @@ class IntegrityChecker:
                     auto_fixable=False
                 )
                 self._add_issue(result, issue)
+            elif portfolio_id not in index.portfolio_ids:
+                issue = IntegrityIssue(
+                    issue_type=IssueType.MISSING_FK,
+                    severity=IssueSeverity.HIGH,
+                    record_id=record_id,
+                    record_type="governance_record",
+                    description=f"Portfolio not found: {portfolio_id}",
+                    details={"portfolio_id": portfolio_id},
+                    suggested_fix="Reassign to valid portfolio or restore portfolio",
+                    auto_fixable=False
+                )
+                self._add_issue(result, issue)
             
             # Check 2: Missing current_revision_id
             if not record.get("current_revision_id") and record.get("status") != "voided":
@@ -142,27 +243,12 @@ class IntegrityChecker:
                 )
                 self._add_issue(result, issue)
             
-            # Check 3: Verify current_revision exists
+            # Check 3: current_revision must exist - resolved during the revision pass
             elif record.get("current_revision_id"):
-                revision = await self.db.governance_revisions.find_one(
-                    {"id": record["current_revision_id"]}
-                )
-                if not revision:
-                    issue = IntegrityIssue(
-                        issue_type=IssueType.MISSING_FK,
-                        severity=IssueSeverity.CRITICAL,
-                        record_id=record_id,
-                        record_type="governance_record",
-                        description=f"Current revision not found: {record['current_revision_id']}",
-                        details={"missing_revision_id": record["current_revision_id"]},
-                        suggested_fix="Find or recreate the revision",
-                        auto_fixable=False
-                    )
-                    self._add_issue(result, issue)
+                index.pending_revision_refs[record["current_revision_id"]] = record_id
             
             # Check 4: Invalid status
-            valid_statuses = ["draft", "pending_approval", "approved", "executed", "finalized", "amended", "voided"]
-            if record.get("status") not in valid_statuses:
+            if record.get("status") not in VALID_RECORD_STATUSES:
                 issue = IntegrityIssue(
                     issue_type=IssueType.INVALID_STATUS,
                     severity=IssueSeverity.MEDIUM,
@@ -176,45 +262,63 @@ class IntegrityChecker:
                 self._add_issue(result, issue)
             
             # Check 5: RM Subject link validity
-            if record.get("rm_subject_id"):
-                subject = await self.db.rm_subjects.find_one(
-                    {"id": record["rm_subject_id"]}
+            if record.get("rm_subject_id") and record["rm_subject_id"] not in index.subject_ids:
+                issue = IntegrityIssue(
+                    issue_type=IssueType.INVALID_THREAD_LINK,
+                    severity=IssueSeverity.HIGH,
+                    record_id=record_id,
+                    record_type="governance_record",
+                    description=f"RM Subject not found: {record['rm_subject_id']}",
+                    details={"rm_subject_id": record["rm_subject_id"]},
+                    suggested_fix="Re-link to valid thread or create new thread",
+                    auto_fixable=False
                 )
-                if not subject:
-                    issue = IntegrityIssue(
-                        issue_type=IssueType.INVALID_THREAD_LINK,
-                        severity=IssueSeverity.HIGH,
-                        record_id=record_id,
-                        record_type="governance_record",
-                        description=f"RM Subject not found: {record['rm_subject_id']}",
-                        details={"rm_subject_id": record["rm_subject_id"]},
-                        suggested_fix="Re-link to valid thread or create new thread",
-                        auto_fixable=False
-                    )
-                    self._add_issue(result, issue)
+                self._add_issue(result, issue)
+            
+            # Finalized records get their revision chain verified
+            if record.get("status") == "finalized":
+                index.revision_chains[record_id] = []
     
-    async def _check_revisions(self, result: IntegrityScanResult, user_id: Optional[str]):
-        """Check governance_revisions collection"""
-        async for revision in self.db.governance_revisions.find({}, {"_id": 0}):
+    async def _check_revisions(
+        self,
+        result: IntegrityScanResult,
+        user_id: Optional[str],
+        index: ScanIndex
+    ):
+        """
+        Check governance_revisions collection.
+        Single pass: orphan check, version check, resolves current_revision_id
+        references and collects the revision chains of finalized records.
+        """
+        async for revision in self.db.governance_revisions.find({}, REVISION_SCAN_PROJECTION):
             result.total_records_scanned += 1
             revision_id = revision.get("id", "unknown")
+            record_id = revision.get("record_id")
+            
+            index.pending_revision_refs.pop(revision_id, None)
+            
+            if record_id in index.revision_chains:
+                index.revision_chains[record_id].append((
+                    revision.get("version", 0),
+                    revision_id,
+                    revision.get("content_hash"),
+                    revision.get("parent_hash"),
+                    revision.get("hash_version")
+                ))
             
             # Check 1: Orphan revision (no parent record)
-            record_id = revision.get("record_id")
-            if record_id:
-                record = await self.db.governance_records.find_one({"id": record_id})
-                if not record:
-                    issue = IntegrityIssue(
-                        issue_type=IssueType.ORPHAN_REVISION,
-                        severity=IssueSeverity.HIGH,
-                        record_id=revision_id,
-                        record_type="governance_revision",
-                        description=f"Revision's parent record not found: {record_id}",
-                        details={"parent_record_id": record_id},
-                        suggested_fix="Delete orphan revision or restore parent record",
-                        auto_fixable=True
-                    )
-                    self._add_issue(result, issue)
+            if record_id and record_id not in index.record_ids:
+                issue = IntegrityIssue(
+                    issue_type=IssueType.ORPHAN_REVISION,
+                    severity=IssueSeverity.HIGH,
+                    record_id=revision_id,
+                    record_type="governance_revision",
+                    description=f"Revision's parent record not found: {record_id}",
+                    details={"parent_record_id": record_id},
+                    suggested_fix="Delete orphan revision or restore parent record",
+                    auto_fixable=True
+                )
+                self._add_issue(result, issue)
             
             # Check 2: Version consistency
             if revision.get("version", 0) < 1:
@@ -237,7 +341,7 @@ class IntegrityChecker:
         # Check for duplicate RM-IDs
         rm_ids_seen: Dict[str, List[str]] = {}
         
-        async for subject in self.db.rm_subjects.find(query, {"_id": 0}):
+        async for subject in self.db.rm_subjects.find(query, {"_id": 0, "id": 1, "rm_id": 1}):
             result.total_records_scanned += 1
             subject_id = subject.get("id", "unknown")
             
@@ -262,68 +366,215 @@ class IntegrityChecker:
                 )
                 self._add_issue(result, issue)
     
-    async def _check_portfolios(self, result: IntegrityScanResult, user_id: Optional[str]):
-        """Check portfolio references are valid"""
-        query = {"user_id": user_id} if user_id else {}
+    def _check_missing_revisions(self, result: IntegrityScanResult, index: ScanIndex):
+        """Report current_revision_id references the revision pass never saw"""
+        for revision_id, record_id in index.pending_revision_refs.items():
+            issue = IntegrityIssue(
+                issue_type=IssueType.MISSING_FK,
+                severity=IssueSeverity.CRITICAL,
+                record_id=record_id,
+                record_type="governance_record",
+                description=f"Current revision not found: {revision_id}",
+                details={"missing_revision_id": revision_id},
+                suggested_fix="Find or recreate the revision",
+                auto_fixable=False
+            )
+            self._add_issue(result, issue)
+    
+    async def _check_hash_chains(
+        self,
+        result: IntegrityScanResult,
+        index: ScanIndex,
+        deep_verify_fraction: float = DEEP_VERIFY_FRACTION
+    ):
+        """
+        Verify content hash chain integrity for finalized records.
         
-        # Get all portfolio IDs
-        portfolio_ids = set()
-        async for portfolio in self.db.portfolios.find(query, {"portfolio_id": 1, "_id": 0}):
-            portfolio_ids.add(portfolio.get("portfolio_id"))
+        Starts after each chain's checkpoint unless the chain is sampled for
+        a deep verify or its checkpoint no longer matches. Linkage
+        (parent_hash -> previous content_hash) is checked for every revision
+        in range; revisions that record a hash_version are also re-hashed
+        from their stored payload.
+        """
+        checkpoints = await self._load_chain_checkpoints(list(index.revision_chains.keys()))
+        stats = {
+            "chains_total": len(index.revision_chains),
+            "chains_incremental": 0,
+            "chains_full": 0,
+            "chains_deep_sampled": 0,
+            "revisions_verified": 0,
+            "revisions_rehashed": 0,
+        }
         
-        # Check governance records reference valid portfolios
-        async for record in self.db.governance_records.find(query, {"_id": 0}):
-            portfolio_id = record.get("portfolio_id")
-            if portfolio_id and portfolio_id not in portfolio_ids:
-                issue = IntegrityIssue(
-                    issue_type=IssueType.MISSING_FK,
-                    severity=IssueSeverity.HIGH,
-                    record_id=record.get("id", "unknown"),
-                    record_type="governance_record",
-                    description=f"Portfolio not found: {portfolio_id}",
-                    details={"portfolio_id": portfolio_id},
-                    suggested_fix="Reassign to valid portfolio or restore portfolio",
-                    auto_fixable=False
-                )
-                self._add_issue(result, issue)
-    
-    async def _check_hash_chains(self, result: IntegrityScanResult, user_id: Optional[str]):
-        """Verify content hash chain integrity for finalized records"""
-        # This is a more expensive check, only run on finalized records
-        query = {"status": "finalized"}
-        if user_id:
-            query["user_id"] = user_id
-        
-        async for record in self.db.governance_records.find(query, {"_id": 0}):
+        to_rehash: Dict[str, tuple] = {}  # revision id -> (record id, version)
+        clean_chains: Dict[str, tuple] = {}  # record id -> chain head
+        failed_chains: Set[str] = set()
+        
+        for record_id, revisions in index.revision_chains.items():
             result.total_records_scanned += 1
+            revisions.sort(key=lambda r: r[0] or 0)
+            chain_ok = True
             
-            # Get all revisions for this record
-            revisions = await self.db.governance_revisions.find(
-                {"record_id": record["id"]},
-                {"_id": 0}
-            ).sort("version", 1).to_list(100)
-            
+            checkpoint = checkpoints.get(record_id)
+            start = 0
             prev_hash = None
-            for rev in revisions:
+            if checkpoint and random.random() < deep_verify_fraction:
+                stats["chains_deep_sampled"] += 1
+                checkpoint = None
+            if checkpoint:
+                anchor = next(
+                    (i for i, r in enumerate(revisions) if r[0] == checkpoint.get("last_verified_version")),
+                    None
+                )
+                if anchor is None or revisions[anchor][2] != checkpoint.get("content_hash"):
+                    chain_ok = False
+                    self._add_issue(result, IntegrityIssue(
+                        issue_type=IssueType.BROKEN_HASH_CHAIN,
+                        severity=IssueSeverity.CRITICAL,
+                        record_id=checkpoint.get("last_revision_id") or record_id,
+                        record_type="governance_revision",
+                        description="Hash chain changed below its verified checkpoint",
+                        details={
+                            "record_id": record_id,
+                            "checkpoint_version": checkpoint.get("last_verified_version"),
+                            "checkpoint_hash": checkpoint.get("content_hash"),
+                            "actual_hash": revisions[anchor][2] if anchor is not None else None,
+                            "checkpoint_verified_at": checkpoint.get("verified_at")
+                        },
+                        suggested_fix="Investigate tampering or data corruption",
+                        auto_fixable=False
+                    ))
+                else:
+                    start = anchor + 1
+                    prev_hash = checkpoint.get("content_hash")
+            
+            stats["chains_incremental" if start else "chains_full"] += 1
+            
+            for version, revision_id, content_hash, parent_hash, hash_version in revisions[start:]:
+                stats["revisions_verified"] += 1
                 # Check parent_hash matches previous revision's content_hash
-                if prev_hash and rev.get("parent_hash") != prev_hash:
+                if prev_hash and parent_hash != prev_hash:
+                    chain_ok = False
                     issue = IntegrityIssue(
                         issue_type=IssueType.BROKEN_HASH_CHAIN,
                         severity=IssueSeverity.CRITICAL,
-                        record_id=rev.get("id", "unknown"),
+                        record_id=revision_id or "unknown",
                         record_type="governance_revision",
                         description="Hash chain broken - parent_hash mismatch",
                         details={
                             "expected_parent_hash": prev_hash,
-                            "actual_parent_hash": rev.get("parent_hash"),
-                            "version": rev.get("version")
+                            "actual_parent_hash": parent_hash,
+                            "version": version
                         },
                         suggested_fix="Investigate tampering or data corruption",
                         auto_fixable=False
                     )
                     self._add_issue(result, issue)
                 
-                prev_hash = rev.get("content_hash")
+                if content_hash and hash_version is not None:
+                    to_rehash[revision_id] = (record_id, version)
+                
+                prev_hash = content_hash
+            
+            if chain_ok and revisions:
+                clean_chains[record_id] = revisions[-1]
+            elif not chain_ok:
+                failed_chains.add(record_id)
+        
+        # Re-hash payloads; a mismatch keeps the chain from being checkpointed
+        for revision_id, (record_id, version, expected, actual) in (await self._rehash_revisions(to_rehash)).items():
+            clean_chains.pop(record_id, None)
+            failed_chains.add(record_id)
+            self._add_issue(result, IntegrityIssue(
+                issue_type=IssueType.BROKEN_HASH_CHAIN,
+                severity=IssueSeverity.CRITICAL,
+                record_id=revision_id,
+                record_type="governance_revision",
+                description="Content hash mismatch - revision modified after finalization",
+                details={
+                    "record_id": record_id,
+                    "version": version,
+                    "stored_content_hash": expected,
+                    "computed_content_hash": actual
+                },
+                suggested_fix="Investigate tampering or data corruption",
+                auto_fixable=False
+            ))
+        stats["revisions_rehashed"] = len(to_rehash)
+        
+        await self._save_chain_checkpoints(clean_chains)
+        # Broken chains are verified from version 1 until they are clean again
+        if failed_chains:
+            await self.db[CHAIN_CHECKPOINT_COLLECTION].delete_many(
+                {"record_id": {"$in": list(failed_chains)}}
+            )
+        result.chain_verification = stats
+    
+    async def _load_chain_checkpoints(self, record_ids: List[str]) -> Dict[str, Dict]:
+        """Checkpoints for the given records, keyed by record id."""
+        checkpoints = {}
+        for i in range(0, len(record_ids), CHAIN_VERIFY_BATCH_SIZE):
+            async for checkpoint in self.db[CHAIN_CHECKPOINT_COLLECTION].find(
+                {"record_id": {"$in": record_ids[i:i + CHAIN_VERIFY_BATCH_SIZE]}},
+                {"_id": 0}
+            ):
+                checkpoints[checkpoint["record_id"]] = checkpoint
+        return checkpoints
+    
+    async def _rehash_revisions(self, to_rehash: Dict[str, tuple]) -> Dict[str, tuple]:
+        """
+        Recompute content hashes for revisions in worker threads.
+        Returns revision id -> (record id, version, stored hash, computed hash)
+        for mismatches.
+        """
+        mismatches = {}
+        revision_ids = list(to_rehash.keys())
+        for i in range(0, len(revision_ids), CHAIN_VERIFY_BATCH_SIZE):
+            revisions = await self.db.governance_revisions.find(
+                {"id": {"$in": revision_ids[i:i + CHAIN_VERIFY_BATCH_SIZE]}},
+                REVISION_HASH_PROJECTION
+            ).to_list(None)
+            computed = await asyncio.to_thread(self._compute_content_hashes, revisions)
+            for revision, actual in zip(revisions, computed):
+                if actual != revision.get("content_hash"):
+                    record_id, version = to_rehash[revision["id"]]
+                    mismatches[revision["id"]] = (record_id, version, revision.get("content_hash"), actual)
+        return mismatches
+    
+    @staticmethod
+    def _compute_content_hashes(revisions: List[Dict]) -> List[str]:
+        return [
+            compute_content_hash(
+                payload_json=revision.get("payload_json", {}),
+                created_at=revision.get("created_at", ""),
+                created_by=revision.get("created_by", ""),
+                version=revision.get("version", 1),
+                parent_hash=revision.get("parent_hash"),
+                hash_version=revision.get("hash_version")
+            )
+            for revision in revisions
+        ]
+    
+    async def _save_chain_checkpoints(self, clean_chains: Dict[str, tuple]):
+        """Advance checkpoints to the head of every chain that verified clean."""
+        if not clean_chains:
+            return
+        verified_at = datetime.now(timezone.utc).isoformat()
+        operations = [
+            UpdateOne(
+                {"record_id": record_id},
+                {"$set": {
+                    "record_id": record_id,
+                    "last_verified_version": head[0],
+                    "last_revision_id": head[1],
+                    "content_hash": head[2],
+                    "verified_at": verified_at
+                }},
+                upsert=True
+            )
+            for record_id, head in clean_chains.items()
+        ]
+        await self.db[CHAIN_CHECKPOINT_COLLECTION].bulk_write(operations, ordered=False)
     
     def _add_issue(self, result: IntegrityScanResult, issue: IntegrityIssue):
         """Add issue to result and update counters"""
@@ -471,6 +722,15 @@ class IntegrityChecker:
         }
 
 
+async def ensure_integrity_checkpoint_indexes(db):
+    """Create the index for hash chain checkpoint lookups."""
+    await db[CHAIN_CHECKPOINT_COLLECTION].create_index(
+        "record_id",
+        unique=True,
+        name="unique_chain_checkpoint_record"
+    )
+
+
 # Factory function to create checker with database
 def create_integrity_checker(db) -> IntegrityChecker:
     return IntegrityChecker(db)
@@ -6,15 +6,88 @@ Provides cryptographic integrity seals for finalized records:
 2. Cross-record verification chains
 3. Verification timestamps
 4. Tamper detection
+5. Per-portfolio Merkle accumulator with signed roots and O(log n) proofs
 """
 
+import asyncio
 import hashlib
-import json
+import os
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional
 from uuid import uuid4
 from enum import Enum
 
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from services.canonical_json import (
+    CURRENT_HASH_VERSION, HASH_VERSION_LEGACY,
+    canonical_hash, canonical_json_str, resolve_hash_version
+)
+from services.db_lease import HeldLease, LeaseLost, lease
+from services.merkle_seal import (
+    SUBTREE_SIZE, TREE_ALGORITHM, SIGNATURE_ALGORITHM,
+    subtree_roots, combine_subtree_roots, audit_path, verify_audit_path,
+    sign_root, verify_root_signature
+)
+
+
+# Records verified per prefetch/hash/write round in bulk verification
+VERIFY_BATCH_SIZE = 500
+
+# Each batch's hashing is split into chunks of this many records, hashed by
+# at most HASH_WORKERS pool threads at a time across all in-flight batches
+HASH_CHUNK_SIZE = 100
+HASH_WORKERS = min(4, os.cpu_count() or 1)
+
+# Publish a signed Merkle root every N seals appended to a portfolio
+MERKLE_ROOT_INTERVAL = 64
+
+# Publicly known key, only used when INTEGRITY_ALLOW_DEV_KEY=true
+DEV_SIGNING_KEY = "omnigovault_integrity_dev_key"
+
+SIGNING_KEY_MISSING = "INTEGRITY_SIGNING_KEY is not configured; Merkle roots cannot be signed or verified"
+
+
+def _load_signing_key() -> Optional[bytes]:
+    key = os.environ.get("INTEGRITY_SIGNING_KEY")
+    if key:
+        return key.encode()
+    if os.environ.get("INTEGRITY_ALLOW_DEV_KEY", "").lower() == "true":
+        return DEV_SIGNING_KEY.encode()
+    return None
+
+
+INTEGRITY_SIGNING_KEY = _load_signing_key()
+INTEGRITY_KEY_ID = hashlib.sha256(INTEGRITY_SIGNING_KEY).hexdigest()[:8] if INTEGRITY_SIGNING_KEY else None
+
+
+def signing_key_status() -> str:
+    """'configured', 'dev' (the public development key) or 'missing'."""
+    if INTEGRITY_SIGNING_KEY is None:
+        return "missing"
+    if INTEGRITY_SIGNING_KEY == DEV_SIGNING_KEY.encode():
+        return "dev"
+    return "configured"
+
+
+SEALABLE_STATUSES = ["finalized", "attested", "amended"]
+
+# Chain head: the seal at the highest accumulator position
+CHAIN_HEAD_SORT = [("merkle_index", -1)]
+
+# Unique (portfolio, user, merkle_index) index; a seal insert claims its
+# accumulator position, so concurrent sealers can't share one
+MERKLE_LEAF_INDEX = "unique_merkle_leaf"
+
+# Appends retried when a concurrent sealer claims the same position
+SEAL_APPEND_ATTEMPTS = 5
+
+# Bulk sealing holds a per-portfolio database lease for at most this long
+SEAL_LEASE_SECONDS = 300
+
+DUPLICATE_KEY = 11000
+
 
 class SealStatus(str, Enum):
     VALID = "valid"
@@ -30,13 +103,13 @@ class IntegritySealService:
     
     def __init__(self, db):
         self.db = db
+        self._hash_slots = asyncio.Semaphore(HASH_WORKERS)
     
     # ============ SEAL GENERATION ============
     
-    def _normalize_payload(self, payload: Dict) -> str:
+    def _strip_volatile(self, payload: Dict) -> Dict:
         """
-        Normalize payload to canonical JSON for consistent hashing.
-        Removes volatile fields that shouldn't affect seal.
+        Remove volatile fields that shouldn't affect the seal.
         """
         # Remove fields that change on every access
         volatile_fields = [
@@ -57,7 +130,11 @@ class IntegritySealService:
                 else:
                     normalized[key] = value
         
-        return json.dumps(normalized, sort_keys=True, default=str)
+        return normalized
+    
+    def _normalize_payload(self, payload: Dict, hash_version: Optional[int] = None) -> str:
+        """Normalize payload to canonical JSON for consistent hashing."""
+        return canonical_json_str(self._strip_volatile(payload), hash_version)
     
     def _normalize_dict(self, d: Dict, exclude_fields: List[str]) -> Dict:
         """Recursively normalize a dictionary."""
@@ -67,11 +144,20 @@ class IntegritySealService:
             if k not in exclude_fields
         }
     
-    def generate_record_hash(self, record: Dict, payload: Dict) -> str:
+    def generate_record_hash(self, record: Dict, payload: Dict, hash_version: Optional[int] = None) -> str:
         """
         Generate SHA-256 hash for a record's content.
         Hash includes key identifiers and payload content.
+        
+        Legacy (version 1) hashes embed the payload as a JSON string; later
+        versions embed the normalized payload object directly.
         """
+        hash_version = resolve_hash_version(hash_version)
+        if hash_version == HASH_VERSION_LEGACY:
+            payload_value = self._normalize_payload(payload, hash_version)
+        else:
+            payload_value = self._strip_volatile(payload)
+        
         hashable_data = {
             "id": record.get("id"),
             "rm_id": record.get("rm_id"),
@@ -81,13 +167,18 @@ class IntegritySealService:
             "status": record.get("status"),
             "finalized_at": record.get("finalized_at"),
             "finalized_by": record.get("finalized_by"),
-            "payload": self._normalize_payload(payload)
+            "payload": payload_value
         }
         
-        canonical = json.dumps(hashable_data, sort_keys=True, default=str)
-        return hashlib.sha256(canonical.encode()).hexdigest()
+        return canonical_hash(hashable_data, hash_version)
     
-    def generate_chain_hash(self, record_hash: str, previous_hash: Optional[str] = None) -> str:
+    def generate_chain_hash(
+        self,
+        record_hash: str,
+        previous_hash: Optional[str] = None,
+        timestamp: Optional[str] = None,
+        hash_version: Optional[int] = None
+    ) -> str:
         """
         Generate a chain hash linking this record to previous sealed records.
         Creates a blockchain-like verification chain.
@@ -95,11 +186,10 @@ class IntegritySealService:
         chain_data = {
             "record_hash": record_hash,
             "previous_hash": previous_hash or "GENESIS",
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": timestamp or datetime.now(timezone.utc).isoformat()
         }
         
-        canonical = json.dumps(chain_data, sort_keys=True)
-        return hashlib.sha256(canonical.encode()).hexdigest()
+        return canonical_hash(chain_data, resolve_hash_version(hash_version))
     
     async def create_integrity_seal(
         self,
@@ -123,7 +213,7 @@ class IntegritySealService:
             return {"success": False, "error": "Record not found"}
         
         # Verify record is finalized
-        if record.get("status") not in ("finalized", "attested", "amended"):
+        if record.get("status") not in SEALABLE_STATUSES:
             return {
                 "success": False,
                 "error": "Only finalized records can be sealed",
@@ -141,62 +231,110 @@ class IntegritySealService:
                 payload = revision.get("payload_json", {})
         
         # Generate record hash
-        record_hash = self.generate_record_hash(record, payload)
+        record_hash = self.generate_record_hash(record, payload, CURRENT_HASH_VERSION)
         
-        # Get previous seal for chain
-        previous_seal = await self.db.integrity_seals.find_one(
-            {"user_id": user_id, "portfolio_id": record.get("portfolio_id")},
-            {"_id": 0},
-            sort=[("sealed_at", -1)]
+        portfolio_id = record.get("portfolio_id")
+        seal = await self._append_seal(record, user_id, sealed_by, record_hash)
+        
+        if not seal:
+            return {"success": False, "error": "Seal chain is busy, please retry"}
+        seal_id, sealed_at, merkle_index = seal["id"], seal["sealed_at"], seal["merkle_index"]
+        
+        # Update the record with seal reference
+        await self.db.governance_records.update_one(
+            {"id": record_id},
+            {"$set": self._record_seal_fields(seal_id, sealed_at)}
         )
         
-        previous_hash = previous_seal.get("chain_hash") if previous_seal else None
-        chain_hash = self.generate_chain_hash(record_hash, previous_hash)
+        # Periodically publish a signed root over the accumulator
+        if (merkle_index + 1) % MERKLE_ROOT_INTERVAL == 0:
+            await self.publish_merkle_root(portfolio_id, user_id)
         
-        # Create seal document
-        seal_id = f"seal_{uuid4().hex[:12]}"
-        sealed_at = datetime.now(timezone.utc).isoformat()
+        # Remove _id from response
+        seal.pop("_id", None)
+        
+        return {
+            "success": True,
+            "seal": seal,
+            "message": "Integrity seal created successfully"
+        }
+    
+    async def _append_seal(
+        self,
+        record: Dict,
+        user_id: str,
+        sealed_by: str,
+        record_hash: str
+    ) -> Optional[Dict]:
+        """
+        Append a seal to its portfolio's chain and Merkle accumulator.
         
-        seal = {
+        The insert itself claims the next accumulator position, so a failed
+        insert leaves no hole and two sealers can't link to the same chain
+        head: the loser hits the unique index, re-reads the head and retries.
+        Returns None if every attempt lost.
+        """
+        portfolio_id = record.get("portfolio_id")
+        await self._index_legacy_seals(portfolio_id, user_id)
+        
+        for _ in range(SEAL_APPEND_ATTEMPTS):
+            head = await self._chain_head(portfolio_id, user_id)
+            seal_id = f"seal_{uuid4().hex[:12]}"
+            sealed_at = datetime.now(timezone.utc).isoformat()
+            chain_hash = self.generate_chain_hash(
+                record_hash, head.get("chain_hash") if head else None, sealed_at, CURRENT_HASH_VERSION
+            )
+            seal = self._build_seal(
+                record, user_id, sealed_by, seal_id, sealed_at,
+                record_hash, chain_hash, head.get("id") if head else None,
+                self._next_leaf_index(head)
+            )
+            try:
+                await self.db.integrity_seals.insert_one(seal)
+            except DuplicateKeyError:
+                continue
+            return seal
+        return None
+    
+    def _build_seal(
+        self,
+        record: Dict,
+        user_id: str,
+        sealed_by: str,
+        seal_id: str,
+        sealed_at: str,
+        record_hash: str,
+        chain_hash: str,
+        previous_seal_id: Optional[str],
+        merkle_index: int
+    ) -> Dict:
+        """Seal document for a record."""
+        return {
             "id": seal_id,
-            "record_id": record_id,
+            "record_id": record["id"],
             "user_id": user_id,
             "portfolio_id": record.get("portfolio_id"),
             "rm_id": record.get("rm_id"),
             "module_type": record.get("module_type"),
             "record_hash": record_hash,
             "chain_hash": chain_hash,
-            "previous_seal_id": previous_seal.get("id") if previous_seal else None,
+            "previous_seal_id": previous_seal_id,
             "sealed_at": sealed_at,
             "sealed_by": sealed_by or user_id,
             "status": SealStatus.VALID.value,
             "algorithm": "SHA-256",
-            "version": "1.0"
+            "version": "1.0",
+            "hash_version": CURRENT_HASH_VERSION,
+            "merkle_index": merkle_index
         }
-        
-        # Store the seal
-        await self.db.integrity_seals.insert_one(seal)
-        
-        # Update the record with seal reference
-        await self.db.governance_records.update_one(
-            {"id": record_id},
-            {
-                "$set": {
-                    "integrity_seal_id": seal_id,
-                    "integrity_sealed_at": sealed_at,
-                    "integrity_verified_at": sealed_at,
-                    "updated_at": sealed_at
-                }
-            }
-        )
-        
-        # Remove _id from response
-        seal.pop("_id", None)
-        
+    
+    def _record_seal_fields(self, seal_id: str, sealed_at: str) -> Dict:
+        """Fields set on a governance record when it is sealed."""
         return {
-            "success": True,
-            "seal": seal,
-            "message": "Integrity seal created successfully"
+            "integrity_seal_id": seal_id,
+            "integrity_sealed_at": sealed_at,
+            "integrity_verified_at": sealed_at,
+            "updated_at": sealed_at
         }
     
     # ============ SEAL VERIFICATION ============
@@ -264,7 +402,7 @@ class IntegritySealService:
                 payload = revision.get("payload_json", {})
         
         # Recalculate hash
-        current_hash = self.generate_record_hash(record, payload)
+        current_hash = self.generate_record_hash(record, payload, seal.get("hash_version"))
         stored_hash = seal.get("record_hash")
         
         verified_at = datetime.now(timezone.utc).isoformat()
@@ -332,14 +470,30 @@ class IntegritySealService:
         """
         Verify the entire seal chain for a portfolio.
         
-        Checks that all seals are properly linked.
+        Streams every seal to check that each links to the one before it,
+        then verifies the leaves against the latest signed Merkle root
+        (subtrees re-hashed concurrently, see verify_merkle_tree).
         """
-        seals = await self.db.integrity_seals.find(
+        total_seals = 0
+        broken_links = []
+        previous = None
+        first_seal = None
+        async for seal in self.db.integrity_seals.find(
             {"portfolio_id": portfolio_id, "user_id": user_id},
-            {"_id": 0}
-        ).sort("sealed_at", 1).to_list(1000)
+            {"_id": 0, "id": 1, "previous_seal_id": 1, "sealed_at": 1}
+        ).sort([("merkle_index", 1), ("sealed_at", 1)]).batch_size(VERIFY_BATCH_SIZE):
+            if previous is None:
+                first_seal = seal.get("sealed_at")
+            elif seal.get("previous_seal_id") != previous.get("id"):
+                broken_links.append({
+                    "seal_id": seal.get("id"),
+                    "expected_previous": previous.get("id"),
+                    "actual_previous": seal.get("previous_seal_id")
+                })
+            previous = seal
+            total_seals += 1
         
-        if not seals:
+        if not total_seals:
             return {
                 "success": True,
                 "status": "no_seals",
@@ -347,37 +501,312 @@ class IntegritySealService:
                 "total_seals": 0
             }
         
-        chain_valid = True
-        broken_links = []
+        chain_valid = not broken_links
+        merkle = await self.verify_merkle_tree(portfolio_id, user_id)
+        merkle_valid = merkle.get("success", False) or merkle.get("status") in ("no_roots", "unverifiable")
+        valid = chain_valid and merkle_valid
         
-        for i, seal in enumerate(seals):
-            if i == 0:
-                # First seal should have no previous
-                if seal.get("previous_seal_id"):
-                    # Verify the previous points to nothing or itself
-                    pass
-            else:
-                # Check chain link
-                expected_previous = seals[i-1].get("id")
-                actual_previous = seal.get("previous_seal_id")
-                
-                if expected_previous != actual_previous:
-                    chain_valid = False
-                    broken_links.append({
-                        "seal_id": seal.get("id"),
-                        "expected_previous": expected_previous,
-                        "actual_previous": actual_previous
-                    })
+        if not chain_valid:
+            status, message = "broken_chain", "Chain integrity broken"
+        elif not merkle_valid:
+            status, message = "merkle_mismatch", "Seals do not match the signed Merkle root"
+        else:
+            status, message = "valid", "Chain integrity verified"
         
         return {
-            "success": chain_valid,
-            "status": "valid" if chain_valid else "broken_chain",
-            "total_seals": len(seals),
+            "success": valid,
+            "status": status,
+            "total_seals": total_seals,
             "chain_valid": chain_valid,
             "broken_links": broken_links,
-            "first_seal": seals[0].get("sealed_at") if seals else None,
-            "last_seal": seals[-1].get("sealed_at") if seals else None,
-            "message": "Chain integrity verified" if chain_valid else "Chain integrity broken"
+            "merkle": merkle,
+            # Seals appended after the latest root aren't covered by it yet
+            "unrooted_seals": max(total_seals - merkle.get("tree_size", 0), 0),
+            "first_seal": first_seal,
+            "last_seal": previous.get("sealed_at"),
+            "message": message
+        }
+    
+    # ============ MERKLE ACCUMULATOR ============
+    
+    async def _chain_head(self, portfolio_id: str, user_id: str) -> Optional[Dict]:
+        """Last seal appended to a portfolio's chain and accumulator."""
+        return await self.db.integrity_seals.find_one(
+            {"portfolio_id": portfolio_id, "user_id": user_id, "merkle_index": {"$exists": True}},
+            {"_id": 0, "id": 1, "chain_hash": 1, "merkle_index": 1},
+            sort=CHAIN_HEAD_SORT
+        )
+    
+    def _next_leaf_index(self, head: Optional[Dict]) -> int:
+        return head["merkle_index"] + 1 if head else 0
+    
+    async def _index_legacy_seals(self, portfolio_id: str, user_id: str) -> int:
+        """
+        Append seals created before the accumulator existed, oldest first.
+        Each position is claimed by the update that sets it, like a new seal's
+        insert, so concurrent callers can't skip or reuse a position.
+        """
+        legacy = await self.db.integrity_seals.find(
+            {"portfolio_id": portfolio_id, "user_id": user_id, "merkle_index": {"$exists": False}},
+            {"_id": 0, "id": 1}
+        ).sort("sealed_at", 1).to_list(None)
+        
+        indexed = 0
+        for seal in legacy:
+            for _ in range(SEAL_APPEND_ATTEMPTS):
+                head = await self._chain_head(portfolio_id, user_id)
+                try:
+                    result = await self.db.integrity_seals.update_one(
+                        {"id": seal["id"], "merkle_index": {"$exists": False}},
+                        {"$set": {"merkle_index": self._next_leaf_index(head)}}
+                    )
+                except DuplicateKeyError:
+                    continue
+                indexed += result.modified_count
+                break
+        return indexed
+    
+    async def _load_merkle_leaves(self, portfolio_id: str, user_id: str, tree_size: Optional[int] = None) -> List[Dict]:
+        """Seal leaves of a portfolio in accumulator order."""
+        query = {"portfolio_id": portfolio_id, "user_id": user_id, "merkle_index": {"$exists": True}}
+        if tree_size is not None:
+            query["merkle_index"] = {"$lt": tree_size}
+        return await self.db.integrity_seals.find(
+            query,
+            {"_id": 0, "id": 1, "record_id": 1, "record_hash": 1, "merkle_index": 1}
+        ).sort("merkle_index", 1).to_list(None)
+    
+    async def _compute_subtree_roots(self, record_hashes: List[str]) -> List[str]:
+        """Hash fixed-size subtrees concurrently in worker threads."""
+        chunks = [
+            record_hashes[i:i + SUBTREE_SIZE]
+            for i in range(0, len(record_hashes), SUBTREE_SIZE)
+        ]
+        results = await asyncio.gather(*[
+            asyncio.to_thread(subtree_roots, chunk, SUBTREE_SIZE) for chunk in chunks
+        ])
+        return [roots[0] for roots in results]
+    
+    async def publish_merkle_root(self, portfolio_id: str, user_id: str) -> Dict:
+        """
+        Compute and store a signed root over all seals in the portfolio.
+        Subtree roots are stored with it so verification can localize tampering.
+        """
+        if INTEGRITY_SIGNING_KEY is None:
+            return {"success": False, "error": SIGNING_KEY_MISSING}
+        
+        await self._index_legacy_seals(portfolio_id, user_id)
+        leaves = await self._load_merkle_leaves(portfolio_id, user_id)
+        
+        # Positions are claimed by the seal writes, so leaves are contiguous
+        # from 0; a read racing an append can still see a later leaf without
+        # the one before it, and that leaf waits for the next root
+        tree_size = 0
+        for leaf in leaves:
+            if leaf["merkle_index"] != tree_size:
+                break
+            tree_size += 1
+        leaves = leaves[:tree_size]
+        
+        record_hashes = [leaf["record_hash"] for leaf in leaves]
+        roots = await self._compute_subtree_roots(record_hashes)
+        root_hash = combine_subtree_roots(roots)
+        signed_at = datetime.now(timezone.utc).isoformat()
+        
+        root_doc = {
+            "id": f"mroot_{uuid4().hex[:12]}",
+            "portfolio_id": portfolio_id,
+            "user_id": user_id,
+            "tree_size": tree_size,
+            "root_hash": root_hash,
+            "subtree_size": SUBTREE_SIZE,
+            "subtree_roots": roots,
+            "algorithm": TREE_ALGORITHM,
+            "signature": sign_root(INTEGRITY_SIGNING_KEY, portfolio_id, tree_size, root_hash, signed_at),
+            "signature_algorithm": SIGNATURE_ALGORITHM,
+            "key_id": INTEGRITY_KEY_ID,
+            "signed_at": signed_at
+        }
+        await self.db.merkle_roots.insert_one(root_doc)
+        root_doc.pop("_id", None)
+        
+        return root_doc
+    
+    async def get_latest_merkle_root(self, portfolio_id: str, user_id: str, min_tree_size: int = 0) -> Optional[Dict]:
+        """Most recent signed root covering at least min_tree_size leaves."""
+        return await self.db.merkle_roots.find_one(
+            {"portfolio_id": portfolio_id, "user_id": user_id, "tree_size": {"$gte": min_tree_size}},
+            {"_id": 0, "subtree_roots": 0},
+            sort=[("tree_size", -1), ("signed_at", -1)]
+        )
+    
+    async def get_record_proof(self, record_id: str, user_id: str) -> Dict:
+        """
+        Build an O(log n) inclusion proof for a record's seal against the
+        latest signed root of its portfolio.
+        """
+        if INTEGRITY_SIGNING_KEY is None:
+            return {"success": False, "error": SIGNING_KEY_MISSING}
+        
+        record = await self.db.governance_records.find_one(
+            {"id": record_id, "user_id": user_id},
+            {"_id": 0, "id": 1, "portfolio_id": 1, "integrity_seal_id": 1}
+        )
+        if not record:
+            return {"success": False, "error": "Record not found"}
+        if not record.get("integrity_seal_id"):
+            return {"success": False, "error": "Record has never been sealed"}
+        
+        portfolio_id = record.get("portfolio_id")
+        seal = await self.db.integrity_seals.find_one(
+            {"id": record["integrity_seal_id"]},
+            {"_id": 0, "id": 1, "record_hash": 1, "merkle_index": 1, "hash_version": 1}
+        )
+        if not seal:
+            return {"success": False, "error": "Seal record missing - data corruption detected"}
+        
+        if seal.get("merkle_index") is None:
+            await self._index_legacy_seals(portfolio_id, user_id)
+            seal = await self.db.integrity_seals.find_one(
+                {"id": seal["id"]},
+                {"_id": 0, "id": 1, "record_hash": 1, "merkle_index": 1, "hash_version": 1}
+            )
+        
+        leaf_index = seal["merkle_index"]
+        root = await self.get_latest_merkle_root(portfolio_id, user_id, leaf_index + 1)
+        if not root:
+            root = await self.publish_merkle_root(portfolio_id, user_id)
+            if root.get("error"):
+                return root
+            if root["tree_size"] <= leaf_index:
+                return {"success": False, "error": "Seal is not yet covered by a signed root"}
+        
+        leaves = await self._load_merkle_leaves(portfolio_id, user_id, root["tree_size"])
+        path = await asyncio.to_thread(audit_path, [l["record_hash"] for l in leaves], leaf_index)
+        
+        return {
+            "success": True,
+            "record_id": record_id,
+            "seal_id": seal["id"],
+            "record_hash": seal["record_hash"],
+            "hash_version": seal.get("hash_version"),
+            "leaf_index": leaf_index,
+            "tree_size": root["tree_size"],
+            "audit_path": path,
+            "root": {
+                "id": root["id"],
+                "root_hash": root["root_hash"],
+                "signature": root["signature"],
+                "signature_algorithm": root.get("signature_algorithm"),
+                "key_id": root.get("key_id"),
+                "signed_at": root["signed_at"],
+                "algorithm": root.get("algorithm")
+            }
+        }
+    
+    async def verify_record_proof(self, record_id: str, user_id: str) -> Dict:
+        """
+        Verify a single record against the signed root using its audit path.
+        Re-hashes the current record content, so edits after sealing fail.
+        """
+        proof = await self.get_record_proof(record_id, user_id)
+        if not proof.get("success"):
+            return proof
+        
+        record = await self.db.governance_records.find_one(
+            {"id": record_id, "user_id": user_id},
+            {"_id": 0}
+        )
+        payload = {}
+        if record.get("current_revision_id"):
+            revision = await self.db.governance_revisions.find_one(
+                {"id": record["current_revision_id"]},
+                {"_id": 0, "payload_json": 1}
+            )
+            if revision:
+                payload = revision.get("payload_json", {})
+        
+        current_hash = self.generate_record_hash(record, payload, proof.get("hash_version"))
+        root = proof["root"]
+        
+        content_match = current_hash == proof["record_hash"]
+        path_valid = verify_audit_path(proof["record_hash"], proof["audit_path"], root["root_hash"])
+        signature_valid = verify_root_signature(
+            INTEGRITY_SIGNING_KEY, record.get("portfolio_id"), proof["tree_size"],
+            root["root_hash"], root["signed_at"], root["signature"]
+        )
+        verified = content_match and path_valid and signature_valid
+        
+        return {
+            "success": verified,
+            "status": SealStatus.VALID.value if verified else SealStatus.TAMPERED.value,
+            "record_id": record_id,
+            "content_match": content_match,
+            "path_valid": path_valid,
+            "signature_valid": signature_valid,
+            "leaf_index": proof["leaf_index"],
+            "tree_size": proof["tree_size"],
+            "root_hash": root["root_hash"],
+            "proof_length": len(proof["audit_path"]),
+            "verified_at": datetime.now(timezone.utc).isoformat()
+        }
+    
+    async def verify_merkle_tree(self, portfolio_id: str, user_id: str) -> Dict:
+        """
+        Verify a portfolio's latest signed root.
+        Subtrees are re-hashed in parallel and compared to the stored subtree
+        roots, so a mismatch is reported with the leaf range it affects.
+        """
+        if INTEGRITY_SIGNING_KEY is None:
+            return {"success": False, "status": "unverifiable", "error": SIGNING_KEY_MISSING}
+        
+        root = await self.db.merkle_roots.find_one(
+            {"portfolio_id": portfolio_id, "user_id": user_id},
+            {"_id": 0},
+            sort=[("tree_size", -1), ("signed_at", -1)]
+        )
+        if not root:
+            return {
+                "success": True,
+                "status": "no_roots",
+                "message": "No signed Merkle roots for this portfolio",
+                "tree_size": 0
+            }
+        
+        signature_valid = verify_root_signature(
+            INTEGRITY_SIGNING_KEY, portfolio_id, root["tree_size"],
+            root["root_hash"], root["signed_at"], root["signature"]
+        )
+        
+        leaves = await self._load_merkle_leaves(portfolio_id, user_id, root["tree_size"])
+        roots = await self._compute_subtree_roots([l["record_hash"] for l in leaves])
+        root_match = len(leaves) == root["tree_size"] and combine_subtree_roots(roots) == root["root_hash"]
+        
+        stored = root.get("subtree_roots", [])
+        subtree_size = root.get("subtree_size", SUBTREE_SIZE)
+        mismatched_subtrees = [
+            {
+                "subtree": i,
+                "leaf_range": [i * subtree_size, min((i + 1) * subtree_size, root["tree_size"]) - 1]
+            }
+            for i, computed in enumerate(roots)
+            if i >= len(stored) or stored[i] != computed
+        ]
+        
+        valid = signature_valid and root_match
+        return {
+            "success": valid,
+            "status": "valid" if valid else "invalid",
+            "root_id": root["id"],
+            "root_hash": root["root_hash"],
+            "tree_size": root["tree_size"],
+            "leaves_found": len(leaves),
+            "signature_valid": signature_valid,
+            "root_match": root_match,
+            "mismatched_subtrees": mismatched_subtrees,
+            "signed_at": root["signed_at"],
+            "verified_at": datetime.now(timezone.utc).isoformat(),
+            "message": "Merkle root verified" if valid else "Merkle root verification failed"
         }
     
     # ============ BATCH OPERATIONS ============
@@ -390,86 +819,334 @@ class IntegritySealService:
     ) -> Dict:
         """
         Create seals for all finalized records that don't have one.
-        """
-        # Find finalized records without seals
-        records = await self.db.governance_records.find(
-            {
-                "portfolio_id": portfolio_id,
-                "user_id": user_id,
-                "status": {"$in": ["finalized", "attested", "amended"]},
-                "integrity_seal_id": {"$exists": False}
-            },
-            {"_id": 0, "id": 1, "title": 1, "rm_id": 1}
-        ).to_list(1000)
-        
-        sealed_count = 0
-        errors = []
         
-        for record in records:
-            result = await self.create_integrity_seal(
-                record["id"], user_id, sealed_by
+        Candidates and their revisions are loaded in bulk, the seal chain is
+        computed in memory in a deterministic order (finalized_at, rm_id, id),
+        and seals are appended with one ordered insert_many. Each insert
+        claims its accumulator position, so a failure part way through
+        leaves a contiguous chain; records whose seals landed are updated
+        and the rest are reported by record_id. A database lease keeps two
+        workers from bulk-sealing the same portfolio at once; it is renewed
+        in the background and before every insert, and sealing stops if it
+        was lost.
+        """
+        async with lease(self.db, f"integrity_seal:{user_id}:{portfolio_id}", SEAL_LEASE_SECONDS) as held:
+            if not held:
+                return {
+                    "success": False,
+                    "sealed_count": 0,
+                    "error": "Portfolio is already being sealed, please retry",
+                    "errors": []
+                }
+            
+            records = await self.db.governance_records.find(
+                {
+                    "portfolio_id": portfolio_id,
+                    "user_id": user_id,
+                    "status": {"$in": SEALABLE_STATUSES},
+                    "integrity_seal_id": {"$exists": False}
+                },
+                {"_id": 0}
+            ).to_list(None)
+            records.sort(key=lambda r: (r.get("finalized_at") or "", r.get("rm_id") or "", r["id"]))
+            
+            revision_ids = [r["current_revision_id"] for r in records if r.get("current_revision_id")]
+            revisions = await self.db.governance_revisions.find(
+                {"id": {"$in": revision_ids}},
+                {"_id": 0, "id": 1, "payload_json": 1}
+            ).to_list(None) if revision_ids else []
+            payloads = {rev["id"]: rev.get("payload_json", {}) for rev in revisions}
+            
+            record_hashes = await asyncio.to_thread(
+                self._hash_batch,
+                [(r, payloads.get(r.get("current_revision_id"), {}), CURRENT_HASH_VERSION) for r in records]
             )
-            if result.get("success"):
-                sealed_count += 1
-            else:
-                errors.append({
-                    "record_id": record["id"],
-                    "error": result.get("error")
-                })
+            
+            sealed_count, errors = await self._append_seal_batch(
+                list(zip(records, record_hashes)), portfolio_id, user_id, sealed_by, held
+            )
+        
+        # Publish a root covering the new seals
+        merkle_root = None
+        if sealed_count:
+            merkle_root = await self.publish_merkle_root(portfolio_id, user_id)
         
         return {
             "success": True,
             "sealed_count": sealed_count,
+            "merkle_root": merkle_root.get("root_hash") if merkle_root else None,
             "total_candidates": len(records),
             "errors": errors,
             "message": f"Sealed {sealed_count} of {len(records)} finalized records"
         }
     
-    async def verify_all_seals(
+    async def _append_seal_batch(
         self,
+        pending: List[tuple],
         portfolio_id: str,
-        user_id: str
-    ) -> Dict:
+        user_id: str,
+        sealed_by: str,
+        held: Optional[HeldLease] = None
+    ) -> tuple:
         """
-        Verify all sealed records in a portfolio.
+        Append seals for (record, record_hash) pairs in order.
+        With `held`, the lease is renewed before each insert and appending
+        stops if it was lost.
+        Returns (sealed count, [{record_id, error}] for records left unsealed).
         """
-        # Find all sealed records
-        records = await self.db.governance_records.find(
+        if not pending:
+            return 0, []
+        await self._index_legacy_seals(portfolio_id, user_id)
+        
+        sealed_count = 0
+        errors = []
+        failure = "Seal chain is busy, please retry"
+        for _ in range(SEAL_APPEND_ATTEMPTS):
+            if held:
+                try:
+                    await held.renew()
+                except LeaseLost:
+                    failure = "Sealing lease expired and was taken over, please retry"
+                    break
+            
+            head = await self._chain_head(portfolio_id, user_id)
+            previous_id = head.get("id") if head else None
+            previous_hash = head.get("chain_hash") if head else None
+            first_index = self._next_leaf_index(head)
+            sealed_at = datetime.now(timezone.utc).isoformat()
+            
+            seals = []
+            for offset, (record, record_hash) in enumerate(pending):
+                seal_id = f"seal_{uuid4().hex[:12]}"
+                chain_hash = self.generate_chain_hash(record_hash, previous_hash, sealed_at, CURRENT_HASH_VERSION)
+                seals.append(self._build_seal(
+                    record, user_id, sealed_by, seal_id, sealed_at,
+                    record_hash, chain_hash, previous_id, first_index + offset
+                ))
+                previous_id, previous_hash = seal_id, chain_hash
+            
+            write_error = None
+            try:
+                await self.db.integrity_seals.insert_many(seals, ordered=True)
+                inserted = len(seals)
+            except BulkWriteError as e:
+                inserted = e.details.get("nInserted", 0)
+                write_error = (e.details.get("writeErrors") or [{}])[0]
+            
+            if inserted:
+                errors.extend(await self._mark_records_sealed(seals[:inserted]))
+                sealed_count += inserted
+                pending = pending[inserted:]
+            
+            if write_error is None:
+                break
+            if write_error.get("code") == DUPLICATE_KEY and MERKLE_LEAF_INDEX in write_error.get("errmsg", ""):
+                # A concurrent seal took the next position; rebuild the rest on the new head
+                continue
+            failure = write_error.get("errmsg", "Seal insert failed")
+            break
+        
+        errors.extend({"record_id": record["id"], "error": failure} for record, _ in pending)
+        if pending:
+            print(f"Error bulk sealing portfolio {portfolio_id}: {len(pending)} records not sealed: {failure}")
+        return sealed_count, errors
+    
+    async def _mark_records_sealed(self, seals: List[Dict]) -> List[Dict]:
+        """Point records at their new seals; returns errors for records not updated."""
+        try:
+            await self.db.governance_records.bulk_write([
+                UpdateOne(
+                    {"id": seal["record_id"], "integrity_seal_id": {"$exists": False}},
+                    {"$set": self._record_seal_fields(seal["id"], seal["sealed_at"])}
+                )
+                for seal in seals
+            ], ordered=False)
+        except BulkWriteError as e:
+            return [
+                {"record_id": seals[error["index"]]["record_id"], "error": error.get("errmsg", "Record update failed")}
+                for error in e.details.get("writeErrors", [])
+            ]
+        return []
+    
+    def _hash_batch(self, items: List[tuple]) -> List[str]:
+        """Hash (record, payload, hash_version) triples; runs in a worker thread."""
+        return [
+            self.generate_record_hash(record, payload, hash_version)
+            for record, payload, hash_version in items
+        ]
+    
+    async def _hash_concurrently(self, items: List[tuple]) -> List[str]:
+        """Hash a batch in chunks on several pool threads; results keep input order."""
+        async def hash_chunk(chunk: List[tuple]) -> List[str]:
+            async with self._hash_slots:
+                return await asyncio.to_thread(self._hash_batch, chunk)
+        
+        chunks = await asyncio.gather(*[
+            hash_chunk(items[i:i + HASH_CHUNK_SIZE])
+            for i in range(0, len(items), HASH_CHUNK_SIZE)
+        ])
+        return [h for chunk in chunks for h in chunk]
+    
+    async def iter_verify_seals(
+        self,
+        portfolio_id: str,
+        user_id: str,
+        batch_size: int = VERIFY_BATCH_SIZE
+    ) -> AsyncIterator[Dict]:
+        """
+        Verify every sealed record in a portfolio, yielding one result per batch.
+        
+        Each batch prefetches its revisions and seals with two $in queries,
+        hashes in chunks across pool threads, then records outcomes with
+        bulk writes. Batch N is verified while batch N+1 is read from the
+        cursor and started; results are still yielded in order.
+        """
+        cursor = self.db.governance_records.find(
             {
                 "portfolio_id": portfolio_id,
                 "user_id": user_id,
                 "integrity_seal_id": {"$exists": True}
             },
-            {"_id": 0, "id": 1, "title": 1, "rm_id": 1}
-        ).to_list(1000)
+            {"_id": 0}
+        ).batch_size(batch_size)
         
-        valid_count = 0
-        tampered_count = 0
+        batch: List[Dict] = []
+        batch_number = 0
+        in_flight: List[asyncio.Task] = []
+        try:
+            async for record in cursor:
+                batch.append(record)
+                if len(batch) >= batch_size:
+                    batch_number += 1
+                    in_flight.append(asyncio.create_task(self._verify_seal_batch(batch, user_id, batch_number)))
+                    batch = []
+                    if len(in_flight) > 1:
+                        yield await in_flight.pop(0)
+            if batch:
+                batch_number += 1
+                in_flight.append(asyncio.create_task(self._verify_seal_batch(batch, user_id, batch_number)))
+            while in_flight:
+                yield await in_flight.pop(0)
+        finally:
+            # The consumer stopped early (client disconnected)
+            for task in in_flight:
+                task.cancel()
+    
+    async def _verify_seal_batch(self, records: List[Dict], user_id: str, batch_number: int) -> Dict:
+        """Verify one batch of sealed records."""
+        revision_ids = [r["current_revision_id"] for r in records if r.get("current_revision_id")]
+        seal_ids = [r["integrity_seal_id"] for r in records]
+        
+        revisions, seals = await asyncio.gather(
+            self.db.governance_revisions.find(
+                {"id": {"$in": revision_ids}},
+                {"_id": 0, "id": 1, "payload_json": 1}
+            ).to_list(None),
+            self.db.integrity_seals.find(
+                {"id": {"$in": seal_ids}},
+                {"_id": 0, "id": 1, "record_hash": 1, "sealed_at": 1, "hash_version": 1}
+            ).to_list(None)
+        )
+        payloads = {rev["id"]: rev.get("payload_json", {}) for rev in revisions}
+        seals_by_id = {seal["id"]: seal for seal in seals}
+        
+        hashable = [r for r in records if r["integrity_seal_id"] in seals_by_id]
+        current_hashes = await self._hash_concurrently(
+            [
+                (r, payloads.get(r.get("current_revision_id"), {}), seals_by_id[r["integrity_seal_id"]].get("hash_version"))
+                for r in hashable
+            ]
+        )
+        hash_by_record = {r["id"]: h for r, h in zip(hashable, current_hashes)}
+        
+        verified_at = datetime.now(timezone.utc).isoformat()
         results = []
+        valid_ids = []
+        seal_updates = []
+        tamper_logs = []
         
         for record in records:
-            result = await self.verify_record_seal(record["id"], user_id)
+            seal = seals_by_id.get(record["integrity_seal_id"])
+            if not seal:
+                status = SealStatus.MISSING.value
+            elif hash_by_record[record["id"]] == seal.get("record_hash"):
+                status = SealStatus.VALID.value
+                valid_ids.append(record["id"])
+            else:
+                status = SealStatus.TAMPERED.value
+                current_hash = hash_by_record[record["id"]]
+                seal_updates.append(UpdateOne(
+                    {"id": seal["id"]},
+                    {"$set": {
+                        "status": SealStatus.TAMPERED.value,
+                        "tamper_detected_at": verified_at,
+                        "expected_hash": seal.get("record_hash"),
+                        "actual_hash": current_hash
+                    }}
+                ))
+                tamper_logs.append({
+                    "id": f"tamper_{uuid4().hex[:12]}",
+                    "action": "tamper_detected",
+                    "record_id": record["id"],
+                    "seal_id": seal["id"],
+                    "expected_hash": seal.get("record_hash"),
+                    "actual_hash": current_hash,
+                    "detected_at": verified_at,
+                    "user_id": user_id
+                })
+            
             results.append({
                 "record_id": record["id"],
                 "rm_id": record.get("rm_id"),
                 "title": record.get("title"),
-                "status": result.get("status"),
-                "verified_at": result.get("verified_at")
+                "status": status,
+                "verified_at": verified_at if status == SealStatus.VALID.value else None
             })
-            
-            if result.get("status") == SealStatus.VALID.value:
-                valid_count += 1
-            elif result.get("status") == SealStatus.TAMPERED.value:
-                tampered_count += 1
+        
+        if valid_ids:
+            await self.db.governance_records.update_many(
+                {"id": {"$in": valid_ids}},
+                {"$set": {"integrity_verified_at": verified_at}}
+            )
+        if seal_updates:
+            await self.db.integrity_seals.bulk_write(seal_updates, ordered=False)
+        if tamper_logs:
+            await self.db.integrity_logs.insert_many(tamper_logs)
+        
+        return {
+            "batch": batch_number,
+            "checked": len(records),
+            "valid_count": len(valid_ids),
+            "tampered_count": len(seal_updates),
+            "missing_count": len(records) - len(hashable),
+            "results": results
+        }
+    
+    async def verify_all_seals(
+        self,
+        portfolio_id: str,
+        user_id: str
+    ) -> Dict:
+        """
+        Verify all sealed records in a portfolio.
+        """
+        valid_count = 0
+        tampered_count = 0
+        results = []
+        
+        async for batch in self.iter_verify_seals(portfolio_id, user_id):
+            valid_count += batch["valid_count"]
+            tampered_count += batch["tampered_count"]
+            results.extend(batch["results"])
         
         return {
             "success": tampered_count == 0,
-            "total_verified": len(records),
+            "total_verified": len(results),
             "valid_count": valid_count,
             "tampered_count": tampered_count,
             "results": results,
             "verification_timestamp": datetime.now(timezone.utc).isoformat(),
-            "message": f"Verified {len(records)} seals: {valid_count} valid, {tampered_count} tampered"
+            "message": f"Verified {len(results)} seals: {valid_count} valid, {tampered_count} tampered"
         }
     
     # ============ REPORTING ============
@@ -496,21 +1173,17 @@ class IntegritySealService:
             "integrity_seal_id": {"$exists": True}
         })
         
-        # Count by seal status
-        seals = await self.db.integrity_seals.find(
-            {"portfolio_id": portfolio_id, "user_id": user_id},
-            {"_id": 0, "status": 1, "sealed_at": 1}
-        ).to_list(1000)
-        
+        # Count by seal status (seals without one count as valid)
         status_counts = {
             SealStatus.VALID.value: 0,
             SealStatus.TAMPERED.value: 0
         }
-        
-        for seal in seals:
-            status = seal.get("status", SealStatus.VALID.value)
-            if status in status_counts:
-                status_counts[status] += 1
+        async for row in self.db.integrity_seals.aggregate([
+            {"$match": {"portfolio_id": portfolio_id, "user_id": user_id}},
+            {"$group": {"_id": {"$ifNull": ["$status", SealStatus.VALID.value]}, "count": {"$sum": 1}}}
+        ]):
+            if row["_id"] in status_counts:
+                status_counts[row["_id"]] = row["count"]
         
         # Get recent seals
         recent_seals = await self.db.integrity_seals.find(
@@ -530,6 +1203,34 @@ class IntegritySealService:
         }
 
 
+async def ensure_integrity_seal_indexes(db):
+    """
+    Create indexes for seals and signed roots.
+    Raises if the Merkle leaf index can't be built: without it concurrent
+    seals could claim the same position, so startup must not carry on.
+    """
+    # Earlier versions built a plain index on the leaf key, which some
+    # servers won't allow next to the unique one
+    if "integrity_seals_merkle_leaf" in await db.integrity_seals.index_information():
+        await db.integrity_seals.drop_index("integrity_seals_merkle_leaf")
+    await db.integrity_seals.create_index(
+        [("portfolio_id", 1), ("user_id", 1), ("merkle_index", 1)],
+        unique=True,
+        name=MERKLE_LEAF_INDEX,
+        partialFilterExpression={"merkle_index": {"$exists": True}}
+    )
+    # Chain order; also serves the lookup of seals without a position yet,
+    # which the partial index above can't
+    await db.integrity_seals.create_index(
+        [("portfolio_id", 1), ("user_id", 1), ("merkle_index", 1), ("sealed_at", 1)],
+        name="integrity_seals_chain_order"
+    )
+    await db.merkle_roots.create_index(
+        [("portfolio_id", 1), ("user_id", 1), ("tree_size", -1), ("signed_at", -1)],
+        name="merkle_roots_latest"
+    )
+
+
 # Factory function for creating service instance
 def create_integrity_seal_service(db):
     return IntegritySealService(db)
@@ -0,0 +1,144 @@
+"""
+Keyset Pagination
+
+List endpoints page with an opaque cursor over the sort key plus a unique
+tie-breaker instead of skip(offset): the next page is "documents after the
+last one returned", which an index serves at the same cost however deep the
+page. Totals are optional (exact, capped estimate, or none) since counting
+every match is the other linear cost of a list call.
+
+    page = await keyset_page(
+        db.meetings, query, [("created_at", -1)], "meeting_id",
+        limit=50, cursor=cursor
+    )
+    page["items"], page["next_cursor"], page["total"]
+
+Endpoints keep accepting offset for older clients; an offset page still
+returns a next_cursor to continue from.
+"""
+
+import base64
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+
+TOTAL_EXACT = "exact"
+TOTAL_ESTIMATE = "estimate"
+TOTAL_NONE = "none"
+TOTAL_MODES = (TOTAL_EXACT, TOTAL_ESTIMATE, TOTAL_NONE)
+
+# Estimated totals stop counting here and report the cap
+ESTIMATE_COUNT_CAP = 1000
+
+
+class InvalidCursor(ValueError):
+    """Raised when a pagination cursor can't be decoded or doesn't match the sort."""
+
+
+def encode_cursor(values: list) -> str:
+    raw = json.dumps(values, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> list:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except Exception:
+        raise InvalidCursor("Invalid pagination cursor")
+    if not isinstance(values, list):
+        raise InvalidCursor("Invalid pagination cursor")
+    return values
+
+
+def _sort_keys(sort: List[Tuple[str, int]], tie_field: str) -> List[Tuple[str, int]]:
+    """The sort with the tie-breaker appended (in the last key's direction)."""
+    keys = list(sort)
+    if tie_field not in [field for field, _ in keys]:
+        keys.append((tie_field, keys[-1][1] if keys else 1))
+    return keys
+
+
+def after_filter(keys: List[Tuple[str, int]], values: list) -> Optional[Dict[str, Any]]:
+    """
+    Filter for documents that sort strictly after values under keys, or None
+    if nothing can. Null/missing sorts lowest, matching MongoDB.
+    """
+    clauses = []
+    for i, (field, direction) in enumerate(keys):
+        equal = {f: v for (f, _), v in zip(keys[:i], values[:i])}
+        value = values[i]
+        if direction == 1:
+            clauses.append({**equal, field: {"$ne": None} if value is None else {"$gt": value}})
+        elif value is not None:
+            clauses.append({**equal, field: {"$lt": value}})
+            clauses.append({**equal, field: None})
+    if not clauses:
+        return None
+    return clauses[0] if len(clauses) == 1 else {"$or": clauses}
+
+
+async def count_total(collection, query: Dict[str, Any], mode: str = TOTAL_EXACT) -> Tuple[Optional[int], bool]:
+    """Returns (total, is_estimate) for the requested total mode."""
+    if mode == TOTAL_NONE:
+        return None, False
+    if mode == TOTAL_ESTIMATE:
+        if not query:
+            return await collection.estimated_document_count(), True
+        total = await collection.count_documents(query, limit=ESTIMATE_COUNT_CAP)
+        return total, total >= ESTIMATE_COUNT_CAP
+    return await collection.count_documents(query), False
+
+
+async def keyset_page(
+    collection,
+    query: Dict[str, Any],
+    sort: List[Tuple[str, int]],
+    tie_field: str,
+    limit: int,
+    cursor: Optional[str] = None,
+    offset: int = 0,
+    projection: Optional[Dict[str, Any]] = None,
+    total: str = TOTAL_EXACT
+) -> Dict[str, Any]:
+    """
+    One page of collection.find(query) ordered by sort then tie_field.
+    offset is only used when no cursor is given.
+    """
+    if total not in TOTAL_MODES:
+        raise InvalidCursor(f"Unknown total mode '{total}'")
+    keys = _sort_keys(sort, tie_field)
+
+    find_query = query
+    if cursor:
+        values = decode_cursor(cursor)
+        if len(values) != len(keys):
+            raise InvalidCursor("Pagination cursor does not match the requested sort")
+        after = after_filter(keys, values)
+        if after is None:
+            find_query = None
+        else:
+            find_query = {"$and": [query, after]} if query else after
+
+    items = []
+    if find_query is not None:
+        find = collection.find(find_query, projection if projection is not None else {"_id": 0}).sort(keys)
+        if not cursor and offset:
+            find = find.skip(offset)
+        # One extra row tells us whether there is a next page
+        items = await find.limit(limit + 1).to_list(limit + 1)
+
+    has_more = len(items) > limit
+    items = items[:limit]
+    next_cursor = None
+    if has_more:
+        last = items[-1]
+        next_cursor = encode_cursor([last.get(field) for field, _ in keys])
+
+    total_count, is_estimate = await count_total(collection, query, total)
+    return {
+        "items": items,
+        "next_cursor": next_cursor,
+        "has_more": has_more,
+        "total": total_count,
+        "total_is_estimate": is_estimate
+    }
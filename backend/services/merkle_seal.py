@@ -0,0 +1,136 @@
+"""
+Merkle Tree Primitives for Integrity Seals
+
+RFC 6962-style Merkle tree over seal record hashes:
+1. Leaf and node hashes are domain-separated (0x00 / 0x01 prefixes)
+2. Any tree size is supported (split at the largest power of two)
+3. Audit paths prove one leaf against a root in O(log n) hashes
+4. Roots can be computed per subtree and combined, so large trees are
+   hashed in parallel
+"""
+
+import hashlib
+import hmac
+from typing import List, Tuple
+
+
+LEAF_PREFIX = b"\x00"
+NODE_PREFIX = b"\x01"
+
+# Leaves per subtree when hashing a tree in parallel (power of two)
+SUBTREE_SIZE = 1024
+
+TREE_ALGORITHM = "RFC6962-SHA256"
+SIGNATURE_ALGORITHM = "HMAC-SHA256"
+
+
+def leaf_hash(record_hash: str) -> bytes:
+    """Hash a seal's record_hash (hex) into a leaf node."""
+    return hashlib.sha256(LEAF_PREFIX + bytes.fromhex(record_hash)).digest()
+
+
+def node_hash(left: bytes, right: bytes) -> bytes:
+    """Hash two child nodes into their parent."""
+    return hashlib.sha256(NODE_PREFIX + left + right).digest()
+
+
+def _split_point(n: int) -> int:
+    """Largest power of two strictly less than n (n > 1)."""
+    k = 1
+    while k * 2 < n:
+        k *= 2
+    return k
+
+
+def root_from_nodes(nodes: List[bytes]) -> bytes:
+    """
+    Merkle root over already-hashed nodes.
+    Used for leaf lists and for combining subtree roots: with a power-of-two
+    subtree size the RFC 6962 split points fall on subtree boundaries, so
+    the root over subtree roots equals the root over all leaves.
+    """
+    n = len(nodes)
+    if n == 0:
+        return hashlib.sha256(b"").digest()
+    if n == 1:
+        return nodes[0]
+    k = _split_point(n)
+    return node_hash(root_from_nodes(nodes[:k]), root_from_nodes(nodes[k:]))
+
+
+def merkle_root(record_hashes: List[str]) -> str:
+    """Hex Merkle root over record hashes in leaf order."""
+    return root_from_nodes([leaf_hash(h) for h in record_hashes]).hex()
+
+
+def subtree_roots(record_hashes: List[str], subtree_size: int = SUBTREE_SIZE) -> List[str]:
+    """Hex roots of consecutive fixed-size subtrees (last may be partial)."""
+    return [
+        merkle_root(record_hashes[i:i + subtree_size])
+        for i in range(0, len(record_hashes), subtree_size)
+    ]
+
+
+def combine_subtree_roots(roots: List[str]) -> str:
+    """Combine fixed-size subtree roots (from subtree_roots) into the tree root."""
+    return root_from_nodes([bytes.fromhex(r) for r in roots]).hex()
+
+
+def _audit_path(nodes: List[bytes], index: int) -> List[Tuple[str, bytes]]:
+    n = len(nodes)
+    if n <= 1:
+        return []
+    k = _split_point(n)
+    if index < k:
+        return _audit_path(nodes[:k], index) + [("right", root_from_nodes(nodes[k:]))]
+    return _audit_path(nodes[k:], index - k) + [("left", root_from_nodes(nodes[:k]))]
+
+
+def audit_path(record_hashes: List[str], index: int) -> List[dict]:
+    """
+    Audit path for the leaf at index, leaf-to-root.
+    Each step gives the sibling hash and which side it sits on.
+    """
+    if index < 0 or index >= len(record_hashes):
+        raise ValueError(f"Leaf index {index} outside tree of size {len(record_hashes)}")
+    nodes = [leaf_hash(h) for h in record_hashes]
+    return [{"side": side, "hash": h.hex()} for side, h in _audit_path(nodes, index)]
+
+
+def verify_audit_path(record_hash: str, path: List[dict], root: str) -> bool:
+    """Check that record_hash with the audit path hashes up to root."""
+    try:
+        current = leaf_hash(record_hash)
+        for step in path:
+            sibling = bytes.fromhex(step["hash"])
+            if step["side"] == "left":
+                current = node_hash(sibling, current)
+            else:
+                current = node_hash(current, sibling)
+    except (ValueError, KeyError, TypeError):
+        return False
+    return hmac.compare_digest(current.hex(), root)
+
+
+def root_signing_message(portfolio_id: str, tree_size: int, root_hash: str, signed_at: str) -> bytes:
+    """Canonical message covered by a root signature."""
+    return f"{TREE_ALGORITHM}|{portfolio_id}|{tree_size}|{root_hash}|{signed_at}".encode()
+
+
+def sign_root(key: bytes, portfolio_id: str, tree_size: int, root_hash: str, signed_at: str) -> str:
+    """HMAC-SHA256 signature over a published root."""
+    message = root_signing_message(portfolio_id, tree_size, root_hash, signed_at)
+    return hmac.new(key, message, hashlib.sha256).hexdigest()
+
+
+def verify_root_signature(
+    key: bytes,
+    portfolio_id: str,
+    tree_size: int,
+    root_hash: str,
+    signed_at: str,
+    signature: str
+) -> bool:
+    """Check a published root's signature."""
+    expected = sign_root(key, portfolio_id, tree_size, root_hash, signed_at)
+    return hmac.compare_digest(expected, signature or "")
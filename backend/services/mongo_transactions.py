@@ -0,0 +1,42 @@
+"""
+MongoDB Transaction Helper
+
+Multi-document transactions need a replica set or sharded cluster. Bulk
+operations that should apply atomically run their write phase through
+run_in_transaction, which uses a transaction when the deployment supports
+one and otherwise runs the same writes without a session (standalone
+servers and local development).
+"""
+
+from typing import Awaitable, Callable, Dict, Optional
+
+
+# Cached per client: does the deployment support transactions?
+_transaction_support: Dict[int, bool] = {}
+
+
+async def transactions_supported(db) -> bool:
+    """True if db is on a replica set member or mongos."""
+    key = id(db.client)
+    if key not in _transaction_support:
+        try:
+            hello = await db.command("hello")
+            _transaction_support[key] = bool(hello.get("setName")) or hello.get("msg") == "isdbgrid"
+        except Exception:
+            _transaction_support[key] = False
+    return _transaction_support[key]
+
+
+async def run_in_transaction(db, writes: Callable[[Optional[object]], Awaitable[None]]) -> bool:
+    """
+    Run writes(session) inside a transaction when available, otherwise
+    writes(None). Returns True if the writes ran in a transaction.
+    """
+    if not await transactions_supported(db):
+        await writes(None)
+        return False
+
+    async with await db.client.start_session() as session:
+        async with session.start_transaction():
+            await writes(session)
+    return True
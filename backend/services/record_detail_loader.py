@@ -0,0 +1,124 @@
+"""
+Governance Record Detail Loader
+Fetches a V2 record and the sub-resources its detail view renders in two
+rounds instead of one query per sub-resource.
+
+- The record is resolved by id or RM-ID in a single query (an id match wins).
+- Sub-resources (current revision, revision count, attestations,
+  attachments, events, revision summaries) are then fetched concurrently
+  with asyncio.gather, keyed off the record's current_revision_id.
+- Callers pass the set of sub-resources they need, so views that only
+  render part of the record skip the rest.
+"""
+
+import asyncio
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+
+# Sub-resources returned when the caller doesn't ask for specific ones
+DEFAULT_INCLUDES = ("current_revision", "revision_count", "attestations", "attachments")
+
+RECORD_INCLUDES = DEFAULT_INCLUDES + ("events", "revisions")
+
+ATTESTATION_LIMIT = 50
+ATTACHMENT_LIMIT = 100
+EVENT_LIMIT = 100
+REVISION_LIMIT = 100
+
+REVISION_SUMMARY_FIELDS = {
+    "_id": 0, "id": 1, "version": 1, "change_type": 1, "change_reason": 1,
+    "created_at": 1, "created_by": 1, "finalized_at": 1, "finalized_by": 1,
+    "content_hash": 1
+}
+
+
+def parse_includes(include: Optional[str]) -> Set[str]:
+    """
+    Parse a comma-separated include parameter. None/empty means the
+    defaults; unknown names raise ValueError.
+    """
+    if not include:
+        return set(DEFAULT_INCLUDES)
+    names = {name.strip() for name in include.split(",") if name.strip()}
+    unknown = names - set(RECORD_INCLUDES)
+    if unknown:
+        raise ValueError(
+            f"Unknown include: {', '.join(sorted(unknown))}. "
+            f"Valid: {', '.join(RECORD_INCLUDES)}"
+        )
+    return names
+
+
+async def resolve_record(
+    db,
+    id_or_rm: str,
+    user_id: str,
+    projection: Optional[Dict[str, Any]] = None
+) -> Tuple[Optional[Dict], Optional[str]]:
+    """
+    Resolve a record by `id` or `rm_id` in one query.
+    Returns (record, resolver_path) or (None, None).
+    """
+    matches = await db.governance_records.find(
+        {"user_id": user_id, "$or": [{"id": id_or_rm}, {"rm_id": id_or_rm}]},
+        projection or {"_id": 0}
+    ).to_list(2)
+
+    for record in matches:
+        if record.get("id") == id_or_rm:
+            return record, "id"
+    if matches:
+        return matches[0], "rm_id"
+    return None, None
+
+
+async def _current_revision(db, revision_id: Optional[str]):
+    if not revision_id:
+        return None
+    return await db.governance_revisions.find_one({"id": revision_id}, {"_id": 0})
+
+
+async def _by_revision(db, collection: str, revision_id: Optional[str], limit: int):
+    if not revision_id:
+        return []
+    return await db[collection].find({"revision_id": revision_id}, {"_id": 0}).to_list(limit)
+
+
+async def load_record_detail(
+    db,
+    id_or_rm: str,
+    user_id: str,
+    include: Iterable[str] = DEFAULT_INCLUDES
+) -> Optional[Dict[str, Any]]:
+    """
+    Load a record and the requested sub-resources.
+
+    Returns None if the record doesn't resolve, otherwise a dict with
+    "record", "resolver_path" and one key per requested sub-resource.
+    """
+    record, resolver_path = await resolve_record(db, id_or_rm, user_id)
+    if not record:
+        return None
+
+    include = set(include)
+    record_id = record["id"]
+    revision_id = record.get("current_revision_id")
+
+    loaders = {
+        "current_revision": lambda: _current_revision(db, revision_id),
+        "revision_count": lambda: db.governance_revisions.count_documents({"record_id": record_id}),
+        "attestations": lambda: _by_revision(db, "governance_attestations", revision_id, ATTESTATION_LIMIT),
+        "attachments": lambda: _by_revision(db, "governance_attachments", revision_id, ATTACHMENT_LIMIT),
+        "events": lambda: db.governance_events.find(
+            {"record_id": record_id}, {"_id": 0}
+        ).sort("at", -1).to_list(EVENT_LIMIT),
+        "revisions": lambda: db.governance_revisions.find(
+            {"record_id": record_id}, REVISION_SUMMARY_FIELDS
+        ).sort("version", 1).to_list(REVISION_LIMIT),
+    }
+    names = [name for name in RECORD_INCLUDES if name in include]
+    results = await asyncio.gather(*[loaders[name]() for name in names])
+
+    detail = {"record": record, "resolver_path": resolver_path}
+    detail.update(zip(names, results))
+    return detail
@@ -0,0 +1,196 @@
+"""
+Governance Revision Diff Engine
+
+Structural diff between two revision payloads, returned as a compact patch:
+one entry per changed leaf, addressed by path (e.g. "attendees[2].role"),
+rather than both full payloads.
+
+- Objects are compared key by key, recursively.
+- Lists are aligned with difflib.SequenceMatcher over canonical item JSON,
+  so an insertion reports one added item instead of every later index as
+  modified. Replaced spans are diffed item by item. Removed items are
+  addressed by their index in the before list, everything else by the
+  index in the after list.
+- Long or multi-line text fields carry a line-level (multi-line) or
+  word-level (single line) text_diff in place of the full old/new values.
+
+Finalized revisions are immutable, so diffs between them are cached in
+governance_revision_diffs keyed by the two revisions' content hashes.
+"""
+
+import difflib
+import json
+import re
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+
+DIFF_CACHE_COLLECTION = "governance_revision_diffs"
+
+# Bump when the patch format changes so cached diffs are recomputed
+DIFF_ENGINE_VERSION = 1
+
+# Strings at least this long (or containing a newline) get a text_diff
+TEXT_DIFF_MIN_LENGTH = 120
+
+_WORDS = re.compile(r"\s+|[^\s]+")
+
+
+def _canonical(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def _child(path: str, key: str) -> str:
+    return f"{path}.{key}" if path else str(key)
+
+
+def _is_long_text(old: Any, new: Any) -> bool:
+    if not isinstance(old, str) or not isinstance(new, str):
+        return False
+    return (
+        "\n" in old or "\n" in new
+        or max(len(old), len(new)) >= TEXT_DIFF_MIN_LENGTH
+    )
+
+
+def text_diff(old: str, new: str) -> Dict[str, Any]:
+    """
+    Line-level diff for multi-line text, word-level otherwise. Returns
+    {"granularity", "ops"} where ops are [op, old_text, new_text] with op one
+    of equal/insert/delete/replace (equal spans keep only the old text).
+    Line ops hold their lines joined with newlines.
+    """
+    if "\n" in old or "\n" in new:
+        granularity, joiner = "line", "\n"
+        a, b = old.split("\n"), new.split("\n")
+    else:
+        granularity, joiner = "word", ""
+        a, b = _WORDS.findall(old), _WORDS.findall(new)
+
+    ops = []
+    for tag, i1, i2, j1, j2 in difflib.SequenceMatcher(None, a, b, autojunk=False).get_opcodes():
+        old_text, new_text = joiner.join(a[i1:i2]), joiner.join(b[j1:j2])
+        ops.append([tag, old_text, "" if tag == "equal" else new_text])
+    return {"granularity": granularity, "ops": ops}
+
+
+def _change(path: str, change_type: str, old: Any, new: Any) -> Dict[str, Any]:
+    change = {"field": path, "type": change_type}
+    if change_type == "modified" and _is_long_text(old, new):
+        change["text_diff"] = text_diff(old, new)
+        return change
+    if change_type != "added":
+        change["old_value"] = old
+    if change_type != "removed":
+        change["new_value"] = new
+    return change
+
+
+def _diff_lists(old: list, new: list, path: str, changes: List[Dict[str, Any]]):
+    if len(old) == len(new):
+        for i, (a, b) in enumerate(zip(old, new)):
+            _diff(a, b, f"{path}[{i}]", changes)
+        return
+
+    matcher = difflib.SequenceMatcher(
+        None, [_canonical(v) for v in old], [_canonical(v) for v in new], autojunk=False
+    )
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            continue
+        paired = min(i2 - i1, j2 - j1) if tag == "replace" else 0
+        for k in range(paired):
+            _diff(old[i1 + k], new[j1 + k], f"{path}[{j1 + k}]", changes)
+        for k in range(i1 + paired, i2):
+            changes.append(_change(f"{path}[{k}]", "removed", old[k], None))
+        for k in range(j1 + paired, j2):
+            changes.append(_change(f"{path}[{k}]", "added", None, new[k]))
+
+
+def _diff(old: Any, new: Any, path: str, changes: List[Dict[str, Any]]):
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in list(old.keys()) + [k for k in new.keys() if k not in old]:
+            child = _child(path, key)
+            if key not in new:
+                changes.append(_change(child, "removed", old[key], None))
+            elif key not in old:
+                changes.append(_change(child, "added", None, new[key]))
+            else:
+                _diff(old[key], new[key], child, changes)
+    elif isinstance(old, list) and isinstance(new, list):
+        _diff_lists(old, new, path, changes)
+    elif old != new or isinstance(old, bool) != isinstance(new, bool):
+        changes.append(_change(path, "modified", old, new))
+
+
+def diff_payloads(before: Optional[Dict[str, Any]], after: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Compact structural patch turning before into after."""
+    changes: List[Dict[str, Any]] = []
+    _diff(before or {}, after or {}, "", changes)
+    return changes
+
+
+def summarize_changes(changes: List[Dict[str, Any]]) -> Dict[str, int]:
+    summary = {"added": 0, "removed": 0, "modified": 0}
+    for change in changes:
+        summary[change["type"]] += 1
+    return summary
+
+
+# ============ CACHE ============
+
+def _is_immutable(revision: Optional[Dict[str, Any]]) -> bool:
+    return bool(revision and revision.get("finalized_at") and revision.get("content_hash"))
+
+
+def diff_cache_key(revision: Dict[str, Any], compare_revision: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Cache key for a diff, or None when either side can still change."""
+    if not _is_immutable(revision):
+        return None
+    if compare_revision is not None and not _is_immutable(compare_revision):
+        return None
+    before_hash = compare_revision["content_hash"] if compare_revision else "none"
+    return f"v{DIFF_ENGINE_VERSION}:{revision['content_hash']}:{before_hash}"
+
+
+async def ensure_diff_cache_indexes(db):
+    await db[DIFF_CACHE_COLLECTION].create_index("diff_key", unique=True, name="unique_diff_key")
+
+
+async def diff_revisions(
+    db,
+    revision: Dict[str, Any],
+    compare_revision: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Diff compare_revision -> revision payloads, served from the cache when
+    both revisions are finalized. Returns {"changes", "summary", "cached"}.
+    """
+    key = diff_cache_key(revision, compare_revision)
+    if key:
+        cached = await db[DIFF_CACHE_COLLECTION].find_one({"diff_key": key}, {"_id": 0})
+        if cached:
+            return {"changes": cached["changes"], "summary": cached["summary"], "cached": True}
+
+    changes = diff_payloads(
+        compare_revision.get("payload_json", {}) if compare_revision else {},
+        revision.get("payload_json", {})
+    )
+    summary = summarize_changes(changes)
+
+    if key:
+        try:
+            await db[DIFF_CACHE_COLLECTION].update_one(
+                {"diff_key": key},
+                {"$setOnInsert": {
+                    "diff_key": key,
+                    "changes": changes,
+                    "summary": summary,
+                    "created_at": datetime.now(timezone.utc).isoformat()
+                }},
+                upsert=True
+            )
+        except Exception as e:
+            print(f"Warning: Failed to cache revision diff: {e}")
+
+    return {"changes": changes, "summary": summary, "cached": False}
@@ -0,0 +1,102 @@
+"""
+RM-ID Sort Keys for Governance Lists
+
+RM-IDs (RF743916765US-20.001) don't sort numerically as strings
+("-3.001" > "-20.001"), so the legacy governance collections store a
+zero-padded key next to each rm_id:
+
+    RF743916765US-20.001 -> "RF743916765US 000020.000001"
+
+Ordering by the key matches parse_rm_id_for_sort tuple ordering, which lets
+list endpoints sort and paginate by RM-ID in MongoDB using the
+(user_id, portfolio_id, rm_sort_key) index.
+"""
+
+import re
+from typing import Dict, Any
+
+from pymongo import UpdateOne
+
+
+RM_SORT_KEY_FIELD = "rm_sort_key"
+
+# Legacy governance collections listed with sort_by=rm_id
+RM_SORTED_COLLECTIONS = [
+    "meetings",
+    "distributions",
+    "disputes",
+    "insurance_policies",
+    "compensation_entries",
+]
+
+BACKFILL_BATCH_SIZE = 500
+
+
+def parse_rm_id_for_sort(rm_id: str) -> tuple:
+    """
+    Parse RM-ID for proper sorting.
+    Format: RF743916765US-20.001 -> (prefix, category, sequence)
+    Returns tuple for comparison that sorts correctly.
+    """
+    if not rm_id:
+        return ("", 0, 0)
+
+    # Match pattern: PREFIX-CATEGORY.SEQUENCE
+    match = re.match(r'^(.+)-(\d+)\.(\d+)$', rm_id)
+    if match:
+        return (match.group(1), int(match.group(2)), int(match.group(3)))
+
+    return (rm_id, 0, 0)
+
+
+def rm_sort_key(rm_id: str) -> str:
+    """
+    String key that orders like parse_rm_id_for_sort.
+    The space separator sorts below every RM-ID character, so a base that is
+    a prefix of another base still sorts first.
+    """
+    prefix, category, sequence = parse_rm_id_for_sort(rm_id)
+    return f"{prefix} {category:06d}.{sequence:06d}"
+
+
+def with_rm_sort_key(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """Set the sort key on a document about to be written."""
+    doc[RM_SORT_KEY_FIELD] = rm_sort_key(doc.get("rm_id", ""))
+    return doc
+
+
+async def ensure_rm_sort_indexes(db):
+    """Index the sort key behind the list endpoints' user/portfolio filters."""
+    for collection in RM_SORTED_COLLECTIONS:
+        await db[collection].create_index(
+            [("user_id", 1), ("portfolio_id", 1), (RM_SORT_KEY_FIELD, 1)],
+            name="user_portfolio_rm_sort"
+        )
+
+
+async def backfill_rm_sort_keys(db, batch_size: int = BACKFILL_BATCH_SIZE) -> Dict[str, int]:
+    """Set the sort key on documents written before it existed."""
+    updated = {}
+    for collection in RM_SORTED_COLLECTIONS:
+        count = 0
+        ops = []
+        async for doc in db[collection].find(
+            {"$or": [
+                {RM_SORT_KEY_FIELD: {"$exists": False}},
+                {RM_SORT_KEY_FIELD: None}
+            ]},
+            {"_id": 1, "rm_id": 1}
+        ):
+            ops.append(UpdateOne(
+                {"_id": doc["_id"]},
+                {"$set": {RM_SORT_KEY_FIELD: rm_sort_key(doc.get("rm_id", ""))}}
+            ))
+            if len(ops) >= batch_size:
+                await db[collection].bulk_write(ops, ordered=False)
+                count += len(ops)
+                ops = []
+        if ops:
+            await db[collection].bulk_write(ops, ordered=False)
+            count += len(ops)
+        updated[collection] = count
+    return updated
@@ -8,6 +8,7 @@ from datetime import datetime, timezone
 from typing import Optional, Tuple
 from utils.db import db
 from models.trust import SubjectCategory
+from services.soft_delete import live_filter
 
 
 def normalize_rm_id(rm_id_raw: str) -> str:
@@ -166,7 +167,7 @@ async def generate_subject_rm_id(portfolio_id: str, user_id: str, subject_code:
     
     # Check documents
     docs = await db.documents.find(
-        {"portfolio_id": portfolio_id, "user_id": user_id, "subject_code": cat_code, "is_deleted": {"$ne": True}},
+        {"portfolio_id": portfolio_id, "user_id": user_id, "subject_code": cat_code, **live_filter("documents")},
         {"sequence_number": 1}
     ).to_list(1000)
     for doc in docs:
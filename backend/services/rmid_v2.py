@@ -4,8 +4,11 @@ RM-ID Allocator V2 - Atomic, Unique RM-ID Generation
 Features:
 - Database constraints prevent duplicate RM-IDs
 - Atomic allocation using transactions/locks
-- Random group number generation for new subjects
+- Random group number generation for new subjects, picked from a
+  per-(portfolio, rm_base) availability bitmap claimed with compare-and-set
 - Sequential subnumber allocation within groups
+- Leased subnumber ranges: one atomic update reserves a contiguous block
+  that is handed out locally, with unused tails rewound or logged as gaps
 - Support for related items sharing same group number
 
 RM-ID Format: RF#########US-NN.SSS
@@ -18,8 +21,9 @@ import random
 import hashlib
 import re
 from datetime import datetime, timezone
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, List, Set
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
 
 # Constants - CONSTRAINED RANGES
 GROUP_MIN = 1      # Minimum group number (was 10)
@@ -27,6 +31,15 @@ GROUP_MAX = 99     # Maximum group number (was 999) - ONLY 1-99 allowed
 MAX_SUBNUMBER = 999
 MAX_ALLOCATION_RETRIES = 50  # More retries since smaller range
 
+# Audit log of subnumbers reserved by a lease but never used
+SUBNUMBER_GAP_COLLECTION = "rm_subnumber_gaps"
+
+# Group availability bitmaps, one document per (portfolio_id, rm_base).
+# Bits are split over words of 50 so each word stays a positive int64.
+GROUP_AVAILABILITY_COLLECTION = "rm_group_availability"
+GROUP_BITMAP_WORD_BITS = 50
+GROUP_BITMAP_WORDS = (GROUP_MAX - GROUP_MIN) // GROUP_BITMAP_WORD_BITS + 1
+
 
 def normalize_rm_base(rm_base: str) -> str:
     """Normalize RM base: uppercase, remove spaces"""
@@ -56,6 +69,32 @@ def parse_rm_id(rm_id: str) -> Optional[Dict[str, Any]]:
     }
 
 
+def _group_bit(group: int) -> Tuple[int, int]:
+    """(word index, bit mask) of a group number in the availability bitmap"""
+    offset = group - GROUP_MIN
+    return offset // GROUP_BITMAP_WORD_BITS, 1 << (offset % GROUP_BITMAP_WORD_BITS)
+
+
+def groups_to_bitmap(groups) -> List[int]:
+    """Encode group numbers as bitmap words"""
+    words = [0] * GROUP_BITMAP_WORDS
+    for group in groups:
+        if GROUP_MIN <= group <= GROUP_MAX:
+            word, mask = _group_bit(group)
+            words[word] |= mask
+    return words
+
+
+def bitmap_to_groups(words: List[int]) -> Set[int]:
+    """Decode bitmap words into the set of used group numbers"""
+    used = set()
+    for group in range(GROUP_MIN, GROUP_MAX + 1):
+        word, mask = _group_bit(group)
+        if word < len(words) and words[word] & mask:
+            used.add(group)
+    return used
+
+
 def compute_relation_key(
     court_name: str = None,
     case_number: str = None,
@@ -89,6 +128,114 @@ def compute_relation_key(
     return None
 
 
+class SubnumberLease:
+    """
+    A contiguous block of subnumbers reserved with one atomic $inc on a
+    counter document (rm_groups or rm_subjects, both keep `next_sub`).
+    Subnumbers are handed out locally; release() gives back the unused tail.
+    """
+    
+    def __init__(self, collection, query: Dict[str, Any], doc: Dict[str, Any], first: int, last: int):
+        self.collection = collection
+        self.query = query
+        self.doc = doc
+        self.first = first
+        self.last = last
+        self.next = first
+    
+    @property
+    def remaining(self) -> int:
+        return self.last - self.next + 1
+    
+    def take(self) -> int:
+        """Hand out the next subnumber in the block."""
+        if self.next > self.last:
+            raise ValueError("Subnumber lease exhausted")
+        sub = self.next
+        self.next += 1
+        return sub
+    
+    def take_many(self, count: int) -> List[int]:
+        return [self.take() for _ in range(count)]
+    
+    def reset(self):
+        """Mark every subnumber unused again (the writes that used them were rolled back)."""
+        self.next = self.first
+    
+    async def release(self, db, reason: str = "unused_lease") -> List[int]:
+        """
+        Return unused subnumbers. If nothing was reserved after this lease the
+        counter is rewound; otherwise the unused subnumbers are logged as gaps.
+        Returns the subnumbers recorded as gaps.
+        """
+        if self.remaining <= 0:
+            return []
+        
+        unused = list(range(self.next, self.last + 1))
+        rewound = await self.collection.update_one(
+            {**self.query, "next_sub": self.last + 1},
+            {"$set": {"next_sub": self.next, "updated_at": datetime.now(timezone.utc).isoformat()}}
+        )
+        self.last = self.next - 1
+        if rewound.modified_count:
+            return []
+        
+        counter_id = self.doc.get("id")
+        try:
+            await db[SUBNUMBER_GAP_COLLECTION].insert_one({
+                "id": f"rmgap_{hashlib.sha256(f'{counter_id}:{unused[0]}'.encode()).hexdigest()[:12]}",
+                "counter_collection": self.collection.name,
+                "counter_id": counter_id,
+                "portfolio_id": self.doc.get("portfolio_id"),
+                "rm_base": self.doc.get("rm_base"),
+                "rm_group": self.doc.get("rm_group"),
+                "subnumbers": unused,
+                "reason": reason,
+                "created_at": datetime.now(timezone.utc).isoformat()
+            })
+        except Exception as e:
+            print(f"Warning: Failed to log subnumber gap: {e}")
+        return unused
+
+
+async def lease_subnumbers(collection, query: Dict[str, Any], count: int) -> Optional[SubnumberLease]:
+    """
+    Atomically reserve `count` consecutive subnumbers on a counter document.
+    Returns None if the document doesn't exist.
+    Raises ValueError if the block would pass MAX_SUBNUMBER.
+    """
+    if count < 1:
+        raise ValueError("Lease size must be at least 1")
+    
+    doc = await collection.find_one_and_update(
+        query,
+        {
+            "$inc": {"next_sub": count},
+            "$set": {"updated_at": datetime.now(timezone.utc).isoformat()}
+        },
+        return_document=ReturnDocument.AFTER
+    )
+    if not doc:
+        return None
+    
+    last = doc["next_sub"] - 1
+    first = last - count + 1
+    if first < 1:
+        raise ValueError("Invalid subnumber state")
+    
+    if last > MAX_SUBNUMBER:
+        # Undo the reservation if nobody reserved after us
+        await collection.update_one(
+            {**query, "next_sub": doc["next_sub"]},
+            {"$inc": {"next_sub": -count}}
+        )
+        raise ValueError(
+            f"Group {doc.get('rm_group')} has exceeded maximum subnumber ({MAX_SUBNUMBER})"
+        )
+    
+    return SubnumberLease(collection, query, doc, first, last)
+
+
 class RMIDAllocator:
     """
     Atomic RM-ID allocator with database constraints.
@@ -132,6 +279,19 @@ class RMIDAllocator:
             sparse=True,
             name="unique_governance_rm_id"
         )
+        
+        # rm_group_availability: One bitmap per (portfolio_id, rm_base)
+        await self.db[GROUP_AVAILABILITY_COLLECTION].create_index(
+            [("portfolio_id", 1), ("rm_base", 1)],
+            unique=True,
+            name="unique_rm_group_availability"
+        )
+        
+        # rm_subnumber_gaps: Lookups by counter document
+        await self.db[SUBNUMBER_GAP_COLLECTION].create_index(
+            [("counter_collection", 1), ("counter_id", 1)],
+            name="rm_subnumber_gaps_counter"
+        )
     
     async def get_rm_base(self, portfolio_id: str, user_id: str) -> str:
         """Get base RM-ID for a portfolio"""
@@ -150,22 +310,107 @@ class RMIDAllocator:
         import uuid
         return f"RF{uuid.uuid4().hex[:9].upper()}US"
     
-    async def _get_random_available_group(self, portfolio_id: str, rm_base: str) -> int:
-        """Get a random group number that isn't already used"""
-        # Get all used groups for this portfolio/base
-        used_groups = await self.db.rm_groups.distinct(
-            "rm_group",
-            {"portfolio_id": portfolio_id, "rm_base": rm_base}
-        )
-        used_set = set(used_groups)
-        
-        # Generate random number not in use
-        available = [g for g in range(GROUP_MIN, GROUP_MAX + 1) if g not in used_set]
+    async def _load_group_bitmap(self, portfolio_id: str, rm_base: str) -> Dict[str, Any]:
+        """
+        Get the availability bitmap for a portfolio/base, building it from
+        rm_groups the first time it is needed.
+        """
+        key = {"portfolio_id": portfolio_id, "rm_base": rm_base}
+        bitmap = await self.db[GROUP_AVAILABILITY_COLLECTION].find_one(key, {"_id": 0})
+        if bitmap:
+            return bitmap
         
-        if not available:
-            raise ValueError(f"No available group numbers for {rm_base}")
+        used_groups = await self.db.rm_groups.distinct("rm_group", key)
+        bitmap = {
+            **key,
+            "words": groups_to_bitmap(used_groups),
+            "version": 0,
+            "cas_retries": 0,
+            "stale_conflicts": 0,
+            "created_at": datetime.now(timezone.utc).isoformat()
+        }
+        try:
+            await self.db[GROUP_AVAILABILITY_COLLECTION].insert_one(dict(bitmap))
+        except Exception as e:
+            if "duplicate key" not in str(e).lower() and "E11000" not in str(e):
+                raise
+            # Another request built it first
+            bitmap = await self.db[GROUP_AVAILABILITY_COLLECTION].find_one(key, {"_id": 0})
+        return bitmap
+    
+    async def _update_group_bitmap(self, bitmap: Dict[str, Any], words: List[int]) -> bool:
+        """Compare-and-set the bitmap words; False if another writer got there first"""
+        result = await self.db[GROUP_AVAILABILITY_COLLECTION].update_one(
+            {
+                "portfolio_id": bitmap["portfolio_id"],
+                "rm_base": bitmap["rm_base"],
+                "version": bitmap["version"]
+            },
+            {
+                "$set": {"words": words, "updated_at": datetime.now(timezone.utc).isoformat()},
+                "$inc": {"version": 1}
+            }
+        )
+        return result.modified_count == 1
+    
+    async def _record_group_contention(self, portfolio_id: str, rm_base: str, cas_retries: int, stale_conflicts: int):
+        """Accumulate contention counters on the bitmap document"""
+        if not cas_retries and not stale_conflicts:
+            return
+        await self.db[GROUP_AVAILABILITY_COLLECTION].update_one(
+            {"portfolio_id": portfolio_id, "rm_base": rm_base},
+            {"$inc": {"cas_retries": cas_retries, "stale_conflicts": stale_conflicts}}
+        )
+    
+    async def _claim_random_group(self, portfolio_id: str, rm_base: str) -> Tuple[int, int]:
+        """
+        Claim a random free group number in the availability bitmap.
+        One read plus one conditional update when uncontended.
+        Returns (group_number, compare-and-set retries).
+        """
+        for attempt in range(MAX_ALLOCATION_RETRIES):
+            bitmap = await self._load_group_bitmap(portfolio_id, rm_base)
+            words = list(bitmap["words"])
+            used = bitmap_to_groups(words)
+            available = [g for g in range(GROUP_MIN, GROUP_MAX + 1) if g not in used]
+            
+            if not available:
+                raise ValueError(f"No available group numbers for {rm_base}")
+            
+            group_num = random.choice(available)
+            word, mask = _group_bit(group_num)
+            words[word] |= mask
+            
+            if await self._update_group_bitmap(bitmap, words):
+                return group_num, attempt
         
-        return random.choice(available)
+        raise RuntimeError(f"Failed to claim group after {MAX_ALLOCATION_RETRIES} attempts")
+    
+    async def _release_group(self, portfolio_id: str, rm_base: str, group_num: int):
+        """Clear a claimed group's bit (group creation failed)"""
+        word, mask = _group_bit(group_num)
+        for _ in range(MAX_ALLOCATION_RETRIES):
+            bitmap = await self._load_group_bitmap(portfolio_id, rm_base)
+            words = list(bitmap["words"])
+            if not words[word] & mask:
+                return
+            words[word] &= ~mask
+            if await self._update_group_bitmap(bitmap, words):
+                return
+    
+    async def get_group_availability(self, portfolio_id: str, user_id: str) -> Dict[str, Any]:
+        """Used/free group counts and claim contention for a portfolio"""
+        rm_base = await self.get_rm_base(portfolio_id, user_id)
+        bitmap = await self._load_group_bitmap(portfolio_id, rm_base)
+        used = bitmap_to_groups(bitmap["words"])
+        return {
+            "rm_base": rm_base,
+            "used_groups": sorted(used),
+            "used_count": len(used),
+            "available_count": (GROUP_MAX - GROUP_MIN + 1) - len(used),
+            "cas_retries": bitmap.get("cas_retries", 0),
+            "stale_conflicts": bitmap.get("stale_conflicts", 0)
+        }
     
     async def _create_group(
         self,
@@ -178,11 +423,16 @@ class RMIDAllocator:
         Create a new group with a random number.
         Returns (group_number, first_subnumber=1)
         
-        Uses retry loop to handle race conditions.
+        The number is claimed in the availability bitmap first; the unique
+        rm_groups index still guards against a stale bitmap, in which case
+        the bit stays set (the group is in use) and another number is tried.
         """
-        for attempt in range(MAX_ALLOCATION_RETRIES):
-            try:
-                group_num = await self._get_random_available_group(portfolio_id, rm_base)
+        cas_retries = 0
+        stale_conflicts = 0
+        try:
+            for attempt in range(MAX_ALLOCATION_RETRIES):
+                group_num, retries = await self._claim_random_group(portfolio_id, rm_base)
+                cas_retries += retries
                 
                 # Try to insert the group (atomic)
                 group_doc = {
@@ -196,7 +446,15 @@ class RMIDAllocator:
                     "updated_at": datetime.now(timezone.utc).isoformat()
                 }
                 
-                await self.db.rm_groups.insert_one(group_doc)
+                try:
+                    await self.db.rm_groups.insert_one(group_doc)
+                except Exception as e:
+                    if "duplicate key" in str(e).lower() or "E11000" in str(e):
+                        # Group existed outside the bitmap, try another number
+                        stale_conflicts += 1
+                        continue
+                    await self._release_group(portfolio_id, rm_base, group_num)
+                    raise
                 
                 # If relation_key provided, map it to this group
                 if relation_key:
@@ -216,15 +474,31 @@ class RMIDAllocator:
                         print(f"Warning: Failed to create relation map: {e}")
                 
                 return group_num, 1
-                
-            except Exception as e:
-                if "duplicate key" in str(e).lower() or "E11000" in str(e):
-                    # Group already exists (race condition), retry
-                    continue
-                raise
+        finally:
+            await self._record_group_contention(portfolio_id, rm_base, cas_retries, stale_conflicts)
         
         raise RuntimeError(f"Failed to allocate group after {MAX_ALLOCATION_RETRIES} attempts")
     
+    async def lease_group_subnumbers(
+        self,
+        portfolio_id: str,
+        rm_base: str,
+        group_num: int,
+        count: int
+    ) -> SubnumberLease:
+        """
+        Reserve `count` consecutive subnumbers in an existing group with a
+        single atomic update. Unused subnumbers go back via lease.release().
+        """
+        lease = await lease_subnumbers(
+            self.db.rm_groups,
+            {"portfolio_id": portfolio_id, "rm_base": rm_base, "rm_group": group_num},
+            count
+        )
+        if not lease:
+            raise ValueError(f"Group {group_num} not found for {rm_base}")
+        return lease
+    
     async def _allocate_subnumber(
         self,
         portfolio_id: str,
@@ -235,26 +509,55 @@ class RMIDAllocator:
         Atomically allocate the next subnumber for an existing group.
         Returns the allocated subnumber.
         """
-        # Use findOneAndUpdate for atomic increment
-        result = await self.db.rm_groups.find_one_and_update(
-            {"portfolio_id": portfolio_id, "rm_base": rm_base, "rm_group": group_num},
-            {
-                "$inc": {"next_sub": 1},
-                "$set": {"updated_at": datetime.now(timezone.utc).isoformat()}
-            },
-            return_document=True  # Return updated document
-        )
-        
-        if not result:
-            raise ValueError(f"Group {group_num} not found for {rm_base}")
-        
-        # The subnumber we allocated is (next_sub - 1) because we just incremented
-        allocated_sub = result["next_sub"] - 1
+        lease = await self.lease_group_subnumbers(portfolio_id, rm_base, group_num, 1)
+        return lease.take()
+    
+    async def _resolve_existing_group(
+        self,
+        portfolio_id: str,
+        rm_base: str,
+        relation_key: Optional[str],
+        related_to_record_id: Optional[str],
+        court_name: Optional[str],
+        case_number: Optional[str],
+        institution: Optional[str],
+        reference_id: Optional[str]
+    ) -> Tuple[Optional[int], Optional[str]]:
+        """
+        Find the group a new allocation should join.
+        Returns (group_num or None for a new group, relation_key).
+        """
+        # Compute relation_key if not directly provided
+        if not relation_key:
+            # If related_to_record_id, look up that record's relation_key or rm_group
+            if related_to_record_id:
+                related_record = await self.db.governance_records.find_one(
+                    {"id": related_to_record_id},
+                    {"rm_base": 1, "rm_group": 1}
+                )
+                if related_record and related_record.get("rm_group"):
+                    # Use the same group as the related record
+                    return related_record["rm_group"], f"related:{related_to_record_id}"
+            
+            # Compute relation_key from other params
+            relation_key = compute_relation_key(
+                court_name=court_name,
+                case_number=case_number,
+                institution=institution,
+                reference_id=reference_id
+            )
         
-        if allocated_sub > MAX_SUBNUMBER:
-            raise ValueError(f"Group {group_num} has exceeded maximum subnumber ({MAX_SUBNUMBER})")
+        # If we have a relation_key, check if it maps to an existing group
+        if relation_key:
+            existing_map = await self.db.rm_relation_map.find_one({
+                "portfolio_id": portfolio_id,
+                "rm_base": rm_base,
+                "relation_key": relation_key
+            })
+            if existing_map:
+                return existing_map["rm_group"], relation_key
         
-        return allocated_sub
+        return None, relation_key
     
     async def allocate(
         self,
@@ -292,127 +595,114 @@ class RMIDAllocator:
                 "is_new_group": True
             }
         """
+        allocations = await self.allocate_many(
+            portfolio_id=portfolio_id,
+            user_id=user_id,
+            module_type=module_type,
+            count=1,
+            relation_key=relation_key,
+            related_to_record_id=related_to_record_id,
+            court_name=court_name,
+            case_number=case_number,
+            institution=institution,
+            reference_id=reference_id
+        )
+        return allocations[0]
+    
+    async def allocate_many(
+        self,
+        portfolio_id: str,
+        user_id: str,
+        module_type: str,
+        count: int,
+        relation_key: Optional[str] = None,
+        related_to_record_id: Optional[str] = None,
+        court_name: Optional[str] = None,
+        case_number: Optional[str] = None,
+        institution: Optional[str] = None,
+        reference_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Allocate `count` consecutive RM-IDs in one group.
+        
+        The group is resolved the same way as allocate(); the subnumbers are
+        reserved as one block (a single atomic update) and the audit log is
+        written with one insert_many.
+        
+        Returns a list of allocation dicts in subnumber order (same shape as
+        allocate()).
+        """
+        if count < 1:
+            return []
+        
         rm_base = await self.get_rm_base(portfolio_id, user_id)
+        group_num, relation_key = await self._resolve_existing_group(
+            portfolio_id, rm_base, relation_key, related_to_record_id,
+            court_name, case_number, institution, reference_id
+        )
         
-        # Compute relation_key if not directly provided
-        if not relation_key:
-            # If related_to_record_id, look up that record's relation_key or rm_group
-            if related_to_record_id:
-                related_record = await self.db.governance_records.find_one(
-                    {"id": related_to_record_id},
-                    {"rm_base": 1, "rm_group": 1}
-                )
-                if related_record and related_record.get("rm_group"):
-                    # Use the same group as the related record
-                    group_num = related_record["rm_group"]
-                    sub_num = await self._allocate_subnumber(portfolio_id, rm_base, group_num)
-                    rm_id = format_rm_id(rm_base, group_num, sub_num)
-                    
-                    # Log allocation
-                    await self._log_allocation(
-                        portfolio_id, user_id, rm_id, rm_base, group_num, sub_num,
-                        module_type, f"related:{related_to_record_id}", False
-                    )
-                    
-                    return {
-                        "rm_id": rm_id,
-                        "rm_base": rm_base,
-                        "rm_group": group_num,
-                        "rm_sub": sub_num,
-                        "relation_key": f"related:{related_to_record_id}",
-                        "is_new_group": False
-                    }
-            
-            # Compute relation_key from other params
-            relation_key = compute_relation_key(
-                court_name=court_name,
-                case_number=case_number,
-                institution=institution,
-                reference_id=reference_id
+        is_new_group = group_num is None
+        if is_new_group:
+            # Creating the group reserves .001; lease the rest of the block
+            group_num, first_sub = await self._create_group(
+                portfolio_id, user_id, rm_base, relation_key
             )
+            subs = [first_sub]
+            if count > 1:
+                lease = await self.lease_group_subnumbers(portfolio_id, rm_base, group_num, count - 1)
+                subs.extend(lease.take_many(count - 1))
+        else:
+            lease = await self.lease_group_subnumbers(portfolio_id, rm_base, group_num, count)
+            subs = lease.take_many(count)
         
-        # If we have a relation_key, check if it maps to an existing group
-        if relation_key:
-            existing_map = await self.db.rm_relation_map.find_one({
-                "portfolio_id": portfolio_id,
+        allocations = [
+            {
+                "rm_id": format_rm_id(rm_base, group_num, sub),
                 "rm_base": rm_base,
-                "relation_key": relation_key
-            })
-            
-            if existing_map:
-                # Use existing group
-                group_num = existing_map["rm_group"]
-                sub_num = await self._allocate_subnumber(portfolio_id, rm_base, group_num)
-                rm_id = format_rm_id(rm_base, group_num, sub_num)
-                
-                # Log allocation
-                await self._log_allocation(
-                    portfolio_id, user_id, rm_id, rm_base, group_num, sub_num,
-                    module_type, relation_key, False
-                )
-                
-                return {
-                    "rm_id": rm_id,
-                    "rm_base": rm_base,
-                    "rm_group": group_num,
-                    "rm_sub": sub_num,
-                    "relation_key": relation_key,
-                    "is_new_group": False
-                }
-        
-        # Create new group
-        group_num, sub_num = await self._create_group(
-            portfolio_id, user_id, rm_base, relation_key
-        )
-        rm_id = format_rm_id(rm_base, group_num, sub_num)
+                "rm_group": group_num,
+                "rm_sub": sub,
+                "relation_key": relation_key,
+                "is_new_group": is_new_group
+            }
+            for sub in subs
+        ]
         
-        # Log allocation
-        await self._log_allocation(
-            portfolio_id, user_id, rm_id, rm_base, group_num, sub_num,
-            module_type, relation_key, True
-        )
+        # Log allocations
+        await self._log_allocations(portfolio_id, user_id, module_type, allocations)
         
-        return {
-            "rm_id": rm_id,
-            "rm_base": rm_base,
-            "rm_group": group_num,
-            "rm_sub": sub_num,
-            "relation_key": relation_key,
-            "is_new_group": True
-        }
+        return allocations
     
-    async def _log_allocation(
+    async def _log_allocations(
         self,
         portfolio_id: str,
         user_id: str,
-        rm_id: str,
-        rm_base: str,
-        rm_group: int,
-        rm_sub: int,
         module_type: str,
-        relation_key: Optional[str],
-        is_new_group: bool
+        allocations: List[Dict[str, Any]]
     ):
-        """Log RM-ID allocation for audit trail"""
-        allocation_doc = {
-            "id": f"rma_{hashlib.sha256(rm_id.encode()).hexdigest()[:12]}",
-            "portfolio_id": portfolio_id,
-            "user_id": user_id,
-            "rm_id": rm_id,
-            "rm_base": rm_base,
-            "rm_group": rm_group,
-            "rm_sub": rm_sub,
-            "module_type": module_type,
-            "relation_key": relation_key,
-            "is_new_group": is_new_group,
-            "allocated_at": datetime.now(timezone.utc).isoformat()
-        }
+        """Log a batch of RM-ID allocations for audit trail"""
+        allocated_at = datetime.now(timezone.utc).isoformat()
+        allocation_docs = [
+            {
+                "id": f"rma_{hashlib.sha256(a['rm_id'].encode()).hexdigest()[:12]}",
+                "portfolio_id": portfolio_id,
+                "user_id": user_id,
+                "rm_id": a["rm_id"],
+                "rm_base": a["rm_base"],
+                "rm_group": a["rm_group"],
+                "rm_sub": a["rm_sub"],
+                "module_type": module_type,
+                "relation_key": a["relation_key"],
+                "is_new_group": a["is_new_group"],
+                "allocated_at": allocated_at
+            }
+            for a in allocations
+        ]
         
         try:
-            await self.db.rm_allocations.insert_one(allocation_doc)
+            await self.db.rm_allocations.insert_many(allocation_docs, ordered=False)
         except Exception as e:
             # Log but don't fail on audit log errors
-            print(f"Warning: Failed to log RM-ID allocation: {e}")
+            print(f"Warning: Failed to log RM-ID allocations: {e}")
     
     async def preview(
         self,
@@ -531,3 +821,25 @@ async def allocate_rm_id(
         institution=institution,
         reference_id=reference_id
     )
+
+
+async def allocate_rm_ids(
+    portfolio_id: str,
+    user_id: str,
+    module_type: str,
+    count: int,
+    relation_key: Optional[str] = None,
+    related_to_record_id: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Convenience function to allocate a block of RM-IDs using global allocator.
+    """
+    allocator = get_allocator()
+    return await allocator.allocate_many(
+        portfolio_id=portfolio_id,
+        user_id=user_id,
+        module_type=module_type,
+        count=count,
+        relation_key=relation_key,
+        related_to_record_id=related_to_record_id
+    )
@@ -17,6 +17,8 @@ import uuid
 import logging
 import asyncio
 
+from services.bson_dates import decode_all, decode_dates
+
 logger = logging.getLogger(__name__)
 
 
@@ -202,7 +204,7 @@ class ScheduledBinderService:
             {"schedule_id": schedule_id},
             {"_id": 0}
         )
-        return schedule
+        return decode_dates(schedule, "omnibinder_schedules")
     
     async def list_schedules(
         self,
@@ -227,7 +229,7 @@ class ScheduledBinderService:
         total = await self.db.omnibinder_schedules.count_documents(query)
         
         return {
-            "schedules": schedules,
+            "schedules": decode_all(schedules, "omnibinder_schedules"),
             "total": total,
             "skip": skip,
             "limit": limit
@@ -273,7 +275,7 @@ class ScheduledBinderService:
         
         update_data["next_run_at"] = self.calculate_next_run(
             schedule_type, schedule_day, schedule_time
-        ).isoformat()
+        )
         
         await self.db.omnibinder_schedules.update_one(
             {"schedule_id": schedule_id},
@@ -326,7 +328,7 @@ class ScheduledBinderService:
             {"schedule_id": schedule_id},
             {"$set": {
                 "status": ScheduleStatus.ACTIVE.value,
-                "next_run_at": next_run.isoformat(),
+                "next_run_at": next_run,
                 "updated_at": datetime.now(timezone.utc).isoformat()
             }}
         )
@@ -431,7 +433,7 @@ class ScheduledBinderService:
                     "$set": {
                         "last_run_at": now.isoformat(),
                         "last_run_status": RunStatus.COMPLETED.value,
-                        "next_run_at": next_run.isoformat()
+                        "next_run_at": next_run
                     },
                     "$inc": {
                         "run_count": 1,
@@ -653,7 +655,7 @@ Please check the schedule configuration and try again.
         
         schedules = await self.db.omnibinder_schedules.find({
             "status": ScheduleStatus.ACTIVE.value,
-            "next_run_at": {"$lte": now.isoformat()}
+            "next_run_at": {"$lte": now}
         }, {"_id": 0}).to_list(100)
         
         return schedules
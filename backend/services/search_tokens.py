@@ -0,0 +1,110 @@
+"""
+Search Tokens for Governance Lists
+
+The legacy governance collections store a lowercase token array next to
+each document's title and rm_id:
+
+    {"title": "Q4 Board Meeting", "rm_id": "RF743916765US-20.001"}
+    -> ["001", "20", "board", "meeting", "q4", "rf743916765us"]
+
+List endpoints match each search term as an anchored prefix of some token,
+which the (user_id, search_tokens) multikey index serves with a range scan
+instead of running an unanchored case-insensitive $regex over every
+document. Searching "board meet" or "RF743916765US-20" still matches; a
+fragment from the middle of a word ("oard") no longer does.
+"""
+
+import re
+from typing import Any, Dict, List, Optional
+
+from pymongo import UpdateOne
+
+from services.rm_sort_key import RM_SORTED_COLLECTIONS
+
+
+SEARCH_TOKENS_FIELD = "search_tokens"
+
+# Fields tokenized into SEARCH_TOKENS_FIELD
+SEARCH_SOURCE_FIELDS = ("title", "rm_id")
+
+# Legacy governance collections with a search parameter
+SEARCHABLE_COLLECTIONS = RM_SORTED_COLLECTIONS
+
+# Extra search terms are ignored past this many
+MAX_SEARCH_TERMS = 8
+
+BACKFILL_BATCH_SIZE = 500
+
+_TOKEN = re.compile(r"[0-9a-z]+")
+
+
+def tokenize(text: Any) -> List[str]:
+    if not text:
+        return []
+    return _TOKEN.findall(str(text).lower())
+
+
+def search_tokens(doc: Dict[str, Any]) -> List[str]:
+    """Sorted unique tokens of a document's searchable fields."""
+    tokens = set()
+    for field in SEARCH_SOURCE_FIELDS:
+        tokens.update(tokenize(doc.get(field)))
+    return sorted(tokens)
+
+
+def with_search_tokens(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """Set the tokens on a document about to be written."""
+    doc[SEARCH_TOKENS_FIELD] = search_tokens(doc)
+    return doc
+
+
+def refresh_search_tokens(update_fields: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    """Add refreshed tokens to a $set that changes a searchable field."""
+    if any(field in update_fields for field in SEARCH_SOURCE_FIELDS):
+        update_fields[SEARCH_TOKENS_FIELD] = search_tokens({**current, **update_fields})
+    return update_fields
+
+
+def search_filter(search: Optional[str]) -> Dict[str, Any]:
+    """
+    Filter requiring every search term to prefix-match a token.
+    Empty when the search has no terms.
+    """
+    terms = list(dict.fromkeys(tokenize(search)))[:MAX_SEARCH_TERMS]
+    clauses = [{SEARCH_TOKENS_FIELD: re.compile(f"^{re.escape(term)}")} for term in terms]
+    if len(clauses) > 1:
+        return {"$and": clauses}
+    return clauses[0] if clauses else {}
+
+
+async def ensure_search_indexes(db):
+    for collection in SEARCHABLE_COLLECTIONS:
+        await db[collection].create_index(
+            [("user_id", 1), (SEARCH_TOKENS_FIELD, 1)],
+            name="user_search_tokens"
+        )
+
+
+async def backfill_search_tokens(db, batch_size: int = BACKFILL_BATCH_SIZE) -> Dict[str, int]:
+    """Set the tokens on documents written before they existed."""
+    updated = {}
+    for collection in SEARCHABLE_COLLECTIONS:
+        count = 0
+        ops = []
+        async for doc in db[collection].find(
+            {SEARCH_TOKENS_FIELD: {"$exists": False}},
+            {"_id": 1, **{field: 1 for field in SEARCH_SOURCE_FIELDS}}
+        ):
+            ops.append(UpdateOne(
+                {"_id": doc["_id"]},
+                {"$set": {SEARCH_TOKENS_FIELD: search_tokens(doc)}}
+            ))
+            if len(ops) >= batch_size:
+                await db[collection].bulk_write(ops, ordered=False)
+                count += len(ops)
+                ops = []
+        if ops:
+            await db[collection].bulk_write(ops, ordered=False)
+            count += len(ops)
+        updated[collection] = count
+    return updated
@@ -0,0 +1,86 @@
+"""
+Soft-Delete Filters
+
+Soft-deleted documents stay in their collection and are hidden by a filter
+on one always-present field per collection:
+
+    documents, files          is_deleted  (False / True)
+    governance, rm_subjects   deleted_at  (None / ISO timestamp)
+
+Documents written before the field was always set are backfilled at
+startup, so list endpoints can use a plain equality instead of
+$or: [{field: None}, {field: {$exists: False}}] or $ne: True. Equality is
+what the partial indexes below (live documents only) can serve, and it
+doesn't get overwritten when a search filter sets query["$or"].
+
+    query = {"user_id": user_id, **live_filter("meetings")}
+"""
+
+from typing import Any, Dict, List, Tuple
+
+
+# collection -> (field, value for live documents)
+SOFT_DELETE_FIELDS: Dict[str, Tuple[str, Any]] = {
+    "documents": ("is_deleted", False),
+    "files": ("is_deleted", False),
+    "meetings": ("deleted_at", None),
+    "distributions": ("deleted_at", None),
+    "disputes": ("deleted_at", None),
+    "insurance_policies": ("deleted_at", None),
+    "compensation_entries": ("deleted_at", None),
+    "rm_subjects": ("deleted_at", None),
+}
+
+# Partial indexes over live documents: (collection, keys, name)
+LIVE_INDEXES: List[Tuple[str, List[Tuple[str, int]], str]] = [
+    ("documents", [("user_id", 1), ("portfolio_id", 1), ("created_at", 1)], "live_user_portfolio_created"),
+    ("documents", [("user_id", 1), ("last_accessed", -1)], "live_user_recent"),
+    ("documents", [("user_id", 1), ("is_pinned", 1), ("pinned_at", -1)], "live_user_pinned"),
+    ("files", [("portfolio_id", 1), ("category", 1)], "live_portfolio_category"),
+    ("rm_subjects", [("user_id", 1), ("portfolio_id", 1), ("rm_group", 1)], "live_user_portfolio_group"),
+] + [
+    (collection, keys, name)
+    for collection in ("meetings", "distributions", "disputes", "insurance_policies", "compensation_entries")
+    for keys, name in (
+        ([("user_id", 1), ("portfolio_id", 1), ("created_at", 1)], "live_user_portfolio_created"),
+        ([("user_id", 1), ("portfolio_id", 1), ("rm_sort_key", 1), ("created_at", 1)], "live_user_portfolio_rm_sort"),
+    )
+]
+
+
+def live_filter(collection: str) -> Dict[str, Any]:
+    """Equality filter matching a collection's live (not soft-deleted) documents."""
+    field, live_value = SOFT_DELETE_FIELDS[collection]
+    return {field: live_value}
+
+
+def deleted_filter(collection: str) -> Dict[str, Any]:
+    """Filter matching a collection's soft-deleted documents."""
+    field, live_value = SOFT_DELETE_FIELDS[collection]
+    if live_value is None:
+        return {field: {"$ne": None}}
+    return {field: True}
+
+
+async def normalize_soft_delete_fields(db) -> Dict[str, int]:
+    """Set the soft-delete field on documents that don't have it yet."""
+    updated = {}
+    for collection, (field, live_value) in SOFT_DELETE_FIELDS.items():
+        try:
+            result = await db[collection].update_many(
+                {field: {"$exists": False}},
+                {"$set": {field: live_value}}
+            )
+            updated[collection] = result.modified_count
+        except Exception as e:
+            print(f"Warning: Failed to normalize {field} on {collection}: {e}")
+    return updated
+
+
+async def ensure_live_indexes(db):
+    for collection, keys, name in LIVE_INDEXES:
+        await db[collection].create_index(
+            keys,
+            name=name,
+            partialFilterExpression=live_filter(collection)
+        )
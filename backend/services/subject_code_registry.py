@@ -0,0 +1,248 @@
+"""
+Subject Code Registry for Legacy RM-IDs
+
+Per-portfolio registry of used whole subject codes (the NN in BASE-NN.SSS)
+for the V1 generator `server.generate_subject_rm_id`.
+
+Instead of loading every asset, ledger entry, document and governance item
+and re-parsing their RM-IDs on each allocation, the generator reads one
+registry document and claims a code with a conditional $addToSet:
+- `used_codes`: codes held by items or claimed by the generator
+- `next_code`: lowest free general-purpose code (hint for default requests)
+- `claims`: number of codes claimed through the registry
+
+The registry is built from a full item scan the first time a portfolio needs
+it (or by scripts/backfill_subject_code_registry.py), and
+check_subject_code_registry compares it against a fresh scan.
+"""
+
+from datetime import datetime, timezone
+from typing import Dict, Any, Iterable, Optional, Set
+
+
+REGISTRY_COLLECTION = "rm_subject_code_registry"
+
+# 00-09 are template codes
+RESERVED_CODES = {f"{i:02d}" for i in range(0, 10)}
+
+# 20-29 are designated governance module codes (20=Meetings, 21=Distributions,
+# 22=Disputes, 23=Insurance, 24=Compensation); non-governance items skip them
+GOVERNANCE_CODES = {f"{i:02d}" for i in range(20, 30)}
+
+MAX_CLAIM_RETRIES = 20
+
+# Collections whose items hold subject codes: (collection, extra filter, has subject_code field)
+SUBJECT_CODE_SOURCES = [
+    ("assets", {}, True),
+    # Standalone ledger entries (asset-linked entries share the asset's code)
+    ("trust_ledger", {"asset_id": None}, True),
+    ("documents", {}, True),
+    ("meetings", {}, False),
+    ("distributions", {}, False),
+    ("disputes", {}, False),
+    ("insurance_policies", {}, False),
+]
+
+
+def extract_code_from_rm_id(rm_id: Optional[str]) -> Optional[str]:
+    """Extract subject code from RM-ID. Returns code as string or None."""
+    if not rm_id or "-" not in rm_id or "." not in rm_id:
+        return None
+    parts = rm_id.split("-")
+    if len(parts) >= 2:
+        code_seq = parts[-1].split(".")
+        if len(code_seq) == 2:
+            return code_seq[0]
+    return None
+
+
+def pick_subject_code(requested_code: str, used_codes: Iterable[str]) -> str:
+    """
+    Choose the code for a new item.
+    Governance requests (20-29) get their designated code; anything else gets
+    the first free code at or after the requested one, skipping reserved and
+    governance codes and wrapping to the lowest free code past 99.
+    """
+    used = set(used_codes)
+    requested = int(requested_code) if requested_code.isdigit() else 10
+
+    if 20 <= requested <= 29:
+        return f"{requested:02d}"
+
+    def is_free(code: int) -> bool:
+        code_str = f"{code:02d}"
+        return code_str not in used and code_str not in RESERVED_CODES and code_str not in GOVERNANCE_CODES
+
+    code = requested
+    while not is_free(code):
+        code += 1
+        if 20 <= code <= 29:
+            code = 30
+        if code > 99:
+            # Wrap around and take the lowest free code; if none is left the
+            # code overflows to 100 as it always has
+            return next((f"{i:02d}" for i in range(10, 100) if is_free(i)), f"{code:02d}")
+    return f"{code:02d}"
+
+
+def lowest_free_code(used_codes: Iterable[str]) -> str:
+    """Code a default (non-governance) request would get."""
+    return pick_subject_code("10", used_codes)
+
+
+async def scan_used_codes(db, portfolio_id: str, user_id: str) -> Set[str]:
+    """Collect used subject codes from every item collection (full scan)."""
+    used = set()
+    for collection, extra_filter, has_code_field in SUBJECT_CODE_SOURCES:
+        projection = {"_id": 0, "rm_id": 1}
+        if has_code_field:
+            projection["subject_code"] = 1
+        async for item in db[collection].find(
+            {"portfolio_id": portfolio_id, "user_id": user_id, **extra_filter},
+            projection
+        ):
+            if item.get("subject_code"):
+                used.add(item["subject_code"])
+            code = extract_code_from_rm_id(item.get("rm_id"))
+            if code:
+                used.add(code)
+    return used
+
+
+async def ensure_subject_code_registry_indexes(db):
+    """Create the registry's unique key."""
+    await db[REGISTRY_COLLECTION].create_index(
+        [("portfolio_id", 1), ("user_id", 1)],
+        unique=True,
+        name="unique_subject_code_registry"
+    )
+
+
+async def backfill_registry(db, portfolio_id: str, user_id: str) -> Dict[str, Any]:
+    """
+    Build (or top up) a portfolio's registry from a full item scan.
+    Codes already in the registry are kept, so concurrent claims survive.
+    """
+    used = await scan_used_codes(db, portfolio_id, user_id)
+    now = datetime.now(timezone.utc).isoformat()
+    await db[REGISTRY_COLLECTION].update_one(
+        {"portfolio_id": portfolio_id, "user_id": user_id},
+        {
+            "$addToSet": {"used_codes": {"$each": sorted(used)}},
+            "$set": {"backfilled_at": now, "updated_at": now},
+            "$setOnInsert": {"claims": 0, "created_at": now}
+        },
+        upsert=True
+    )
+    registry = await db[REGISTRY_COLLECTION].find_one(
+        {"portfolio_id": portfolio_id, "user_id": user_id},
+        {"_id": 0}
+    )
+    next_code = lowest_free_code(registry.get("used_codes", []))
+    await db[REGISTRY_COLLECTION].update_one(
+        {"portfolio_id": portfolio_id, "user_id": user_id},
+        {"$set": {"next_code": next_code}}
+    )
+    registry["next_code"] = next_code
+    return registry
+
+
+async def get_registry(db, portfolio_id: str, user_id: str) -> Dict[str, Any]:
+    """Load a portfolio's registry, backfilling it on first use."""
+    registry = await db[REGISTRY_COLLECTION].find_one(
+        {"portfolio_id": portfolio_id, "user_id": user_id},
+        {"_id": 0}
+    )
+    if registry:
+        return registry
+    return await backfill_registry(db, portfolio_id, user_id)
+
+
+async def claim_subject_code(db, portfolio_id: str, user_id: str, requested_code: str) -> str:
+    """
+    Pick and atomically claim a subject code for a new item.
+    Governance codes are shared by design and are not claimed.
+    """
+    for _ in range(MAX_CLAIM_RETRIES):
+        registry = await get_registry(db, portfolio_id, user_id)
+        used = set(registry.get("used_codes", []))
+        code = pick_subject_code(requested_code, used)
+
+        if code in GOVERNANCE_CODES:
+            return code
+
+        # Claim only if nobody registered the code since we read it
+        result = await db[REGISTRY_COLLECTION].update_one(
+            {"portfolio_id": portfolio_id, "user_id": user_id, "used_codes": {"$ne": code}},
+            {
+                "$addToSet": {"used_codes": code},
+                "$inc": {"claims": 1},
+                "$set": {
+                    "next_code": lowest_free_code(used | {code}),
+                    "updated_at": datetime.now(timezone.utc).isoformat()
+                }
+            }
+        )
+        if result.modified_count:
+            return code
+
+    raise RuntimeError(f"Failed to claim subject code after {MAX_CLAIM_RETRIES} attempts")
+
+
+async def check_subject_code_registry(
+    db,
+    portfolio_id: str,
+    user_id: str,
+    repair: bool = False,
+    release_unused: bool = False
+) -> Dict[str, Any]:
+    """
+    Compare the registry with a fresh scan of the items.
+
+    - missing_from_registry: codes items hold that the registry doesn't know
+      (the generator could hand them out again)
+    - unused_in_registry: claimed codes no item holds (deleted items or
+      abandoned claims)
+
+    repair=True registers missing codes; with release_unused=True it also frees
+    unused ones so they can be handed out again (only safe while no items
+    are being created in the portfolio, since a fresh claim looks unused
+    until its item is written).
+    """
+    registry = await get_registry(db, portfolio_id, user_id)
+    registered = set(registry.get("used_codes", []))
+    in_use = await scan_used_codes(db, portfolio_id, user_id)
+
+    missing = sorted(in_use - registered)
+    unused = sorted(registered - in_use)
+
+    unused_to_release = unused if repair and release_unused else []
+
+    if repair and (missing or unused_to_release):
+        now = datetime.now(timezone.utc).isoformat()
+        if missing:
+            await db[REGISTRY_COLLECTION].update_one(
+                {"portfolio_id": portfolio_id, "user_id": user_id},
+                {"$addToSet": {"used_codes": {"$each": missing}}, "$set": {"updated_at": now}}
+            )
+        if unused_to_release:
+            await db[REGISTRY_COLLECTION].update_one(
+                {"portfolio_id": portfolio_id, "user_id": user_id},
+                {"$pull": {"used_codes": {"$in": unused_to_release}}, "$set": {"updated_at": now}}
+            )
+        await db[REGISTRY_COLLECTION].update_one(
+            {"portfolio_id": portfolio_id, "user_id": user_id},
+            {"$set": {"next_code": lowest_free_code((registered | set(missing)) - set(unused_to_release))}}
+        )
+
+    return {
+        "portfolio_id": portfolio_id,
+        "consistent": not missing and not unused,
+        "registered_count": len(registered),
+        "in_use_count": len(in_use),
+        "missing_from_registry": missing,
+        "unused_in_registry": unused,
+        "repaired": repair and bool(missing or unused_to_release),
+        "released": unused_to_release,
+        "checked_at": datetime.now(timezone.utc).isoformat()
+    }
@@ -5,9 +5,10 @@
  * - Before (prior revision) vs After (current draft)
  * - Highlight changed fields
  * - Field-level diff indicators
+ * - Full payloads for the side-by-side tab are loaded on demand (onLoadPayloads)
  */
 
-import { useState, useMemo } from 'react';
+import { useState, useMemo, useEffect } from 'react';
 import { motion } from 'framer-motion';
 import {
   ArrowsLeftRight,
@@ -55,7 +56,29 @@ function formatFieldName(field) {
     .join(' ');
 }
 
-function DiffField({ field, oldValue, newValue, type }) {
+function TextDiff({ textDiff }) {
+  const separator = textDiff.granularity === 'line' ? '\n' : '';
+  return (
+    <pre className="text-xs text-slate-300 whitespace-pre-wrap overflow-auto max-h-60 p-2 rounded bg-vault-darker/50">
+      {textDiff.ops.map(([op, oldText, newText], index) => {
+        const prefix = index > 0 ? separator : '';
+        if (op === 'equal') {
+          return <span key={index}>{prefix}{oldText}</span>;
+        }
+        return (
+          <span key={index}>
+            {prefix}
+            {oldText && <span className="text-red-400 line-through bg-red-500/10">{oldText}</span>}
+            {oldText && newText && separator}
+            {newText && <span className="text-emerald-400 bg-emerald-500/10">{newText}</span>}
+          </span>
+        );
+      })}
+    </pre>
+  );
+}
+
+function DiffField({ field, oldValue, newValue, type, textDiff }) {
   const config = changeTypeColors[type] || changeTypeColors.modified;
   const Icon = config.icon;
   const isComplex = typeof oldValue === 'object' || typeof newValue === 'object';
@@ -74,7 +97,9 @@ function DiffField({ field, oldValue, newValue, type }) {
         </Badge>
       </div>
 
-      {isComplex ? (
+      {textDiff ? (
+        <TextDiff textDiff={textDiff} />
+      ) : isComplex ? (
         <div className="grid grid-cols-2 gap-4 mt-2">
           <div className="p-2 rounded bg-vault-darker/50">
             <span className="text-xs text-slate-500 block mb-1">Before</span>
@@ -111,9 +136,32 @@ export default function DiffPreview({
   afterVersion,
   changes = [],
   beforePayload = {},
-  afterPayload = {}
+  afterPayload = {},
+  onLoadPayloads
 }) {
   const [viewMode, setViewMode] = useState('changes');
+  const [loadedPayloads, setLoadedPayloads] = useState(null);
+  const [payloadsLoading, setPayloadsLoading] = useState(false);
+
+  // A new comparison starts on the changes tab without payloads
+  useEffect(() => {
+    setViewMode('changes');
+    setLoadedPayloads(null);
+  }, [onLoadPayloads]);
+
+  const handleViewModeChange = (mode) => {
+    setViewMode(mode);
+    if (mode === 'sideBySide' && onLoadPayloads && !loadedPayloads && !payloadsLoading) {
+      setPayloadsLoading(true);
+      onLoadPayloads()
+        .then(setLoadedPayloads)
+        .catch(() => setViewMode('changes'))
+        .finally(() => setPayloadsLoading(false));
+    }
+  };
+
+  const before = onLoadPayloads ? loadedPayloads?.before_payload : beforePayload;
+  const after = onLoadPayloads ? loadedPayloads?.after_payload : afterPayload;
 
   const hasChanges = changes.length > 0;
 
@@ -164,7 +212,7 @@ export default function DiffPreview({
           </div>
         </div>
 
-        <Tabs value={viewMode} onValueChange={setViewMode} className="flex-1 flex flex-col">
+        <Tabs value={viewMode} onValueChange={handleViewModeChange} className="flex-1 flex flex-col">
           <TabsList className="bg-vault-darker/50">
             <TabsTrigger value="changes">Changes ({changes.length})</TabsTrigger>
             <TabsTrigger value="sideBySide">Side by Side</TabsTrigger>
@@ -181,6 +229,7 @@ export default function DiffPreview({
                       oldValue={change.old_value}
                       newValue={change.new_value}
                       type={change.type}
+                      textDiff={change.text_diff}
                     />
                   ))}
                 </div>
@@ -201,7 +250,7 @@ export default function DiffPreview({
                 </div>
                 <ScrollArea className="h-[calc(100%-36px)]">
                   <pre className="p-3 text-xs text-slate-300 whitespace-pre-wrap">
-                    {JSON.stringify(beforePayload, null, 2)}
+                    {payloadsLoading ? 'Loading…' : JSON.stringify(before || {}, null, 2)}
                   </pre>
                 </ScrollArea>
               </div>
@@ -211,7 +260,7 @@ export default function DiffPreview({
                 </div>
                 <ScrollArea className="h-[calc(100%-36px)]">
                   <pre className="p-3 text-xs text-slate-300 whitespace-pre-wrap">
-                    {JSON.stringify(afterPayload, null, 2)}
+                    {payloadsLoading ? 'Loading…' : JSON.stringify(after || {}, null, 2)}
                   </pre>
                 </ScrollArea>
               </div>
@@ -188,12 +188,14 @@ export default function useGovernanceRecord(recordId) {
     }
   }, [recordId, fetchRecord]);
 
-  // Get diff between revisions
-  const getDiff = useCallback(async (revisionId, compareToId = null) => {
+  // Get diff between revisions (full payloads only when includePayloads is set)
+  const getDiff = useCallback(async (revisionId, compareToId = null, includePayloads = false) => {
     try {
-      const url = compareToId
-        ? `${API_V2}/revisions/${revisionId}/diff?compare_to=${compareToId}`
-        : `${API_V2}/revisions/${revisionId}/diff`;
+      const params = new URLSearchParams();
+      if (compareToId) params.set('compare_to', compareToId);
+      if (includePayloads) params.set('include_payloads', 'true');
+      const query = params.toString();
+      const url = `${API_V2}/revisions/${revisionId}/diff${query ? `?${query}` : ''}`;
       const res = await axios.get(url);
       return res.data.data;
     } catch (err) {
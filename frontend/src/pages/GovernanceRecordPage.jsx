@@ -294,6 +294,19 @@ export default function GovernanceRecordPage({ user }) {
     }
   };
 
+  // Full payloads for the diff's side-by-side tab, fetched when it is opened
+  const loadDiffPayloads = useCallback(async () => {
+    try {
+      const compareTo = diffData.compare_to_id ? `compare_to=${diffData.compare_to_id}&` : '';
+      const res = await axios.get(`${API}/revisions/${diffData.revision_id}/diff?${compareTo}include_payloads=true`);
+      return res.data.data;
+    } catch (err) {
+      console.error('Error loading revision payloads:', err);
+      toast.error('Failed to load revision payloads');
+      throw err;
+    }
+  }, [diffData]);
+
   // Handle export
   const handleExport = () => {
     toast.info('Export feature coming soon');
@@ -475,8 +488,7 @@ export default function GovernanceRecordPage({ user }) {
           beforeVersion={diffData.compare_to_version}
           afterVersion={diffData.revision_version}
           changes={diffData.changes}
-          beforePayload={diffData.before_payload}
-          afterPayload={diffData.after_payload}
+          onLoadPayloads={loadDiffPayloads}
         />
       )}
 
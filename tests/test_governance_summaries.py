@@ -0,0 +1,72 @@
+"""
+Parity of the governance summary pipelines with plain Python reductions,
+over randomized fixtures in a mongomock database (no live MongoDB needed).
+"""
+
+import asyncio
+import os
+import random
+import sys
+
+import pytest
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend")
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, os.path.join(BACKEND_DIR, "scripts"))
+
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+from check_governance_summaries import SUMMARIES, check_portfolio, random_documents  # noqa: E402
+
+
+USER_ID = "user_parity"
+PORTFOLIO_ID = "port_parity"
+
+
+async def seed(db, seed_value: int, count: int):
+    rng = random.Random(seed_value)
+    for collection, docs in random_documents(rng, count).items():
+        for doc in docs:
+            doc.update({"user_id": USER_ID, "portfolio_id": PORTFOLIO_ID, "deleted_at": None})
+        if docs:
+            await db[collection].insert_many(docs)
+        # Documents outside the match must not leak into the summaries
+        await db[collection].insert_many([
+            {"user_id": USER_ID, "portfolio_id": "port_other", "deleted_at": None, "status": "active"},
+            {"user_id": USER_ID, "portfolio_id": PORTFOLIO_ID, "deleted_at": "2025-01-01T00:00:00+00:00"}
+        ])
+
+
+@pytest.mark.parametrize("seed_value", [1, 2, 3])
+def test_summaries_match_reference(seed_value):
+    async def run():
+        db = mongomock_motor.AsyncMongoMockClient()["governance_summaries"]
+        await seed(db, seed_value, 1500)
+        return await check_portfolio(db, USER_ID, PORTFOLIO_ID)
+
+    assert asyncio.run(run()) == []
+
+
+def test_empty_portfolio_matches_reference():
+    async def run():
+        db = mongomock_motor.AsyncMongoMockClient()["governance_summaries"]
+        return await check_portfolio(db, USER_ID, PORTFOLIO_ID)
+
+    assert asyncio.run(run()) == []
+
+
+def test_empty_string_keys_stay_separate():
+    # $ifNull only replaces missing/null, so "" is its own breakdown key
+    async def run():
+        db = mongomock_motor.AsyncMongoMockClient()["governance_summaries"]
+        base = {"user_id": USER_ID, "portfolio_id": PORTFOLIO_ID, "deleted_at": None}
+        await db.distributions.insert_many([
+            {**base, "distribution_type": "", "total_amount": 5},
+            {**base, "total_amount": 7}
+        ])
+        summarize = dict((name, fn) for name, _, fn, _ in SUMMARIES)["distributions"]
+        return await summarize(db, base), await check_portfolio(db, USER_ID, PORTFOLIO_ID)
+
+    summary, mismatches = asyncio.run(run())
+    assert summary["by_type"] == {"": 5, "regular": 7}
+    assert mismatches == []